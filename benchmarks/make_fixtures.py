@@ -0,0 +1,233 @@
+"""
+Regenerate the checked-in benchmark fixtures from the CSV snapshots under data/.
+
+Each fixture reproduces the markup (or JSON shape) that the corresponding scraper reads,
+filled with real rows from our own data files, so the benchmarks exercise the parsers
+on realistic page sizes without touching the network.
+
+Usage:
+    python3 benchmarks/make_fixtures.py
+"""
+import html
+import json
+import os
+import re
+
+import pandas as pd
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+data_dir = os.path.join(base_dir, "data")
+fixtures_dir = os.path.join(base_dir, "benchmarks", "fixtures")
+
+# Basketball-Reference totals columns in page order (after the "Rk" header)
+BBREF_COLUMNS = [
+    "Player", "Age", "Team", "Pos", "G", "GS", "MP", "FG", "FGA", "FG%",
+    "3P", "3PA", "3P%", "2P", "2PA", "2P%", "eFG%", "FT", "FTA", "FT%",
+    "ORB", "DRB", "TRB", "AST", "STL", "BLK", "TOV", "PF", "PTS", "Trp-Dbl", "Awards",
+]
+
+# leaguedashplayerstats result set columns used by utils/scrape_nba.py
+NBA_HEADERS = [
+    "PLAYER_ID", "PLAYER_NAME", "TEAM_ABBREVIATION", "GP", "MIN",
+    "PTS", "REB", "AST", "STL", "BLK", "TOV", "PF",
+]
+
+
+def _cell(value):
+    return "" if pd.isna(value) else html.escape(str(value))
+
+
+def _write(relative_path, content):
+    path = os.path.join(fixtures_dir, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    print(f"Wrote {path} ({len(content)} bytes)")
+
+
+def make_spotrac_team_pages():
+    """
+    One yearly contracts page per team, in the dataTable-active layout.
+    """
+    df = pd.read_csv(os.path.join(data_dir, "spotrac_contracts.csv"))
+    seasons = [col for col in df.columns if re.match(r"^20\d{2}-\d{2}$", col)]
+
+    for team_link, team_df in df.groupby("Team Link"):
+        team = team_link.rstrip("/").split("/")[-2]
+        head = "".join(f"<th>{season}</th>" for season in seasons)
+        rows = []
+        for _, row in team_df.iterrows():
+            cells = []
+            for season in seasons:
+                value = row[season]
+                if pd.isna(value):
+                    cells.append('<td data-export="-10">-</td>')
+                elif str(value).startswith("$"):
+                    amount = str(value)[1:]
+                    cells.append(f'<td data-export="{amount}">${int(amount):,}</td>')
+                else:
+                    cells.append(f"<td><span class=\"badge\">{_cell(value)}</span></td>")
+            rows.append(
+                "<tr>"
+                f'<td class="sticky"><a href="{_cell(row["Player Link"])}">{_cell(row["Player"])}</a></td>'
+                f'<td data-export="{_cell(row["Position"])}">{_cell(row["Position"])}</td>'
+                f'<td data-export="{_cell(row["Age"])}">{_cell(row["Age"])}</td>'
+                + "".join(cells) +
+                "</tr>"
+            )
+        page = (
+            "<html><body><main>"
+            '<table id="dataTable-active" class="table">'
+            f"<thead><tr><th>Player ({len(team_df)})</th><th>Pos</th><th>Age</th>{head}</tr></thead>"
+            f"<tbody>{''.join(rows)}</tbody>"
+            "</table></main></body></html>"
+        )
+        _write(os.path.join("spotrac", "teams", f"{team}.html"), page)
+
+
+def make_spotrac_player_page():
+    """
+    A player contract page with the header and contract-details blocks the scraper reads.
+    """
+    page = """<html><body>
+<div id="main"><section><article>
+<div class="row m-0 mt-0 pb-3">
+  <div class="col-md-6"><div>
+    <div><strong>Drafted:</strong> <span>Round 1 (#4 overall), 2014</span></div>
+    <div><strong>College:</strong> <span>Arizona</span></div>
+  </div></div>
+  <div class="col-md-6"><div>
+    <div><strong>Age:</strong> <span>31</span></div>
+  </div></div>
+</div>
+<div id="contracts"><div><div>
+  <div class="contract-wrapper mb-5">
+    <h2 class="contract-title">Denver Nuggets - 4 Years | $133,203,878</h2>
+    <div class="contract-details row m-0">
+      <div class="col"><div class="label">Contract Terms:</div><div class="value">4 yr(s) / $133,203,878</div></div>
+      <div class="col"><div class="label">Average Salary:</div><div class="value">$33,300,970</div></div>
+      <div class="col"><div class="label">GTD at Sign:</div><div class="value">$133,203,878</div></div>
+      <div class="col"><div class="label">Total GTD:</div><div class="value">$133,203,878</div></div>
+      <div class="col"><div class="label">Signed Using:</div><div class="value">Bird Rights</div></div>
+      <div class="col"><div class="label">Free Agent:</div><div class="value">2029 / UFA</div></div>
+    </div>
+    <table class="table contract-breakdown">
+      <thead><tr><th>Year</th><th>Age</th><th>Status</th><th>Cap Hit</th></tr></thead>
+      <tbody>
+        <tr><td>2025-26</td><td>30</td><td></td><td>$22,841,455</td></tr>
+        <tr><td>2026-27</td><td>31</td><td></td><td>$31,978,037</td></tr>
+        <tr><td>2027-28</td><td>32</td><td></td><td>$34,536,280</td></tr>
+        <tr><td>2028-29</td><td>33</td><td>Player Option</td><td>$37,094,523</td></tr>
+      </tbody>
+    </table>
+  </div>
+</div></div></div>
+</article></section></div>
+</body></html>
+"""
+    _write(os.path.join("spotrac", "player.html"), page)
+
+
+def make_bbref_totals_page():
+    """
+    The totals_stats table from a Basketball-Reference season totals page.
+    """
+    df = pd.read_csv(os.path.join(data_dir, "bbref_archive", "NBA_2025_totals.csv"), dtype=str)
+    head = "<th>Rk</th>" + "".join(f"<th>{col}</th>" for col in BBREF_COLUMNS)
+    rows = []
+    for rank, (_, row) in enumerate(df.iterrows(), start=1):
+        cells = []
+        for col in BBREF_COLUMNS:
+            value = _cell(row[col])
+            if col == "Player" and isinstance(row["Player Link"], str):
+                href = row["Player Link"].replace("https://www.basketball-reference.com", "")
+                value = f'<a href="{href}">{value}</a>'
+            elif col == "Team" and isinstance(row["Team Link"], str) and "/teams/" in row["Team Link"]:
+                href = row["Team Link"].replace("https://www.basketball-reference.com", "")
+                value = f'<a href="{href}">{value}</a>'
+            cells.append(f"<td>{value}</td>")
+        rows.append(f"<tr><th>{rank}</th>{''.join(cells)}</tr>")
+    page = (
+        "<html><body>"
+        '<table id="totals_stats">'
+        f"<thead><tr>{head}</tr></thead>"
+        f"<tbody>{''.join(rows)}</tbody>"
+        "</table></body></html>"
+    )
+    _write(os.path.join("bbref", "totals.html"), page)
+
+
+def make_nba_stats_json():
+    """
+    A leaguedashplayerstats response in the stats.nba.com resultSets format.
+    """
+    df = pd.read_csv(os.path.join(data_dir, "nba_stats.csv"))
+    rows = [
+        [player_id, row["Player"], row["Team"], int(row["G"]), float(row["MP"]),
+         int(row["PTS"]), int(row["TRB"]), int(row["AST"]), int(row["STL"]),
+         int(row["BLK"]), int(row["TOV"]), int(row["PF"])]
+        for player_id, (_, row) in enumerate(df.iterrows(), start=1)
+    ]
+    payload = {
+        "resource": "leaguedashplayerstats",
+        "parameters": {"Season": "2025-26"},
+        "resultSets": [{"name": "LeagueDashPlayerStats", "headers": NBA_HEADERS, "rowSet": rows}],
+    }
+    _write(os.path.join("nba", "leaguedashplayerstats.json"), json.dumps(payload))
+
+
+def make_sportsws_stats_page():
+    """
+    The Sports.ws NBA stats table (player link followed by ", TEAM, POS").
+    """
+    df = pd.read_csv(os.path.join(data_dir, "sportsws_positions.csv"))
+    teams = pd.read_csv(os.path.join(data_dir, "nba_stats.csv")).set_index("Player Key")["Team"].to_dict()
+    rows = []
+    for _, row in df.iterrows():
+        href = str(row["Player Link"]).replace("https://sports.ws", "")
+        team = teams.get(row["Player Key"], "FA")
+        position = _cell(row["Position"]) or "G"
+        rows.append(
+            f'<tr><td><a href="{_cell(href)}">{_cell(row["Name"])}</a>, {team}, {position}</td>'
+            "<td>0</td></tr>"
+        )
+    page = f"<html><body><table><tbody>{''.join(rows)}</tbody></table></body></html>"
+    _write(os.path.join("sportsws", "stats.html"), page)
+
+
+def make_sportsws_league_pages():
+    """
+    The league standings page (one link per fantasy team, labelled with its owner) and
+    one roster page per team, built from the Owner column of the positions snapshot.
+    These are synthetic (modelled on the public stats page, not captured from the
+    league), which is why the league URL must be configured rather than defaulted.
+    """
+    df = pd.read_csv(os.path.join(data_dir, "sportsws_positions.csv"))
+    df = df[df["Owner"].notna()]
+    owners = sorted(df["Owner"].unique())
+
+    standings = "".join(
+        f'<tr><td>{number}</td><td><a href="/dmcb/team/{number}">{_cell(owner)}</a></td><td>0-0</td></tr>'
+        for number, owner in enumerate(owners, start=1)
+    )
+    _write(
+        os.path.join("sportsws", "league", "standings.html"),
+        f"<html><body><table><tbody>{standings}</tbody></table></body></html>",
+    )
+
+    for number, owner in enumerate(owners, start=1):
+        rows = []
+        for _, row in df[df["Owner"] == owner].iterrows():
+            href = str(row["Player Link"]).replace("https://sports.ws", "")
+            rows.append(f'<tr><td><a href="{_cell(href)}">{_cell(row["Name"])}</a>, {_cell(row["Position"])}</td><td>0</td></tr>')
+        page = f"<html><body><h1>{_cell(owner)}</h1><table><tbody>{''.join(rows)}</tbody></table></body></html>"
+        _write(os.path.join("sportsws", "league", "team", f"{number}.html"), page)
+
+
+if __name__ == "__main__":
+    make_spotrac_team_pages()
+    make_spotrac_player_page()
+    make_bbref_totals_page()
+    make_nba_stats_json()
+    make_sportsws_stats_page()
+    make_sportsws_league_pages()
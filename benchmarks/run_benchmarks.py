@@ -0,0 +1,248 @@
+"""
+Offline throughput and memory benchmarks for the scrapers and the get_* pipelines.
+
+Every case runs against the checked-in fixtures through the local HTTP stand-in, so the
+numbers reflect parsing and processing cost rather than network conditions. Results are
+compared against benchmarks/baseline.json.
+
+Usage:
+    python3 benchmarks/run_benchmarks.py                    # run all cases and compare
+    python3 benchmarks/run_benchmarks.py --only scrape_bbref_totals
+    python3 benchmarks/run_benchmarks.py --check            # exit 1 on a regression
+    python3 benchmarks/run_benchmarks.py --update-baseline  # record new baseline numbers
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+# Make the project modules importable
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+from benchmarks.stand_in import StandInServer, make_session
+
+baseline_path = os.path.join(base_dir, "benchmarks", "baseline.json")
+contracts_csv = os.path.join(base_dir, "data", "spotrac_contracts.csv")
+
+
+def _load_modules(workdir):
+    """
+    Import the scrapers and scripts from inside a scratch working directory, since the
+    scripts create data/ and logs/ relative to the current directory.
+    """
+    os.makedirs(os.path.join(workdir, "logs"), exist_ok=True)
+    os.makedirs(os.path.join(workdir, "data"), exist_ok=True)
+    os.chdir(workdir)
+
+    from utils import scrape_bbref, scrape_nba, scrape_sportsws, scrape_spotrac
+    from scripts import get_contracts, get_contract_types, get_stats, get_positions
+
+    # The scripts log every row at INFO; keep the benchmark output readable
+    logging.getLogger().setLevel(logging.WARNING)
+
+    return {
+        "scrape_bbref": scrape_bbref,
+        "scrape_nba": scrape_nba,
+        "scrape_sportsws": scrape_sportsws,
+        "scrape_spotrac": scrape_spotrac,
+        "get_contracts": get_contracts,
+        "get_contract_types": get_contract_types,
+        "get_stats": get_stats,
+        "get_positions": get_positions,
+    }
+
+
+def build_cases(modules, session):
+    """
+    Returns {case name: callable() -> rows produced}.
+    """
+    salary_data = pd.read_csv(contracts_csv)
+    player_link = salary_data["Player Link"].iloc[0]
+    contract_types_csv = modules["get_contract_types"].output_csv
+
+    def team_contracts():
+        return len(modules["scrape_spotrac"].scrape_team_contracts("denver-nuggets", session))
+
+    def player_contracts():
+        signed_using, drafted = modules["scrape_spotrac"].scrape_player_contracts(player_link, session)
+        return int(signed_using is not None)
+
+    def bbref_totals():
+        return len(modules["scrape_bbref"].scrape_nba_totals(2025, session=session))
+
+    def nba_totals():
+        return len(modules["scrape_nba"].scrape_nba_totals(2026, session=session))
+
+    def sportsws_positions():
+        return len(modules["scrape_sportsws"].scrape_sportsws_positions(session=session))
+
+    def contracts_main():
+        df = modules["get_contracts"].main(update_csv=True, session=session, owner_lookup={})
+        return len(df)
+
+    def contract_types_main():
+        # Start from an empty output so every run scrapes the full player list
+        if os.path.exists(contract_types_csv):
+            os.remove(contract_types_csv)
+        df = modules["get_contract_types"].main(
+            update_csv=True, update_sheets=False, salary_data=salary_data, session=session
+        )
+        return len(df)
+
+    def stats_main():
+        return len(modules["get_stats"].main(year=2026, update_csv=True, session=session))
+
+    def positions_main():
+        df = modules["get_positions"].main(update_csv=True, session=session, owner_lookup={})
+        return len(df)
+
+    return {
+        "scrape_team_contracts": team_contracts,
+        "scrape_player_contracts": player_contracts,
+        "scrape_bbref_totals": bbref_totals,
+        "scrape_nba_totals": nba_totals,
+        "scrape_sportsws_positions": sportsws_positions,
+        "get_contracts_main": contracts_main,
+        "get_contract_types_main": contract_types_main,
+        "get_stats_main": stats_main,
+        "get_positions_main": positions_main,
+    }
+
+
+def measure(func, repeat):
+    """
+    Runs func once to warm up, then `repeat` timed runs and one traced run for memory.
+
+    Returns:
+        dict: rows, median seconds, rows per second and peak traced memory in MB.
+    """
+    rows = func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    seconds = statistics.median(timings)
+    return {
+        "rows": rows,
+        "seconds": round(seconds, 5),
+        "rows_per_second": round(rows / seconds, 1) if seconds else None,
+        "peak_memory_mb": round(peak / 1024 / 1024, 2),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Returns a list of human-readable regressions against the baseline.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        if reference.get("rows_per_second") and result["rows_per_second"] < reference["rows_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['rows_per_second']} rows/s vs baseline {reference['rows_per_second']}"
+            )
+        if reference.get("peak_memory_mb") and result["peak_memory_mb"] > reference["peak_memory_mb"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: {result['peak_memory_mb']} MB peak vs baseline {reference['peak_memory_mb']}"
+            )
+    return regressions
+
+
+def main(only=None, repeat=3, tolerance=0.25, update_baseline=False, check=False):
+    """
+    Run the benchmark cases and report them against the stored baseline.
+
+    Args:
+        only (list of str, optional): Case names to run. Defaults to all cases.
+        repeat (int): Timed runs per case (the median is reported).
+        tolerance (float): Allowed relative slowdown / memory growth before flagging.
+        update_baseline (bool): Overwrite the stored baseline with these results.
+        check (bool): Exit with status 1 if any case regressed.
+    """
+    original_cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix="dmcb-bench-")
+    try:
+        modules = _load_modules(workdir)
+        with StandInServer() as server:
+            session = make_session(server)
+            cases = build_cases(modules, session)
+            unknown = set(only or []) - set(cases)
+            if unknown:
+                raise SystemExit(f"Unknown benchmark case(s): {', '.join(sorted(unknown))}")
+
+            results = {}
+            for name, func in cases.items():
+                if only and name not in only:
+                    continue
+                results[name] = measure(func, repeat)
+            session.close()
+    finally:
+        os.chdir(original_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    baseline = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print(f"{'case':<28}{'rows':>8}{'seconds':>10}{'rows/s':>12}{'base rows/s':>13}{'peak MB':>10}{'base MB':>9}")
+    for name, result in results.items():
+        reference = baseline.get(name, {})
+        print(
+            f"{name:<28}{result['rows']:>8}{result['seconds']:>10.4f}{result['rows_per_second']:>12}"
+            f"{str(reference.get('rows_per_second', '-')):>13}{result['peak_memory_mb']:>10}"
+            f"{str(reference.get('peak_memory_mb', '-')):>9}"
+        )
+
+    regressions = compare(results, baseline, tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    if update_baseline:
+        baseline.update(results)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline updated: {baseline_path}")
+
+    if check and regressions:
+        sys.exit(1)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the offline scraper and pipeline benchmarks.")
+    parser.add_argument("--only", nargs="+", default=None, help="Only run these cases")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (median is reported)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression (default 0.25)")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 on a regression")
+    args = parser.parse_args()
+
+    main(
+        only=args.only,
+        repeat=args.repeat,
+        tolerance=args.tolerance,
+        update_baseline=args.update_baseline,
+        check=args.check,
+    )
@@ -0,0 +1,151 @@
+"""
+A local HTTP stand-in for Spotrac, Basketball-Reference, stats.nba.com and Sports.ws.
+
+StandInServer serves the checked-in fixtures over a real socket on 127.0.0.1, and
+StandInAdapter is a requests transport adapter that rewrites requests for the real hosts
+to that server. Mount the adapter on a session (see make_session()) and pass the session
+to the scrapers to run them fully offline. Like the real hosts, the server keeps
+connections alive (HTTP/1.1) and gzips bodies for clients that accept it.
+"""
+import gzip
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+from utils import http_client
+
+fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Real host -> path prefix on the stand-in server
+HOST_PREFIXES = {
+    "www.spotrac.com": "/spotrac",
+    "www.basketball-reference.com": "/bbref",
+    "stats.nba.com": "/nba",
+    "sports.ws": "/sportsws",
+}
+
+# (path pattern, fixture file or callable(match) -> fixture file, content type)
+ROUTES = [
+    (r"^/spotrac/nba/player/", lambda m: os.path.join("spotrac", "player.html"), "text/html"),
+    (r"^/spotrac/nba/([^/]+)/yearly$", lambda m: os.path.join("spotrac", "teams", f"{m.group(1)}.html"), "text/html"),
+    (r"^/bbref/leagues/NBA_\d{4}_totals\.html$", lambda m: os.path.join("bbref", "totals.html"), "text/html"),
+    (r"^/nba/stats/leaguedashplayerstats$", lambda m: os.path.join("nba", "leaguedashplayerstats.json"), "application/json"),
+    (r"^/sportsws/nba/stats$", lambda m: os.path.join("sportsws", "stats.html"), "text/html"),
+    (r"^/sportsws/dmcb/standings$", lambda m: os.path.join("sportsws", "league", "standings.html"), "text/html"),
+    (r"^/sportsws/dmcb/team/(\d+)$", lambda m: os.path.join("sportsws", "league", "team", f"{m.group(1)}.html"), "text/html"),
+]
+
+
+def resolve(path):
+    """
+    Returns (fixture path, content type) for a stand-in request path, or (None, None).
+    """
+    for pattern, target, content_type in ROUTES:
+        match = re.match(pattern, path)
+        if match:
+            fixture = os.path.join(fixtures_dir, target(match))
+            if os.path.exists(fixture):
+                return fixture, content_type
+    return None, None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    # Headers and body go out in separate sends; with Nagle's algorithm on, the body of
+    # every keep-alive response would wait for the client's delayed ACK (~40 ms)
+    disable_nagle_algorithm = True
+
+    # Cache fixture bytes so the benchmarks measure our code, not disk reads
+    _cache = {}
+    _cache_lock = threading.Lock()
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        fixture, content_type = resolve(path)
+        if fixture is None:
+            self.send_error(404, f"No fixture for {path}")
+            return
+
+        compress = "gzip" in self.headers.get("Accept-Encoding", "")
+        with self._cache_lock:
+            body = self._cache.get((fixture, compress))
+            if body is None:
+                with open(fixture, "rb") as f:
+                    body = f.read()
+                if compress:
+                    body = gzip.compress(body)
+                self._cache[(fixture, compress)] = body
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep benchmark output clean
+        pass
+
+
+class StandInServer:
+    """
+    Serves the fixtures on an ephemeral local port. Use as a context manager.
+    """
+
+    def __init__(self):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class StandInAdapter(requests.adapters.HTTPAdapter):
+    """
+    Transport adapter that sends requests for the real hosts to the stand-in server.
+    """
+
+    def __init__(self, base_url, **kwargs):
+        self.base_url = base_url
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        prefix = HOST_PREFIXES.get(parts.netloc)
+        if prefix is not None:
+            local = urlsplit(self.base_url)
+            request.url = urlunsplit((local.scheme, local.netloc, prefix + parts.path, parts.query, ""))
+        return super().send(request, **kwargs)
+
+
+def make_session(server, pool_size=16):
+    """
+    Returns a requests session that routes every known host to the given stand-in server,
+    with the same headers and retry policy as utils.http_client.
+    """
+    session = requests.Session()
+    session.headers.update(http_client.DEFAULT_HEADERS)
+    adapter = StandInAdapter(
+        server.base_url, pool_connections=pool_size, pool_maxsize=pool_size, max_retries=http_client.make_retry()
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,21 @@
+"""
+Library API for the DMCB league data.
+
+Each source has a module whose fetch() scrapes it and returns the processed DataFrame in
+memory, the same frame the matching scripts/get_*.py script writes to CSV:
+
+    import dmcb
+
+    contracts = dmcb.contracts.fetch()            # spotrac_contracts.csv layout
+    table = dmcb.contracts.fetch(typed=True)      # SalaryTable (int64 salaries, status codes)
+    stats = dmcb.stats.fetch(2026)                # nba_stats.csv layout with fantasy metrics
+    positions = dmcb.positions.fetch()            # sportsws_positions.csv layout
+    owners = dmcb.owners.fetch()                  # owners.csv layout (needs DMCB_SPORTSWS_LEAGUE)
+
+Pass max_age (seconds) to reuse a result fetched earlier in the same process instead of
+scraping again, and owner_lookup (Player Key -> Owner, e.g. dmcb.owners.lookup(owners)) to
+add the Owner column.
+"""
+from dmcb import cache, contracts, owners, positions, stats
+
+__all__ = ["cache", "contracts", "owners", "positions", "stats"]
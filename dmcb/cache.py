@@ -0,0 +1,45 @@
+import threading
+import time
+
+# (source, key) -> (fetched at, DataFrame)
+_entries = {}
+_lock = threading.Lock()
+
+
+def cached(source, key, max_age, loader):
+    """
+    Returns a copy of the cached frame for (source, key) if it is at most max_age
+    seconds old; otherwise calls loader() and caches its result.
+
+    Args:
+        source (str): Data source name (e.g., "contracts").
+        key (tuple): Arguments that identify the result (e.g., the season year).
+        max_age (float or None): Maximum age in seconds of a reusable result. None always
+            calls loader() and leaves the cache untouched.
+        loader (callable): Returns a fresh DataFrame.
+
+    Returns:
+        pd.DataFrame: A frame the caller is free to modify.
+    """
+    if max_age is None:
+        return loader()
+
+    with _lock:
+        entry = _entries.get((source, key))
+    if entry is not None and time.time() - entry[0] <= max_age:
+        return entry[1].copy()
+
+    df = loader()
+    with _lock:
+        _entries[(source, key)] = (time.time(), df)
+    return df.copy()
+
+
+def clear(source=None):
+    """
+    Drops every cached result, or only those of one source.
+    """
+    with _lock:
+        for entry_key in list(_entries):
+            if source is None or entry_key[0] == source:
+                del _entries[entry_key]
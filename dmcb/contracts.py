@@ -0,0 +1,70 @@
+from utils.salary_codec import SalaryTable
+from utils.scrape_spotrac import scrape_all_teams
+from utils.text_formatter import make_player_key, make_title_case
+
+from dmcb import cache, owners
+
+# Leading columns of spotrac_contracts.csv; the season columns follow
+REQUIRED_COLUMNS = ["Player", "Player Link", "Player Key", "Team", "Team Link", "Position", "Age"]
+
+
+def process(df):
+    """
+    Clean the raw Spotrac scrape and add the derived key and link columns.
+
+    Args:
+        df (pd.DataFrame): Raw output of scrape_all_teams().
+
+    Returns:
+        pd.DataFrame: Contracts sorted by Player Key with the standard column order.
+    """
+    # Exclude rows where Player is "Incomplete Roster Charge"
+    df = df[df["Player"] != "Incomplete Roster Charge"].copy()
+
+    # Add derived columns for Player Key and Team Link
+    df["Player Key"] = df["Player"].apply(make_player_key)
+    df["Team Link"] = df["Team"].apply(lambda team: f"https://www.spotrac.com/nba/{team}/yearly")
+
+    # Format the Team column to Title Case
+    df["Team"] = df["Team"].apply(make_title_case)
+
+    # Sort by Player Key then Team for consistency
+    df = df.sort_values(by=["Player Key", "Team"], ignore_index=True)
+
+    # Dynamically reorder columns
+    dynamic_columns = [col for col in df.columns if col.startswith("20")]
+    column_order = REQUIRED_COLUMNS + dynamic_columns
+
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing_columns:
+        raise ValueError(f"Missing required columns: {missing_columns}")
+
+    return df[column_order]
+
+
+def _scrape(session):
+    df = scrape_all_teams(session=session)
+    if df is None or df.empty:
+        raise ValueError("No data was returned from the scrape.")
+    return process(df)
+
+
+def fetch(session=None, owner_lookup=None, typed=False, max_age=None):
+    """
+    Scrape every team's Spotrac contracts page and return the processed contracts.
+
+    Args:
+        session (requests.Session, optional): Session to use instead of the shared pooled client.
+        owner_lookup (dict, optional): Player Key -> Owner; adds the Owner column.
+        typed (bool): If True, return a SalaryTable instead of the text DataFrame.
+        max_age (float, optional): Reuse a scrape from this process up to this many seconds old.
+
+    Returns:
+        pd.DataFrame or SalaryTable: Contracts in the spotrac_contracts.csv layout.
+
+    Raises:
+        ValueError: If the scrape returned no rows or lacks required columns.
+    """
+    df = cache.cached("contracts", (), max_age, lambda: _scrape(session))
+    df = owners.merge(df, owner_lookup)
+    return SalaryTable.from_frame(df) if typed else df
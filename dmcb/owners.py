@@ -0,0 +1,117 @@
+import pandas as pd
+
+from utils.scrape_sportsws import LEAGUE_URL, scrape_league_rosters
+from utils.text_formatter import make_player_key
+
+from dmcb import cache
+
+# Columns of owners.csv
+COLUMN_ORDER = ["Player Key", "Name", "Owner"]
+
+# Columns of the roster change log returned by diff()
+CHANGE_COLUMNS = ["Player Key", "Name", "Old Owner", "New Owner", "Change"]
+
+
+def merge(df, owner_lookup):
+    """
+    Adds an Owner column (last) from a Player Key -> Owner mapping.
+
+    Args:
+        df (pd.DataFrame): Frame with a Player Key column.
+        owner_lookup (dict or None): Owner by Player Key. None returns df unchanged.
+
+    Returns:
+        pd.DataFrame: A copy with Owner filled in ("" for unowned players).
+    """
+    if owner_lookup is None or df.empty:
+        return df
+
+    merged_df = df.copy()
+    merged_df["Player Key"] = merged_df["Player Key"].astype(str).str.strip()
+    merged_df["Owner"] = merged_df["Player Key"].map(owner_lookup)
+    merged_df["Owner"] = merged_df["Owner"].replace({None: ""}).fillna("")
+
+    other_columns = [col for col in merged_df.columns if col != "Owner"]
+    return merged_df[other_columns + ["Owner"]]
+
+
+def process(df):
+    """
+    Key the raw Sports.ws league rosters by Player Key.
+
+    Args:
+        df (pd.DataFrame): Raw output of scrape_league_rosters().
+
+    Returns:
+        pd.DataFrame: One row per rostered player, sorted by Player Key.
+    """
+    df = df.copy()
+
+    # Same Player Key as the positions data (built from the Sports.ws player link)
+    df["Player Key"] = df["Player Link"].str.replace("https://sports.ws/nba/", "").apply(make_player_key)
+    df = df.drop_duplicates(subset=["Player Key"], keep="first")
+
+    return df.sort_values(by="Player Key", ignore_index=True)[COLUMN_ORDER]
+
+
+def lookup(df):
+    """
+    Returns the Player Key -> Owner mapping of an owners frame (None passes through).
+    """
+    if df is None:
+        return None
+    return dict(zip(df["Player Key"], df["Owner"]))
+
+
+def diff(old, new):
+    """
+    List the roster moves between two owners frames.
+
+    Args:
+        old (pd.DataFrame or None): Previous owners frame (None: everyone is added).
+        new (pd.DataFrame): Current owners frame.
+
+    Returns:
+        pd.DataFrame: One row per player whose owner changed, with Change "added"
+            (newly rostered), "dropped" (released) or "moved" (traded), sorted by Player Key.
+    """
+    if old is None:
+        old = pd.DataFrame(columns=COLUMN_ORDER)
+
+    def owners(df):
+        df = df[COLUMN_ORDER].copy()
+        df["Owner"] = df["Owner"].fillna("").astype(str)
+        return df[df["Owner"] != ""].set_index("Player Key")
+
+    before, after = owners(old), owners(new)
+    merged = before.join(after, how="outer", lsuffix=" Old", rsuffix=" New")
+    merged = merged.fillna("")
+    merged = merged[merged["Owner Old"] != merged["Owner New"]]
+
+    changes = pd.DataFrame({
+        "Player Key": merged.index,
+        "Name": merged["Name New"].where(merged["Name New"] != "", merged["Name Old"]).to_numpy(),
+        "Old Owner": merged["Owner Old"].to_numpy(),
+        "New Owner": merged["Owner New"].to_numpy(),
+    })
+    changes["Change"] = "moved"
+    changes.loc[changes["Old Owner"] == "", "Change"] = "added"
+    changes.loc[changes["New Owner"] == "", "Change"] = "dropped"
+    return changes.sort_values(by="Player Key", ignore_index=True)[CHANGE_COLUMNS]
+
+
+def fetch(session=None, league_url=LEAGUE_URL, max_age=None):
+    """
+    Scrape the league's Sports.ws roster pages and return each rostered player's owner.
+
+    Args:
+        session (requests.Session, optional): Session to use instead of the shared pooled client.
+        league_url (str): League home page on Sports.ws (default: $DMCB_SPORTSWS_LEAGUE).
+        max_age (float, optional): Reuse a scrape from this process up to this many seconds old.
+
+    Returns:
+        pd.DataFrame: Owners in the owners.csv layout (see lookup() for the mapping).
+    """
+    return cache.cached(
+        "owners", (league_url,), max_age, lambda: process(scrape_league_rosters(session=session, league_url=league_url))
+    )
@@ -0,0 +1,48 @@
+from utils.scrape_sportsws import scrape_sportsws_positions
+from utils.text_formatter import make_player_key
+
+from dmcb import cache, owners
+
+# Columns of sportsws_positions.csv (before Owner)
+COLUMN_ORDER = ["Name", "Player Link", "Player Key", "Position"]
+
+
+def process(df):
+    """
+    Key the raw Sports.ws scrape by Player Key and drop placeholder players.
+
+    Args:
+        df (pd.DataFrame): Raw output of scrape_sportsws_positions().
+
+    Returns:
+        pd.DataFrame: Positions sorted by Player Key.
+    """
+    df = df.copy()
+
+    # Generate a unique Player Key from the Sports.ws link
+    df["Player Key"] = df["Player Link"].str.replace("https://sports.ws/nba/", "").apply(make_player_key)
+
+    # Remove any rows where Player Key contains "placeholder" (case-insensitive)
+    df = df[~df["Player Key"].str.contains("placeholder", case=False, na=False)].copy()
+
+    # Sort the DataFrame by Player Key for consistency
+    df = df.sort_values(by="Player Key", ignore_index=True)
+
+    # Reorder columns and remove "Team" from output
+    return df[COLUMN_ORDER]
+
+
+def fetch(session=None, owner_lookup=None, max_age=None):
+    """
+    Scrape the Sports.ws stats page and return each player's fantasy position.
+
+    Args:
+        session (requests.Session, optional): Session to use instead of the shared pooled client.
+        owner_lookup (dict, optional): Player Key -> Owner; adds the Owner column.
+        max_age (float, optional): Reuse a scrape from this process up to this many seconds old.
+
+    Returns:
+        pd.DataFrame: Positions in the sportsws_positions.csv layout.
+    """
+    df = cache.cached("positions", (), max_age, lambda: process(scrape_sportsws_positions(session=session)))
+    return owners.merge(df, owner_lookup)
@@ -0,0 +1,86 @@
+import pandas as pd
+
+from utils.scrape_nba import scrape_nba_totals
+from utils.text_formatter import make_player_key
+
+from dmcb import cache
+
+# Season year of the current stats (2026 for the 2025-26 season)
+CURRENT_YEAR = 2026
+
+# Columns that require numeric conversion
+NUMERIC_COLUMNS = ["PTS", "TRB", "AST", "STL", "BLK", "TOV", "PF", "G", "MP"]
+
+# Column order of nba_stats.csv
+COLUMN_ORDER = [
+    "Player", "Age", "Team", "Pos", "G", "GS", "MP", "FG", "FGA", "FG%",
+    "3P", "3PA", "3P%", "2P", "2PA", "2P%", "eFG%", "FT", "FTA", "FT%",
+    "ORB", "DRB", "TRB", "AST", "STL", "BLK", "TOV", "PF", "PTS",
+    "Trp-Dbl", "Awards", "Player Link", "Team Link", "Player Key",
+    "FP", "FPPG", "FPPM", "MPG", "FPR"
+]
+
+# Columns filled with "" (rather than 0) when the source does not provide them
+TEXT_COLUMNS = [
+    "Trp-Dbl", "Awards", "Age", "Pos", "GS", "FG", "FGA", "FG%",
+    "3P", "3PA", "3P%", "2P", "2PA", "2P%", "eFG%", "FT", "FTA", "FT%",
+    "ORB", "DRB",
+]
+
+
+def process(df):
+    """
+    Compute the fantasy metrics for raw season totals.
+
+    Args:
+        df (pd.DataFrame): Raw output of scrape_nba_totals().
+
+    Returns:
+        pd.DataFrame: Stats in the nba_stats.csv column order, sorted by Player Key.
+    """
+    # Remove any aggregate rows and missing player names
+    df = df[df["Player"] != "League Average"].dropna(subset=["Player"]).copy()
+
+    # Generate Player Key
+    df["Player Key"] = df["Player"].apply(make_player_key)
+
+    # Add Player Link and Team Link
+    df["Player Link"] = df["Player Key"].apply(lambda x: f"https://www.nba.com/player/{x}")
+    df["Team Link"] = df["Team"].apply(lambda x: f"https://www.nba.com/team/{x}")
+
+    # Convert numeric columns
+    df[NUMERIC_COLUMNS] = df[NUMERIC_COLUMNS].apply(pd.to_numeric, errors="coerce").fillna(0)
+
+    # Round minutes to whole numbers
+    df["MP"] = df["MP"].round(0).astype(int)
+
+    # Compute fantasy metrics
+    df["FP"] = (df["PTS"] + df["TRB"] + df["AST"] + df["STL"] + df["BLK"]
+                - df["TOV"] - df["PF"]).astype(int)
+    df["FPPG"] = (df["FP"] / df["G"]).round(1)
+    df["FPPM"] = (df["FP"] / df["MP"]).round(2)
+    df["MPG"] = (df["MP"] / df["G"]).round(1)
+    df["FPR"] = ((df["FP"] ** 2) / (df["G"] * df["MP"])).round(1)
+
+    # Ensure all columns exist in df, fill missing with default 0 or empty string
+    for col in COLUMN_ORDER:
+        if col not in df.columns:
+            df[col] = "" if col in TEXT_COLUMNS else 0
+
+    # Reorder columns and sort by Player Key
+    return df[COLUMN_ORDER].sort_values(by="Player Key").reset_index(drop=True)
+
+
+def fetch(year=CURRENT_YEAR, session=None, max_age=None):
+    """
+    Pull a season's player totals from stats.nba.com and compute the fantasy metrics.
+
+    Args:
+        year (int): NBA season year (e.g., 2026 for the 2025-26 season).
+        session (requests.Session, optional): Session to use instead of the shared pooled client.
+        max_age (float, optional): Reuse a pull from this process up to this many seconds old.
+
+    Returns:
+        pd.DataFrame: Stats in the nba_stats.csv layout.
+    """
+    return cache.cached("stats", (year,), max_age, lambda: process(scrape_nba_totals(year, session=session)))
@@ -0,0 +1,140 @@
+import os
+import sys
+import logging
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Input and output file settings
+output_dir = "data"
+os.makedirs(output_dir, exist_ok=True)
+archive_dir = os.path.join(output_dir, "spotrac_archive")
+current_csv = os.path.join(output_dir, "spotrac_contracts.csv")
+output_csv = os.path.join(output_dir, "contract_changes.csv")
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import required utilities
+from utils.snapshot_diff import diff_archive, snapshot_files
+from utils.google_sheets_manager import GoogleSheetsManager
+from utils import output_manifest, telemetry
+
+
+def main(update_csv=True, update_sheets=False, sheet_name="Changes", since=None, sheets_manager=None):
+    """
+    Build the change log across the Spotrac contract archive and the live contracts.
+
+    Args:
+        update_csv (bool): If True, save the change log to CSV.
+        update_sheets (bool): If True, update Google Sheets with the change log.
+        sheet_name (str): Google Sheets tab name to update.
+        since (str, optional): Only diff snapshots from this label on (e.g., "2026").
+        sheets_manager (GoogleSheetsManager, optional): Shared Google Sheets client.
+
+    Returns:
+        pd.DataFrame: One row per added, removed, team-changed or salary-changed entry.
+    """
+    files = snapshot_files(archive_dir=archive_dir, current_csv=current_csv)
+    if since is not None:
+        labels = list(files)
+        files = {label: files[label] for label in labels[labels.index(since):]} if since in files else files
+    df = diff_archive(files)
+    logger.info(f"{len(df)} contract changes across {len(files)} snapshots")
+
+    # Save to CSV
+    if update_csv:
+        try:
+            if output_manifest.write_csv(df, output_csv):
+                logger.info(f"Contract changes saved to CSV: {output_csv}")
+        except Exception as e:
+            logger.error(f"Error saving CSV: {e}")
+
+    # Update Google Sheets
+    if update_sheets:
+        try:
+            sheet_df = df.fillna("")
+            payload = [sheet_df.columns.tolist()] + sheet_df.values.tolist()
+            if not output_manifest.sheet_unchanged(sheet_name, payload):
+                sheets_manager = sheets_manager or GoogleSheetsManager()
+                sheets_manager.clear_data(sheet_name=sheet_name)
+                sheets_manager.write_data(payload, sheet_name=sheet_name)
+                output_manifest.record_push(sheet_name, payload)
+                logger.info(f"Contract changes successfully written to Google Sheets: {sheet_name}")
+        except Exception as e:
+            logger.error(f"Error updating Google Sheets: {e}")
+
+    return df
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Diff the Spotrac contract snapshots into a change log.")
+
+    # Mutually exclusive group for CSV updating
+    csv_group = parser.add_mutually_exclusive_group()
+    csv_group.add_argument(
+        "--update-csv",
+        action="store_true",
+        dest="update_csv",
+        help="Save the change log to CSV (default)",
+    )
+    csv_group.add_argument(
+        "--no-update-csv",
+        action="store_false",
+        dest="update_csv",
+        help="Do not save the change log to CSV",
+    )
+    parser.set_defaults(update_csv=True)
+
+    # Mutually exclusive group for Sheets updating
+    sheets_group = parser.add_mutually_exclusive_group()
+    sheets_group.add_argument(
+        "--update-sheets",
+        action="store_true",
+        dest="update_sheets",
+        help="Update Google Sheets with results",
+    )
+    sheets_group.add_argument(
+        "--no-update-sheets",
+        action="store_false",
+        dest="update_sheets",
+        help="Do not update Google Sheets (default)",
+    )
+    parser.set_defaults(update_sheets=False)
+
+    parser.add_argument(
+        "--sheet",
+        dest="sheet_name",
+        type=str,
+        default="Changes",
+        help="Google Sheets tab name to update",
+    )
+    parser.add_argument(
+        "--since",
+        type=str,
+        default=None,
+        help="Only diff snapshots from this label on (an archive year or 'current')",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("diff_contracts", profile=args.profile):
+        main(
+            update_csv=args.update_csv,
+            update_sheets=args.update_sheets,
+            sheet_name=args.sheet_name,
+            since=args.since,
+        )
@@ -0,0 +1,75 @@
+import os
+import sys
+import logging
+import argparse
+import pandas as pd
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Input file settings
+contracts_csv = os.path.join("data", "spotrac_contracts.csv")
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import required utilities
+from utils.salary_cap import CapTable
+from utils.trade_evaluator import TradeEvaluator
+from scripts.get_salary_cap import load_cap_inputs
+
+
+def main(owner_a, owner_b, a_sends=2, b_sends=1, legal_only=False, output_csv=None):
+    """
+    Score every trade of a_sends players from owner A for b_sends players from owner B.
+
+    Args:
+        owner_a (str): First owner.
+        owner_b (str): Second owner.
+        a_sends (int): Players sent by owner A in each trade.
+        b_sends (int): Players sent by owner B in each trade.
+        legal_only (bool): Only keep trades that are cap- and roster-legal.
+        output_csv (str, optional): Save the scored trades to this CSV.
+
+    Returns:
+        pd.DataFrame: The scored trades, best savings for owner A first.
+    """
+    dead_money, cap_holds = load_cap_inputs()
+    evaluator = TradeEvaluator(CapTable(pd.read_csv(contracts_csv), dead_money=dead_money, cap_holds=cap_holds))
+
+    trades = evaluator.evaluate(evaluator.candidate_trades(owner_a, owner_b, a_sends, b_sends))
+    if legal_only:
+        trades = trades[trades["Legal"]]
+    trades = trades.sort_values(f"A Net {evaluator.table.seasons[0]}", kind="mergesort").reset_index(drop=True)
+    logger.info(f"{len(trades)} trades scored ({int(trades['Legal'].sum())} legal).")
+
+    if output_csv:
+        trades.to_csv(output_csv, index=False, encoding="utf-8")
+        logger.info(f"Trades saved to CSV: {output_csv}")
+    return trades
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score candidate trades between two owners for cap and roster legality.")
+    parser.add_argument("owner_a", help="Owner sending --a-sends players")
+    parser.add_argument("owner_b", help="Owner sending --b-sends players")
+    parser.add_argument("--a-sends", dest="a_sends", type=int, default=2, help="Players owner A sends (default 2)")
+    parser.add_argument("--b-sends", dest="b_sends", type=int, default=1, help="Players owner B sends (default 1)")
+    parser.add_argument("--legal-only", dest="legal_only", action="store_true", help="Only list legal trades")
+    parser.add_argument("--output", dest="output_csv", default=None, help="Save the scored trades to this CSV")
+    args = parser.parse_args()
+
+    trades = main(
+        owner_a=args.owner_a,
+        owner_b=args.owner_b,
+        a_sends=args.a_sends,
+        b_sends=args.b_sends,
+        legal_only=args.legal_only,
+        output_csv=args.output_csv,
+    )
+    print(trades.head(25).to_string())
@@ -5,8 +5,6 @@ import pandas as pd
 import time
 import re
 import argparse
-import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # -------------------------------------------------
 # Paths
@@ -28,10 +26,21 @@ logger.info("get_contract_types.py started successfully.")
 # -------------------------------------------------
 # Imports
 # -------------------------------------------------
+from utils import output_manifest, telemetry
 from utils.google_sheets_manager import GoogleSheetsManager
-from utils.scrape_spotrac import scrape_player_contracts, HEADERS
+from utils.scrape_spotrac import PLAYER_FIELDS, scrape_player_records
 from utils.text_formatter import make_title_case
 
+# contract_types.csv columns: player identity, the extracted contract record and why any
+# field could not be read
+OUTPUT_COLUMNS = ["Player", "Player Link", "Player Key"] + PLAYER_FIELDS + ["Parse Errors"]
+
+# Whole-number fields, kept as nullable integers so blanks don't turn them into floats
+INTEGER_COLUMNS = [
+    "Contract Years", "Contract Value", "Average Salary", "Guaranteed at Signing",
+    "Total Guaranteed", "Free Agent Year",
+]
+
 
 # -------------------------------------------------
 # Helpers
@@ -73,14 +82,32 @@ def get_links_to_scrape(unique_links, output_csv_path):
 # -------------------------------------------------
 # Main
 # -------------------------------------------------
-def main(update_csv=False, update_sheets=True, sheet_name="Contract Types"):
-    logger.info(f"Loading Spotrac source data: {input_csv}")
+def main(update_csv=False, update_sheets=True, sheet_name="Contract Types",
+         salary_data=None, session=None, sheets_manager=None, max_players=None, parse_workers=None):
+    """
+    Scrape Spotrac player pages for contract types and optionally export them.
+
+    Args:
+        update_csv (bool): Scrape missing players and rewrite the CSV.
+        update_sheets (bool): Push the CSV contents to Google Sheets.
+        sheet_name (str): Google Sheets tab name to update.
+        salary_data (pd.DataFrame, optional): Contracts frame to use instead of reading input_csv.
+        session (requests.Session, optional): Shared HTTP session for the player pages.
+        sheets_manager (GoogleSheetsManager, optional): Shared Google Sheets client.
+        max_players (int, optional): Scrape at most this many player pages in this run.
+        parse_workers (int, optional): Processes parsing the player pages (default: CPU count).
+
+    Returns:
+        pd.DataFrame or None: The contract types table, or None if the source data is unavailable.
+    """
+    if salary_data is None:
+        logger.info(f"Loading Spotrac source data: {input_csv}")
 
-    try:
-        salary_data = pd.read_csv(input_csv)
-    except Exception as e:
-        logger.error(f"Failed to load {input_csv}: {e}")
-        return
+        try:
+            salary_data = pd.read_csv(input_csv)
+        except Exception as e:
+            logger.error(f"Failed to load {input_csv}: {e}")
+            return
 
     # -------------------------------------------------
     # Active players only
@@ -105,10 +132,13 @@ def main(update_csv=False, update_sheets=True, sheet_name="Contract Types"):
     if update_csv:
         if os.path.exists(output_csv):
             existing_df = pd.read_csv(output_csv)
+            # Widen files written before the full record was extracted (new fields stay
+            # empty until the player's next visit)
+            if list(existing_df.columns) != OUTPUT_COLUMNS:
+                existing_df = existing_df.reindex(columns=OUTPUT_COLUMNS)
+                existing_df.to_csv(output_csv, index=False)
         else:
-            existing_df = pd.DataFrame(
-                columns=["Player", "Player Link", "Player Key", "Signed Using", "Drafted"]
-            )
+            existing_df = pd.DataFrame(columns=OUTPUT_COLUMNS)
             existing_df.to_csv(output_csv, index=False)
 
         cleaned_df = pd.read_csv(output_csv)
@@ -123,13 +153,16 @@ def main(update_csv=False, update_sheets=True, sheet_name="Contract Types"):
         # If all players have been scraped, reset and start from the beginning
         if len(to_scrape) == 0 and len(existing_links) > 0:
             logger.info("All players have been scraped. Resetting and starting from the beginning.")
-            existing_df = pd.DataFrame(
-                columns=["Player", "Player Link", "Player Key", "Signed Using", "Drafted"]
-            )
+            existing_df = pd.DataFrame(columns=OUTPUT_COLUMNS)
             existing_df.to_csv(output_csv, index=False)
             existing_links = set()
             to_scrape = unique_links
 
+        # Respect the per-run page budget; the rest are picked up by the next run
+        if max_players is not None and len(to_scrape) > max_players:
+            logger.info(f"Limiting this run to {max_players} of {len(to_scrape)} players")
+            to_scrape = to_scrape[:max_players]
+
         # -------------------------------------------------
         # Fast lookup dict (thread-safe)
         # -------------------------------------------------
@@ -141,58 +174,46 @@ def main(update_csv=False, update_sheets=True, sheet_name="Contract Types"):
         )
 
         # -------------------------------------------------
-        # Threaded scraping (BIG WIN)
+        # Threaded fetching + process-pool parsing
         # -------------------------------------------------
         start_time = time.time()
 
-        with requests.Session() as session:
-            session.headers.update(HEADERS)
-
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                futures = {
-                    executor.submit(scrape_player_contracts, link, session): link
-                    for link in to_scrape
-                }
-
-                for idx, future in enumerate(as_completed(futures), start=1):
-                    link = futures[future]
-                    meta = player_lookup.get(link)
-
-                    if not meta:
-                        continue
-
-                    player_name = meta["Player"]
-                    player_key = meta["Player Key"]
-
-                    try:
-                        signed_using, drafted = future.result()
-                        signed_using = make_title_case(signed_using)
-                    except Exception as e:
-                        logger.warning(f"Failed to scrape {player_name}: {e}")
-                        continue
-
-                    row = {
-                        "Player": player_name,
-                        "Player Link": link,
-                        "Player Key": player_key,
-                        "Signed Using": signed_using,
-                        "Drafted": drafted,
-                    }
-
-                    pd.DataFrame([row]).to_csv(
-                        output_csv, mode="a", header=False, index=False
-                    )
-
-                    # ETA logging
-                    elapsed = time.time() - start_time
-                    rate = elapsed / idx
-                    remaining = rate * (len(to_scrape) - idx)
-
-                    logger.info(
-                        f"Processed {idx}/{len(to_scrape)} "
-                        f"- {player_name} | "
-                        f"ETA {int(remaining//60):02d}:{int(remaining%60):02d}"
-                    )
+        # Fetch threads share the pooled HTTP client (or the caller's session) and feed
+        # the page bytes to a parse process pool; each page is visited once for the
+        # whole record
+        for idx, (link, record) in enumerate(
+            scrape_player_records(to_scrape, session=session, parse_workers=parse_workers), start=1
+        ):
+            meta = player_lookup.get(link)
+
+            if not meta:
+                continue
+
+            player_name = meta["Player"]
+            player_key = meta["Player Key"]
+            record["Signed Using"] = make_title_case(record["Signed Using"])
+
+            row = {
+                "Player": player_name,
+                "Player Link": link,
+                "Player Key": player_key,
+                **record,
+            }
+
+            pd.DataFrame([row], columns=OUTPUT_COLUMNS).to_csv(
+                output_csv, mode="a", header=False, index=False
+            )
+
+            # ETA logging
+            elapsed = time.time() - start_time
+            rate = elapsed / idx
+            remaining = rate * (len(to_scrape) - idx)
+
+            logger.info(
+                f"Processed {idx}/{len(to_scrape)} "
+                f"- {player_name} | "
+                f"ETA {int(remaining//60):02d}:{int(remaining%60):02d}"
+            )
 
         # -------------------------------------------------
         # Post-processing / cleanup
@@ -217,7 +238,8 @@ def main(update_csv=False, update_sheets=True, sheet_name="Contract Types"):
         )
 
         df = df[~exclude_mask].sort_values("Player Key", ignore_index=True)
-        df.to_csv(output_csv, index=False)
+        df[INTEGER_COLUMNS] = df[INTEGER_COLUMNS].astype("Int64")
+        output_manifest.write_csv(df, output_csv)
 
         logger.info(
             f"Filtered expired RFA/UFA contracts (≤ {first_year})"
@@ -226,31 +248,40 @@ def main(update_csv=False, update_sheets=True, sheet_name="Contract Types"):
     # -------------------------------------------------
     # Google Sheets update
     # -------------------------------------------------
+    df = pd.read_csv(output_csv) if os.path.exists(output_csv) else None
+
     if update_sheets:
         try:
-            df = pd.read_csv(output_csv).fillna("")
-            sheets = GoogleSheetsManager()
+            sheet_df = df.fillna("")
+            payload = [sheet_df.columns.tolist()] + sheet_df.values.tolist()
 
-            sheets.clear_range(sheet_name=sheet_name, range_to_clear="A:E")
+            if not output_manifest.sheet_unchanged(sheet_name, payload):
+                sheets = sheets_manager or GoogleSheetsManager()
 
-            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-            sheets.write_data(
-                [[f"Last updated {timestamp} by {sheets.service_account_email}"]],
-                sheet_name=sheet_name,
-                start_cell="A1",
-            )
+                last_column = chr(ord("A") + len(OUTPUT_COLUMNS) - 1)
+                sheets.clear_range(sheet_name=sheet_name, range_to_clear=f"A:{last_column}")
 
-            sheets.write_data(
-                [df.columns.tolist()] + df.values.tolist(),
-                sheet_name=sheet_name,
-                start_cell="A2",
-            )
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+                sheets.write_data(
+                    [[f"Last updated {timestamp} by {sheets.service_account_email}"]],
+                    sheet_name=sheet_name,
+                    start_cell="A1",
+                )
+
+                sheets.write_data(
+                    payload,
+                    sheet_name=sheet_name,
+                    start_cell="A2",
+                )
+                output_manifest.record_push(sheet_name, payload)
 
-            logger.info(f"Google Sheets '{sheet_name}' updated successfully")
+                logger.info(f"Google Sheets '{sheet_name}' updated successfully")
 
         except Exception as e:
             logger.error(f"Google Sheets update failed: {e}")
 
+    return df
+
 
 # -------------------------------------------------
 # CLI
@@ -277,10 +308,26 @@ if __name__ == "__main__":
         help="Google Sheets tab name",
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--max-players",
+        dest="max_players",
+        type=int,
+        default=None,
+        help="Scrape at most this many player pages in this run",
+    )
 
-    main(
-        update_csv=args.update_csv,
-        update_sheets=args.update_sheets,
-        sheet_name=args.sheet_name,
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
     )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("get_contract_types", profile=args.profile):
+        main(
+            update_csv=args.update_csv,
+            update_sheets=args.update_sheets,
+            sheet_name=args.sheet_name,
+            max_players=args.max_players,
+        )
@@ -2,7 +2,6 @@ import os
 import sys
 import logging
 import argparse
-import re
 import pandas as pd
 import time
 
@@ -34,29 +33,41 @@ os.makedirs(output_dir, exist_ok=True)
 output_csv = os.path.join(output_dir, output_file)
 
 # Import utility functions and modules
-from utils.scrape_spotrac import scrape_all_teams
-from utils.text_formatter import make_player_key, make_title_case
+import dmcb
+from utils.salary_codec import SalaryTable
 from utils.google_sheets_manager import GoogleSheetsManager
+from utils import output_manifest, telemetry
+from scripts import get_owners
 
 
-def merge_owner_from_google_sheets(df, sheet_name="Contracts"):
-    """Merge owner values from the Google Sheets Contracts tab using Player Key."""
+def load_owner_lookup(sheet_name="Contracts", sheets_manager=None):
+    """
+    Read the Player Key -> Owner mapping from column Q of the Google Sheets Contracts tab.
+
+    Args:
+        sheet_name (str): The worksheet holding the owner column.
+        sheets_manager (GoogleSheetsManager, optional): Shared client to reuse. A new one is
+            created when omitted.
+
+    Returns:
+        dict or None: The owner lookup, or None if the sheet could not be read.
+    """
     try:
-        sheets_manager = GoogleSheetsManager()
+        sheets_manager = sheets_manager or GoogleSheetsManager()
         raw_data = sheets_manager.read_data(sheet_name=sheet_name)
     except Exception as e:
         logging.warning(f"Could not read owner data from Google Sheets '{sheet_name}': {e}")
-        return df
+        return None
 
     if not raw_data:
-        return df
+        return None
 
     header = raw_data[0]
     rows = raw_data[1:] if len(raw_data) > 1 else []
 
     if len(header) <= 16:
         logging.warning("Google Sheets 'Contracts' tab does not contain the expected owner column (Q).")
-        return df
+        return None
 
     owner_df = pd.DataFrame(rows, columns=[str(col).strip() for col in header])
     owner_df = owner_df.iloc[:, [0, 1, 2, 16]].copy()
@@ -72,19 +83,18 @@ def merge_owner_from_google_sheets(df, sheet_name="Contracts"):
         owner = row["Owner"]
         owner_lookup.setdefault(key, owner)
 
-    if df.empty:
-        return df
+    return owner_lookup
 
-    merged_df = df.copy()
-    merged_df["Player Key"] = merged_df["Player Key"].astype(str).str.strip()
-    merged_df["Owner"] = merged_df["Player Key"].map(owner_lookup)
-    merged_df["Owner"] = merged_df["Owner"].replace({None: ""}).fillna("")
 
-    other_columns = [col for col in merged_df.columns if col != "Owner"]
-    return merged_df[other_columns + ["Owner"]]
+def merge_owner_from_google_sheets(df, sheet_name="Contracts", sheets_manager=None, owner_lookup=None):
+    """Merge owner values from the Google Sheets Contracts tab using Player Key."""
+    if owner_lookup is None:
+        owner_lookup = load_owner_lookup(sheet_name=sheet_name, sheets_manager=sheets_manager)
+    return dmcb.owners.merge(df, owner_lookup)
 
 
-def main(update_csv=True, update_sheets=False, sheet_name="Contracts", data_range="A1:L751"):
+def main(update_csv=True, update_sheets=False, sheet_name="Contracts", data_range="A1:L751",
+         session=None, sheets_manager=None, owner_lookup=None):
     """
     Main function to scrape Spotrac data, process it, and optionally save it to a CSV file
     and/or update Google Sheets.
@@ -93,6 +103,12 @@ def main(update_csv=True, update_sheets=False, sheet_name="Contracts", data_rang
         update_csv (bool): Whether to save the data to a CSV file.
         update_sheets (bool): Whether to update the data in Google Sheets.
         sheet_name (str): The name of the Google Sheets tab to update.
+        session (requests.Session, optional): Shared HTTP session for the scrape.
+        sheets_manager (GoogleSheetsManager, optional): Shared Google Sheets client.
+        owner_lookup (dict, optional): Pre-loaded Player Key -> Owner mapping.
+
+    Returns:
+        pd.DataFrame: The processed contracts (including Owner when available).
     """
     if not update_csv:
         # Load existing CSV instead of scraping
@@ -103,97 +119,70 @@ def main(update_csv=True, update_sheets=False, sheet_name="Contracts", data_rang
             logging.error(f"CSV file not found at {output_csv}. Cannot proceed with --no-update-csv.")
             sys.exit(1)
     else:
-        # Full scraping workflow
+        # Full scraping workflow (scrape and process in the library)
         logging.info("Starting data scrape from Spotrac...")
         try:
-            df = scrape_all_teams()
-            if df is None or df.empty:
-                raise ValueError("No data was returned from the scrape.")
+            df = dmcb.contracts.fetch(session=session)
         except Exception as e:
             logging.error(f"Data scrape failed: {e}")
             sys.exit(1)
     
-        # Process the DataFrame if valid data is returned
-        logging.info("Processing scraped data...")
-        try:
-            # Exclude rows where Player is "Incomplete Roster Charge"
-            df = df[df["Player"] != "Incomplete Roster Charge"]
-
-            # Add derived columns for Player Key and Team Link
-            df["Player Key"] = df["Player"].apply(make_player_key)
-            df["Team Link"] = df["Team"].apply(lambda team: f"https://www.spotrac.com/nba/{team}/yearly")
-            
-            # Format the Team column to Title Case
-            df["Team"] = df["Team"].apply(make_title_case)
-            
-            # Sort by Player Key then Team for consistency
-            df = df.sort_values(by=["Player Key", "Team"], ignore_index=True)
-            
-            # Dynamically reorder columns
-            required_columns = ["Player", "Player Link", "Player Key", "Team", "Team Link", "Position", "Age"]
-            dynamic_columns = [col for col in df.columns if col.startswith("20")]
-            column_order = required_columns + dynamic_columns
-            
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                raise ValueError(f"Missing required columns: {missing_columns}")
-            
-            df = df[column_order]
-
-        except Exception as e:
-            logging.error(f"Error during data processing: {e}")
-            sys.exit(1)
-    
-    df = merge_owner_from_google_sheets(df, sheet_name=sheet_name)
+    # Owners come from the league's Sports.ws rosters (the saved ones when not refreshing);
+    # the Sheets owner column is the fallback
+    if owner_lookup is None:
+        if update_csv:
+            owner_lookup = get_owners.main(update_csv=update_csv, session=session)
+        else:
+            owner_lookup = get_owners.saved_lookup()
+
+    df = merge_owner_from_google_sheets(
+        df, sheet_name=sheet_name, sheets_manager=sheets_manager, owner_lookup=owner_lookup
+    )
 
     # Save the processed data to a CSV file
     if update_csv:
         try:
-            df.to_csv(output_csv, mode="w", index=False, encoding="utf-8")
-            logging.info(f"Data successfully saved to {output_csv}")
+            if output_manifest.write_csv(df, output_csv):
+                logging.info(f"Data successfully saved to {output_csv}")
         except Exception as e:
             logging.error(f"Failed to save data to CSV: {e}")
     
+    # Keep the CSV representation for the caller; the Sheets export works on a copy
+    result_df = df
+
     # Update the Google Sheets document if requested
     if update_sheets:
-        # Identify salary/year columns (those starting with '20', e.g., '2025-26')
-        salary_cols = [col for col in df.columns if re.match(r"20\d{2}-\d{2}", col)]
-
-        # Convert any column like '2025-26' to numeric if it has strings with $
-        for col in salary_cols:
-            # Remove $ and commas, convert numeric values to float, leave text as-is
-            df[col + "_numeric"] = pd.to_numeric(df[col].replace(r'[\$,]', '', regex=True), errors='coerce')
-            # Replace numeric values in the original column, leave non-numeric as text
-            df[col] = df[col + "_numeric"].combine_first(df[col])
-            # Drop temporary numeric helper column
-            df.drop(columns=[col + "_numeric"], inplace=True)
-
-        # Clean up before updating Google Sheets
-        df = df.replace([pd.NA, None, float("inf"), float("-inf")], "")
-        df = df.fillna("")
+        # Parse the salary cells once: salaries go to Sheets as numbers, statuses as text
+        df = SalaryTable.from_frame(df).sheets_frame()
+
+        # Exclude the Owner column from the sheet write so it does not overwrite column M
+        write_df = df.drop(columns=["Owner"]) if "Owner" in df.columns else df.copy()
+        payload = [write_df.columns.tolist()] + write_df.values.tolist()
 
         logging.info(f"Updating Google Sheets: {sheet_name}")
         try:
-            # Generate a timestamp for logging and data tracking
-            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-
-            # Initialize the Google Sheets manager and clear the target range
-            sheets_manager = GoogleSheetsManager()
-            sheets_manager.clear_range(sheet_name=sheet_name, range_to_clear=data_range)
-
-            # Exclude the Owner column from the sheet write so it does not overwrite column M
-            write_df = df.drop(columns=["Owner"]) if "Owner" in df.columns else df.copy()
-
-            # Write the processed data frame to the sheet starting from cell A1
-            sheets_manager.write_data([write_df.columns.tolist()] + write_df.values.tolist(), sheet_name=sheet_name, start_cell="A1")
-            logging.info("Google Sheets updated successfully.")
-
-            # Write the timestamp to Google Sheets
-            sheets_manager.write_data([[f"{timestamp}"]], sheet_name=sheet_name, start_cell="AB2")
-            logging.info("Wrote timestamp to Google Sheets.")
+            # Skip the clear and both writes when the tab already holds this payload
+            if not output_manifest.sheet_unchanged(sheet_name, payload):
+                # Generate a timestamp for logging and data tracking
+                timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+
+                # Initialize the Google Sheets manager and clear the target range
+                sheets_manager = sheets_manager or GoogleSheetsManager()
+                sheets_manager.clear_range(sheet_name=sheet_name, range_to_clear=data_range)
+
+                # Write the processed data frame to the sheet starting from cell A1
+                sheets_manager.write_data(payload, sheet_name=sheet_name, start_cell="A1")
+                logging.info("Google Sheets updated successfully.")
+
+                # Write the timestamp to Google Sheets
+                sheets_manager.write_data([[f"{timestamp}"]], sheet_name=sheet_name, start_cell="AB2")
+                logging.info("Wrote timestamp to Google Sheets.")
+                output_manifest.record_push(sheet_name, payload)
         except Exception as e:
             logging.error(f"Failed to update Google Sheets: {e}")
 
+    return result_df
+
 # Main execution block
 if __name__ == "__main__":
     logging.info(f"Script execution started: {__file__}")
@@ -247,12 +236,19 @@ if __name__ == "__main__":
         help="Range to clear in Google Sheets before writing."
     )
 
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/."
+    )
+
     args = parser.parse_args()
 
-    main(
-        update_csv=args.update_csv,
-        update_sheets=args.update_sheets,
-        sheet_name=args.sheet_name,
-        data_range=args.data_range
-    )
+    with telemetry.run_session("get_contracts", profile=args.profile):
+        main(
+            update_csv=args.update_csv,
+            update_sheets=args.update_sheets,
+            sheet_name=args.sheet_name,
+            data_range=args.data_range
+        )
     logging.info(f"Script execution completed: {__file__}")
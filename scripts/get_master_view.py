@@ -0,0 +1,129 @@
+import os
+import sys
+import logging
+import pandas as pd
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Input and output file settings
+output_dir = "data"
+os.makedirs(output_dir, exist_ok=True)
+source_csvs = {
+    "contracts": os.path.join(output_dir, "spotrac_contracts.csv"),
+    "contract_types": os.path.join(output_dir, "contract_types.csv"),
+    "stats": os.path.join(output_dir, "nba_stats.csv"),
+    "positions": os.path.join(output_dir, "sportsws_positions.csv"),
+    "owners": os.path.join(output_dir, "owners.csv"),
+}
+output_csv = os.path.join(output_dir, "master_view.csv")
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import required utilities
+from utils.master_view import MasterView
+from utils import output_manifest, telemetry
+
+
+def export(view, update_csv=True):
+    """
+    Save the view to CSV, formatting only the rows changed since the last export.
+
+    The view keeps each row's CSV line between exports (see MasterView.to_csv), so the
+    first export formats every row and later ones only the dirty rows. Without
+    update_csv nothing is written and the dirty marks are kept for the next export.
+
+    Args:
+        view (MasterView): The view to export.
+        update_csv (bool): If True, save the view to CSV.
+    """
+    logger.info(f"Master view: {len(view.dirty)} changed and {len(view.removed)} removed rows since the last export")
+    if update_csv:
+        try:
+            if output_manifest.write_file(output_csv, view.to_csv()):
+                logger.info(f"Master view saved to {output_csv}")
+        except Exception as e:
+            logger.error(f"Error saving CSV: {e}")
+
+
+def main(update_csv=True, frames=None, owner_lookup=None, view=None):
+    """
+    Join every league dataset into one row per player and save it.
+
+    Frames passed in (e.g. by the pipeline or the daemon) are used as-is; anything
+    omitted is read from its CSV. Passing the view from a previous call only recomputes
+    the rows of the sources that changed.
+
+    Args:
+        update_csv (bool): If True, save the view to CSV.
+        frames (dict, optional): Source name -> DataFrame (see utils.master_view.SOURCES).
+        owner_lookup (dict, optional): Player Key -> Owner, used as the owners source.
+        view (MasterView, optional): View to update instead of building a new one.
+
+    Returns:
+        MasterView: The updated view.
+    """
+    frames = dict(frames or {})
+    if owner_lookup:
+        frames["owners"] = pd.DataFrame(list(owner_lookup.items()), columns=["Player Key", "Owner"])
+    view = view or MasterView()
+    for source, csv_path in source_csvs.items():
+        df = frames.get(source)
+        if df is None and source not in view.frames and os.path.exists(csv_path):
+            df = pd.read_csv(csv_path)
+        if df is not None:
+            view.update(source, df)
+
+    for _, row in view.coverage().iterrows():
+        logger.info(f"{row['Source']}: {row['Keys']} players, {row['Unmatched']} in no other source, "
+                    f"missing {row['Missing']} of {len(view.table)}")
+    export(view, update_csv=update_csv)
+    return view
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Join contracts, contract types, stats, positions and owners by player.")
+
+    # Mutually exclusive group for CSV updating
+    csv_group = parser.add_mutually_exclusive_group()
+    csv_group.add_argument(
+        "--update-csv",
+        action="store_true",
+        dest="update_csv",
+        help="Save the master view to CSV (default)",
+    )
+    csv_group.add_argument(
+        "--no-update-csv",
+        action="store_false",
+        dest="update_csv",
+        help="Only report source coverage",
+    )
+    parser.set_defaults(update_csv=True)
+
+    parser.add_argument(
+        "--unmatched",
+        choices=sorted(source_csvs),
+        help="Print the Player Keys of this source that no other source has",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("get_master_view", profile=args.profile):
+        view = main(update_csv=args.update_csv)
+
+    if args.unmatched and args.unmatched in view.frames:
+        print("\n".join(view.unmatched(args.unmatched)))
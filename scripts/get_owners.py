@@ -0,0 +1,138 @@
+import os
+import sys
+import logging
+import pandas as pd
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Output directory and file settings
+output_dir = "data"
+os.makedirs(output_dir, exist_ok=True)
+owners_csv = os.path.join(output_dir, "owners.csv")
+changes_csv = os.path.join(output_dir, "owner_changes.csv")
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import required utilities
+import dmcb
+from utils.scrape_sportsws import LEAGUE_URL
+from utils import output_manifest, telemetry
+
+
+def load_saved_owners(path=owners_csv):
+    """
+    Read the owners saved by the previous run, or None if there are none.
+    """
+    if not os.path.exists(path):
+        return None
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def saved_lookup(path=owners_csv):
+    """
+    Player Key -> Owner from the previous run's owners.csv, or None if there is none.
+    Used by runs that do not refresh data, so they make no Sports.ws request.
+    """
+    previous = load_saved_owners(path)
+    return dmcb.owners.lookup(previous) if previous is not None else None
+
+
+def main(update_csv=True, session=None, league_url=LEAGUE_URL):
+    """
+    Build the Player Key -> Owner mapping from the league's Sports.ws roster pages.
+
+    The rosters are compared with the previous run's owners.csv and every add, drop and
+    trade is logged (and appended to owner_changes.csv). If the league pages cannot be
+    scraped, the previous run's mapping is returned instead. Without a league URL
+    (DMCB_SPORTSWS_LEAGUE unset) nothing is scraped and None is returned, so callers use
+    the Google Sheets owner column.
+
+    Args:
+        update_csv (bool): If True, save the owners and the roster changes to CSV.
+        session (requests.Session, optional): Shared HTTP session for the scrape.
+        league_url (str, optional): League home page on Sports.ws.
+
+    Returns:
+        dict or None: The owner lookup, or None if no league URL is set, or the rosters
+            could not be scraped and no previous run was saved.
+    """
+    if not league_url:
+        logger.info("DMCB_SPORTSWS_LEAGUE is not set; owners will come from Google Sheets.")
+        return None
+
+    previous = load_saved_owners()
+    try:
+        df = dmcb.owners.fetch(session=session, league_url=league_url)
+    except Exception as e:
+        if previous is None:
+            logger.warning(f"Could not scrape Sports.ws rosters: {e}")
+            return None
+        logger.warning(f"Could not scrape Sports.ws rosters ({e}); using {owners_csv}")
+        return dmcb.owners.lookup(previous)
+
+    logger.info(f"Scraped {len(df)} rostered players for {df['Owner'].nunique()} owners.")
+
+    changes = dmcb.owners.diff(previous, df) if previous is not None else None
+    if changes is not None:
+        for _, row in changes.iterrows():
+            logger.info(f"Roster {row['Change']}: {row['Name']} ({row['Old Owner'] or '-'} -> {row['New Owner'] or '-'})")
+
+    if update_csv:
+        try:
+            output_manifest.write_csv(df, owners_csv)
+            if changes is not None and not changes.empty:
+                changes.insert(0, "Date", pd.Timestamp.now().strftime("%Y-%m-%d %H:%M"))
+                log = pd.read_csv(changes_csv, dtype=str, keep_default_na=False) if os.path.exists(changes_csv) else None
+                output_manifest.write_csv(pd.concat([log, changes], ignore_index=True), changes_csv)
+            logger.info(f"Owners saved to CSV: {owners_csv}")
+        except Exception as e:
+            logger.error(f"Error saving CSV: {e}")
+
+    return dmcb.owners.lookup(df)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Map rostered players to their owners from the Sports.ws league pages.")
+
+    # Mutually exclusive group for CSV updating
+    csv_group = parser.add_mutually_exclusive_group()
+    csv_group.add_argument(
+        "--update-csv",
+        action="store_true",
+        dest="update_csv",
+        help="Save the owners and roster changes to CSV (default)",
+    )
+    csv_group.add_argument(
+        "--no-update-csv",
+        action="store_false",
+        dest="update_csv",
+        help="Do not save CSV files",
+    )
+    parser.set_defaults(update_csv=True)
+
+    parser.add_argument(
+        "--league-url",
+        dest="league_url",
+        default=LEAGUE_URL,
+        help="League home page on Sports.ws. Default is $DMCB_SPORTSWS_LEAGUE.",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("get_owners", profile=args.profile):
+        main(update_csv=args.update_csv, league_url=args.league_url)
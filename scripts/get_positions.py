@@ -23,29 +23,40 @@ logger = logging.getLogger()
 logger.info("The script started successfully.")
 
 # Import custom utilities
-from utils.scrape_sportsws import scrape_sportsws_positions
-from utils.text_formatter import make_player_key
+import dmcb
 from utils.google_sheets_manager import GoogleSheetsManager
+from utils import output_manifest, telemetry
+from scripts import get_owners
 
 
-def merge_owner_from_google_sheets(df, sheet_name="Contracts"):
-    """Merge owner values from the Google Sheets Contracts tab using Player Key."""
+def load_owner_lookup(sheet_name="Contracts", sheets_manager=None):
+    """
+    Read the Player Key -> Owner mapping from column Q of the Google Sheets Contracts tab.
+
+    Args:
+        sheet_name (str): The worksheet holding the owner column.
+        sheets_manager (GoogleSheetsManager, optional): Shared client to reuse. A new one is
+            created when omitted.
+
+    Returns:
+        dict or None: The owner lookup, or None if the sheet could not be read.
+    """
     try:
-        sheets_manager = GoogleSheetsManager()
+        sheets_manager = sheets_manager or GoogleSheetsManager()
         raw_data = sheets_manager.read_data(sheet_name=sheet_name)
     except Exception as e:
         logger.warning(f"Could not read owner data from Google Sheets '{sheet_name}': {e}")
-        return df
+        return None
 
     if not raw_data:
-        return df
+        return None
 
     header = raw_data[0]
     rows = raw_data[1:] if len(raw_data) > 1 else []
 
     if len(header) <= 16:
         logger.warning("Google Sheets 'Contracts' tab does not contain the expected owner column (Q).")
-        return df
+        return None
 
     owner_df = pd.DataFrame(rows, columns=[str(col).strip() for col in header])
     owner_df = owner_df.iloc[:, [0, 1, 2, 16]].copy()
@@ -59,19 +70,18 @@ def merge_owner_from_google_sheets(df, sheet_name="Contracts"):
     for _, row in owner_df.iterrows():
         owner_lookup[row["Player Key"]] = row["Owner"]
 
-    if df.empty:
-        return df
+    return owner_lookup
 
-    merged_df = df.copy()
-    merged_df["Player Key"] = merged_df["Player Key"].astype(str).str.strip()
-    merged_df["Owner"] = merged_df["Player Key"].map(owner_lookup)
-    merged_df["Owner"] = merged_df["Owner"].replace({None: ""}).fillna("")
 
-    other_columns = [col for col in merged_df.columns if col != "Owner"]
-    return merged_df[other_columns + ["Owner"]]
+def merge_owner_from_google_sheets(df, sheet_name="Contracts", sheets_manager=None, owner_lookup=None):
+    """Merge owner values from the Google Sheets Contracts tab using Player Key."""
+    if owner_lookup is None:
+        owner_lookup = load_owner_lookup(sheet_name=sheet_name, sheets_manager=sheets_manager)
+    return dmcb.owners.merge(df, owner_lookup)
 
 
-def main(update_csv=True, update_sheets=False, sheet_name="Positions"):
+def main(update_csv=True, update_sheets=False, sheet_name="Positions",
+         session=None, sheets_manager=None, owner_lookup=None):
     """
     Scrape, process, and optionally export Sports.ws player position data.
 
@@ -79,32 +89,36 @@ def main(update_csv=True, update_sheets=False, sheet_name="Positions"):
         update_csv (bool): If True, save processed data to CSV.
         update_sheets (bool): If True, update Google Sheets with processed data.
         sheet_name (str): Google Sheets tab name to update.
+        session (requests.Session, optional): Shared HTTP session for the scrape.
+        sheets_manager (GoogleSheetsManager, optional): Shared Google Sheets client.
+        owner_lookup (dict, optional): Pre-loaded Player Key -> Owner mapping.
+
+    Returns:
+        pd.DataFrame: The processed positions (including Owner when available).
     """
     # Scrape player position data from Sports.ws
-    df = scrape_sportsws_positions()
-
-    # Generate a unique Player Key from the Sports.ws link
-    df["Player Key"] = df["Player Link"].str.replace("https://sports.ws/nba/", "").apply(make_player_key)
-
-    # Remove any rows where Player Key contains "placeholder" (case-insensitive)
-    df = df[~df["Player Key"].str.contains("placeholder", case=False, na=False)].copy()
-
-    # Sort the DataFrame by Player Key for consistency
-    df = df.sort_values(by="Player Key", ignore_index=True)
-
-    # Reorder columns and remove "Team" from output
-    column_order = ["Name", "Player Link", "Player Key", "Position"]
-    df = df[column_order]
-
-    df = merge_owner_from_google_sheets(df, sheet_name="Contracts")
+    df = dmcb.positions.fetch(session=session)
+
+    # Owners come from the league's Sports.ws rosters (the saved ones when not refreshing);
+    # the Sheets owner column is the fallback
+    if owner_lookup is None:
+        if update_csv:
+            owner_lookup = get_owners.main(update_csv=update_csv, session=session)
+        else:
+            owner_lookup = get_owners.saved_lookup()
+
+    df = merge_owner_from_google_sheets(
+        df, sheet_name="Contracts", sheets_manager=sheets_manager, owner_lookup=owner_lookup
+    )
 
     # Export to CSV if requested
     if update_csv:
-        df.to_csv(output_csv, mode="w", index=False, encoding="utf-8")
-        logger.info(f"Data saved to {output_csv}")
+        if output_manifest.write_csv(df, output_csv):
+            logger.info(f"Data saved to {output_csv}")
 
     # Update Google Sheets if requested
-    if update_sheets:
+    payload = [df.columns.tolist()] + df.values.tolist()
+    if update_sheets and not output_manifest.sheet_unchanged(sheet_name, payload):
         try:
             # Generate a timestamp for the update
             timestamp = logging.Formatter('%(asctime)s').format(
@@ -112,7 +126,7 @@ def main(update_csv=True, update_sheets=False, sheet_name="Positions"):
             )
 
             # Initialize Google Sheets manager and clear the target sheet
-            sheets_manager = GoogleSheetsManager()
+            sheets_manager = sheets_manager or GoogleSheetsManager()
             sheets_manager.clear_data(sheet_name=sheet_name)
             logger.info(f"Cleared existing data in Google Sheets '{sheet_name}'.")
 
@@ -126,14 +140,17 @@ def main(update_csv=True, update_sheets=False, sheet_name="Positions"):
 
             # Write the processed data to the sheet starting from cell A2
             sheets_manager.write_data(
-                [df.columns.tolist()] + df.values.tolist(),
+                payload,
                 sheet_name=sheet_name,
                 start_cell="A2"
             )
             logger.info(f"Data successfully written to the '{sheet_name}' sheet.")
+            output_manifest.record_push(sheet_name, payload)
         except Exception as e:
             logger.error(f"Error updating Google Sheets: {e}")
 
+    return df
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Process Spotrac contracts and classify contract types.")
 
@@ -177,10 +194,17 @@ if __name__ == "__main__":
         help="Google Sheets tab name to update",
     )
 
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
     args = parser.parse_args()
 
-    main(
-        update_csv=args.update_csv,
-        update_sheets=args.update_sheets,
-        sheet_name=args.sheet_name
-    )
+    with telemetry.run_session("get_positions", profile=args.profile):
+        main(
+            update_csv=args.update_csv,
+            update_sheets=args.update_sheets,
+            sheet_name=args.sheet_name
+        )
@@ -0,0 +1,142 @@
+import os
+import sys
+import logging
+import pandas as pd
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Input and output file settings
+output_dir = "data"
+os.makedirs(output_dir, exist_ok=True)
+archive_dir = os.path.join(output_dir, "bbref_archive")
+current_csv = os.path.join(output_dir, "nba_stats.csv")
+cache_dir = os.path.join(output_dir, ".cache")
+output_csv = os.path.join(output_dir, "projections.csv")
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import required utilities
+from utils.projections import cached_projections, season_files
+from utils.google_sheets_manager import GoogleSheetsManager
+from utils import output_manifest, telemetry
+
+
+def main(update_csv=True, update_sheets=False, sheet_name="Projections", target_year=None, sheets_manager=None):
+    """
+    Project FPPM, minutes and games for every player from the season archive.
+
+    The archive (data/bbref_archive) plus the in-progress season (data/nba_stats.csv) are
+    hashed, and the projections are only recomputed when one of those files changes.
+
+    Args:
+        update_csv (bool): If True, save the projections to CSV.
+        update_sheets (bool): If True, update Google Sheets with the projections.
+        sheet_name (str): Google Sheets tab name to update.
+        target_year (int, optional): Season to project (e.g., 2027 for 2026-27).
+        sheets_manager (GoogleSheetsManager, optional): Shared Google Sheets client.
+
+    Returns:
+        pd.DataFrame: Projections keyed by Player Key.
+    """
+    files = season_files(archive_dir=archive_dir, current_csv=current_csv)
+    df = cached_projections(files, cache_dir=cache_dir, target_year=target_year)
+
+    # Save to CSV
+    if update_csv:
+        try:
+            if output_manifest.write_csv(df, output_csv):
+                logger.info(f"Projections saved to CSV: {output_csv}")
+        except Exception as e:
+            logger.error(f"Error saving CSV: {e}")
+
+    # Update Google Sheets
+    if update_sheets:
+        try:
+            sheet_df = df.replace([float("inf"), float("-inf")], pd.NA).fillna("")
+            payload = [sheet_df.columns.tolist()] + sheet_df.values.tolist()
+            if not output_manifest.sheet_unchanged(sheet_name, payload):
+                sheets_manager = sheets_manager or GoogleSheetsManager()
+                sheets_manager.clear_data(sheet_name=sheet_name)
+                sheets_manager.write_data(payload, sheet_name=sheet_name)
+                output_manifest.record_push(sheet_name, payload)
+                logger.info(f"Projections successfully written to Google Sheets: {sheet_name}")
+        except Exception as e:
+            logger.error(f"Error updating Google Sheets: {e}")
+
+    return df
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Project player FPPM and minutes from the season archive.")
+
+    # Mutually exclusive group for CSV updating
+    csv_group = parser.add_mutually_exclusive_group()
+    csv_group.add_argument(
+        "--update-csv",
+        action="store_true",
+        dest="update_csv",
+        help="Save projections to CSV (default)",
+    )
+    csv_group.add_argument(
+        "--no-update-csv",
+        action="store_false",
+        dest="update_csv",
+        help="Do not save projections to CSV",
+    )
+    parser.set_defaults(update_csv=True)
+
+    # Mutually exclusive group for Sheets updating
+    sheets_group = parser.add_mutually_exclusive_group()
+    sheets_group.add_argument(
+        "--update-sheets",
+        action="store_true",
+        dest="update_sheets",
+        help="Update Google Sheets with results",
+    )
+    sheets_group.add_argument(
+        "--no-update-sheets",
+        action="store_false",
+        dest="update_sheets",
+        help="Do not update Google Sheets (default)",
+    )
+    parser.set_defaults(update_sheets=False)
+
+    parser.add_argument(
+        "--sheet",
+        dest="sheet_name",
+        type=str,
+        default="Projections",
+        help="Google Sheets tab name to update",
+    )
+    parser.add_argument(
+        "--year",
+        dest="target_year",
+        type=int,
+        default=None,
+        help="Season year to project (default: the season after the latest data)",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("get_projections", profile=args.profile):
+        main(
+            update_csv=args.update_csv,
+            update_sheets=args.update_sheets,
+            sheet_name=args.sheet_name,
+            target_year=args.target_year,
+        )
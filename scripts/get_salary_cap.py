@@ -0,0 +1,160 @@
+import os
+import sys
+import logging
+import pandas as pd
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Input and output file settings
+output_dir = "data"
+os.makedirs(output_dir, exist_ok=True)
+contracts_csv = os.path.join(output_dir, "spotrac_contracts.csv")
+dead_money_csv = os.path.join(output_dir, "dead_money.csv")
+cap_holds_csv = os.path.join(output_dir, "cap_holds.csv")
+output_csv = os.path.join(output_dir, "salary_cap.csv")
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import required utilities
+from utils.salary_cap import CapTable
+from utils.salary_codec import SalaryTable
+from utils.google_sheets_manager import GoogleSheetsManager
+from utils import output_manifest, telemetry
+
+
+def load_cap_inputs():
+    """
+    Read the optional dead-money and cap-hold files maintained by the commissioner.
+
+    data/dead_money.csv has Player, Owner and one column per season (waived guaranteed salary);
+    data/cap_holds.csv has Player Key and Cap Hold (Spotrac's published hold for unsigned RFAs).
+
+    Returns:
+        tuple: (dead money DataFrame or None, cap hold dict)
+    """
+    dead_money = pd.read_csv(dead_money_csv) if os.path.exists(dead_money_csv) else None
+
+    cap_holds = {}
+    if os.path.exists(cap_holds_csv):
+        holds = pd.read_csv(cap_holds_csv)
+        cap_holds = dict(zip(holds["Player Key"], holds["Cap Hold"]))
+    return dead_money, cap_holds
+
+
+def main(update_csv=True, update_sheets=False, sheet_name="Cap", contracts=None, sheets_manager=None):
+    """
+    Compute payroll, cap holds, dead money and cap space for every owner and season.
+
+    Args:
+        update_csv (bool): If True, save the cap table to CSV.
+        update_sheets (bool): If True, update Google Sheets with the cap table.
+        sheet_name (str): Google Sheets tab name to update.
+        contracts (SalaryTable or pd.DataFrame, optional): Contracts already in memory
+            (e.g., parsed by the pipeline's salaries stage). Read from
+            data/spotrac_contracts.csv when omitted.
+        sheets_manager (GoogleSheetsManager, optional): Shared Google Sheets client.
+
+    Returns:
+        CapTable: The computed cap table.
+    """
+    if contracts is None:
+        contracts = SalaryTable.from_frame(pd.read_csv(contracts_csv))
+
+    dead_money, cap_holds = load_cap_inputs()
+    table = CapTable(contracts, dead_money=dead_money, cap_holds=cap_holds)
+    df = table.summary()
+
+    over = df[df["Cap Space"] < 0]
+    for _, row in over.iterrows():
+        logger.warning(f"{row['Owner']} is ${-row['Cap Space']:,} over the cap in {row['Season']}.")
+
+    # Save to CSV
+    if update_csv:
+        try:
+            if output_manifest.write_csv(df, output_csv):
+                logger.info(f"Cap table saved to CSV: {output_csv}")
+        except Exception as e:
+            logger.error(f"Error saving CSV: {e}")
+
+    # Update Google Sheets
+    if update_sheets:
+        try:
+            payload = [df.columns.tolist()] + df.astype(object).values.tolist()
+            if not output_manifest.sheet_unchanged(sheet_name, payload):
+                sheets_manager = sheets_manager or GoogleSheetsManager()
+                sheets_manager.clear_data(sheet_name=sheet_name)
+                sheets_manager.write_data(payload, sheet_name=sheet_name)
+                output_manifest.record_push(sheet_name, payload)
+                logger.info(f"Cap table successfully written to Google Sheets: {sheet_name}")
+        except Exception as e:
+            logger.error(f"Error updating Google Sheets: {e}")
+
+    return table
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compute the league cap table from the contracts CSV.")
+
+    # Mutually exclusive group for CSV updating
+    csv_group = parser.add_mutually_exclusive_group()
+    csv_group.add_argument(
+        "--update-csv",
+        action="store_true",
+        dest="update_csv",
+        help="Save the cap table to CSV (default)",
+    )
+    csv_group.add_argument(
+        "--no-update-csv",
+        action="store_false",
+        dest="update_csv",
+        help="Do not save the cap table to CSV",
+    )
+    parser.set_defaults(update_csv=True)
+
+    # Mutually exclusive group for Sheets updating
+    sheets_group = parser.add_mutually_exclusive_group()
+    sheets_group.add_argument(
+        "--update-sheets",
+        action="store_true",
+        dest="update_sheets",
+        help="Update Google Sheets with results",
+    )
+    sheets_group.add_argument(
+        "--no-update-sheets",
+        action="store_false",
+        dest="update_sheets",
+        help="Do not update Google Sheets (default)",
+    )
+    parser.set_defaults(update_sheets=False)
+
+    parser.add_argument(
+        "--sheet",
+        dest="sheet_name",
+        type=str,
+        default="Cap",
+        help="Google Sheets tab name to update",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("get_salary_cap", profile=args.profile):
+        main(
+            update_csv=args.update_csv,
+            update_sheets=args.update_sheets,
+            sheet_name=args.sheet_name,
+        )
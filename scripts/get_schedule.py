@@ -0,0 +1,103 @@
+import os
+import sys
+import logging
+import pandas as pd
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Output directory and file settings
+output_dir = "data"
+os.makedirs(output_dir, exist_ok=True)
+schedule_csv = os.path.join(output_dir, "nba_schedule.csv")
+windows_csv = os.path.join(output_dir, "game_windows.csv")
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import required utilities
+from utils.schedule_index import ScheduleIndex, fetch_schedule, load_schedule_json
+from utils import output_manifest, telemetry
+
+
+def main(year=2026, update_csv=True, from_json=None):
+    """
+    Build the DMCB game-number windows from the NBA schedule.
+
+    Args:
+        year (int): NBA season year (e.g., 2026 for the 2025-26 season).
+        update_csv (bool): If True, save the schedule and the game windows to CSV.
+        from_json (str, optional): Recorded scheduleleaguev2 response to use instead of the API.
+
+    Returns:
+        ScheduleIndex: The game-number index.
+    """
+    schedule = load_schedule_json(from_json) if from_json else fetch_schedule(year)
+    index = ScheduleIndex(schedule)
+    windows = index.windows()
+    logger.info(f"Indexed {len(schedule)} games into {len(windows)} game-number windows.")
+
+    if update_csv:
+        try:
+            output_manifest.write_csv(schedule, schedule_csv)
+            output_manifest.write_csv(windows, windows_csv)
+            logger.info(f"Schedule saved to CSV: {schedule_csv}, {windows_csv}")
+        except Exception as e:
+            logger.error(f"Error saving CSV: {e}")
+
+    return index
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Map DMCB game numbers to their NBA schedule windows.")
+
+    parser.add_argument(
+        "--year",
+        type=int,
+        default=2026,
+        help="NBA season year (e.g., 2026 for 2025-26 season). Default is 2026."
+    )
+
+    # Mutually exclusive group for CSV updating
+    csv_group = parser.add_mutually_exclusive_group()
+    csv_group.add_argument(
+        "--update-csv",
+        action="store_true",
+        dest="update_csv",
+        help="Save the schedule and windows to CSV (default)",
+    )
+    csv_group.add_argument(
+        "--no-update-csv",
+        action="store_false",
+        dest="update_csv",
+        help="Do not save CSV files",
+    )
+    parser.set_defaults(update_csv=True)
+
+    parser.add_argument(
+        "--from-json",
+        dest="from_json",
+        default=None,
+        help="Build from a recorded scheduleleaguev2 JSON response instead of calling the API",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("get_schedule", profile=args.profile):
+        index = main(year=args.year, update_csv=args.update_csv, from_json=args.from_json)
+
+    now = pd.Timestamp.now(tz="UTC")
+    print(f"Game numbers open now: {index.open_numbers(now) or 'none'}")
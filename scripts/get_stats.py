@@ -22,102 +22,68 @@ logger = logging.getLogger()
 logger.info("Script execution started.")
 
 # Import required utilities
-from utils.scrape_nba import scrape_nba_totals
-from utils.text_formatter import make_player_key
+import dmcb
 from utils.google_sheets_manager import GoogleSheetsManager
-
-# Columns that require numeric conversion
-numeric_columns = ["PTS", "TRB", "AST", "STL", "BLK", "TOV", "PF", "G", "MP"]
-
-def main(year=2026, update_csv=True, update_sheets=False, sheet_name="Stats"):
-    """Scrape NBA stats, compute fantasy metrics, and export CSV/Google Sheets."""
-    
-    # Scrape raw NBA stats
-    df = scrape_nba_totals(year)
-
-    # Remove any aggregate rows and missing player names
-    df = df[df["Player"] != "League Average"].dropna(subset=["Player"])
-
-    # Generate Player Key
-    df["Player Key"] = df["Player"].apply(make_player_key)
-
-    # Add Player Link and Team Link
-    df["Player Link"] = df["Player Key"].apply(lambda x: f"https://www.nba.com/player/{x}")
-    df["Team Link"] = df["Team"].apply(lambda x: f"https://www.nba.com/team/{x}")
-
-    # Convert numeric columns
-    df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors="coerce").fillna(0)
-
-    # Round minutes to whole numbers
-    df["MP"] = df["MP"].round(0).astype(int)
-
-    # Compute fantasy metrics
-    df["FP"] = (df["PTS"] + df["TRB"] + df["AST"] + df["STL"] + df["BLK"]
-                - df["TOV"] - df["PF"]).astype(int)
-    df["FPPG"] = (df["FP"] / df["G"]).round(1)
-    df["FPPM"] = (df["FP"] / df["MP"]).round(2)
-    df["MPG"] = (df["MP"] / df["G"]).round(1)
-    df["FPR"] = ((df["FP"] ** 2) / (df["G"] * df["MP"])).round(1)
-
-    # Reorder columns to match original CSV
-    column_order = [
-        "Player", "Age", "Team", "Pos", "G", "GS", "MP", "FG", "FGA", "FG%",
-        "3P", "3PA", "3P%", "2P", "2PA", "2P%", "eFG%", "FT", "FTA", "FT%",
-        "ORB", "DRB", "TRB", "AST", "STL", "BLK", "TOV", "PF", "PTS",
-        "Trp-Dbl", "Awards", "Player Link", "Team Link", "Player Key",
-        "FP", "FPPG", "FPPM", "MPG", "FPR"
-    ]
-
-    # Ensure all columns exist in df, fill missing with default 0 or empty string
-    for col in column_order:
-        if col not in df.columns:
-            if col in ["Trp-Dbl", "Awards", "Age", "Pos", "GS", "FG","FGA","FG%",
-                       "3P","3PA","3P%","2P","2PA","2P%","eFG%","FT","FTA","FT%",
-                       "ORB","DRB"]:
-                df[col] = ""
-            else:
-                df[col] = 0
-
-    # Reorder columns to match original CSV
-    df = df[column_order]
-
-    # Sort data by Player Key
-    df = df.sort_values(by="Player Key").reset_index(drop=True)
-    logger.info("Data sorted by Player Key.")
+from utils import output_manifest, telemetry
+
+def main(year=2026, update_csv=True, update_sheets=False, sheet_name="Stats", session=None, sheets_manager=None):
+    """
+    Scrape NBA stats, compute fantasy metrics, and export CSV/Google Sheets.
+
+    Args:
+        year (int): NBA season year (e.g., 2026 for the 2025-26 season).
+        update_csv (bool): If True, save processed data to CSV.
+        update_sheets (bool): If True, update Google Sheets with processed data.
+        sheet_name (str): Google Sheets tab name to update.
+        session (requests.Session, optional): Shared HTTP session for the stats.nba.com pull.
+        sheets_manager (GoogleSheetsManager, optional): Shared Google Sheets client.
+
+    Returns:
+        pd.DataFrame: The processed stats with fantasy metrics.
+    """
+    # Scrape raw NBA stats and compute the fantasy metrics
+    df = dmcb.stats.fetch(year, session=session)
+    logger.info(f"Processed {len(df)} players, sorted by Player Key.")
 
     # Save to CSV
     if update_csv:
         try:
             target_csv = output_csv if year == 2026 else os.path.join("data/bbref_archive", f"NBA_{year}_totals.csv")
             os.makedirs(os.path.dirname(target_csv), exist_ok=True)
-            df.to_csv(target_csv, index=False, encoding="utf-8")
-            logger.info(f"Data saved to CSV: {target_csv}")
+            if output_manifest.write_csv(df, target_csv):
+                logger.info(f"Data saved to CSV: {target_csv}")
         except Exception as e:
             logger.error(f"Error saving CSV: {e}")
-            return
+            return df
 
     # Update Google Sheets
     if update_sheets:
         try:
-            sheets_manager = GoogleSheetsManager()
-            sheets_manager.clear_data(sheet_name=sheet_name)
-            timestamp = logging.Formatter('%(asctime)s').format(logging.LogRecord("", 0, "", 0, "", [], None))
-            sheets_manager.write_data(
-                [[f"Last updated {timestamp}"]],
-                sheet_name=sheet_name,
-                start_cell="A1"
-            )
-
             # Clean NaN and Inf values before writing to Google Sheets
             logger.info("Cleaning data before writing to Google Sheets...")
-            df = df.replace([float("inf"), float("-inf")], pd.NA).fillna("")
-
-            # Safely write data to Google Sheets
-            sheets_manager.write_data([df.columns.tolist()] + df.values.tolist(), sheet_name=sheet_name, start_cell="A2")
-            logger.info(f"Data successfully written to Google Sheets: {sheet_name}")
+            sheet_df = df.replace([float("inf"), float("-inf")], pd.NA).fillna("")
+            payload = [sheet_df.columns.tolist()] + sheet_df.values.tolist()
+
+            # The timestamp only moves when the data does; an unchanged payload costs no API calls
+            if not output_manifest.sheet_unchanged(sheet_name, payload):
+                sheets_manager = sheets_manager or GoogleSheetsManager()
+                sheets_manager.clear_data(sheet_name=sheet_name)
+                timestamp = logging.Formatter('%(asctime)s').format(logging.LogRecord("", 0, "", 0, "", [], None))
+                sheets_manager.write_data(
+                    [[f"Last updated {timestamp}"]],
+                    sheet_name=sheet_name,
+                    start_cell="A1"
+                )
+
+                # Safely write data to Google Sheets
+                sheets_manager.write_data(payload, sheet_name=sheet_name, start_cell="A2")
+                output_manifest.record_push(sheet_name, payload)
+                logger.info(f"Data successfully written to Google Sheets: {sheet_name}")
         except Exception as e:
             logger.error(f"Error updating Google Sheets: {e}")
 
+    return df
+
 if __name__ == "__main__":
     import argparse
 
@@ -170,11 +136,18 @@ if __name__ == "__main__":
         help="Google Sheets tab name to update",
     )
 
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
     args = parser.parse_args()
 
-    main(
-        year=args.year,
-        update_csv=args.update_csv,
-        update_sheets=args.update_sheets,
-        sheet_name=args.sheet_name
-    )
+    with telemetry.run_session("get_stats", profile=args.profile):
+        main(
+            year=args.year,
+            update_csv=args.update_csv,
+            update_sheets=args.update_sheets,
+            sheet_name=args.sheet_name
+        )
@@ -0,0 +1,157 @@
+import os
+import sys
+import logging
+import pandas as pd
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Input and output file settings
+output_dir = "data"
+os.makedirs(output_dir, exist_ok=True)
+contracts_csv = os.path.join(output_dir, "spotrac_contracts.csv")
+stats_csv = os.path.join(output_dir, "nba_stats.csv")
+positions_csv = os.path.join(output_dir, "sportsws_positions.csv")
+output_csv = os.path.join(output_dir, "value_table.csv")
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import required utilities
+from utils.salary_codec import SalaryTable
+from utils.value_table import ValueTable
+from utils.google_sheets_manager import GoogleSheetsManager
+from utils import output_manifest, telemetry
+
+
+def load_previous():
+    """
+    Restore the last saved value table so only changed rows are recomputed.
+
+    Returns:
+        ValueTable: The saved table, or an empty one if none exists.
+    """
+    if not os.path.exists(output_csv):
+        return ValueTable()
+    try:
+        return ValueTable.from_frame(pd.read_csv(output_csv, dtype={"Fingerprint": str}))
+    except Exception as e:
+        logger.warning(f"Could not read {output_csv}; rebuilding the value table: {e}")
+        return ValueTable()
+
+
+def main(update_csv=True, update_sheets=False, sheet_name="Value",
+         contracts=None, stats=None, positions=None, sheets_manager=None):
+    """
+    Join contracts, stats and positions into a value-per-dollar table.
+
+    Args:
+        update_csv (bool): If True, save the value table to CSV.
+        update_sheets (bool): If True, update Google Sheets with the value table.
+        sheet_name (str): Google Sheets tab name to update.
+        contracts (SalaryTable or pd.DataFrame, optional): Contracts (defaults to spotrac_contracts.csv).
+        stats (pd.DataFrame, optional): Stats (defaults to nba_stats.csv).
+        positions (pd.DataFrame, optional): Positions (defaults to sportsws_positions.csv).
+        sheets_manager (GoogleSheetsManager, optional): Shared Google Sheets client.
+
+    Returns:
+        pd.DataFrame: One row per contracted player, ranked by surplus value.
+    """
+    contracts = contracts if contracts is not None else SalaryTable.from_frame(pd.read_csv(contracts_csv))
+    stats = stats if stats is not None else pd.read_csv(stats_csv)
+    positions = positions if positions is not None else pd.read_csv(positions_csv)
+
+    value = load_previous()
+    changed = value.refresh(contracts, stats, positions)
+    df = value.table.reset_index(drop=True)
+    logger.info(f"Value table: {len(changed)} of {len(df)} rows recomputed")
+
+    # Save to CSV
+    if update_csv:
+        try:
+            if output_manifest.write_csv(df, output_csv):
+                logger.info(f"Value table saved to CSV: {output_csv}")
+        except Exception as e:
+            logger.error(f"Error saving CSV: {e}")
+
+    # Update Google Sheets
+    if update_sheets:
+        try:
+            sheet_df = df.drop(columns=["Fingerprint"]).fillna("")
+            payload = [sheet_df.columns.tolist()] + sheet_df.values.tolist()
+            if not output_manifest.sheet_unchanged(sheet_name, payload):
+                sheets_manager = sheets_manager or GoogleSheetsManager()
+                sheets_manager.clear_data(sheet_name=sheet_name)
+                sheets_manager.write_data(payload, sheet_name=sheet_name)
+                output_manifest.record_push(sheet_name, payload)
+                logger.info(f"Value table successfully written to Google Sheets: {sheet_name}")
+        except Exception as e:
+            logger.error(f"Error updating Google Sheets: {e}")
+
+    return df
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rank contracts by fantasy value per dollar.")
+
+    # Mutually exclusive group for CSV updating
+    csv_group = parser.add_mutually_exclusive_group()
+    csv_group.add_argument(
+        "--update-csv",
+        action="store_true",
+        dest="update_csv",
+        help="Save the value table to CSV (default)",
+    )
+    csv_group.add_argument(
+        "--no-update-csv",
+        action="store_false",
+        dest="update_csv",
+        help="Do not save the value table to CSV",
+    )
+    parser.set_defaults(update_csv=True)
+
+    # Mutually exclusive group for Sheets updating
+    sheets_group = parser.add_mutually_exclusive_group()
+    sheets_group.add_argument(
+        "--update-sheets",
+        action="store_true",
+        dest="update_sheets",
+        help="Update Google Sheets with results",
+    )
+    sheets_group.add_argument(
+        "--no-update-sheets",
+        action="store_false",
+        dest="update_sheets",
+        help="Do not update Google Sheets (default)",
+    )
+    parser.set_defaults(update_sheets=False)
+
+    parser.add_argument(
+        "--sheet",
+        dest="sheet_name",
+        type=str,
+        default="Value",
+        help="Google Sheets tab name to update",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("get_value_table", profile=args.profile):
+        main(
+            update_csv=args.update_csv,
+            update_sheets=args.update_sheets,
+            sheet_name=args.sheet_name,
+        )
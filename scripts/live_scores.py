@@ -0,0 +1,121 @@
+import os
+import sys
+import logging
+import pandas as pd
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Input and output file settings
+output_dir = "data"
+os.makedirs(output_dir, exist_ok=True)
+schedule_csv = os.path.join(output_dir, "nba_schedule.csv")
+live_csv = os.path.join(output_dir, "live_scores.csv")
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import required utilities
+from scripts import get_owners
+from utils.live_scoring import POLL_INTERVAL, LiveScorer
+from utils.schedule_index import ScheduleIndex, fetch_schedule, load_schedule_csv
+from utils import output_manifest, telemetry
+
+
+def main(number=None, year=2026, update_csv=False, interval=POLL_INTERVAL, max_polls=None):
+    """
+    Keep a live per-owner fantasy point tally for a DMCB game number until its games end.
+
+    Args:
+        number (int, optional): Game number to score (default: the earliest one open now).
+        year (int): NBA season year, used when the schedule has to be fetched.
+        update_csv (bool): If True, rewrite the live standings CSV after every change.
+        interval (float): Seconds between polls.
+        max_polls (int, optional): Stop after this many polls.
+
+    Returns:
+        pd.DataFrame: The final live standings.
+    """
+    schedule = load_schedule_csv(schedule_csv) if os.path.exists(schedule_csv) else fetch_schedule(year)
+    index = ScheduleIndex(schedule)
+    if number is None:
+        open_numbers = index.open_numbers(pd.Timestamp.now(tz="UTC"))
+        if not open_numbers:
+            logger.error("No game number is open right now; pass --game")
+            sys.exit(1)
+        number = open_numbers[0]
+
+    owner_lookup = get_owners.saved_lookup() or get_owners.main(update_csv=False)
+    if not owner_lookup:
+        logger.error("No owner data available; run scripts/get_owners.py first")
+        sys.exit(1)
+
+    scorer = LiveScorer(owner_lookup, index, number)
+    logger.info(f"Scoring game number {number} ({len(scorer.counted)} NBA games)")
+
+    def on_update(scorer, changes):
+        standings = scorer.standings()
+        logger.info("Live: " + ", ".join(f"{owner} {delta:+g}" for owner, delta in sorted(changes.items())))
+        print(standings.to_string(index=False))
+        if update_csv:
+            output_manifest.write_csv(standings.assign(Game=number), live_csv)
+
+    scorer.run(interval=interval, on_update=on_update, max_polls=max_polls)
+    return scorer.standings()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Live per-owner fantasy points for a DMCB game number.")
+
+    parser.add_argument(
+        "--game",
+        type=int,
+        default=None,
+        help="DMCB game number to score. Default is the earliest game number open now.",
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        default=2026,
+        help="NBA season year (e.g., 2026 for 2025-26 season). Default is 2026."
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=POLL_INTERVAL,
+        help=f"Seconds between polls. Default is {POLL_INTERVAL}.",
+    )
+
+    # Mutually exclusive group for CSV updating
+    csv_group = parser.add_mutually_exclusive_group()
+    csv_group.add_argument(
+        "--update-csv",
+        action="store_true",
+        dest="update_csv",
+        help=f"Rewrite {live_csv} after every change",
+    )
+    csv_group.add_argument(
+        "--no-update-csv",
+        action="store_false",
+        dest="update_csv",
+        help="Only print the live standings (default)",
+    )
+    parser.set_defaults(update_csv=False)
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("live_scores", profile=args.profile):
+        main(number=args.game, year=args.year, update_csv=args.update_csv, interval=args.interval)
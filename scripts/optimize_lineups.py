@@ -0,0 +1,107 @@
+import os
+import sys
+import logging
+import pandas as pd
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Input and output file settings
+output_dir = "data"
+os.makedirs(output_dir, exist_ok=True)
+positions_csv = os.path.join(output_dir, "sportsws_positions.csv")
+stats_csv = os.path.join(output_dir, "nba_stats.csv")
+availability_csv = os.path.join(output_dir, "availability.csv")
+output_csv = os.path.join(output_dir, "lineups.csv")
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import required utilities
+from utils.lineup_optimizer import SEASON_GAMES, build_rosters, optimize_season
+from utils import output_manifest, telemetry
+
+
+def main(update_csv=True, games=SEASON_GAMES, positions=None, stats=None):
+    """
+    Allocate the 96 G / 96 F / 48 C lineup minutes for every owner and game number.
+
+    Eligibility comes from sportsws_positions.csv and projected FPPM/minutes from
+    nba_stats.csv. If data/availability.csv exists (Player Key plus one column per game
+    number with the fraction of minutes expected), it scales each player's minutes.
+
+    Args:
+        update_csv (bool): If True, save the lineups to CSV.
+        games (int): Number of fantasy games to solve.
+        positions (pd.DataFrame, optional): Positions already in memory.
+        stats (pd.DataFrame, optional): Stats already in memory.
+
+    Returns:
+        pd.DataFrame: Minutes by slot and projected FP per owner, game and player.
+    """
+    positions = positions if positions is not None else pd.read_csv(positions_csv)
+    stats = stats if stats is not None else pd.read_csv(stats_csv)
+
+    availability = None
+    if os.path.exists(availability_csv):
+        availability = pd.read_csv(availability_csv).set_index("Player Key")
+        availability.columns = [int(col) for col in availability.columns]
+
+    lineups = optimize_season(build_rosters(positions, stats), availability=availability, games=games)
+
+    if update_csv:
+        try:
+            if output_manifest.write_csv(lineups, output_csv):
+                logger.info(f"Lineups saved to CSV: {output_csv}")
+        except Exception as e:
+            logger.error(f"Error saving CSV: {e}")
+
+    return lineups
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Optimize lineup minutes for every owner and game number.")
+
+    # Mutually exclusive group for CSV updating
+    csv_group = parser.add_mutually_exclusive_group()
+    csv_group.add_argument(
+        "--update-csv",
+        action="store_true",
+        dest="update_csv",
+        help="Save lineups to CSV (default)",
+    )
+    csv_group.add_argument(
+        "--no-update-csv",
+        action="store_false",
+        dest="update_csv",
+        help="Do not save lineups to CSV",
+    )
+    parser.set_defaults(update_csv=True)
+
+    parser.add_argument(
+        "--games",
+        type=int,
+        default=SEASON_GAMES,
+        help=f"Number of fantasy games to solve. Default is {SEASON_GAMES}.",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("optimize_lineups", profile=args.profile):
+        lineups = main(update_csv=args.update_csv, games=args.games)
+
+    totals = lineups[lineups["Game"] == 1].groupby("Owner")["Projected FP"].sum()
+    print(totals.sort_values(ascending=False).round(1).to_string())
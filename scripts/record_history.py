@@ -0,0 +1,126 @@
+import os
+import sys
+import logging
+import pandas as pd
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Input file settings (one history per dataset, stored under data/history/)
+output_dir = "data"
+dataset_csvs = {
+    "contracts": os.path.join(output_dir, "spotrac_contracts.csv"),
+    "contract_types": os.path.join(output_dir, "contract_types.csv"),
+    "stats": os.path.join(output_dir, "nba_stats.csv"),
+    "positions": os.path.join(output_dir, "sportsws_positions.csv"),
+}
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import required utilities
+from utils.snapshot_store import HISTORY_DIR, SnapshotStore
+from utils import output_manifest, telemetry
+
+
+def main(frames=None, date=None, root=HISTORY_DIR):
+    """
+    Record a version of every league dataset in the snapshot history.
+
+    Frames passed in (e.g. by the pipeline) are used as-is; anything omitted is read from
+    its CSV. Datasets that did not change since their last version are skipped.
+
+    Args:
+        frames (dict, optional): Dataset name -> DataFrame.
+        date (str, optional): Version date (ISO). Defaults to now.
+        root (str): History directory.
+
+    Returns:
+        dict: Dataset name -> new version entry (None when unchanged).
+    """
+    frames = dict(frames or {})
+    store = SnapshotStore(root)
+    entries = {}
+    for dataset, csv_path in dataset_csvs.items():
+        df = frames.get(dataset)
+        if df is None and os.path.exists(csv_path):
+            df = pd.read_csv(csv_path)
+        if df is None:
+            logger.warning(f"No data for {dataset}; skipping")
+            continue
+        entries[dataset] = store.record(dataset, df, date=date)
+    logger.info(f"History updated: {root}")
+    return entries
+
+
+def as_of(dataset, date, output_csv=None, root=HISTORY_DIR):
+    """
+    Rebuild a dataset as it was on a given date.
+
+    Args:
+        dataset (str): Dataset name (contracts, contract_types, stats, positions).
+        date (str): ISO date or datetime.
+        output_csv (str, optional): Where to write the rebuilt dataset.
+        root (str): History directory.
+
+    Returns:
+        pd.DataFrame or None: The dataset, or None if it has no version that old.
+    """
+    df = SnapshotStore(root).as_of(dataset, date)
+    if df is None:
+        logger.warning(f"No {dataset} version recorded on or before {date}")
+    elif output_csv:
+        output_manifest.write_csv(df, output_csv)
+        logger.info(f"{dataset} as of {date} saved to {output_csv} ({len(df)} rows)")
+    return df
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Record the league CSVs in the versioned history, or rebuild a dataset as of a date."
+    )
+    parser.add_argument(
+        "--as-of",
+        dest="as_of",
+        help="Rebuild --dataset as of this ISO date (e.g., 2026-03-01) instead of recording",
+    )
+    parser.add_argument(
+        "--dataset",
+        choices=sorted(dataset_csvs),
+        default="contracts",
+        help="Dataset to rebuild with --as-of. Default is contracts.",
+    )
+    parser.add_argument(
+        "--output",
+        help="CSV path for the rebuilt dataset (default: print the first rows)",
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Print the versions, checkpoints and disk usage of each history",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("record_history", profile=args.profile):
+        if args.summary:
+            print(SnapshotStore().summary().to_string(index=False))
+        elif args.as_of:
+            df = as_of(args.dataset, args.as_of, output_csv=args.output)
+            if df is not None and not args.output:
+                print(df.head(20).to_string(index=False))
+        else:
+            main()
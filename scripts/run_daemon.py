@@ -0,0 +1,303 @@
+import os
+import sys
+import logging
+import argparse
+import signal
+import threading
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+# Get the root project directory (2 levels up from the current script)
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Append the base_dir to sys.path to ensure modules can be imported
+sys.path.append(base_dir)
+
+# The individual scripts log to files under logs/, so make sure it exists before importing them
+os.makedirs("logs", exist_ok=True)
+
+# Set up logging for the script
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(threadName)s - %(levelname)s - %(message)s",
+    handlers=[
+        logging.FileHandler(os.path.join("logs", "run_daemon.log"), mode="a", encoding="utf-8"),
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+logger = logging.getLogger()
+
+# Import the scheduler, shared resources and the per-source scripts
+from utils import telemetry
+from utils.pipeline import PipelineContext
+from utils.salary_codec import SalaryTable
+from utils.scheduler import RefreshJob, RefreshScheduler, request_refresh
+from scripts import get_contracts, get_contract_types, get_owners, get_stats, get_positions, get_salary_cap
+from scripts import get_master_view
+
+# Cadences (seconds)
+GAME_NIGHT_STATS_INTERVAL = 15 * 60
+OFF_NIGHT_STATS_INTERVAL = 6 * 60 * 60
+DAILY = 24 * 60 * 60
+OWNERS_INTERVAL = 60 * 60
+PLAYER_METADATA_INTERVAL = 10 * 60
+METRICS_INTERVAL = 60 * 60
+
+# Player pages scraped per metadata refresh (keeps Spotrac load low and steady)
+PLAYER_METADATA_BUDGET = 25
+
+# NBA games tip off from ~7pm ET and finish by ~1am ET; the regular season and playoffs
+# run October through June
+EASTERN = ZoneInfo("America/New_York")
+GAME_NIGHT_HOURS = set(range(19, 24)) | {0, 1}
+SEASON_MONTHS = {10, 11, 12, 1, 2, 3, 4, 5, 6}
+
+JOB_NAMES = ["owners", "contracts", "types", "stats", "positions"]
+
+
+def is_game_night(now):
+    """
+    Returns True if the epoch time falls in a typical NBA game window (Eastern time).
+    """
+    local = datetime.fromtimestamp(now, EASTERN)
+    return local.month in SEASON_MONTHS and local.hour in GAME_NIGHT_HOURS
+
+
+def stats_interval(now):
+    return GAME_NIGHT_STATS_INTERVAL if is_game_night(now) else OFF_NIGHT_STATS_INTERVAL
+
+
+class LeagueRefresher:
+    """
+    Holds the warm resources for the daemon: one HTTP session, one Google Sheets client,
+    the latest owner lookup and contracts frame for the jobs that depend on them, and the
+    master view, which each job updates with only its own source.
+    """
+
+    def __init__(self, update_csv=True, update_sheets=False, year=2026, player_budget=PLAYER_METADATA_BUDGET):
+        self.context = PipelineContext(update_csv=update_csv, update_sheets=update_sheets)
+        self.year = year
+        self.player_budget = player_budget
+        self.cache = {}
+        self.master = None
+        # Jobs run on separate scheduler threads; the view is updated in place, so one at a time
+        self._master_lock = threading.Lock()
+        # All jobs start together and most need owners: the first to ask scrapes them and the
+        # rest wait, and the owners job's own first run reuses that scrape
+        self._owners_lock = threading.Lock()
+        self._owners_prefetched = False
+
+    def _sheets(self):
+        return self.context.sheets_manager if self.context.update_sheets else None
+
+    def _owner_lookup(self):
+        with self._owners_lock:
+            if "owners" not in self.cache:
+                self._load_owners()
+                self._owners_prefetched = True
+        return self.cache["owners"]
+
+    def _load_owners(self):
+        # League rosters first; the Sheets owner column only if Sports.ws is unavailable
+        lookup = get_owners.main(update_csv=self.context.update_csv, session=self.context.session)
+        sheets_manager = self.context.sheets_manager if lookup is None else None
+        if sheets_manager is not None:
+            lookup = get_contracts.load_owner_lookup(sheet_name="Contracts", sheets_manager=sheets_manager)
+        # Keep the previous mapping if the read failed
+        self.cache["owners"] = lookup if lookup is not None else self.cache.get("owners", {})
+
+    def refresh_owners(self):
+        with self._owners_lock:
+            if not self._owners_prefetched:
+                self._load_owners()
+            self._owners_prefetched = False
+            owner_lookup = self.cache["owners"]
+        self.refresh_master(owner_lookup=owner_lookup)
+
+    def refresh_contracts(self):
+        self.cache["contracts"] = get_contracts.main(
+            update_csv=self.context.update_csv,
+            update_sheets=self.context.update_sheets,
+            session=self.context.session,
+            sheets_manager=self._sheets(),
+            owner_lookup=self._owner_lookup(),
+        )
+        # Parse the salary cells once; the cap table is then a few array operations, so
+        # rebuild it after every contracts scrape
+        self.cache["salaries"] = SalaryTable.from_frame(self.cache["contracts"])
+        self.cache["cap"] = get_salary_cap.main(
+            update_csv=self.context.update_csv,
+            update_sheets=self.context.update_sheets,
+            contracts=self.cache["salaries"],
+            sheets_manager=self._sheets(),
+        )
+        self.refresh_master(frames={"contracts": self.cache["contracts"]})
+
+    def refresh_types(self):
+        contract_types = get_contract_types.main(
+            update_csv=self.context.update_csv,
+            update_sheets=self.context.update_sheets,
+            salary_data=self.cache.get("contracts"),
+            session=self.context.session,
+            sheets_manager=self._sheets(),
+            max_players=self.player_budget,
+        )
+        self.refresh_master(frames={"contract_types": contract_types})
+
+    def refresh_stats(self):
+        stats = get_stats.main(
+            year=self.year,
+            update_csv=self.context.update_csv,
+            update_sheets=self.context.update_sheets,
+            session=self.context.session,
+            sheets_manager=self._sheets(),
+        )
+        self.refresh_master(frames={"stats": stats})
+
+    def refresh_positions(self):
+        positions = get_positions.main(
+            update_csv=self.context.update_csv,
+            update_sheets=self.context.update_sheets,
+            session=self.context.session,
+            sheets_manager=self._sheets(),
+            owner_lookup=self._owner_lookup(),
+        )
+        self.refresh_master(frames={"positions": positions})
+
+    def refresh_master(self, frames=None, owner_lookup=None):
+        # The view is kept between jobs, so only the refreshed source's rows are recomputed
+        with self._master_lock:
+            self.master = get_master_view.main(
+                update_csv=self.context.update_csv, frames=frames, owner_lookup=owner_lookup, view=self.master
+            )
+
+    def jobs(self):
+        """
+        Returns the RefreshJobs with their cadences.
+        """
+        def staged(name, func):
+            def run():
+                with telemetry.stage(name):
+                    func()
+            return run
+
+        return [
+            RefreshJob("owners", staged("owners", self.refresh_owners), OWNERS_INTERVAL),
+            RefreshJob("contracts", staged("contracts", self.refresh_contracts), DAILY),
+            RefreshJob("types", staged("types", self.refresh_types), PLAYER_METADATA_INTERVAL),
+            RefreshJob("stats", staged("stats", self.refresh_stats), stats_interval),
+            RefreshJob("positions", staged("positions", self.refresh_positions), DAILY),
+        ]
+
+    def close(self):
+        self.context.close()
+
+
+def main(update_csv=True, update_sheets=False, year=2026, player_budget=PLAYER_METADATA_BUDGET, tick_seconds=5):
+    """
+    Run the refresh daemon until interrupted (SIGINT/SIGTERM).
+
+    Args:
+        update_csv (bool): Save refreshed data to CSV.
+        update_sheets (bool): Push refreshed data to Google Sheets.
+        year (int): NBA season year for the stats job.
+        player_budget (int): Player pages scraped per contract-type refresh.
+        tick_seconds (float): How often the scheduler checks for due jobs and triggers.
+    """
+    refresher = LeagueRefresher(
+        update_csv=update_csv, update_sheets=update_sheets, year=year, player_budget=player_budget
+    )
+    scheduler = RefreshScheduler(refresher.jobs(), tick_seconds=tick_seconds)
+
+    def handle_signal(signum, frame):
+        logger.info(f"Received signal {signum}; shutting down.")
+        scheduler.stop()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    # Write a metrics file every hour so long-running trends are visible
+    telemetry.start_run("run_daemon")
+    last_metrics = [time.time()]
+
+    def on_tick():
+        if time.time() - last_metrics[0] >= METRICS_INTERVAL:
+            telemetry.get_metrics().write()
+            telemetry.start_run("run_daemon")
+            last_metrics[0] = time.time()
+
+    try:
+        scheduler.run_forever(on_tick=on_tick)
+    finally:
+        telemetry.get_metrics().write()
+        refresher.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep league datasets fresh with per-source refresh cadences.")
+
+    # Mutually exclusive group for CSV updating
+    csv_group = parser.add_mutually_exclusive_group()
+    csv_group.add_argument(
+        "--update-csv",
+        action="store_true",
+        dest="update_csv",
+        help="Save refreshed data to CSV files (default)",
+    )
+    csv_group.add_argument(
+        "--no-update-csv",
+        action="store_false",
+        dest="update_csv",
+        help="Do not save CSV files",
+    )
+    parser.set_defaults(update_csv=True)
+
+    # Mutually exclusive group for Sheets updating
+    sheets_group = parser.add_mutually_exclusive_group()
+    sheets_group.add_argument(
+        "--update-sheets",
+        action="store_true",
+        dest="update_sheets",
+        help="Push refreshed data to Google Sheets",
+    )
+    sheets_group.add_argument(
+        "--no-update-sheets",
+        action="store_false",
+        dest="update_sheets",
+        help="Do not update Google Sheets (default)",
+    )
+    parser.set_defaults(update_sheets=False)
+
+    parser.add_argument(
+        "--refresh",
+        choices=JOB_NAMES,
+        default=None,
+        help="Ask the running daemon to refresh this source now, then exit",
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        default=2026,
+        help="NBA season year for the stats job. Default is 2026.",
+    )
+    parser.add_argument(
+        "--player-budget",
+        dest="player_budget",
+        type=int,
+        default=PLAYER_METADATA_BUDGET,
+        help=f"Player pages per contract-type refresh. Default is {PLAYER_METADATA_BUDGET}.",
+    )
+
+    args = parser.parse_args()
+
+    if args.refresh:
+        request_refresh(args.refresh)
+        logger.info(f"Requested an on-demand refresh of '{args.refresh}'.")
+    else:
+        main(
+            update_csv=args.update_csv,
+            update_sheets=args.update_sheets,
+            year=args.year,
+            player_budget=args.player_budget,
+        )
@@ -0,0 +1,299 @@
+import os
+import sys
+import logging
+import argparse
+import time
+
+# Get the root project directory (2 levels up from the current script)
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Append the base_dir to sys.path to ensure modules can be imported
+sys.path.append(base_dir)
+
+# The individual scripts log to files under logs/, so make sure it exists before importing them
+os.makedirs("logs", exist_ok=True)
+
+# Set up logging for the script
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(threadName)s - %(levelname)s - %(message)s",
+    handlers=[
+        logging.FileHandler(os.path.join("logs", "run_pipeline.log"), mode="a", encoding="utf-8"),
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+logger = logging.getLogger()
+
+# Import the pipeline runner and the per-source scripts it orchestrates
+from utils import telemetry
+from utils.pipeline import Pipeline, PipelineContext
+from utils.salary_codec import SalaryTable
+from scripts import get_contracts, get_contract_types, get_stats, get_positions, get_salary_cap, get_projections
+from scripts import get_master_view, get_owners, get_value_table, record_history, sync_league_db
+
+# Default season for the stats stage (matches get_stats.py)
+DEFAULT_YEAR = 2026
+
+
+def _sheets_for(context):
+    # Only hand out (and therefore authenticate) the shared client when pushing to Sheets
+    return context.sheets_manager if context.update_sheets else None
+
+
+def build_pipeline(year=DEFAULT_YEAR, max_workers=4):
+    """
+    Declare the league refresh as a dependency graph.
+
+    owners ──┬── contracts ──┬── types
+             │               └── salaries ──┬── cap
+             │                              └── value (also waits on stats and positions)
+             └── positions
+    stats ── projections
+    contracts, types, stats, positions ── db, history
+    owners, contracts, types, stats, positions ── master
+
+    The salaries stage parses the contract cells into a SalaryTable once, and cap and
+    value share it instead of each parsing the text frame. Stats and positions do not
+    wait on contracts, so a full refresh takes roughly as long
+    as its slowest branch (contracts -> types).
+
+    Args:
+        year (int): NBA season year for the stats stage.
+        max_workers (int): Maximum number of stages running at once.
+
+    Returns:
+        Pipeline: The configured pipeline.
+    """
+    pipeline = Pipeline(max_workers=max_workers)
+
+    def owners(context, inputs):
+        # Scrape the league rosters once and share them with every stage that needs them;
+        # the Sheets owner column is only read if Sports.ws is unavailable
+        lookup = get_owners.main(update_csv=context.update_csv, session=context.session)
+        if lookup is not None:
+            return lookup
+        sheets_manager = context.sheets_manager
+        if sheets_manager is None:
+            return {}
+        return get_contracts.load_owner_lookup(sheet_name="Contracts", sheets_manager=sheets_manager) or {}
+
+    def contracts(context, inputs):
+        return get_contracts.main(
+            update_csv=context.update_csv,
+            update_sheets=context.update_sheets,
+            session=context.session,
+            sheets_manager=_sheets_for(context),
+            owner_lookup=inputs["owners"],
+        )
+
+    def types(context, inputs):
+        return get_contract_types.main(
+            update_csv=context.update_csv,
+            update_sheets=context.update_sheets,
+            salary_data=inputs["contracts"],
+            session=context.session,
+            sheets_manager=_sheets_for(context),
+        )
+
+    def salaries(context, inputs):
+        # Parse the salary cells once for every consumer of the typed contracts
+        return SalaryTable.from_frame(inputs["contracts"])
+
+    def cap(context, inputs):
+        # Recomputed from the parsed contracts in memory; no extra scraping
+        return get_salary_cap.main(
+            update_csv=context.update_csv,
+            update_sheets=context.update_sheets,
+            contracts=inputs["salaries"],
+            sheets_manager=_sheets_for(context),
+        )
+
+    def stats(context, inputs):
+        return get_stats.main(
+            year=year,
+            update_csv=context.update_csv,
+            update_sheets=context.update_sheets,
+            session=context.session,
+            sheets_manager=_sheets_for(context),
+        )
+
+    def projections(context, inputs):
+        # Reads the refreshed season file; cached results are reused if it did not change
+        return get_projections.main(
+            update_csv=context.update_csv,
+            update_sheets=context.update_sheets,
+            sheets_manager=_sheets_for(context),
+        )
+
+    def value(context, inputs):
+        # Joins the three frames in memory; only rows whose inputs changed are recomputed
+        return get_value_table.main(
+            update_csv=context.update_csv,
+            update_sheets=context.update_sheets,
+            contracts=inputs["salaries"],
+            stats=inputs["stats"],
+            positions=inputs["positions"],
+            sheets_manager=_sheets_for(context),
+        )
+
+    def db(context, inputs):
+        # One transaction over the fresh frames; readers never see a half-updated database
+        sync_league_db.main(
+            contracts=inputs["contracts"],
+            contract_types=inputs["types"],
+            stats=inputs["stats"],
+            positions=inputs["positions"],
+            year=year,
+        ).close()
+
+    def history(context, inputs):
+        # Row-level deltas against the previous version; unchanged datasets are skipped
+        if not context.update_csv:
+            return None
+        return record_history.main(frames={
+            "contracts": inputs["contracts"],
+            "contract_types": inputs["types"],
+            "stats": inputs["stats"],
+            "positions": inputs["positions"],
+        })
+
+    def master(context, inputs):
+        # One row per player across every source, joined on Player Key
+        return get_master_view.main(
+            update_csv=context.update_csv,
+            frames={
+                "contracts": inputs["contracts"],
+                "contract_types": inputs["types"],
+                "stats": inputs["stats"],
+                "positions": inputs["positions"],
+            },
+            owner_lookup=inputs["owners"],
+        )
+
+    def positions(context, inputs):
+        return get_positions.main(
+            update_csv=context.update_csv,
+            update_sheets=context.update_sheets,
+            session=context.session,
+            sheets_manager=_sheets_for(context),
+            owner_lookup=inputs["owners"],
+        )
+
+    pipeline.add_stage("owners", owners)
+    pipeline.add_stage("contracts", contracts, depends_on=["owners"])
+    pipeline.add_stage("types", types, depends_on=["contracts"])
+    pipeline.add_stage("salaries", salaries, depends_on=["contracts"])
+    pipeline.add_stage("cap", cap, depends_on=["salaries"])
+    pipeline.add_stage("stats", stats)
+    pipeline.add_stage("projections", projections, depends_on=["stats"])
+    pipeline.add_stage("positions", positions, depends_on=["owners"])
+    pipeline.add_stage("value", value, depends_on=["salaries", "stats", "positions"])
+    pipeline.add_stage("db", db, depends_on=["contracts", "types", "stats", "positions"])
+    pipeline.add_stage("history", history, depends_on=["contracts", "types", "stats", "positions"])
+    pipeline.add_stage("master", master, depends_on=["owners", "contracts", "types", "stats", "positions"])
+    return pipeline
+
+
+def main(update_csv=True, update_sheets=False, stages=None, year=DEFAULT_YEAR, max_workers=4):
+    """
+    Run the league refresh pipeline.
+
+    Args:
+        update_csv (bool): Scrape fresh data and save the CSV outputs.
+        update_sheets (bool): Push each dataset to Google Sheets.
+        stages (list of str, optional): Only run these stages (plus their dependencies).
+        year (int): NBA season year for the stats stage.
+        max_workers (int): Maximum number of stages running at once.
+
+    Returns:
+        dict: Stage outcomes as returned by Pipeline.run().
+    """
+    start = time.perf_counter()
+    pipeline = build_pipeline(year=year, max_workers=max_workers)
+    context = PipelineContext(update_csv=update_csv, update_sheets=update_sheets)
+
+    try:
+        outcomes = pipeline.run(context, targets=stages)
+    finally:
+        context.close()
+
+    summary = ", ".join(f"{name}={outcome['status']}" for name, outcome in sorted(outcomes.items()))
+    logger.info(f"Pipeline finished in {time.perf_counter() - start:.1f}s ({summary})")
+    return outcomes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh all league datasets as one dependency-aware pipeline.")
+
+    # Mutually exclusive group for CSV updating
+    csv_group = parser.add_mutually_exclusive_group()
+    csv_group.add_argument(
+        "--update-csv",
+        action="store_true",
+        dest="update_csv",
+        help="Scrape fresh data and save CSV files (default)",
+    )
+    csv_group.add_argument(
+        "--no-update-csv",
+        action="store_false",
+        dest="update_csv",
+        help="Do not save CSV files",
+    )
+    parser.set_defaults(update_csv=True)
+
+    # Mutually exclusive group for Sheets updating
+    sheets_group = parser.add_mutually_exclusive_group()
+    sheets_group.add_argument(
+        "--update-sheets",
+        action="store_true",
+        dest="update_sheets",
+        help="Update Google Sheets with results",
+    )
+    sheets_group.add_argument(
+        "--no-update-sheets",
+        action="store_false",
+        dest="update_sheets",
+        help="Do not update Google Sheets (default)",
+    )
+    parser.set_defaults(update_sheets=False)
+
+    parser.add_argument(
+        "--stages",
+        nargs="+",
+        default=None,
+        help="Only run these stages and their dependencies (owners, contracts, types, salaries, cap, stats, projections, positions, value, db, history, master)",
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        default=DEFAULT_YEAR,
+        help=f"NBA season year for the stats stage. Default is {DEFAULT_YEAR}.",
+    )
+    parser.add_argument(
+        "--workers",
+        dest="max_workers",
+        type=int,
+        default=4,
+        help="Maximum number of stages to run concurrently",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats (main thread plus every stage) to logs/profile/",
+    )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("run_pipeline", profile=args.profile):
+        outcomes = main(
+            update_csv=args.update_csv,
+            update_sheets=args.update_sheets,
+            stages=args.stages,
+            year=args.year,
+            max_workers=args.max_workers,
+        )
+
+    # Exit non-zero if any stage failed so cron/make notice
+    if any(outcome["status"] != "ok" for outcome in outcomes.values()):
+        sys.exit(1)
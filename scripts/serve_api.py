@@ -0,0 +1,51 @@
+import os
+import sys
+import logging
+import argparse
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import the API server
+from utils.league_api import make_server
+
+
+def main(data_dir="data", host="127.0.0.1", port=8765):
+    """
+    Serve the merged league data as read-only JSON until interrupted.
+
+    Endpoints:
+        GET /players/<player-key>       One player with contracts, types, stats, position and owner
+        GET /owners/<owner>/roster      Every player owned by an owner
+        GET /top?by=FPR&n=25            Top-N players by FPR, FP, FPPG, FPPM or MPG
+        GET /health                     Data version and load time
+
+    Responses carry an ETag (304 on If-None-Match), and the data reloads automatically
+    when the get_* scripts rewrite their CSV files.
+    """
+    server = make_server(data_dir=data_dir, host=host, port=port)
+    logger.info(f"Serving league data from {data_dir} on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve merged league data as a local read-only JSON API.")
+    parser.add_argument("--data-dir", dest="data_dir", default="data", help="Directory with the get_* CSV outputs")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default 8765)")
+    args = parser.parse_args()
+
+    main(data_dir=args.data_dir, host=args.host, port=args.port)
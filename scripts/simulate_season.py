@@ -0,0 +1,110 @@
+import os
+import sys
+import glob
+import logging
+import pandas as pd
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Input and output file settings
+output_dir = "data"
+os.makedirs(output_dir, exist_ok=True)
+positions_csv = os.path.join(output_dir, "sportsws_positions.csv")
+projections_csv = os.path.join(output_dir, "projections.csv")
+stats_csv = os.path.join(output_dir, "nba_stats.csv")
+archive_dir = os.path.join(output_dir, "bbref_archive")
+output_csv = os.path.join(output_dir, "playoff_odds.csv")
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import required utilities
+from utils.lineup_optimizer import build_rosters
+from utils.season_simulator import (
+    POINTS_VARIANCE_WEIGHT, fit_dispersion, points_variance_weight, simulate, team_distributions,
+)
+from utils import output_manifest, telemetry
+
+
+def main(update_csv=True, sims=100_000, workers=None, seed=None):
+    """
+    Simulate the DMCB season and report seeding, playoff and title odds for every owner.
+
+    Player FPPM and minutes come from data/projections.csv when it exists, otherwise
+    from the current stats (data/nba_stats.csv); rosters and eligibility come from Sports.ws.
+    Each player's game-to-game spread is fitted from the current season's box score totals,
+    with the points variance weight fitted on the Basketball-Reference archive.
+
+    Args:
+        update_csv (bool): If True, save the odds to CSV.
+        sims (int): Number of seasons to simulate.
+        workers (int, optional): Worker processes (default: CPU count).
+        seed (int, optional): Seed for reproducible results.
+
+    Returns:
+        pd.DataFrame: Odds per owner.
+    """
+    source = projections_csv if os.path.exists(projections_csv) else stats_csv
+    logger.info(f"Using player FPPM and minutes from {source}")
+    rosters = build_rosters(pd.read_csv(positions_csv), pd.read_csv(source))
+
+    archive = sorted(glob.glob(os.path.join(archive_dir, "NBA_*_totals.csv")))
+    weight = points_variance_weight(pd.concat(map(pd.read_csv, archive))) if archive else POINTS_VARIANCE_WEIGHT
+    dispersion = fit_dispersion(pd.read_csv(stats_csv), points_weight=weight)
+    rosters = rosters.merge(dispersion.drop_duplicates(subset=["Player Key"]), on="Player Key", how="left")
+
+    odds = simulate(team_distributions(rosters), sims=sims, workers=workers, seed=seed)
+
+    if update_csv:
+        try:
+            if output_manifest.write_csv(odds, output_csv):
+                logger.info(f"Playoff odds saved to CSV: {output_csv}")
+        except Exception as e:
+            logger.error(f"Error saving CSV: {e}")
+
+    return odds
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Monte Carlo playoff and title odds for every owner.")
+
+    # Mutually exclusive group for CSV updating
+    csv_group = parser.add_mutually_exclusive_group()
+    csv_group.add_argument(
+        "--update-csv",
+        action="store_true",
+        dest="update_csv",
+        help="Save odds to CSV (default)",
+    )
+    csv_group.add_argument(
+        "--no-update-csv",
+        action="store_false",
+        dest="update_csv",
+        help="Do not save odds to CSV",
+    )
+    parser.set_defaults(update_csv=True)
+
+    parser.add_argument("--sims", type=int, default=100_000, help="Seasons to simulate. Default is 100000.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible odds")
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("simulate_season", profile=args.profile):
+        odds = main(update_csv=args.update_csv, sims=args.sims, workers=args.workers, seed=args.seed)
+
+    print(odds[["Owner", "Expected Wins", "Playoffs", "Semifinals", "Finals", "Title"]].round(3).to_string(index=False))
@@ -0,0 +1,141 @@
+import os
+import sys
+import logging
+import pandas as pd
+
+# Set the root project directory to 2 levels up from the current script location
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(base_dir)
+
+# Input and output file settings
+output_dir = "data"
+os.makedirs(output_dir, exist_ok=True)
+db_path = os.path.join(output_dir, "league.db")
+archive_dir = os.path.join(output_dir, "bbref_archive")
+contracts_csv = os.path.join(output_dir, "spotrac_contracts.csv")
+types_csv = os.path.join(output_dir, "contract_types.csv")
+stats_csv = os.path.join(output_dir, "nba_stats.csv")
+positions_csv = os.path.join(output_dir, "sportsws_positions.csv")
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger()
+
+# Import required utilities
+from utils.league_db import LeagueDB
+from utils.projections import season_files
+from utils import output_manifest, telemetry
+
+# Season year of nba_stats.csv (matches get_stats.py)
+CURRENT_YEAR = 2026
+
+
+def _read(frame, path):
+    if frame is not None:
+        return frame
+    return pd.read_csv(path) if os.path.exists(path) else None
+
+
+def main(update_csv=False, contracts=None, contract_types=None, stats=None, positions=None,
+         year=CURRENT_YEAR, include_archive=True, path=db_path):
+    """
+    Load the league datasets into the SQLite database in one transaction.
+
+    Frames passed in (e.g. by the pipeline) are used as-is; anything omitted is read from
+    its CSV. With update_csv, the CSVs are rewritten as exports of the database views.
+
+    Args:
+        update_csv (bool): If True, export the database views back to the CSV files.
+        contracts (pd.DataFrame, optional): Contracts snapshot.
+        contract_types (pd.DataFrame, optional): Contract types.
+        stats (pd.DataFrame, optional): Stats for the current season.
+        positions (pd.DataFrame, optional): Positions (with Owner).
+        year (int): Season year of the current stats.
+        include_archive (bool): Also load the Basketball-Reference season archive.
+        path (str): Database file.
+
+    Returns:
+        LeagueDB: The open database.
+    """
+    contracts = _read(contracts, contracts_csv)
+    contract_types = _read(contract_types, types_csv)
+    positions = _read(positions, positions_csv)
+    seasons = season_files(archive_dir=archive_dir) if include_archive else {}
+    if stats is not None:
+        seasons[year] = stats
+    elif os.path.exists(stats_csv):
+        seasons[year] = stats_csv
+
+    db = LeagueDB(path)
+    with db.transaction():
+        if contracts is not None:
+            db.upsert_contracts(contracts)
+        if contract_types is not None:
+            db.upsert_contract_types(contract_types)
+        if positions is not None:
+            db.upsert_positions(positions)
+        for season, season_stats in seasons.items():
+            db.upsert_stats(season_stats if isinstance(season_stats, pd.DataFrame) else pd.read_csv(season_stats), season)
+    logger.info(f"League database updated: {path} ({len(db.seasons())} stat seasons)")
+
+    # Export the views back to CSV
+    if update_csv:
+        try:
+            output_manifest.write_csv(db.contracts_frame(), contracts_csv)
+            output_manifest.write_csv(db.contract_types_frame(), types_csv)
+            output_manifest.write_csv(db.positions_frame(), positions_csv)
+            output_manifest.write_csv(db.stats_frame(year), stats_csv)
+            logger.info("Database views exported to CSV")
+        except Exception as e:
+            logger.error(f"Error saving CSV: {e}")
+
+    return db
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Load the league CSVs into the SQLite league database.")
+
+    # Mutually exclusive group for CSV updating
+    csv_group = parser.add_mutually_exclusive_group()
+    csv_group.add_argument(
+        "--update-csv",
+        action="store_true",
+        dest="update_csv",
+        help="Export the database views back to the CSV files",
+    )
+    csv_group.add_argument(
+        "--no-update-csv",
+        action="store_false",
+        dest="update_csv",
+        help="Do not rewrite the CSV files (default)",
+    )
+    parser.set_defaults(update_csv=False)
+
+    parser.add_argument(
+        "--year",
+        type=int,
+        default=CURRENT_YEAR,
+        help="Season year of data/nba_stats.csv (e.g., 2026 for 2025-26). Default is 2026.",
+    )
+    parser.add_argument(
+        "--no-archive",
+        action="store_false",
+        dest="include_archive",
+        help="Skip loading the Basketball-Reference season archive",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile stats to logs/profile/",
+    )
+
+    args = parser.parse_args()
+
+    with telemetry.run_session("sync_league_db", profile=args.profile):
+        main(update_csv=args.update_csv, year=args.year, include_archive=args.include_archive).close()
@@ -0,0 +1,74 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import dmcb
+from benchmarks.stand_in import StandInServer, make_session
+from utils.salary_codec import SalaryTable
+
+
+@pytest.fixture(scope="module")
+def session():
+    with StandInServer() as server:
+        session = make_session(server)
+        yield session
+        session.close()
+
+
+def test_contracts_fetch_returns_processed_and_typed_frames(session):
+    df = dmcb.contracts.fetch(session=session, owner_lookup={"aaron-gordon": "Kyle"})
+    assert list(df.columns[:7]) == dmcb.contracts.REQUIRED_COLUMNS
+    assert df["Player Key"].is_monotonic_increasing
+    assert df.loc[df["Player Key"] == "aaron-gordon", "Owner"].iloc[0] == "Kyle"
+
+    table = dmcb.contracts.fetch(session=session, typed=True)
+    assert isinstance(table, SalaryTable) and len(table) == len(df)
+
+
+def test_positions_fetch_is_cached_by_max_age(session, monkeypatch):
+    dmcb.cache.clear()
+    calls = []
+    scrape = dmcb.positions.scrape_sportsws_positions
+    monkeypatch.setattr(dmcb.positions, "scrape_sportsws_positions", lambda session: calls.append(1) or scrape(session=session))
+
+    first = dmcb.positions.fetch(session=session, max_age=60)
+    first["Position"] = "X"
+    second = dmcb.positions.fetch(session=session, max_age=60)
+    assert len(calls) == 1
+    assert list(second.columns) == dmcb.positions.COLUMN_ORDER
+    assert (second["Position"] != "X").all()
+
+    dmcb.positions.fetch(session=session)
+    assert len(calls) == 2
+
+
+def test_owners_fetch_builds_lookup_from_league_rosters(session):
+    # The stand-in serves the fixture league's pages under this address
+    df = dmcb.owners.fetch(session=session, league_url="https://sports.ws/dmcb")
+    assert list(df.columns) == dmcb.owners.COLUMN_ORDER
+    assert df["Owner"].nunique() == 16
+
+    lookup = dmcb.owners.lookup(df)
+    assert lookup["aaron-gordon"] == "BJ"
+
+    # A trade, a release and a pickup between two runs
+    new = df.copy()
+    new.loc[new["Player Key"] == "aaron-gordon", "Owner"] = "Kyle"
+    new = new[new["Player Key"] != "ace-bailey"]
+    new = pd.concat([new, pd.DataFrame([["a-pony", "A. Pony", "Sam"]], columns=dmcb.owners.COLUMN_ORDER)])
+    changes = dmcb.owners.diff(df, new)
+    assert changes.values.tolist() == [
+        ["a-pony", "A. Pony", "", "Sam", "added"],
+        ["aaron-gordon", "A. Gordon", "BJ", "Kyle", "moved"],
+        ["ace-bailey", "A. Bailey", "Hil", "", "dropped"],
+    ]
+
+    with pytest.raises(RuntimeError, match="DMCB_SPORTSWS_LEAGUE"):
+        dmcb.owners.fetch(session=session, league_url=None)
@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+
+import pytest
+from concurrent.futures.process import BrokenProcessPool
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils import telemetry
+from utils.fetch_parse import FetchParsePool
+
+
+def _word_count(content):
+    if content == b"bad":
+        raise ValueError("unreadable")
+    return (len(content.split()), os.getpid())
+
+
+def _crash(content):
+    # Kills the parse worker outright, as a segfault or the OOM killer would
+    os._exit(1)
+
+
+def _fetch(url):
+    if url.endswith("missing"):
+        raise RuntimeError("HTTP 404")
+    return b"bad" if url.endswith("bad") else f"{url} has four words".encode()
+
+
+@pytest.mark.parametrize("parse_workers", [1, 2])
+def test_results_errors_and_utilization(parse_workers):
+    metrics = telemetry.start_run("test")
+    pool = FetchParsePool(_fetch, _word_count, fetch_workers=3, parse_workers=parse_workers, name="words")
+    items = [(i, f"page-{i}") for i in range(8)] + [("x", "page-missing"), ("y", "page-bad")]
+
+    results = {key: (result, error) for key, result, error in pool.map(items)}
+
+    assert {key: result[0] for key, (result, error) in results.items() if error is None} == {i: 4 for i in range(8)}
+    assert results["x"] == (None, "HTTP 404")
+    assert results["y"] == (None, "parse failed: unreadable")
+
+    # Parsing ran in worker processes only when more than one worker was asked for
+    parse_pids = {result[1] for result, error in results.values() if error is None}
+    assert (os.getpid() not in parse_pids) == (parse_workers > 1)
+
+    report = pool.report
+    assert report["pages"] == 10 and report["parse_workers"] == parse_workers
+    assert 0 <= report["fetch_utilization"] <= 1 and 0 <= report["parse_utilization"] <= 1
+    stage = metrics.to_dict()["stages"][telemetry.NO_STAGE]
+    assert stage["pools"]["words"] == [report]
+    assert stage["parse"]["words"]["seconds"]["count"] == 8
+
+
+def test_dead_parse_worker_raises_instead_of_hanging():
+    def late_fetch(url):
+        # Every page but the first arrives after its parse has broken the pool, so its
+        # submit fails rather than its future
+        if url != "page-0":
+            time.sleep(0.3)
+        return _fetch(url)
+
+    pool = FetchParsePool(late_fetch, _crash, fetch_workers=3, parse_workers=2, name="crash")
+    with pytest.raises(BrokenProcessPool):
+        list(pool.map([(i, f"page-{i}") for i in range(6)]))
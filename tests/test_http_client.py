@@ -0,0 +1,82 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from benchmarks.stand_in import StandInServer, make_session
+from utils import http_client, rate_limiter, scrape_spotrac, telemetry
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    calls = []
+
+    def do_GET(self):
+        self.calls.append(dict(self.headers))
+        status, body = (503, b"busy") if len(self.calls) == 1 else (200, b"ok")
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_url():
+    _FlakyHandler.calls = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    host, port = httpd.server_address
+    yield f"http://{host}:{port}/page"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_retries_transient_status_and_sends_shared_headers(flaky_url):
+    metrics = telemetry.start_run("test")
+    session = http_client.make_session()
+
+    response = http_client.get(flaky_url, session=session)
+    assert response.status_code == 200 and response.text == "ok"
+    assert len(_FlakyHandler.calls) == 2
+    assert _FlakyHandler.calls[-1]["User-Agent"] == http_client.DEFAULT_HEADERS["User-Agent"]
+    assert "gzip" in _FlakyHandler.calls[-1]["Accept-Encoding"]
+
+    # Only the final response reaches the metrics hook
+    host = metrics.to_dict()["stages"][telemetry.NO_STAGE]["http"]
+    assert list(host.values())[0]["status"] == {"200": 1}
+    session.close()
+
+
+def test_every_attempt_takes_a_rate_limit_token(flaky_url, monkeypatch):
+    tokens = []
+    monkeypatch.setattr(rate_limiter, "acquire", lambda url: tokens.append(rate_limiter.RateLimiter.host(url)) or 0.0)
+    session = http_client.make_session()
+
+    assert http_client.get(flaky_url, session=session).status_code == 200
+    # The adapter's token for the first attempt, and the retry policy's for the retry
+    host = rate_limiter.RateLimiter.host(flaky_url)
+    assert tokens == [host, host]
+    session.close()
+
+
+def test_connections_are_reused_per_host():
+    with StandInServer() as server:
+        session = make_session(server)
+        for team in ["denver-nuggets", "miami-heat", "utah-jazz"]:
+            assert scrape_spotrac.scrape_team_contracts(team, session) is not None
+
+        stats = http_client.pool_stats(session)
+        (host, entry), = stats.items()
+        assert entry == {"connections": 1, "requests": 3}
+        session.close()
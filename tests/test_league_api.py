@@ -0,0 +1,83 @@
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pandas as pd
+import pytest
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils import league_api
+
+
+def _write_data(data_dir, lebron_fpr=30.0):
+    pd.DataFrame([
+        {"Player": "LeBron James", "Player Key": "lebron-james", "Team": "Los Angeles Lakers", "2026-27": "$52627153", "Owner": "Sam"},
+        {"Player": "Nikola Jokic", "Player Key": "nikola-jokic", "Team": "Denver Nuggets", "2026-27": "$59033114", "Owner": "Brandon"},
+    ]).to_csv(data_dir / "spotrac_contracts.csv", index=False)
+    pd.DataFrame([
+        {"Player": "LeBron James", "Player Key": "lebron-james", "FP": 1500, "FPR": lebron_fpr},
+        {"Player": "Nikola Jokic", "Player Key": "nikola-jokic", "FP": 2500, "FPR": 60.5},
+    ]).to_csv(data_dir / "nba_stats.csv", index=False)
+    pd.DataFrame([
+        {"Name": "L. James", "Player Key": "lebron-james", "Position": "F", "Owner": "Sam"},
+    ]).to_csv(data_dir / "sportsws_positions.csv", index=False)
+
+
+def test_indexes_merge_sources(tmp_path):
+    _write_data(tmp_path)
+    data = league_api.LeagueData(str(tmp_path))
+
+    lebron = data.player("lebron-james")
+    assert lebron["Owner"] == "Sam"
+    assert lebron["positions"]["Position"] == "F"
+    assert lebron["stats"]["FP"] == 1500
+    assert data.roster("sam")["players"][0]["Player Key"] == "lebron-james"
+    assert [p["Player Key"] for p in data.top("FPR", 1)] == ["nikola-jokic"]
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(league_api, "RELOAD_CHECK_SECONDS", 0)
+    _write_data(tmp_path)
+    httpd = league_api.make_server(data_dir=str(tmp_path), port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get(httpd, path, etag=None):
+    request = urllib.request.Request(f"http://127.0.0.1:{httpd.server_address[1]}{path}")
+    if etag:
+        request.add_header("If-None-Match", etag)
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.headers.get("ETag"), json.loads(response.read() or b"null")
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers.get("ETag"), None
+
+
+def test_etag_and_hot_reload(server, tmp_path):
+    status, etag, body = _get(server, "/top?by=FPR&n=2")
+    assert status == 200
+    assert [p["Player Key"] for p in body["players"]] == ["nikola-jokic", "lebron-james"]
+
+    assert _get(server, "/top?by=FPR&n=2", etag=etag)[0] == 304
+    assert _get(server, "/players/unknown")[0] == 404
+
+    # Rewrite the stats file; the next request sees the new ranking and a new ETag
+    time.sleep(0.01)
+    _write_data(tmp_path, lebron_fpr=99.0)
+    status, new_etag, body = _get(server, "/top?by=FPR&n=2", etag=etag)
+    assert status == 200
+    assert new_etag != etag
+    assert body["players"][0]["Player Key"] == "lebron-james"
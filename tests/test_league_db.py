@@ -0,0 +1,87 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.league_db import LeagueDB
+
+
+CONTRACTS = pd.DataFrame({
+    "Player": ["Alpha", "Beta", "Beta"],
+    "Player Link": ["/id/1", "/id/2", "/id/2"],
+    "Player Key": ["alpha", "beta", "beta"],
+    "Team": ["Denver Nuggets", "LA Clippers", "Toronto Raptors"],
+    "Age": [25, 30, 30],
+    "2026-27": ["$10", "$20", "$20"],
+    "2027-28": ["UFA", None, None],
+    "Owner": ["Kyle", "", ""],
+})
+
+
+@pytest.fixture
+def db():
+    with LeagueDB(":memory:") as league_db:
+        yield league_db
+
+
+def test_contracts_round_trip_and_cross_dataset_query(db):
+    db.upsert_contracts(CONTRACTS)
+    db.upsert_positions(pd.DataFrame({"Name": ["A. Alpha"], "Player Key": ["alpha"], "Position": ["G"], "Owner": ["Kyle"]}))
+    db.upsert_stats(pd.DataFrame({"Player": ["Alpha", "Beta"], "Player Key": ["alpha", "beta"], "FP": [900, 400]}), 2026)
+
+    exported = db.contracts_frame()
+    assert list(exported.columns) == list(CONTRACTS.columns)
+    assert exported["Team"].tolist() == ["Denver Nuggets", "LA Clippers", "Toronto Raptors"]
+    assert exported.loc[0, "2027-28"] == "UFA" and pd.isna(exported.loc[1, "2027-28"])
+    assert exported.loc[0, "Owner"] == "Kyle" and pd.isna(exported.loc[1, "Owner"])
+
+    owned = db.query("""
+        SELECT l."Player Key", l."Position", s."FP" FROM league_players l
+        JOIN stats s ON s."Player Key" = l."Player Key" AND s."Season" = ?
+        WHERE l."Owner" = ?
+    """, (2026, "Kyle"))
+    assert owned.values.tolist() == [["alpha", "G", 900]]
+
+
+def test_snapshot_upserts_replace_stale_rows(db):
+    db.upsert_contracts(CONTRACTS)
+    db.upsert_contracts(CONTRACTS[CONTRACTS["Team"] != "LA Clippers"].assign(**{"2026-27": ["$11", "$20"]}))
+
+    exported = db.contracts_frame()
+    assert exported["Team"].tolist() == ["Denver Nuggets", "Toronto Raptors"]
+    assert exported.loc[0, "2026-27"] == "$11"
+    assert db.query("SELECT COUNT(*) AS n FROM contract_salaries")["n"][0] == 4
+
+
+def test_dropped_players_lose_their_owner(db):
+    db.upsert_owners({"alpha": "Kyle", "beta": "Sam"})
+    db.upsert_positions(pd.DataFrame({"Name": ["B. Beta"], "Player Key": ["beta"], "Position": ["F"], "Owner": ["Sam"]}))
+
+    assert db.query('SELECT "Player Key", "Owner" FROM owners').values.tolist() == [["beta", "Sam"]]
+
+
+def test_stats_seasons_are_replaced_independently(db):
+    db.upsert_stats(pd.DataFrame({"Player Key": ["alpha", "beta"], "FP": [1, 2]}), 2025)
+    db.upsert_stats(pd.DataFrame({"Player Key": ["alpha", "beta"], "FP": [3, 4]}), 2026)
+    # New columns are added on demand
+    db.upsert_stats(pd.DataFrame({"Player Key": ["alpha"], "FP": [5], "FPPG": [20.5]}), 2026)
+
+    assert db.seasons() == [2025, 2026]
+    assert db.stats_frame(2025)["FP"].tolist() == [1, 2]
+    current = db.stats_frame(2026)
+    assert current.values.tolist() == [["alpha", 5, 20.5]]
+
+
+def test_failed_transaction_rolls_back(db):
+    db.upsert_contracts(CONTRACTS)
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.upsert_contracts(CONTRACTS.iloc[:1])
+            raise RuntimeError("scrape failed")
+    assert len(db.contracts_frame()) == 3
@@ -0,0 +1,48 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.lineup_optimizer import eligibility_matrix, optimize_lineup, optimize_season
+
+
+def test_multi_position_player_shifts_to_make_room():
+    # The GF is placed first in G; the pure guards arrive later and the GF must slide to F
+    eligible = eligibility_matrix(["GF", "G", "G", "G", "F", "C"])
+    fppm = [1.5, 1.2, 1.1, 1.0, 0.5, 0.9]
+    minutes = [36, 36, 36, 36, 40, 40]
+
+    alloc = optimize_lineup(fppm, minutes, eligible)
+
+    assert np.allclose(alloc.sum(axis=0), [96, 76, 40])
+    assert np.allclose(alloc[0], [0, 36, 0])
+    assert np.allclose(alloc[1:4].sum(axis=1), [36, 36, 24])
+    assert np.isclose(alloc[4, 1], 40)
+
+
+def test_negative_fppm_players_sit():
+    alloc = optimize_lineup([1.0, -0.2], [30, 30], eligibility_matrix(["C", "C"]))
+    assert np.allclose(alloc[:, 2], [30, 0])
+
+
+def test_season_batch_respects_availability():
+    rosters = pd.DataFrame([
+        {"Owner": "Sam", "Player Key": "a", "Position": "C", "FPPM": 1.2, "Minutes": 34.0},
+        {"Owner": "Sam", "Player Key": "b", "Position": "FC", "FPPM": 1.0, "Minutes": 30.0},
+        {"Owner": "Kyle", "Player Key": "c", "Position": "G", "FPPM": 1.1, "Minutes": 32.0},
+    ])
+    availability = pd.DataFrame({1: [1.0], 2: [0.0], 3: [0.5]}, index=["a"])
+
+    lineups = optimize_season(rosters, availability=availability, games=3)
+
+    assert len(lineups) == 3 * 3
+    sam = lineups[lineups["Owner"] == "Sam"].set_index(["Game", "Player Key"])
+    assert [sam.loc[(game, "a"), "C"] for game in (1, 2, 3)] == [34, 0, 17]
+    assert [sam.loc[(game, "b"), "Minutes"] for game in (1, 2, 3)] == [30, 30, 30]
+    assert np.isclose(sam.loc[(1, "a"), "Projected FP"], 34 * 1.2)
@@ -0,0 +1,119 @@
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils import http_client
+from utils.live_scoring import FINAL, LIVE, SCHEDULED, LiveScorer
+from utils.schedule_index import ScheduleIndex
+
+
+class _LiveFeedHandler(BaseHTTPRequestHandler):
+    """Serves mutable feed payloads with ETags, answering 304 when the client's copy is current."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    feeds = {}
+    requests = []
+
+    def do_GET(self):
+        payload = self.feeds.get(self.path)
+        if payload is None:
+            status, body, etag = 404, b"", None
+        else:
+            body = json.dumps(payload).encode("utf-8")
+            etag = f'"{hash(body)}"'
+            status = 304 if self.headers.get("If-None-Match") == etag else 200
+        self.requests.append((self.path, status))
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        body = body if status == 200 else b""
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    _LiveFeedHandler.feeds = {}
+    _LiveFeedHandler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _LiveFeedHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    host, port = httpd.server_address
+    yield f"http://{host}:{port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _player(person_id, first, last, **stats):
+    return {"personId": person_id, "firstName": first, "familyName": last, "statistics": stats}
+
+
+def _boxscore(game_id, status, home, away):
+    return {"game": {"gameId": game_id, "gameStatus": status, "homeTeam": home, "awayTeam": away}}
+
+
+def test_poll_applies_only_changed_lines(base_url):
+    schedule = pd.DataFrame({
+        "Game ID": ["0022500001", "0022500002"],
+        "Start": ["2026-01-10T00:00:00Z", "2026-01-10T03:00:00Z"],
+        "Home": ["DEN", "UTA"],
+        "Away": ["MIA", "BOS"],
+    })
+    scorer = LiveScorer(
+        {"aaron-gordon": "Kyle", "bam-adebayo": "Sam", "lauri-markkanen": "Sam"},
+        ScheduleIndex(schedule),
+        number=1,
+        session=http_client.make_session(),
+        scoreboard_url=f"{base_url}/scoreboard.json",
+        boxscore_url=base_url + "/boxscore_{game_id}.json",
+    )
+    feeds = _LiveFeedHandler.feeds
+    feeds["/scoreboard.json"] = {"scoreboard": {"games": [
+        {"gameId": "0022500001", "gameStatus": LIVE},
+        {"gameId": "0022500002", "gameStatus": SCHEDULED},
+    ]}}
+    gordon = _player(1, "Aaron", "Gordon", points=10, reboundsTotal=5)
+    bam = _player(2, "Bam", "Adebayo", points=4, turnovers=2)
+    jokic = _player(3, "Nikola", "Jokic", points=30)
+    feeds["/boxscore_0022500001.json"] = _boxscore(
+        "0022500001", LIVE,
+        {"teamTricode": "DEN", "players": [gordon, jokic]},
+        {"teamTricode": "MIA", "players": [bam]},
+    )
+
+    now = "2026-01-10T01:00:00Z"
+    assert scorer.poll(now) == {"Kyle": 15, "Sam": 2}
+    assert ("/boxscore_0022500002.json", 200) not in _LiveFeedHandler.requests
+
+    # Nothing changed: both feeds answer 304 and the tally is untouched
+    _LiveFeedHandler.requests.clear()
+    assert scorer.poll(now) == {}
+    assert [status for _, status in _LiveFeedHandler.requests] == [304, 304]
+
+    # One stat line changes and the game ends
+    gordon["statistics"]["points"] = 12
+    feeds["/boxscore_0022500001.json"]["game"]["gameStatus"] = FINAL
+    assert scorer.poll(now) == {"Kyle": 2}
+
+    standings = scorer.standings()
+    assert standings.values.tolist() == [["Kyle", 17.0, 1], ["Sam", 2.0, 1]]
+
+    # Final games are not requested again
+    _LiveFeedHandler.requests.clear()
+    scorer.poll(now)
+    assert [path for path, _ in _LiveFeedHandler.requests] == ["/scoreboard.json"]
+    assert not scorer.done()
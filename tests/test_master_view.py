@@ -0,0 +1,105 @@
+import os
+import sys
+
+import pandas as pd
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.master_view import MasterView
+
+
+def _sources():
+    contracts = pd.DataFrame({
+        "Player": ["Aaron Gordon", "Bam Adebayo", "Bam Adebayo"],
+        "Player Key": ["aaron-gordon", "bam-adebayo", "bam-adebayo"],
+        "Team": ["DEN", "MIA", "MIA"],
+        "2026-27": ["$22,841,455", "$37,096,500", "$37,096,500"],
+        "Owner": ["Kyle", "", ""],
+    })
+    stats = pd.DataFrame({
+        "Player": ["Aaron Gordon", "Bam Adebayo", "Nikola Jokic"],
+        "Player Key": ["aaron-gordon", "bam-adebayo", "nikola-jokic"],
+        "Team": ["DEN", "MIA", "DEN"],
+        "FP": [1500, 1900, 3600],
+    })
+    positions = pd.DataFrame({
+        "Name": ["A. Gordon", "B. Adebayo", "A. Pony"],
+        "Player Key": ["aaron-gordon", "bam-adebayo", "a-pony"],
+        "Position": ["F", "C", "G"],
+        "Owner": ["Kyle", "Sam", ""],
+    })
+    return contracts, stats, positions
+
+
+def test_join_owner_and_coverage():
+    contracts, stats, positions = _sources()
+    view = MasterView()
+    view.update("contracts", contracts)
+    view.update("stats", stats)
+    view.update("positions", positions)
+
+    table = view.table
+    assert table["Player Key"].tolist() == ["a-pony", "aaron-gordon", "bam-adebayo", "nikola-jokic"]
+    assert list(table.columns[:4]) == ["Player Key", "Player", "Team", "2026-27"]
+    assert "Team (Stats)" in table.columns and "Name" in table.columns
+    assert table.set_index("Player Key")["Owner"].to_dict() == {
+        "a-pony": "", "aaron-gordon": "Kyle", "bam-adebayo": "Sam", "nikola-jokic": "",
+    }
+
+    coverage = view.coverage().set_index("Source")
+    assert coverage.loc["contracts"].tolist() == [2, 2, 0]
+    assert coverage.loc["stats"].tolist() == [3, 1, 1]
+    assert view.unmatched("positions") == ["a-pony"]
+
+
+def test_refresh_recomputes_only_changed_rows():
+    contracts, stats, positions = _sources()
+    view = MasterView()
+    for source, df in [("contracts", contracts), ("stats", stats), ("positions", positions)]:
+        view.update(source, df)
+    rows, removed = view.take_dirty()
+    assert len(rows) == 4 and removed == []
+
+    # Unchanged refresh: nothing to export
+    assert view.update("stats", stats.copy()) == []
+    assert len(view.take_dirty()[0]) == 0
+
+    # One stat line changes and one player drops out of every source
+    stats = stats.copy()
+    stats.loc[0, "FP"] = 1525
+    stats = stats[stats["Player Key"] != "nikola-jokic"]
+    assert view.update("stats", stats) == ["aaron-gordon", "nikola-jokic"]
+    rows, removed = view.take_dirty()
+    assert rows["Player Key"].tolist() == ["aaron-gordon"] and removed == ["nikola-jokic"]
+
+    # The incrementally maintained table matches a full rebuild
+    rebuilt = MasterView()
+    for source, df in [("contracts", contracts), ("stats", stats), ("positions", positions)]:
+        rebuilt.update(source, df)
+    pd.testing.assert_frame_equal(view.table, rebuilt.table)
+
+
+def test_csv_export_reformats_only_dirty_rows():
+    contracts, stats, positions = _sources()
+    view = MasterView()
+    for source, df in [("contracts", contracts), ("stats", stats), ("positions", positions)]:
+        view.update(source, df)
+    assert view.to_csv() == view.table.to_csv(index=False)
+
+    stats = stats.copy()
+    stats.loc[1, "FP"] = 1950
+    stats = stats[stats["Player Key"] != "nikola-jokic"]
+    view.update("stats", stats)
+    cached = dict(view._csv_lines)
+    text = view.to_csv()
+    assert text == view.table.to_csv(index=False)
+    assert "nikola-jokic" not in view._csv_lines
+    changed = [key for key in view._csv_lines if view._csv_lines[key] != cached[key]]
+    assert changed == ["bam-adebayo"] and view.dirty == set()
+
+    # A new column re-formats every row
+    view.update("positions", positions.assign(Height="6-8"))
+    assert view.to_csv() == view.table.to_csv(index=False)
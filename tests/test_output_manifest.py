@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pandas as pd
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.output_manifest import OutputManifest
+
+
+def test_csv_written_only_when_content_changes(tmp_path):
+    manifest = OutputManifest(path=str(tmp_path / "manifest.json"), force=False)
+    path = str(tmp_path / "out.csv")
+    df = pd.DataFrame({"Player Key": ["a", "b"], "FP": [1, 2]})
+
+    assert manifest.write_csv(df, path)
+    assert not manifest.write_csv(df, path)
+    assert pd.read_csv(path).equals(df)
+
+    assert manifest.write_csv(df.assign(FP=[1, 3]), path)
+    # No temporary files are left behind by the atomic rename (the lock file persists)
+    assert sorted(os.listdir(tmp_path)) == ["manifest.json", "manifest.json.lock", "out.csv"]
+
+    # A fresh manifest (new process) still skips the unchanged write
+    assert not OutputManifest(path=str(tmp_path / "manifest.json"), force=False).write_csv(df.assign(FP=[1, 3]), path)
+
+
+def test_file_edited_outside_the_manifest_is_rewritten(tmp_path):
+    manifest = OutputManifest(path=str(tmp_path / "manifest.json"), force=False)
+    path = str(tmp_path / "out.csv")
+    df = pd.DataFrame({"Player Key": ["a"]})
+    manifest.write_csv(df, path)
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("edited\n")
+    assert manifest.write_csv(df, path)
+    assert pd.read_csv(path).equals(df)
+
+
+def test_sheet_push_skipped_until_payload_changes(tmp_path):
+    manifest = OutputManifest(path=str(tmp_path / "manifest.json"), force=False)
+    payload = [["Player", "FP"], ["A", 1]]
+
+    assert not manifest.sheet_unchanged("Stats", payload)
+    manifest.record_push("Stats", payload)
+    assert manifest.sheet_unchanged("Stats", payload)
+    assert not manifest.sheet_unchanged("Stats", [["Player", "FP"], ["A", 2]])
+    assert not manifest.sheet_unchanged("Positions", payload)
+
+    # Forcing (DMCB_FORCE_WRITES=1) always pushes
+    reloaded = OutputManifest(path=str(tmp_path / "manifest.json"), force=True)
+    assert not reloaded.sheet_unchanged("Stats", payload)
+
+
+def test_concurrent_writers_keep_each_others_entries(tmp_path):
+    # Two processes that loaded the manifest before either saved
+    path = str(tmp_path / "manifest.json")
+    daemon, pipeline = OutputManifest(path=path, force=False), OutputManifest(path=path, force=False)
+
+    daemon.write_file(str(tmp_path / "a.csv"), "a\n")
+    pipeline.record_push("Stats", [["Player"], ["A"]])
+    pipeline.write_file(str(tmp_path / "b.csv"), "b\n")
+
+    saved = OutputManifest(path=path, force=False).entries
+    assert sorted(saved["files"]) == sorted(os.path.normpath(str(tmp_path / name)) for name in ("a.csv", "b.csv"))
+    assert list(saved["sheets"]) == ["Stats"]
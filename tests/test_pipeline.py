@@ -0,0 +1,76 @@
+import os
+import sys
+import threading
+
+import pytest
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.pipeline import Pipeline, PipelineContext
+
+
+def test_independent_stages_run_concurrently_and_pass_results():
+    barrier = threading.Barrier(2, timeout=5)
+    pipeline = Pipeline(max_workers=2)
+
+    def left(context, inputs):
+        barrier.wait()  # only returns if the other branch is running at the same time
+        return 1
+
+    def right(context, inputs):
+        barrier.wait()
+        return 2
+
+    pipeline.add_stage("left", left)
+    pipeline.add_stage("right", right)
+    pipeline.add_stage("total", lambda context, inputs: inputs["left"] + inputs["right"], depends_on=["left", "right"])
+
+    context = PipelineContext()
+    try:
+        outcomes = pipeline.run(context)
+    finally:
+        context.close()
+
+    assert outcomes["total"]["status"] == "ok"
+    assert outcomes["total"]["result"] == 3
+
+
+def test_failed_stage_skips_dependents_and_targets_select_upstream():
+    calls = []
+    pipeline = Pipeline()
+
+    def boom(context, inputs):
+        raise SystemExit(1)
+
+    pipeline.add_stage("source", boom)
+    pipeline.add_stage("child", lambda context, inputs: calls.append("child"), depends_on=["source"])
+    pipeline.add_stage("grandchild", lambda context, inputs: calls.append("grandchild"), depends_on=["child"])
+    pipeline.add_stage("other", lambda context, inputs: calls.append("other"))
+
+    context = PipelineContext()
+    try:
+        outcomes = pipeline.run(context, targets=["grandchild"])
+    finally:
+        context.close()
+
+    assert outcomes["source"]["status"] == "failed"
+    assert outcomes["child"]["status"] == "skipped"
+    assert outcomes["grandchild"]["status"] == "skipped"
+    assert "other" not in outcomes
+    assert calls == []
+
+
+def test_cycle_is_rejected():
+    pipeline = Pipeline()
+    pipeline.add_stage("a", lambda context, inputs: None, depends_on=["b"])
+    pipeline.add_stage("b", lambda context, inputs: None, depends_on=["a"])
+
+    context = PipelineContext()
+    try:
+        with pytest.raises(ValueError, match="cycle"):
+            pipeline.run(context)
+    finally:
+        context.close()
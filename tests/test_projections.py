@@ -0,0 +1,64 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils import projections
+
+
+def _write_season(archive, year, rows):
+    pd.DataFrame(rows).to_csv(archive / f"NBA_{year}_totals.csv", index=False)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = tmp_path / "bbref_archive"
+    archive.mkdir()
+    # Veteran at 1.0 FPPM every season; rookie with one small season at 2.0 FPPM
+    _write_season(archive, 2023, [{"Player": "Vet", "Player Key": "vet", "Age": 26, "G": 80, "MP": 2400, "FP": 2400}])
+    _write_season(archive, 2024, [{"Player": "Vet", "Player Key": "vet", "Age": 27, "G": 70, "MP": 2100, "FP": 2100}])
+    _write_season(archive, 2025, [
+        {"Player": "Vet", "Player Key": "vet", "Age": 28, "G": 60, "MP": 1800, "FP": 1800},
+        {"Player": "Rookie", "Player Key": "rookie", "Age": 20, "G": 10, "MP": 100, "FP": 200},
+    ])
+    return archive
+
+
+def test_weighted_regressed_age_adjusted(archive):
+    files = projections.season_files(archive_dir=str(archive))
+    result = projections.project(projections.load_seasons(files), regression_minutes=0).set_index("Player Key")
+
+    vet = result.loc["vet"]
+    assert vet["Season"] == 2026 and vet["Age"] == 29 and vet["Seasons"] == 3
+    # 1.0 FPPM, two years past the peak
+    assert vet["FPPM"] == pytest.approx(1.0 * (1 - 2 * projections.OLD_AGE_RATE), abs=1e-3)
+    # Weighted games (5*60 + 4*70 + 3*80) / 12
+    assert vet["G"] == pytest.approx(68.3, abs=0.05)
+
+    # Regression pulls the small-sample rookie toward the league rate
+    regressed = projections.project(projections.load_seasons(files), regression_minutes=800).set_index("Player Key")
+    assert regressed.loc["rookie", "FPPM"] < result.loc["rookie", "FPPM"]
+
+
+def test_cache_recomputes_only_when_a_season_file_changes(archive, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    files = projections.season_files(archive_dir=str(archive))
+    calls = []
+    original = projections.project
+    monkeypatch.setattr(projections, "project", lambda *a, **kw: calls.append(1) or original(*a, **kw))
+
+    first = projections.cached_projections(files, cache_dir=cache_dir)
+    second = projections.cached_projections(files, cache_dir=cache_dir)
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+
+    _write_season(archive, 2025, [{"Player": "Vet", "Player Key": "vet", "Age": 28, "G": 82, "MP": 2800, "FP": 3000}])
+    projections.cached_projections(files, cache_dir=cache_dir)
+    assert len(calls) == 2
+    assert len(os.listdir(cache_dir)) == 1
@@ -0,0 +1,51 @@
+import multiprocessing
+import os
+import sys
+import time
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.rate_limiter import RateLimiter
+
+RATES = {"example.com": (20.0, 2)}
+
+
+def _fetch(path, count):
+    limiter = RateLimiter(path=path, rates=RATES)
+    for _ in range(count):
+        limiter.acquire("https://example.com/page")
+
+
+def test_budget_is_shared_across_processes(tmp_path):
+    path = str(tmp_path / "rate_limits.json")
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_fetch, args=(path, 5)) for _ in range(2)]
+
+    start = time.time()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    elapsed = time.time() - start
+
+    # 10 requests with a burst of 2 need at least 8 refills at 20/s
+    assert all(process.exitcode == 0 for process in processes)
+    assert elapsed >= 8 / 20
+
+
+def test_status_reports_rate_and_wait(tmp_path):
+    limiter = RateLimiter(path=str(tmp_path / "rate_limits.json"), rates=RATES)
+    assert limiter.status()["example.com"]["wait_seconds"] == 0
+
+    limiter.acquire("https://example.com/a")
+    limiter.acquire("https://example.com/b")
+    status = limiter.status()["example.com"]
+    assert status["rate_per_second"] == 20.0 and status["burst"] == 2
+    assert 0 < status["wait_seconds"] <= 1 / 20
+    assert limiter.wait_time("example.com") > 0
+
+    # Hosts without a configured rate are never delayed
+    assert limiter.acquire("http://127.0.0.1:8000/") == 0.0
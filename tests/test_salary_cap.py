@@ -0,0 +1,74 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.salary_cap import CapTable, dmcb_cap, parse_salary, TWO_WAY, RFA
+
+
+def _contracts():
+    return pd.DataFrame([
+        {"Player Key": "a", "2026-27": "$40000000", "2027-28": "$42000000", "Owner": "Sam"},
+        {"Player Key": "b", "2026-27": "$10000000", "2027-28": "RFA", "Owner": "Sam"},
+        {"Player Key": "c", "2026-27": "Two-Way", "2027-28": None, "Owner": "Sam"},
+        {"Player Key": "d", "2026-27": "$30000000", "2027-28": "UFA", "Owner": "Kyle"},
+        {"Player Key": "d", "2026-27": None, "2027-28": None, "Owner": "Kyle"},
+        {"Player Key": "e", "2026-27": "$5000000", "2027-28": "$5000000", "Owner": None},
+    ])
+
+
+def test_parse_salary_and_cap():
+    assert parse_salary("$31978037") == (31978037, 1)
+    assert parse_salary("Two-Way") == (0, TWO_WAY)
+    assert parse_salary("RFA") == (0, RFA)
+    assert parse_salary(float("nan"))[0] == 0
+    assert dmcb_cap("2025-26") == 231_970_500
+    assert dmcb_cap("2026-27", growth=0.0) == 231_970_500
+
+
+def test_payroll_holds_dead_money_and_two_way():
+    dead_money = pd.DataFrame([{"Player": "x", "Owner": "Kyle", "2026-27": "$2000000"}])
+    table = CapTable(_contracts(), dead_money=dead_money, cap_holds={"b": 15_000_000})
+    sam, kyle = table.owner("Sam"), table.owner("Kyle")
+
+    # Two-way salary is excluded; the RFA hold counts in the first RFA season
+    assert sam["2026-27"]["Salary"] == 50_000_000
+    assert sam["2026-27"]["Two-Way"] == 1
+    assert sam["2027-28"]["Cap Holds"] == 15_000_000
+    assert sam["2027-28"]["Cap Total"] == 57_000_000
+    assert sam["2027-28"]["Players"] == 2
+
+    # The duplicate (traded) row is only counted once
+    assert kyle["2026-27"]["Salary"] == 30_000_000
+    assert kyle["2026-27"]["Dead Money"] == 2_000_000
+    assert kyle["2026-27"]["Cap Space"] == table.caps[0] - 32_000_000
+
+
+def test_incremental_update_matches_full_rebuild():
+    table = CapTable(_contracts(), cap_holds={"b": 15_000_000})
+
+    changed = table.update_contract("e", seasons={"2027-28": "$9000000"}, owner="Kyle")
+    assert changed == ["Kyle"]
+    changed = table.update_contract("a", owner="Brian")
+    assert changed == ["Brian", "Sam"]
+    table.update_contract("b", cap_hold=20_000_000)
+
+    contracts = _contracts()
+    contracts.loc[contracts["Player Key"] == "e", ["2027-28", "Owner"]] = ["$9000000", "Kyle"]
+    contracts.loc[contracts["Player Key"] == "a", "Owner"] = "Brian"
+    rebuilt = CapTable(contracts, cap_holds={"b": 20_000_000})
+
+    pd.testing.assert_frame_equal(table.summary(), rebuilt.summary())
+
+
+def test_unknown_season_is_rejected():
+    table = CapTable(_contracts())
+    with pytest.raises(KeyError):
+        table.update_contract("a", seasons={"2040-41": "$1"})
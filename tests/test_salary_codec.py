@@ -0,0 +1,53 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.salary_codec import BLANK, RFA, SALARY, TWO_WAY, UFA, SalaryTable, parse_cells
+
+
+CONTRACTS = pd.DataFrame({
+    "Player": ["Alpha", "Beta", "Beta", "Gamma"],
+    "Player Key": ["alpha", "beta", "beta", "gamma"],
+    "Team": ["Denver Nuggets", "LA Clippers", "Toronto Raptors", "Denver Nuggets"],
+    "Position": ["PF", "SG", "SG", "C"],
+    "2026-27": ["$31978037", "$5000000", "$5000000", "Two-Way"],
+    "2027-28": ["$34536280", "RFA", np.nan, np.nan],
+    "Owner": ["Kyle", np.nan, np.nan, "Sam"],
+})
+
+
+def test_parse_cells_vectorized():
+    salary, status = parse_cells(np.array([["$31978037", "Two-Way"], ["RFA", None], [" UFA ", 1500000.0]], dtype=object))
+    assert salary.dtype == np.int64 and status.dtype == np.int8
+    assert salary.tolist() == [[31978037, 0], [0, 0], [0, 1500000]]
+    assert status.tolist() == [[SALARY, TWO_WAY], [RFA, BLANK], [UFA, SALARY]]
+
+
+def test_round_trip_and_typed_columns():
+    table = SalaryTable.from_frame(CONTRACTS)
+    assert table.seasons == ["2026-27", "2027-28"]
+    assert table.salary[0].tolist() == [31978037, 34536280]
+    assert table.info["Team"].dtype == "category" and table.info["Owner"].dtype == "category"
+
+    pd.testing.assert_frame_equal(table.to_frame(), CONTRACTS)
+    assert table.cap_hits()[:, 0].tolist() == [31978037, 5000000, 5000000, 0]
+
+
+def test_sheets_frame_and_dedupe():
+    table = SalaryTable.from_frame(CONTRACTS)
+    sheet = table.sheets_frame()
+    assert sheet["2026-27"].tolist() == [31978037, 5000000, 5000000, "Two-Way"]
+    assert sheet["2027-28"].tolist() == [34536280, "RFA", "", ""]
+    assert sheet["Owner"].tolist() == ["Kyle", "", "", "Sam"]
+
+    # The traded player's row with more filled seasons is kept
+    deduped = table.dedupe()
+    assert deduped.info["Team"].astype(str).tolist() == ["Denver Nuggets", "LA Clippers", "Denver Nuggets"]
+    assert SalaryTable.coerce(deduped) is deduped
@@ -0,0 +1,73 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.schedule_index import ScheduleIndex, parse_schedule_json
+
+
+def _game(game_id, start, home, away):
+    return {
+        "gameId": game_id,
+        "gameDateTimeUTC": start,
+        "homeTeam": {"teamTricode": home},
+        "awayTeam": {"teamTricode": away},
+    }
+
+
+@pytest.fixture
+def index():
+    # Recorded scheduleleaguev2 shape: a preseason game (ignored) and four regular-season games
+    payload = {"leagueSchedule": {"gameDates": [
+        {"gameDate": "10/15/2025", "games": [_game("0012500001", "2025-10-15T23:00:00Z", "BOS", "NYK")]},
+        {"gameDate": "10/21/2025", "games": [_game("0022500001", "2025-10-21T23:30:00Z", "BOS", "NYK")]},
+        {"gameDate": "10/22/2025", "games": [_game("0022500002", "2025-10-22T23:00:00Z", "DEN", "LAL")]},
+        {"gameDate": "10/24/2025", "games": [_game("0022500003", "2025-10-24T23:00:00Z", "NYK", "DEN")]},
+        {"gameDate": "10/27/2025", "games": [_game("0022500004", "2025-10-27T23:00:00Z", "LAL", "BOS")]},
+    ]}}
+    return ScheduleIndex(parse_schedule_json(payload))
+
+
+def test_windows_span_first_to_last_team(index):
+    opens, closes = index.window(1)
+    assert opens == pd.Timestamp("2025-10-21T23:30:00Z")
+    assert closes == pd.Timestamp("2025-10-23T01:30:00Z")
+    assert {entry["Team"]: entry["Game ID"] for entry in index.games_for(2)} == {
+        "BOS": "0022500004", "DEN": "0022500003", "LAL": "0022500004", "NYK": "0022500003",
+    }
+    assert index.team_game_number("DEN", "0022500003") == 2
+
+
+def test_reverse_lookup(index):
+    assert index.open_numbers("2025-10-20T12:00:00Z") == []
+    assert index.open_numbers("2025-10-22T12:00:00Z") == [1]
+    # Game 1 is still open (DEN/LAL) when NYK plays its 2nd game
+    assert index.open_numbers("2025-10-23T00:00:00Z") == [1]
+    assert index.open_numbers("2025-10-25T00:00:00Z") == [2]
+    assert index.open_on("2025-10-22") == [1]
+
+
+def test_reschedule_updates_only_affected_numbers(index):
+    # Postpone DEN-LAL until after NYK-DEN: DEN's games swap order
+    changed = index.update_game("0022500002", start="2025-10-26T23:00:00Z")
+    assert changed == [1, 2]
+    assert index.team_game_number("DEN", "0022500003") == 1
+    # LAL's first game is now the postponed one, so game 1 stays open until it ends
+    assert index.window(1)[1] == pd.Timestamp("2025-10-27T01:30:00Z")
+
+    # Re-applying an identical schedule is a no-op
+    schedule = pd.DataFrame([
+        {"Game ID": game_id, "Start": game["Start"], "End": game["End"], "Home": game["Home"], "Away": game["Away"]}
+        for game_id, game in index.games.items()
+    ])
+    assert index.apply(schedule) == []
+
+    assert index.remove_game("0022500004") == [2]
+    assert index.open_numbers("2025-10-26T12:00:00Z") == [1, 2]
+    assert index.open_numbers("2025-10-28T00:00:00Z") == []
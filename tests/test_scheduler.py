@@ -0,0 +1,46 @@
+import os
+import sys
+import threading
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.scheduler import RefreshJob, RefreshScheduler
+
+
+def test_jobs_follow_their_own_cadence_and_triggers(tmp_path):
+    runs = []
+    done = threading.Event()
+
+    def record(name):
+        def run():
+            runs.append(name)
+            done.set()
+        return run
+
+    fast = RefreshJob("stats", record("stats"), lambda now: 60)
+    slow = RefreshJob("contracts", record("contracts"), 3600, run_at_start=False)
+    scheduler = RefreshScheduler([fast, slow], trigger_dir=str(tmp_path))
+
+    try:
+        assert scheduler.run_pending(now=1000) == ["stats"]
+        scheduler.running["stats"].result(timeout=5)
+
+        # Not due again until its interval has passed
+        assert scheduler.run_pending(now=1030) == []
+        assert scheduler.run_pending(now=1060) == ["stats"]
+        scheduler.running["stats"].result(timeout=5)
+
+        # An on-demand trigger makes a job due immediately and is consumed
+        scheduler.request("contracts")
+        assert scheduler.run_pending(now=1070) == ["contracts"]
+        scheduler.running["contracts"].result(timeout=5)
+        assert os.listdir(tmp_path) == []
+        assert slow.next_run == 1070 + 3600
+    finally:
+        scheduler.executor.shutdown(wait=True)
+
+    assert runs == ["stats", "stats", "contracts"]
+    assert scheduler.status()["contracts"]["last_status"] == "ok"
@@ -0,0 +1,105 @@
+import os
+import sys
+
+import pytest
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from benchmarks.stand_in import StandInServer, make_session
+from utils import http_client, scrape_bbref, scrape_nba, scrape_sportsws, scrape_spotrac
+
+
+@pytest.fixture(scope="module")
+def session():
+    with StandInServer() as server:
+        session = make_session(server)
+        yield session
+        session.close()
+
+
+def test_spotrac_team_page(session):
+    df = scrape_spotrac.scrape_team_contracts("denver-nuggets", session)
+
+    jokic = df[df["Player"] == "Nikola Jokic"].iloc[0]
+    assert jokic["Position"] == "C"
+    assert jokic["2026-27"] == "$59033114"
+    assert jokic["2028-29"] == "UFA"
+    assert df[df["Player"] == "K.J. Simpson"].iloc[0]["2026-27"] == "Two-Way"
+
+
+def test_spotrac_player_page(session):
+    signed_using, drafted = scrape_spotrac.scrape_player_contracts(
+        "https://www.spotrac.com/nba/player/_/id/15356/aaron-gordon", session
+    )
+
+    assert signed_using == "Bird Rights"
+    assert drafted == "Round 1 (#4 overall), 2014"
+
+
+def test_spotrac_player_record(session):
+    record = scrape_spotrac.scrape_player_record(
+        "https://www.spotrac.com/nba/player/_/id/15356/aaron-gordon", session
+    )
+
+    assert record["Contract Years"] == 4
+    assert record["Contract Value"] == 133203878
+    assert record["Average Salary"] == 33300970
+    assert record["Total Guaranteed"] == 133203878
+    assert record["Options"] == "2028-29 Player Option"
+    assert (record["Free Agent Year"], record["Free Agent Type"]) == (2029, "UFA")
+    assert record["Parse Errors"] == ""
+
+
+def test_spotrac_player_record_reports_failures(session):
+    missing = scrape_spotrac.scrape_player_record("https://www.spotrac.com/nba/no-such-page", session)
+    assert missing["Signed Using"] is None
+    assert missing["Parse Errors"] == "HTTP 404"
+
+    record = scrape_spotrac.parse_player_page(b"<html><body><div id='main'></div></body></html>")
+    assert record["Parse Errors"] == "player header not found; contract details not found"
+
+    # Markup that differs from the fixture is reported field by field, not left blank
+    record = scrape_spotrac.parse_player_page(
+        b"<html><body><div id='main'><div class='pb-3'><strong>Drafted:</strong><span>2014</span></div></div>"
+        b"<div id='contracts'><div class='contract-wrapper'><div class='contract-details'>"
+        b"<div class='label'>Signed Using:</div><div class='value'>Bird Rights</div>"
+        b"<div class='label'>Contract Terms:</div><div class='value'>4 yr(s) / $1</div></div>"
+        b"<table class='contract-breakdown'><thead><tr><th>Year</th><th>Type</th></tr></thead></table>"
+        b"</div></div></body></html>"
+    )
+    assert record["Signed Using"] == "Bird Rights" and record["Average Salary"] is None
+    assert record["Parse Errors"] == (
+        "Average Salary missing; GTD at Sign missing; Total GTD missing; Free Agent missing; "
+        "Status column missing from contract breakdown"
+    )
+
+
+def test_bbref_totals_page(session):
+    df = scrape_bbref.scrape_nba_totals(2025, session=session)
+
+    assert len(df) == 569
+    assert df.iloc[0]["Player"] == "Aaron Gordon"
+    assert df.iloc[0]["Player Link"].endswith("/players/g/gordoaa01.html")
+
+
+def test_nba_api_goes_through_the_pooled_client(session):
+    from nba_api.stats.library.http import NBAStatsHTTP
+
+    df = scrape_nba.scrape_nba_totals(2026, session=session)
+    assert len(df) == 582 and NBAStatsHTTP.get_session() is session
+
+    # Without a session, nba_api gets the shared client rather than a bare requests.Session
+    assert scrape_nba.use_session() is http_client.get_session()
+    assert NBAStatsHTTP.get_session() is http_client.get_session()
+    NBAStatsHTTP.set_session(None)
+
+
+def test_sportsws_positions_page(session):
+    df = scrape_sportsws.scrape_sportsws_positions(session=session)
+
+    gordon = df[df["Player Link"] == "https://sports.ws/nba/aaron-gordon"].iloc[0]
+    assert gordon["Position"] == "F"
+    assert gordon["Team"] == "DEN"
@@ -0,0 +1,89 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.season_simulator import fit_dispersion, round_robin, seed_order, simulate, team_distributions
+
+
+def test_round_robin_pairs_every_team_once_per_game():
+    schedule = round_robin(16)
+    assert schedule.shape == (56, 8, 2)
+    for game in schedule:
+        assert sorted(game.ravel().tolist()) == list(range(16))
+    # The first 15 games are a full round-robin
+    pairs = {tuple(sorted(pair)) for game in schedule[:15] for pair in game.tolist()}
+    assert len(pairs) == 16 * 15 // 2
+
+
+def test_seed_order_breaks_win_ties_by_fppg():
+    # Float32, as in the simulation; wins * 1e6 + fppg would lose the 0.5 FPPG gap
+    wins = np.array([[40, 40, 41, 12]], dtype=np.float32)
+    fppg = np.array([[180.25, 180.75, 150.0, 250.0]], dtype=np.float32)
+    assert seed_order(wins, fppg).tolist() == [[2, 1, 0, 3]]
+
+
+def test_team_distribution_sums_player_lines():
+    rosters = pd.DataFrame([
+        {"Owner": "Sam", "Player Key": "c", "Position": "C", "FPPM": 1.0, "Minutes": 30.0},
+        {"Owner": "Sam", "Player Key": "g", "Position": "G", "FPPM": 0.5, "Minutes": 20.0},
+    ])
+    dist = team_distributions(rosters, player_cv=0.5).iloc[0]
+    assert dist["Mean"] == 40.0
+    assert np.isclose(dist["SD"], np.sqrt(15.0 ** 2 + 5.0 ** 2))
+
+
+def test_dispersion_is_fitted_from_box_scores_and_shrunk():
+    stats = pd.DataFrame({
+        "Player Key": ["big", "guard", "rookie", "injured"],
+        "G": [60, 60, 2, 0],
+        "FP": [1800, 1200, 10, 0],
+        "PTS": [1000, 800, 6, 0],
+        "TRB": [600, 200, 3, 0], "AST": [200, 300, 2, 0], "STL": [50, 60, 0, 0],
+        "BLK": [100, 10, 0, 0], "TOV": [100, 120, 1, 0], "PF": [50, 50, 0, 0],
+    })
+    dispersion = fit_dispersion(stats, points_weight=2.0, prior_games=20).set_index("Player Key")["Dispersion"]
+
+    # Total variance (2 x PTS + other stats) over total FP
+    league = (2.0 * 1806 + 1100 + 740 + 6) / 3010
+    assert np.isclose(dispersion["injured"], league)
+    # 60 games of the player's own estimate against 20 of the league's
+    assert np.isclose(dispersion["big"], (60 * (2000 + 1100) / 1800 + 20 * league) / 80)
+    # Two games barely move a player off the league value
+    assert abs(dispersion["rookie"] - league) < abs((12 + 6) / 10 - league)
+
+    rosters = pd.DataFrame([
+        {"Owner": "Sam", "Player Key": "c", "Position": "C", "FPPM": 1.0, "Minutes": 30.0, "Dispersion": 2.0},
+        {"Owner": "Sam", "Player Key": "g", "Position": "G", "FPPM": 0.5, "Minutes": 20.0, "Dispersion": 3.0},
+    ])
+    assert np.isclose(team_distributions(rosters).iloc[0]["SD"], np.sqrt(2.0 * 30 + 3.0 * 10))
+
+
+def test_probabilities_are_consistent_and_reproducible():
+    distributions = pd.DataFrame({
+        "Owner": [f"Owner {i}" for i in range(16)],
+        "Mean": [150.0 + 5 * i for i in range(16)],
+        "SD": [20.0] * 16,
+    })
+    odds = simulate(distributions, sims=2000, workers=1, seed=7)
+    again = simulate(distributions, sims=2000, workers=1, seed=7)
+    pd.testing.assert_frame_equal(odds, again)
+
+    assert np.isclose(odds["Playoffs"].sum(), 8)
+    assert np.isclose(odds["Title"].sum(), 1)
+    seeds = odds[[f"Seed {k}" for k in range(1, 17)]]
+    assert np.allclose(seeds.sum(axis=0), 1) and np.allclose(seeds.sum(axis=1), 1)
+    assert np.isclose(odds["Expected Wins"].sum(), 56 * 8, atol=0.1)
+    assert odds.iloc[0]["Owner"] == "Owner 15"
+
+
+def test_process_pool_splits_the_work():
+    distributions = pd.DataFrame({"Owner": list("ABCDEFGHIJKLMNOP"), "Mean": 200.0, "SD": 25.0})
+    odds = simulate(distributions, sims=1000, workers=2, seed=1)
+    assert np.isclose(odds["Finals"].sum(), 2)
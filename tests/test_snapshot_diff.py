@@ -0,0 +1,68 @@
+import os
+import sys
+
+import pandas as pd
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils import snapshot_diff
+
+
+def _snapshot(rows, seasons):
+    columns = ["Player", "Player Link", "Player Key", "Team"] + seasons
+    return pd.DataFrame(rows, columns=columns)
+
+
+OLD = _snapshot([
+    ["Stays", "https://www.spotrac.com/nba/player/_/id/1", "stays", "Denver Nuggets", "$10", "$11"],
+    ["Extended", "https://www.spotrac.com/nba/player/_/id/2", "extended", "Boston Celtics", "$20", "UFA"],
+    ["Traded", "https://www.spotrac.com/nba/player/_/id/3", "traded", "Utah Jazz", "$30", "$31"],
+    ["Waived", "https://www.spotrac.com/nba/player/_/id/4", "waived", "Miami Heat", "$40", None],
+], ["2025-26", "2026-27"])
+
+# The live snapshot has moved on a season and carries the name slug in its links
+NEW = _snapshot([
+    ["Stays", "https://www.spotrac.com/nba/player/_/id/1/stays", "stays", "Denver Nuggets", "$11", "$12"],
+    ["Extended", "https://www.spotrac.com/nba/player/_/id/2/extended", "extended", "Boston Celtics", "$25", "$26"],
+    ["Traded", "https://www.spotrac.com/nba/player/_/id/3/traded", "traded", "LA Clippers", "$31", ""],
+    ["Traded", "https://www.spotrac.com/nba/player/_/id/3/traded", "traded", "Toronto Raptors", "$31", ""],
+    ["Signed", "https://www.spotrac.com/nba/player/_/id/5/signed", "signed", "Miami Heat", "Two-Way", ""],
+], ["2026-27", "2027-28"])
+
+
+def test_typed_change_log():
+    changes = snapshot_diff.diff_snapshots(
+        snapshot_diff.index_snapshot(OLD), snapshot_diff.index_snapshot(NEW), "2026", "current"
+    )
+    summary = [tuple(row) for row in changes[["Player Key", "Change", "Field", "Old", "New"]].itertuples(index=False)]
+
+    assert summary == [
+        ("signed", "added", "Team", "", "Miami Heat"),
+        ("waived", "removed", "Team", "Miami Heat", ""),
+        ("traded", "team changed", "Team", "Utah Jazz", "LA Clippers / Toronto Raptors"),
+        # Only the overlapping season (2026-27) is compared
+        ("extended", "salary changed", "2026-27", "UFA", "$25"),
+    ]
+    assert (changes["From"] == "2026").all() and (changes["To"] == "current").all()
+    assert snapshot_diff.changed_keys(changes) == ["extended", "signed", "traded", "waived"]
+    assert snapshot_diff.changed_keys(changes, [snapshot_diff.SALARY_CHANGED]) == ["extended"]
+
+
+def test_diff_archive_chains_snapshots(tmp_path):
+    archive = tmp_path / "spotrac_archive"
+    archive.mkdir()
+    OLD.to_csv(archive / "spotrac_contracts_2026.csv", index=False)
+    OLD.iloc[:3].to_csv(archive / "spotrac_contracts_2025.csv", index=False)
+    current = tmp_path / "spotrac_contracts.csv"
+    NEW.to_csv(current, index=False)
+
+    files = snapshot_diff.snapshot_files(archive_dir=str(archive), current_csv=str(current))
+    assert list(files) == ["2025", "2026", "current"]
+
+    changes = snapshot_diff.diff_archive(files)
+    first = changes[changes["To"] == "2026"]
+    assert first[["Player Key", "Change"]].values.tolist() == [["waived", "added"]]
+    assert len(changes[changes["To"] == "current"]) == 4
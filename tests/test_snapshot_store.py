@@ -0,0 +1,65 @@
+import io
+import os
+import sys
+
+import pandas as pd
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.snapshot_store import SnapshotStore
+
+
+def _contracts(rows):
+    return pd.DataFrame(rows, columns=["Player", "Player Key", "Team", "2026-27", "Owner"])
+
+
+def _as_read(df):
+    # The store returns datasets typed as if read back from their CSV
+    return pd.read_csv(io.StringIO(df.to_csv(index=False)))
+
+
+def test_deltas_and_time_travel(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    day1 = _contracts([
+        ["Aaron Gordon", "aaron-gordon", "DEN", "$22,841,455", "Kyle"],
+        ["Bam Adebayo", "bam-adebayo", "MIA", "$37,096,500", None],
+        ["Jordan McLaughlin", "jordan-mclaughlin", "SAS", "Two-Way", None],
+        ["Jordan McLaughlin", "jordan-mclaughlin", "SAS", "Two-Way", None],
+        ["Lauri Markkanen", "lauri-markkanen", "UTA", "$46,394,100", "Sam"],
+    ])
+    assert store.record("contracts", day1, "2026-01-01")["kind"] == "checkpoint"
+    assert store.record("contracts", day1, "2026-01-01T12:00:00") is None
+
+    # One owner change and one waived player become a two-row delta
+    day2 = day1.drop(index=1).reset_index(drop=True)
+    day2.loc[0, "Owner"] = "Sam"
+    entry = store.record("contracts", day2, "2026-01-02")
+    assert (entry["kind"], entry["changes"], entry["rows"]) == ("delta", 2, 4)
+
+    # A fresh store (no in-memory state) rebuilds each day from the files
+    store = SnapshotStore(str(tmp_path))
+    assert store.as_of("contracts", "2025-12-31") is None
+    before = store.as_of("contracts", "2026-01-01")
+    pd.testing.assert_frame_equal(before, _as_read(day1))
+    after = store.as_of("contracts", "2026-01-02")
+    pd.testing.assert_frame_equal(after, _as_read(day2))
+    pd.testing.assert_frame_equal(store.as_of("contracts"), _as_read(day2))
+
+
+def test_checkpoints_bound_the_delta_chain(tmp_path):
+    store = SnapshotStore(str(tmp_path), checkpoint_every=3)
+    df = pd.DataFrame({"Player Key": [f"p{i:02d}" for i in range(10)], "FP": range(10)})
+    for day in range(1, 8):
+        df.loc[day, "FP"] += 100
+        store.record("stats", df, f"2026-02-{day:02d}")
+
+    kinds = [entry["kind"] for entry in store.versions("stats")]
+    assert kinds == ["checkpoint", "delta", "delta", "checkpoint", "delta", "delta", "checkpoint"]
+
+    expected = df.copy()
+    expected.loc[5:7, "FP"] -= 100
+    pd.testing.assert_frame_equal(SnapshotStore(str(tmp_path)).as_of("stats", "2026-02-04"), expected)
+    assert store.summary().loc[0, "Versions"] == 7
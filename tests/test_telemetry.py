@@ -0,0 +1,55 @@
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import requests
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils import telemetry
+
+
+def _fake_response(url, status_code, body, seconds):
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response._content = body
+    response.elapsed = timedelta(seconds=seconds)
+    return response
+
+
+def test_metrics_are_grouped_by_stage_and_host(tmp_path):
+    metrics = telemetry.start_run("test")
+
+    with metrics.stage("contracts"):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                telemetry.submit(executor, telemetry.record_response, _fake_response(
+                    "https://www.spotrac.com/nba/team", status, b"x" * 10, seconds))
+                for status, seconds in [(200, 0.1), (200, 0.3), (502, 0.2)]
+            ]
+            for future in futures:
+                future.result()
+        telemetry.record_sheets_call("write", "Contracts", 123, 0.5)
+        with telemetry.timed_parse("spotrac-team", "team"):
+            pass
+
+    path = metrics.write(directory=str(tmp_path))
+    with open(path) as f:
+        data = json.load(f)
+
+    stage = data["stages"]["contracts"]
+    host = stage["http"]["www.spotrac.com"]
+    assert host["requests"] == 3
+    assert host["bytes"] == 30
+    assert host["status"] == {"200": 2, "502": 1}
+    assert host["latency_seconds"]["p50"] == 0.2
+    assert stage["sheets"]["write"]["calls"] == 1
+    assert stage["sheets"]["write"]["bytes"] == 123
+    assert stage["parse"]["spotrac-team"]["seconds"]["count"] == 1
+    assert stage["wall_seconds"] >= 0
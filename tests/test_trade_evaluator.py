@@ -0,0 +1,57 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.salary_cap import CapTable
+from utils.trade_evaluator import TradeEvaluator
+
+
+def _contracts():
+    rows = []
+    # Sam: 12 players at $19M (at the cap), Kyle: 13 players at $10M
+    for n in range(12):
+        rows.append({"Player Key": f"sam-{n}", "2026-27": "$19000000", "2027-28": "$19000000", "Owner": "Sam"})
+    for n in range(13):
+        rows.append({"Player Key": f"kyle-{n}", "2026-27": "$10000000", "2027-28": "UFA", "Owner": "Kyle"})
+    rows.append({"Player Key": "kyle-tw", "2026-27": "Two-Way", "2027-28": None, "Owner": "Kyle"})
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def evaluator():
+    return TradeEvaluator(CapTable(_contracts(), nba_caps={"2026-27": 152_000_000}))
+
+
+def test_cap_and_roster_legality(evaluator):
+    result = evaluator.evaluate([
+        # Sam takes back more salary while already at the cap
+        ("Sam", ["sam-0"], "Kyle", ["kyle-0", "kyle-1"]),
+        # Sam sheds salary: always cap-legal for Sam, Kyle stays under the cap
+        ("Sam", ["sam-0"], "Kyle", ["kyle-0"]),
+    ])
+
+    assert result["A Net 2026-27"].tolist() == [1_000_000, -9_000_000]
+    assert result["A Net 2027-28"].tolist() == [-19_000_000, -19_000_000]
+    assert result["Legal"].tolist() == [False, True]
+    assert result.loc[0, "B Players"] == 12
+    assert result.loc[1, "A Cap Space"] == 9_000_000
+
+
+def test_two_for_one_covers_both_directions(evaluator):
+    result = evaluator.two_for_one("Sam", "Kyle")
+    # Kyle has 14 players including the two-way: C(12,2)*14 + 12*C(14,2)
+    assert len(result) == 66 * 14 + 12 * 91
+    # Sam cannot go under 12 players, so only Sam-receives-two trades are roster-legal
+    assert not result.loc[result["A Sends"].str.contains(","), "Roster Legal"].any()
+
+
+def test_rejects_players_not_on_the_roster(evaluator):
+    with pytest.raises(ValueError):
+        evaluator.evaluate([("Sam", ["kyle-0"], "Kyle", ["kyle-1"])])
@@ -0,0 +1,89 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Dynamically add the project root to PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.value_table import ValueTable
+
+
+@pytest.fixture
+def league():
+    contracts = pd.DataFrame({
+        "Player": ["Star", "Bargain", "Bust", "Bench", "Rookie"],
+        "Player Key": ["star", "bargain", "bust", "bench", "rookie"],
+        "Owner": ["A", "A", "B", "B", None],
+        "2026-27": ["$30000000", "$2000000", "$25000000", "$1000000", "Two-Way"],
+        "2027-28": ["$31000000", "", "$26000000", "", "RFA"],
+    })
+    stats = pd.DataFrame({
+        "Player Key": ["star", "bargain", "bust", "bench", "rookie"],
+        "FP": [3000, 1500, 600, 500, 400],
+        "FPPG": [40.0, 20.0, 10.0, 8.0, 6.0],
+        "FPR": [45.0, 22.0, 5.0, 4.0, 3.0],
+    })
+    positions = pd.DataFrame({
+        "Player Key": ["star", "bargain", "bust", "bench", "rookie"],
+        "Position": ["G", "G", "C", "F", "F"],
+    })
+    return contracts, stats, positions
+
+
+def _value_table():
+    # Two teams of one rostered player each: the third-best FP (600) is replacement level
+    return ValueTable(cap=10_000_000, teams=2, roster_spots=1)
+
+
+def test_value_per_dollar_and_surplus(league):
+    value = _value_table()
+    value.refresh(*league)
+    table = value.table.set_index("Player Key")
+
+    assert table.loc["star", "FP per $1M"] == pytest.approx(100.0)
+    assert pd.isna(table.loc["rookie", "FP per $1M"])  # two-way: no cap salary
+    assert value.replacement_fp == 600
+
+    # 20M of league cap spread over (3000 - 600) + (1500 - 600) = 3300 marginal FP
+    assert value.dollars_per_fp == pytest.approx(20_000_000 / 3300)
+    assert table.loc["bargain", "Value"] == round(900 * 20_000_000 / 3300)
+    assert table.loc["bust", "Value"] == 0
+    assert table.loc["bust", "Surplus"] == -25_000_000
+
+    assert table.loc["bargain", "Overall Rank"] == 1
+    assert table.loc["bargain", "Position Rank"] == 1 and table.loc["star", "Position Rank"] == 2
+    assert table.loc["bust", "Position Rank"] == 1  # only center
+
+
+def test_incremental_refresh_matches_full_rebuild(league):
+    contracts, stats, positions = league
+    value = _value_table()
+    assert len(value.refresh(contracts, stats, positions)) == 5
+    assert value.refresh(contracts, stats, positions) == []
+
+    stats = stats.copy()
+    stats.loc[stats["Player Key"] == "bench", "FP"] = 2000
+    contracts = contracts[contracts["Player Key"] != "rookie"]
+    assert value.refresh(contracts, stats, positions) == ["bench", "rookie"]
+
+    rebuilt = _value_table()
+    rebuilt.refresh(contracts, stats, positions)
+    pd.testing.assert_frame_equal(
+        value.table.reset_index(drop=True), rebuilt.table.reset_index(drop=True), check_dtype=False
+    )
+    # The replacement level moved, so league columns changed for untouched rows too
+    assert value.table.set_index("Player Key").loc["star", "Value"] != 0
+
+
+def test_restored_table_only_recomputes_changes(league, tmp_path):
+    value = _value_table()
+    value.refresh(*league)
+    path = tmp_path / "value_table.csv"
+    value.table.to_csv(path, index=False)
+
+    restored = ValueTable.from_frame(pd.read_csv(path, dtype={"Fingerprint": str}), cap=10_000_000, teams=2, roster_spots=1)
+    assert restored.refresh(*league) == []
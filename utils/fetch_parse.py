@@ -0,0 +1,148 @@
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from utils import telemetry
+
+# Set up module-level logging for the fetch/parse executor
+logger = logging.getLogger(__name__)
+
+# Default number of fetch threads (network-bound, so independent of the core count)
+FETCH_WORKERS = 6
+
+# Parse workers are started by a single-threaded fork server rather than forked from
+# the caller, which has pipeline, fetch and logging threads (and their locks) running
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _timed(parse, content):
+    # Runs in a parse worker; returns the compact result and the time spent parsing
+    start = time.perf_counter()
+    result = parse(content)
+    return result, time.perf_counter() - start
+
+
+class FetchParsePool:
+    """
+    Two-stage executor: fetch threads download pages and hand the raw bytes to a pool of
+    parse processes, which return compact results (row tuples) to the caller.
+
+    Network waits and GIL-bound parsing no longer share threads, so the parse stage
+    scales with the number of cores while the fetch stage keeps every connection busy.
+    With a single parse worker (e.g. on a one-core machine) parsing runs on one
+    in-process thread instead, which avoids the cost of shipping pages to a subprocess.
+
+    After map() is exhausted, report holds the busy time and utilization of each stage.
+    """
+
+    def __init__(self, fetch, parse, fetch_workers=FETCH_WORKERS, parse_workers=None, name="pages"):
+        """
+        Args:
+            fetch (callable): fetch(url) -> bytes; raises on failure. Runs on the fetch threads.
+            parse (callable): parse(bytes) -> compact, picklable result. Must be a
+                module-level function so it can run in a worker process.
+            fetch_workers (int): Fetch threads.
+            parse_workers (int, optional): Parse processes (default: CPU count).
+            name (str): Source name used for the parse metrics and the utilization log.
+        """
+        self.fetch = fetch
+        self.parse = parse
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.name = name
+        self.report = None
+
+    def _parse_executor(self):
+        if self.parse_workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=self.parse_workers, mp_context=multiprocessing.get_context(START_METHOD)
+            )
+            # Workers start on demand; start them all now, before any fetch thread exists
+            for future in [executor.submit(os.getpid) for _ in range(self.parse_workers)]:
+                future.result()
+            return executor
+        return ThreadPoolExecutor(max_workers=1)
+
+    def map(self, items):
+        """
+        Fetches and parses every (key, url) item, yielding results as they complete.
+
+        Args:
+            items (iterable): (key, url) pairs.
+
+        Yields:
+            tuple: (key, result, error). error is None on success; otherwise result is
+                None and error describes the fetch or parse failure.
+
+        Raises:
+            BrokenExecutor: A parse worker died, or the parse pool stopped taking work.
+        """
+        items = list(items)
+        done = queue.Queue()
+        lock = threading.Lock()
+        busy = {"fetch": 0.0, "parse": 0.0}
+        start = time.perf_counter()
+
+        def on_parsed(key, url, future):
+            try:
+                result, seconds = future.result()
+                done.put((key, url, result, None, seconds))
+            except BrokenExecutor as e:
+                # The pool itself is gone, so every remaining page would fail the same way
+                done.put((key, url, None, e, 0.0))
+            except Exception as e:
+                done.put((key, url, None, f"parse failed: {e}", 0.0))
+
+        def fetch_one(key, url, parse_executor):
+            fetch_start = time.perf_counter()
+            try:
+                content = self.fetch(url)
+            except Exception as e:
+                done.put((key, url, None, str(e), 0.0))
+                return
+            finally:
+                with lock:
+                    busy["fetch"] += time.perf_counter() - fetch_start
+            try:
+                future = parse_executor.submit(_timed, self.parse, content)
+            except Exception as e:
+                # e.g. BrokenProcessPool after a worker crash; map() must not wait for this page
+                done.put((key, url, None, e, 0.0))
+                return
+            future.add_done_callback(lambda f: on_parsed(key, url, f))
+
+        with self._parse_executor() as parse_executor, \
+                ThreadPoolExecutor(max_workers=self.fetch_workers) as fetch_executor:
+            for key, url in items:
+                telemetry.submit(fetch_executor, fetch_one, key, url, parse_executor)
+
+            for _ in items:
+                key, url, result, error, seconds = done.get()
+                if isinstance(error, Exception):
+                    raise error
+                busy["parse"] += seconds
+                if error is None:
+                    telemetry.get_metrics().record_parse(self.name, url, seconds)
+                yield key, result, error
+
+        wall = time.perf_counter() - start
+        self.report = {
+            "pages": len(items),
+            "wall_seconds": round(wall, 4),
+            "fetch_workers": self.fetch_workers,
+            "parse_workers": self.parse_workers,
+            "fetch_busy_seconds": round(busy["fetch"], 4),
+            "parse_busy_seconds": round(busy["parse"], 4),
+            "fetch_utilization": round(busy["fetch"] / (wall * self.fetch_workers), 3) if wall else 0.0,
+            "parse_utilization": round(busy["parse"] / (wall * self.parse_workers), 3) if wall else 0.0,
+        }
+        telemetry.record_pool(self.name, self.report)
+        logger.info(
+            f"{self.name}: {len(items)} pages in {wall:.2f}s | fetch {self.report['fetch_utilization']:.0%} "
+            f"of {self.fetch_workers} threads | parse {self.report['parse_utilization']:.0%} "
+            f"of {self.parse_workers} worker(s)"
+        )
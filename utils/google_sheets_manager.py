@@ -3,6 +3,9 @@ from dotenv import load_dotenv
 import gspread
 import logging
 import json
+import time
+
+from utils import telemetry
 
 # Set up module-level logging to track the operations of the Google Sheets manager
 logger = logging.getLogger(__name__)
@@ -90,7 +93,11 @@ class GoogleSheetsManager:
             # Get the worksheet object
             worksheet = self.get_worksheet(sheet_name)
             # Retrieve all values from the worksheet
+            start = time.perf_counter()
             data = worksheet.get_all_values()
+            telemetry.record_sheets_call(
+                "read", sheet_name, len(json.dumps(data)), time.perf_counter() - start
+            )
             logger.info(f"Read {len(data)} rows from worksheet '{sheet_name}'.")
             return data
         except Exception as e:
@@ -114,7 +121,11 @@ class GoogleSheetsManager:
             # Get the worksheet object
             worksheet = self.get_worksheet(sheet_name)
             # Update the sheet with the data starting from the specified cell
+            start = time.perf_counter()
             worksheet.update(start_cell, data)
+            telemetry.record_sheets_call(
+                "write", sheet_name, len(json.dumps(data, default=str)), time.perf_counter() - start
+            )
             logger.info(f"Written data to worksheet '{sheet_name}' starting at '{start_cell}'.")
         except Exception as e:
             # Log an error if writing data fails
@@ -135,7 +146,9 @@ class GoogleSheetsManager:
             # Get the worksheet object
             worksheet = self.get_worksheet(sheet_name)
             # Clear all contents of the worksheet
+            start = time.perf_counter()
             worksheet.clear()
+            telemetry.record_sheets_call("clear", sheet_name, 0, time.perf_counter() - start)
             logger.info(f"Cleared data from worksheet '{sheet_name}'.")
         except Exception as e:
             # Log an error if clearing data fails
@@ -157,7 +170,9 @@ class GoogleSheetsManager:
             # Get the worksheet object
             worksheet = self.get_worksheet(sheet_name)
             # Clear the specified range
+            start = time.perf_counter()
             worksheet.batch_clear([range_to_clear])
+            telemetry.record_sheets_call("clear", sheet_name, 0, time.perf_counter() - start)
             logger.info(f"Cleared range '{range_to_clear}' in worksheet '{sheet_name}'.")
         except Exception as e:
             # Log an error if clearing the range fails
@@ -0,0 +1,198 @@
+import logging
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils import rate_limiter, telemetry
+
+# Set up module-level logging for the HTTP client
+logger = logging.getLogger(__name__)
+
+# One browser User-Agent for every source, with compressed transfer encoding
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/117.0 Safari/537.36"
+    ),
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+# (connect, read) timeout in seconds applied to every request
+TIMEOUT = (5, 20)
+
+# Retry policy: transient statuses and connection errors, with exponential backoff
+# (1s, 2s, 4s) and Retry-After honoured on 429/503
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 1.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Number of hosts that keep a pool, and keep-alive connections per host (covers the
+# per-script thread pools)
+POOL_HOSTS = 8
+POOL_SIZE = 16
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class ThrottledAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that takes a token from the cross-process per-domain rate limiter
+    before every request. Retries happen inside urllib3, below this adapter, so the
+    retry policy (ThrottledRetry) takes a token for each of them.
+    """
+
+    def send(self, request, **kwargs):
+        rate_limiter.acquire(request.url)
+        return super().send(request, **kwargs)
+
+
+class ThrottledRetry(Retry):
+    """
+    urllib3 Retry that takes a rate-limiter token for the host after each backoff, so a
+    burst of retries stays within the per-domain limit like any other request.
+    """
+
+    DEFAULT_PORTS = {"http": 80, "https": 443}
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if _pool is not None:
+            # Same host key as the adapter's request URL (port only when not the default)
+            port = "" if _pool.port in (None, self.DEFAULT_PORTS.get(_pool.scheme)) else f":{_pool.port}"
+            retry.throttle_url = f"{_pool.scheme}://{_pool.host}{port}"
+        return retry
+
+    def sleep(self, response=None):
+        super().sleep(response)
+        throttle_url = getattr(self, "throttle_url", None)
+        if throttle_url:
+            rate_limiter.acquire(throttle_url)
+
+
+def make_retry(retries=MAX_RETRIES):
+    """
+    Returns the urllib3 Retry policy shared by every session.
+    """
+    return ThrottledRetry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def make_session(pool_size=POOL_SIZE, retries=MAX_RETRIES, headers=None):
+    """
+    Creates an instrumented requests session with keep-alive pools, the retry policy
+    and the per-domain rate limits (see utils.rate_limiter).
+
+    Args:
+        pool_size (int): Keep-alive connections kept per host.
+        retries (int): Retries for transient statuses and connection errors.
+        headers (dict, optional): Headers added to DEFAULT_HEADERS.
+
+    Returns:
+        requests.Session: The new session (responses are recorded by telemetry).
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    if headers:
+        session.headers.update(headers)
+    adapter = ThrottledAdapter(pool_connections=POOL_HOSTS, pool_maxsize=pool_size, max_retries=make_retry(retries))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return telemetry.instrument_session(session)
+
+
+def get_session():
+    """
+    Returns the process-wide shared session, creating it on first use.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = make_session()
+        return _session
+
+
+def close_session():
+    """
+    Logs the connection reuse of the shared session and closes it; the next
+    get_session() opens a fresh one.
+    """
+    global _session
+    with _session_lock:
+        session, _session = _session, None
+    if session is not None:
+        for host, stats in pool_stats(session).items():
+            logger.info(f"{host}: {stats['requests']} requests over {stats['connections']} connections")
+        session.close()
+
+
+def get(url, session=None, **kwargs):
+    """
+    GET a URL through the given session, or the shared session when session is None.
+
+    The default timeout and headers apply unless overridden, so sessions that were not
+    built here (e.g. the benchmark stand-in) behave the same way.
+
+    Args:
+        url (str): URL to fetch.
+        session (requests.Session, optional): Session to use instead of the shared one.
+        **kwargs: Passed through to session.get().
+
+    Returns:
+        requests.Response: The response (after any retries).
+    """
+    session = telemetry.instrument_session(session) if session is not None else get_session()
+    kwargs.setdefault("timeout", TIMEOUT)
+    headers = {**DEFAULT_HEADERS, **(kwargs.pop("headers", None) or {})}
+    return session.get(url, headers=headers, **kwargs)
+
+
+def pool_stats(session=None):
+    """
+    Returns per-host connection counts for a session's keep-alive pools.
+
+    Args:
+        session (requests.Session, optional): Defaults to the shared session.
+
+    Returns:
+        dict: {host: {"connections": opened, "requests": sent}}. Many requests over few
+            connections means keep-alive is working.
+    """
+    session = session or _session
+    stats = {}
+    if session is None:
+        return stats
+    # http:// and https:// share one adapter
+    for adapter in {id(a): a for a in session.adapters.values()}.values():
+        for key in list(adapter.poolmanager.pools.keys()):
+            pool = adapter.poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            host = urlparse(f"{key.key_scheme}://{key.key_host}:{key.key_port}").netloc
+            entry = stats.setdefault(host, {"connections": 0, "requests": 0})
+            entry["connections"] += pool.num_connections
+            entry["requests"] += pool.num_requests
+    return stats
+
+
+if __name__ == "__main__":
+    # Example usage: two requests to one host share a single connection
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    for _ in range(2):
+        print(get("https://www.basketball-reference.com/").status_code)
+    print(pool_stats())
+    close_session()
@@ -0,0 +1,276 @@
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import pandas as pd
+
+# Set up module-level logging for the API server
+logger = logging.getLogger(__name__)
+
+# Output files of the get_* scripts, relative to the data directory
+DATASETS = {
+    "contracts": "spotrac_contracts.csv",
+    "contract_types": "contract_types.csv",
+    "stats": "nba_stats.csv",
+    "positions": "sportsws_positions.csv",
+}
+
+# Stats columns that can be ranked with /top?by=...
+RANKABLE = ["FPR", "FP", "FPPG", "FPPM", "MPG"]
+
+# Seconds between checks for changed data files
+RELOAD_CHECK_SECONDS = 1.0
+
+# Encoded responses kept per data version
+RESPONSE_CACHE_SIZE = 512
+
+
+def _records(df):
+    """
+    Converts a DataFrame to a list of dicts with NaN replaced by None.
+    """
+    return [
+        {key: (None if isinstance(value, float) and math.isnan(value) else value) for key, value in row.items()}
+        for row in df.astype(object).to_dict("records")
+    ]
+
+
+class LeagueData:
+    """
+    An immutable, indexed snapshot of the league datasets.
+
+    Players are keyed by Player Key with every source merged under it, rosters are
+    indexed by owner, and players are pre-sorted for each rankable stat, so every query
+    is a dictionary lookup or a list slice.
+    """
+
+    def __init__(self, data_dir="data"):
+        self.data_dir = data_dir
+        self.signature = self.file_signature(data_dir)
+        self.loaded_at = time.strftime("%Y-%m-%d %H:%M:%S")
+
+        frames = {}
+        digest = hashlib.sha1()
+        for name, file_name in DATASETS.items():
+            path = os.path.join(data_dir, file_name)
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+                frames[name] = pd.read_csv(path)
+            else:
+                frames[name] = pd.DataFrame(columns=["Player Key"])
+        self.version = digest.hexdigest()[:16]
+
+        self.players = {}
+        for name, df in frames.items():
+            df = df.dropna(subset=["Player Key"])
+            for record in _records(df):
+                player = self.players.setdefault(record["Player Key"], {"Player Key": record["Player Key"]})
+                if name == "contracts":
+                    # A player can have more than one contract row (e.g., waived and re-signed)
+                    player.setdefault("contracts", []).append(record)
+                else:
+                    player.setdefault(name, record)
+
+        self.rosters = {}
+        for key, player in self.players.items():
+            owner = self._owner(player)
+            player["Owner"] = owner
+            if owner:
+                self.rosters.setdefault(owner.lower(), {"owner": owner, "players": []})["players"].append(key)
+        for roster in self.rosters.values():
+            roster["players"].sort()
+
+        self.rankings = {}
+        stats = frames["stats"].dropna(subset=["Player Key"])
+        for column in RANKABLE:
+            if column in stats.columns:
+                ranked = stats.sort_values(column, ascending=False, kind="mergesort")
+                self.rankings[column] = ranked["Player Key"].tolist()
+
+    @staticmethod
+    def _owner(player):
+        for contract in player.get("contracts", []):
+            if contract.get("Owner"):
+                return contract["Owner"]
+        return (player.get("positions") or {}).get("Owner") or None
+
+    @staticmethod
+    def file_signature(data_dir):
+        """
+        Returns (mtime, size) for each dataset file, used to detect changes cheaply.
+        """
+        signature = []
+        for file_name in DATASETS.values():
+            path = os.path.join(data_dir, file_name)
+            try:
+                stat = os.stat(path)
+                signature.append((file_name, stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append((file_name, None, None))
+        return tuple(signature)
+
+    def player(self, key):
+        return self.players.get(key)
+
+    def roster(self, owner):
+        roster = self.rosters.get(owner.lower())
+        if roster is None:
+            return None
+        return {"owner": roster["owner"], "players": [self.players[key] for key in roster["players"]]}
+
+    def top(self, by="FPR", n=25):
+        """
+        Returns the top-n players by a rankable stat.
+
+        Raises:
+            KeyError: If the stat is not rankable.
+        """
+        keys = self.rankings[by][:n]
+        return [self.players[key] for key in keys]
+
+
+class LeagueStore:
+    """
+    Holds the current LeagueData and swaps in a fresh snapshot when the files change.
+    """
+
+    def __init__(self, data_dir="data"):
+        self.data_dir = data_dir
+        self._lock = threading.Lock()
+        self._last_check = time.monotonic()
+        self.data = LeagueData(data_dir)
+        self._responses = {}
+
+    def current(self):
+        """
+        Returns the current snapshot, reloading it first if any data file changed.
+        """
+        now = time.monotonic()
+        if now - self._last_check < RELOAD_CHECK_SECONDS:
+            return self.data
+
+        with self._lock:
+            if now - self._last_check >= RELOAD_CHECK_SECONDS:
+                self._last_check = now
+                if LeagueData.file_signature(self.data_dir) != self.data.signature:
+                    try:
+                        self.data = LeagueData(self.data_dir)
+                        self._responses = {}
+                        logger.info(f"Reloaded league data (version {self.data.version})")
+                    except Exception as e:
+                        # Files may be mid-write; keep serving the old snapshot and retry later
+                        logger.warning(f"Reload failed, keeping version {self.data.version}: {e}")
+        return self.data
+
+    def response(self, data, target, build):
+        """
+        Returns (status, body bytes, etag) for a request target, encoding it once per version.
+        """
+        cache_key = (data.version, target)
+        cached = self._responses.get(cache_key)
+        if cached is None:
+            status, payload = build(data)
+            body = json.dumps(payload).encode("utf-8")
+            etag = f'"{hashlib.sha1(data.version.encode() + target.encode()).hexdigest()[:20]}"'
+            cached = (status, body, etag)
+            if len(self._responses) >= RESPONSE_CACHE_SIZE:
+                self._responses.clear()
+            self._responses[cache_key] = cached
+        return cached
+
+
+def route(path, query):
+    """
+    Maps a request to a builder callable(data) -> (status, payload).
+    """
+    parts = [unquote(part) for part in path.strip("/").split("/") if part]
+
+    if parts == ["health"]:
+        return lambda data: (200, {"version": data.version, "loaded_at": data.loaded_at, "players": len(data.players)})
+
+    if len(parts) == 2 and parts[0] == "players":
+        def player(data):
+            found = data.player(parts[1])
+            return (200, found) if found else (404, {"error": f"Unknown player: {parts[1]}"})
+        return player
+
+    if len(parts) == 3 and parts[0] == "owners" and parts[2] == "roster":
+        def roster(data):
+            found = data.roster(parts[1])
+            return (200, found) if found else (404, {"error": f"Unknown owner: {parts[1]}"})
+        return roster
+
+    if parts == ["top"]:
+        by = query.get("by", ["FPR"])[0]
+        try:
+            n = max(1, min(500, int(query.get("n", ["25"])[0])))
+        except ValueError:
+            return lambda data: (400, {"error": "n must be an integer"})
+
+        def top(data):
+            if by not in data.rankings:
+                return 400, {"error": f"Cannot rank by {by}; choose from {sorted(data.rankings)}"}
+            return 200, {"by": by, "players": data.top(by, n)}
+        return top
+
+    return None
+
+
+class LeagueRequestHandler(BaseHTTPRequestHandler):
+    """
+    Read-only JSON endpoints over the in-memory league data.
+    """
+
+    store = None
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        build = route(parts.path, parse_qs(parts.query))
+        if build is None:
+            self._send(404, json.dumps({"error": "Not found"}).encode("utf-8"), None)
+            return
+
+        data = self.store.current()
+        status, body, etag = self.store.response(data, self.path, build)
+
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", etag)
+            return
+        self._send(status, body, etag if status == 200 else None)
+
+    def _send(self, status, body, etag):
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if status != 304:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def make_server(data_dir="data", host="127.0.0.1", port=8765):
+    """
+    Builds (but does not start) a threaded API server over the given data directory.
+    """
+    handler = type("BoundLeagueRequestHandler", (LeagueRequestHandler,), {"store": LeagueStore(data_dir)})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+if __name__ == "__main__":
+    # Example usage: query the local data directly without starting a server
+    data = LeagueData("data")
+    print(f"Loaded {len(data.players)} players (version {data.version})")
+    print([player["Player Key"] for player in data.top("FPR", 5)])
@@ -0,0 +1,305 @@
+import json
+import logging
+import sqlite3
+from contextlib import contextmanager
+
+import pandas as pd
+
+from utils.salary_cap import season_columns
+
+# Set up module-level logging for the league database
+logger = logging.getLogger(__name__)
+
+# Primary key of every table. Columns beyond these are added on demand from the frames
+# being upserted, so new scraped fields do not need a migration.
+TABLE_KEYS = {
+    "contracts": ["Player Key", "Team"],
+    "contract_salaries": ["Player Key", "Team", "Season"],
+    "contract_types": ["Player Key"],
+    "stats": ["Player Key", "Season"],
+    "positions": ["Player Key"],
+    "owners": ["Player Key"],
+}
+
+# Columns every table starts with (besides its keys); the views depend on these
+TABLE_COLUMNS = {
+    "contracts": ["Player"],
+    "contract_salaries": ["Salary"],
+    "contract_types": ["Signed Using"],
+    "stats": [],
+    "positions": ["Position"],
+    "owners": ["Owner"],
+}
+
+# Secondary indexes for season and player lookups
+INDEXES = {
+    "contract_salaries": [["Season"]],
+    "stats": [["Season"]],
+    "contracts": [["Team"]],
+}
+
+# One row per rostered player joined across datasets; stats are joined per season in queries
+VIEWS = {
+    "league_players": """
+        SELECT c."Player Key", c."Player", c."Team", o."Owner", p."Position", t."Signed Using"
+        FROM contracts c
+        LEFT JOIN owners o ON o."Player Key" = c."Player Key"
+        LEFT JOIN positions p ON p."Player Key" = c."Player Key"
+        LEFT JOIN contract_types t ON t."Player Key" = c."Player Key"
+    """,
+}
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _affinity(dtype):
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL"
+    return "TEXT"
+
+
+def _records(df):
+    # NaN -> NULL and NumPy scalars -> Python scalars for sqlite3
+    return list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+
+
+class LeagueDB:
+    """
+    One SQLite database holding contracts, contract types, per-season stats, positions
+    and owners, keyed on Player Key (and Season where it applies).
+
+    Every write is an upsert inside a transaction, so a failed refresh leaves the previous
+    data intact. The CSV and Sheets outputs are rebuilt from the tables with the *_frame
+    methods, and cross-dataset questions are answered with query() instead of loading and
+    merging several CSVs.
+    """
+
+    def __init__(self, path="data/league.db"):
+        """
+        Args:
+            path (str): Database file (":memory:" for a throwaway database).
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self._depth = 0
+        self._create_schema()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Groups writes into one transaction; nested blocks join the outermost one.
+        """
+        if self._depth == 0:
+            self.conn.execute("BEGIN")
+        self._depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._depth -= 1
+            if self._depth == 0:
+                self.conn.execute("ROLLBACK")
+            raise
+        self._depth -= 1
+        if self._depth == 0:
+            self.conn.execute("COMMIT")
+
+    def _create_schema(self):
+        with self.transaction():
+            for table, keys in TABLE_KEYS.items():
+                columns = ", ".join(
+                    [f"{_quote(key)} {'INTEGER' if key == 'Season' and table == 'stats' else 'TEXT'} NOT NULL" for key in keys]
+                    + [f"{_quote(col)} TEXT" for col in TABLE_COLUMNS[table]]
+                )
+                self.conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ({columns}, PRIMARY KEY ({', '.join(map(_quote, keys))}))"
+                )
+            for table, indexes in INDEXES.items():
+                for columns in indexes:
+                    name = f"idx_{table}_{'_'.join(col.lower().replace(' ', '_') for col in columns)}"
+                    self.conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(map(_quote, columns))})"
+                    )
+            # Source column order per table, so exported frames match the original CSVs
+            self.conn.execute('CREATE TABLE IF NOT EXISTS column_order ("Table" TEXT PRIMARY KEY, "Columns" TEXT)')
+            for name, sql in VIEWS.items():
+                self.conn.execute(f"CREATE VIEW IF NOT EXISTS {name} AS {sql}")
+
+    def columns(self, table):
+        return [row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")]
+
+    def _ensure_columns(self, table, df):
+        existing = set(self.columns(table))
+        for col in df.columns:
+            if col not in existing:
+                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {_quote(col)} {_affinity(df[col].dtype)}")
+
+    def upsert(self, table, df, replace_where=None, replace_params=()):
+        """
+        Inserts or updates rows by primary key.
+
+        Args:
+            table (str): Table name (see TABLE_KEYS).
+            df (pd.DataFrame): Rows to write; must contain the table's key columns.
+            replace_where (str, optional): When given, rows matching this SQL condition whose
+                keys are not in df are deleted, so df replaces that slice of the table
+                (e.g. '"Season" = ?' for one season of stats, "1" for the whole table).
+            replace_params (tuple): Parameters for replace_where.
+
+        Returns:
+            int: Number of rows written.
+        """
+        keys = TABLE_KEYS[table]
+        df = df.dropna(subset=keys).drop_duplicates(subset=keys)
+        columns = list(df.columns)
+        updates = [col for col in columns if col not in keys]
+        sql = (
+            f"INSERT INTO {table} ({', '.join(map(_quote, columns))}) "
+            f"VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT ({', '.join(map(_quote, keys))}) "
+            + (f"DO UPDATE SET {', '.join(f'{_quote(col)} = excluded.{_quote(col)}' for col in updates)}" if updates else "DO NOTHING")
+        )
+
+        with self.transaction():
+            self._ensure_columns(table, df)
+            self.conn.executemany(sql, _records(df))
+            self.conn.execute(
+                'INSERT OR REPLACE INTO column_order ("Table", "Columns") VALUES (?, ?)', (table, json.dumps(columns))
+            )
+            if replace_where is not None:
+                self._delete_missing(table, df[keys], replace_where, replace_params)
+        return len(df)
+
+    def _delete_missing(self, table, incoming, where, params):
+        keys = TABLE_KEYS[table]
+        self.conn.execute("DROP TABLE IF EXISTS temp._incoming")
+        self.conn.execute(f"CREATE TEMP TABLE _incoming ({', '.join(map(_quote, keys))})")
+        self.conn.executemany(f"INSERT INTO temp._incoming VALUES ({', '.join('?' for _ in keys)})", _records(incoming))
+        match = " AND ".join(f"i.{_quote(key)} = {table}.{_quote(key)}" for key in keys)
+        deleted = self.conn.execute(
+            f"DELETE FROM {table} WHERE ({where}) AND NOT EXISTS (SELECT 1 FROM temp._incoming i WHERE {match})",
+            params,
+        ).rowcount
+        self.conn.execute("DROP TABLE temp._incoming")
+        if deleted:
+            logger.info(f"Removed {deleted} stale rows from {table}")
+
+    def upsert_owners(self, owners):
+        """
+        Replaces the Player Key -> Owner mapping (a dict, or a frame with both columns).
+        Blank owners are stored as NULL; players absent from owners lose their row, so a
+        player dropped from a roster does not keep a stale owner.
+        """
+        if isinstance(owners, dict):
+            owners = pd.DataFrame({"Player Key": list(owners), "Owner": list(owners.values())})
+        owners = owners[["Player Key", "Owner"]].copy()
+        owners["Owner"] = owners["Owner"].replace("", None)
+        return self.upsert("owners", owners, replace_where="1")
+
+    def upsert_contracts(self, df):
+        """
+        Replaces the contracts snapshot: one row per player and team, with the season
+        salary cells stored long in contract_salaries. An Owner column goes to owners.
+        """
+        seasons = season_columns(df)
+        base = df.drop(columns=seasons + ["Owner"], errors="ignore")
+        salaries = df.melt(id_vars=["Player Key", "Team"], value_vars=seasons, var_name="Season", value_name="Salary")
+        with self.transaction():
+            self.upsert("contracts", base, replace_where="1")
+            self.upsert("contract_salaries", salaries, replace_where="1")
+            if "Owner" in df.columns:
+                self.upsert_owners(df)
+        logger.info(f"Upserted {len(base)} contracts across {len(seasons)} seasons")
+
+    def upsert_contract_types(self, df):
+        return self.upsert("contract_types", df)
+
+    def upsert_stats(self, df, season):
+        """
+        Replaces one season of stats.
+
+        Args:
+            df (pd.DataFrame): Season totals (nba_stats.csv or an archive file).
+            season (int): Season year (e.g., 2026 for 2025-26).
+        """
+        df = df.assign(Season=int(season))
+        return self.upsert("stats", df, replace_where='"Season" = ?', replace_params=(int(season),))
+
+    def upsert_positions(self, df):
+        """
+        Replaces the positions snapshot; an Owner column goes to owners.
+        """
+        with self.transaction():
+            written = self.upsert("positions", df.drop(columns=["Owner"], errors="ignore"), replace_where="1")
+            if "Owner" in df.columns:
+                self.upsert_owners(df)
+        return written
+
+    def query(self, sql, params=()):
+        """
+        Runs a read query and returns the result as a DataFrame.
+        """
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def table(self, table, where=None, params=()):
+        """
+        Reads a table (optionally filtered) with its columns in the order last written.
+        """
+        sql = f"SELECT * FROM {table}" + (f" WHERE {where}" if where else "")
+        df = self.query(sql, params)
+        row = self.conn.execute('SELECT "Columns" FROM column_order WHERE "Table" = ?', (table,)).fetchone()
+        order = [col for col in json.loads(row[0]) if col in df.columns] if row else []
+        return df[order + [col for col in df.columns if col not in order]]
+
+    def contracts_frame(self):
+        """
+        Rebuilds spotrac_contracts.csv: one wide row per player and team, with Owner.
+        """
+        contracts = self.table("contracts")
+        salaries = self.table("contract_salaries")
+        wide = salaries.pivot(index=["Player Key", "Team"], columns="Season", values="Salary").reset_index()
+        wide.columns.name = None
+        df = contracts.merge(wide, on=["Player Key", "Team"], how="left")
+        df = df.merge(self.table("owners"), on="Player Key", how="left")
+        df = df[[col for col in contracts.columns] + season_columns(wide) + ["Owner"]]
+        return df.sort_values(["Player Key", "Team"], kind="mergesort").reset_index(drop=True)
+
+    def stats_frame(self, season):
+        df = self.table("stats", '"Season" = ?', (int(season),)).drop(columns=["Season"])
+        return df.sort_values("Player Key", kind="mergesort").reset_index(drop=True)
+
+    def positions_frame(self):
+        df = self.table("positions").merge(self.table("owners"), on="Player Key", how="left")
+        return df.sort_values("Player Key", kind="mergesort").reset_index(drop=True)
+
+    def contract_types_frame(self):
+        return self.table("contract_types").sort_values("Player Key", kind="mergesort").reset_index(drop=True)
+
+    def seasons(self):
+        return [row[0] for row in self.conn.execute('SELECT DISTINCT "Season" FROM stats ORDER BY "Season"')]
+
+
+if __name__ == "__main__":
+    # Example usage: load the current CSVs and answer a cross-dataset question
+    with LeagueDB(":memory:") as db:
+        db.upsert_contracts(pd.read_csv("data/spotrac_contracts.csv"))
+        db.upsert_positions(pd.read_csv("data/sportsws_positions.csv"))
+        db.upsert_stats(pd.read_csv("data/nba_stats.csv"), 2026)
+        print(db.query("""
+            SELECT l."Owner", COUNT(*) AS "Players", ROUND(SUM(s."FP")) AS "FP"
+            FROM league_players l JOIN stats s ON s."Player Key" = l."Player Key" AND s."Season" = ?
+            WHERE l."Owner" IS NOT NULL GROUP BY l."Owner" ORDER BY "FP" DESC
+        """, (2026,)))
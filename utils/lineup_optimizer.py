@@ -0,0 +1,206 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Set up module-level logging for the lineup optimizer
+logger = logging.getLogger(__name__)
+
+# Lineup minutes per game by slot (league rules, section 2.2)
+SLOTS = ("G", "F", "C")
+SLOT_MINUTES = np.array([96.0, 96.0, 48.0])
+
+# Slots each Sports.ws default position may fill
+ELIGIBILITY = {
+    "G": (True, False, False),
+    "F": (False, True, False),
+    "C": (False, False, True),
+    "GF": (True, True, False),
+    "FC": (False, True, True),
+}
+
+# Fantasy games in a DMCB season (56 regular season + three 7-game playoff rounds)
+SEASON_GAMES = 77
+
+# Minutes below this are treated as zero
+EPSILON = 1e-9
+
+
+def eligibility_matrix(positions):
+    """
+    Converts Sports.ws positions (G, F, C, GF, FC) into an (n x 3) boolean G/F/C matrix.
+
+    Unknown positions are not eligible for any slot.
+    """
+    return np.array([ELIGIBILITY.get(str(p).strip().upper(), (False, False, False)) for p in positions], dtype=bool)
+
+
+def _augmenting_path(start_slots, free, alloc, eligible):
+    """
+    Finds a chain of slots from one of start_slots to a slot with free minutes.
+
+    Moving along an edge s -> t means shifting minutes of an already-placed player from
+    slot s to slot t, which frees room in s. With three slots the search is tiny.
+
+    Returns:
+        list of int or None: The slot path, or None if every reachable slot is full.
+    """
+    parents = {s: None for s in start_slots}
+    queue = list(start_slots)
+    while queue:
+        slot = queue.pop(0)
+        if free[slot] > EPSILON:
+            path = [slot]
+            while parents[path[-1]] is not None:
+                path.append(parents[path[-1]])
+            return path[::-1]
+        for target in range(len(SLOTS)):
+            if target in parents:
+                continue
+            if (alloc[:, slot] * eligible[:, target]).sum() > EPSILON:
+                parents[target] = slot
+                queue.append(target)
+    return None
+
+
+def optimize_lineup(fppm, minutes, eligible, slot_minutes=SLOT_MINUTES):
+    """
+    Allocates lineup minutes to maximize projected fantasy points.
+
+    Players are placed in descending FPPM order, each taking as many of their minutes as
+    the slots allow; when a player's slots are full, minutes of already-placed
+    multi-position players are shifted along an augmenting path (e.g., a GF moves from G to
+    F to make room for a guard). Because the feasible allocations form a polymatroid, this
+    greedy max-flow is optimal, and it needs no LP solver.
+
+    Args:
+        fppm (array): Projected fantasy points per minute for each player.
+        minutes (array): Maximum minutes each player can play.
+        eligible (array): (n x 3) boolean G/F/C eligibility.
+        slot_minutes (array): Minutes available per slot.
+
+    Returns:
+        np.ndarray: (n x 3) minutes allocated to each player in each slot.
+    """
+    fppm = np.asarray(fppm, dtype=float)
+    minutes = np.asarray(minutes, dtype=float)
+    eligible = np.asarray(eligible, dtype=bool)
+
+    alloc = np.zeros((len(fppm), len(SLOTS)))
+    free = np.array(slot_minutes, dtype=float)
+
+    for i in np.argsort(-fppm, kind="mergesort"):
+        # Minutes for players with no positive value only lower the score
+        if fppm[i] <= 0:
+            break
+        remaining = minutes[i]
+        start_slots = list(np.flatnonzero(eligible[i]))
+        while remaining > EPSILON and start_slots:
+            path = _augmenting_path(start_slots, free, alloc, eligible)
+            if path is None:
+                break
+
+            # The push is limited by the player's minutes, the free room at the end of the
+            # path and the movable minutes along each edge
+            amount = min(remaining, free[path[-1]])
+            for source, target in zip(path, path[1:]):
+                amount = min(amount, (alloc[:, source] * eligible[:, target]).sum())
+
+            alloc[i, path[0]] += amount
+            for source, target in zip(path, path[1:]):
+                to_move = amount
+                for j in np.flatnonzero((alloc[:, source] > EPSILON) & eligible[:, target]):
+                    moved = min(to_move, alloc[j, source])
+                    alloc[j, source] -= moved
+                    alloc[j, target] += moved
+                    to_move -= moved
+                    if to_move <= EPSILON:
+                        break
+            free[path[-1]] -= amount
+            remaining -= amount
+
+    return alloc
+
+
+def build_rosters(positions, stats):
+    """
+    Joins owned players from sportsws_positions.csv with projected FPPM and minutes.
+
+    Args:
+        positions (pd.DataFrame): Player Key, Position and Owner (Sports.ws).
+        stats (pd.DataFrame): Player Key, FPPM and MPG (e.g., nba_stats.csv).
+
+    Returns:
+        pd.DataFrame: Owner, Player Key, Position, FPPM and Minutes for every owned player.
+    """
+    owned = positions.dropna(subset=["Owner"])
+    owned = owned[owned["Owner"].astype(str).str.strip() != ""]
+    rosters = owned[["Owner", "Player Key", "Position"]].merge(
+        stats[["Player Key", "FPPM", "MPG"]].drop_duplicates(subset=["Player Key"]),
+        on="Player Key",
+        how="left",
+    )
+    rosters["FPPM"] = pd.to_numeric(rosters["FPPM"], errors="coerce").fillna(0.0)
+    rosters["Minutes"] = pd.to_numeric(rosters["MPG"], errors="coerce").fillna(0.0).clip(upper=48.0)
+    return rosters.drop(columns=["MPG"]).sort_values(["Owner", "Player Key"]).reset_index(drop=True)
+
+
+def optimize_season(rosters, availability=None, games=SEASON_GAMES):
+    """
+    Solves every owner's lineup for every game number in one batch.
+
+    Args:
+        rosters (pd.DataFrame): Owner, Player Key, Position, FPPM and Minutes (see build_rosters).
+        availability (pd.DataFrame, optional): Player Key index x game number columns (1..games)
+            with the fraction of projected minutes each player is expected to play (0 when
+            injured or resting). Players missing from it are always available.
+        games (int): Number of fantasy games.
+
+    Returns:
+        pd.DataFrame: One row per owner, game and player with G/F/C minutes and projected FP.
+    """
+    frames = []
+    solved = {}
+    for owner, roster in rosters.groupby("Owner", sort=True):
+        roster = roster.reset_index(drop=True)
+        eligible = eligibility_matrix(roster["Position"])
+        fppm = roster["FPPM"].to_numpy(dtype=float)
+
+        if availability is None:
+            scale = np.ones((games, len(roster)))
+        else:
+            scale = (
+                availability.reindex(index=roster["Player Key"], columns=range(1, games + 1))
+                .fillna(1.0).to_numpy(dtype=float).T
+            )
+        minutes = scale * roster["Minutes"].to_numpy(dtype=float)
+
+        # Most game numbers share the same availability, so solve each distinct one once
+        alloc = np.empty((games, len(roster), len(SLOTS)))
+        for game in range(games):
+            signature = (owner, minutes[game].tobytes())
+            if signature not in solved:
+                solved[signature] = optimize_lineup(fppm, minutes[game], eligible)
+            alloc[game] = solved[signature]
+
+        frame = pd.DataFrame({
+            "Owner": owner,
+            "Game": np.repeat(np.arange(1, games + 1), len(roster)),
+            "Player Key": np.tile(roster["Player Key"].to_numpy(), games),
+            "Position": np.tile(roster["Position"].to_numpy(), games),
+        })
+        for s, slot in enumerate(SLOTS):
+            frame[slot] = alloc[:, :, s].ravel().round(2)
+        frame["Minutes"] = frame[list(SLOTS)].sum(axis=1).round(2)
+        frame["Projected FP"] = (alloc.sum(axis=2) * fppm).ravel().round(2)
+        frames.append(frame)
+
+    logger.info(f"Solved {len(solved)} distinct lineups for {rosters['Owner'].nunique()} owners x {games} games")
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+if __name__ == "__main__":
+    # Example usage: projected FP per game for each owner's best lineup
+    rosters = build_rosters(pd.read_csv("data/sportsws_positions.csv"), pd.read_csv("data/nba_stats.csv"))
+    lineups = optimize_season(rosters, games=1)
+    print(lineups.groupby("Owner")["Projected FP"].sum().sort_values(ascending=False))
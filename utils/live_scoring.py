@@ -0,0 +1,231 @@
+import logging
+import time
+from collections import defaultdict
+
+import pandas as pd
+import requests
+
+from utils import http_client, telemetry
+from utils.text_formatter import make_player_key
+
+# Set up module-level logging for the live scorer
+logger = logging.getLogger(__name__)
+
+# NBA live data feeds (the same JSON nba_api.live reads). Both send ETag and
+# Last-Modified headers, so unchanged feeds cost a 304 with no body.
+SCOREBOARD_URL = "https://cdn.nba.com/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+BOXSCORE_URL = "https://cdn.nba.com/static/json/liveData/boxscore/boxscore_{game_id}.json"
+
+# Seconds between polls (the feeds themselves refresh every few seconds)
+POLL_INTERVAL = 5
+
+# gameStatus values in the live feeds
+SCHEDULED, LIVE, FINAL = 1, 2, 3
+
+# Box score statistics that make up fantasy points (FP = PTS + TRB + AST + STL + BLK - TOV - PF)
+FP_STATS = ["points", "reboundsTotal", "assists", "steals", "blocks", "turnovers", "foulsPersonal"]
+FP_SIGNS = [1, 1, 1, 1, 1, -1, -1]
+
+
+def fantasy_points(stats):
+    """
+    Returns the fantasy points of one live box score stat line.
+    """
+    return sum(sign * (stats.get(name) or 0) for name, sign in zip(FP_STATS, FP_SIGNS))
+
+
+class LiveScorer:
+    """
+    Per-owner fantasy point tally for one DMCB game number, kept current by polling the
+    NBA live box scores.
+
+    Every feed is requested conditionally (If-None-Match / If-Modified-Since), so a poll
+    in which nothing happened costs one 304 per live game. When a box score did change,
+    only the stat lines that differ from the previous poll are applied to the tally, and
+    games that have gone final are not requested again.
+
+    Only the NBA games that count for the game number are scored: each team's Nth game
+    (see ScheduleIndex.games_for). Raw FP is tallied for every rostered player; lineup
+    minute limits are not applied.
+    """
+
+    def __init__(self, owner_lookup, schedule_index, number, session=None,
+                 scoreboard_url=SCOREBOARD_URL, boxscore_url=BOXSCORE_URL):
+        """
+        Args:
+            owner_lookup (dict): Player Key -> Owner.
+            schedule_index (ScheduleIndex): Game-number windows and games.
+            number (int): DMCB game number to score.
+            session (requests.Session, optional): Session to use instead of the shared pooled client.
+            scoreboard_url (str): Live scoreboard feed.
+            boxscore_url (str): Live box score feed, formatted with game_id.
+        """
+        self.owner_lookup = {key: owner for key, owner in owner_lookup.items() if owner}
+        self.number = number
+        self.session = session
+        self.scoreboard_url = scoreboard_url
+        self.boxscore_url = boxscore_url
+
+        # Game ID -> teams whose game for this number it is
+        self.counted = defaultdict(set)
+        for entry in schedule_index.games_for(number):
+            self.counted[entry["Game ID"]].add(entry["Team"])
+        self.starts = {game_id: schedule_index.games[game_id]["Start"] for game_id in self.counted}
+
+        # (Game ID, personId) -> (Player Key, Owner, stat tuple, FP)
+        self.lines = {}
+        self.owner_fp = defaultdict(float)
+        # Scoreboard gameStatus by Game ID, and games whose final box score has been applied
+        self.status = {}
+        self.final = set()
+        self._validators = {}
+
+    def _get_json(self, url):
+        """
+        Conditionally GETs a feed. Returns the parsed JSON, or None if it has not changed
+        (or is not available yet).
+        """
+        headers = {}
+        etag, modified = self._validators.get(url, (None, None))
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+        try:
+            response = http_client.get(url, session=self.session, headers=headers)
+        except requests.RequestException as e:
+            logger.warning(f"Live feed request failed: {url}: {e}")
+            return None
+        if response.status_code == 304:
+            return None
+        if response.status_code != 200:
+            # Box scores 403/404 until a game tips off
+            logger.debug(f"Live feed {url} returned HTTP {response.status_code}")
+            return None
+        self._validators[url] = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        with telemetry.timed_parse("nba-live", url):
+            return response.json()
+
+    def _pending_games(self, now):
+        """
+        Game IDs worth requesting: counted games that have started and are not final yet.
+        """
+        payload = self._get_json(self.scoreboard_url)
+        if payload is not None:
+            for game in payload.get("scoreboard", {}).get("games", []):
+                if game["gameId"] in self.counted:
+                    self.status[game["gameId"]] = game["gameStatus"]
+
+        pending = []
+        for game_id, start in sorted(self.starts.items(), key=lambda item: item[1]):
+            if game_id in self.final or self.status.get(game_id) == SCHEDULED or start > now:
+                continue
+            pending.append(game_id)
+        return pending
+
+    def apply_boxscore(self, payload):
+        """
+        Applies the stat lines of a live box score that changed since the last one.
+
+        Args:
+            payload (dict): boxscore_<game_id>.json content.
+
+        Returns:
+            dict: Owner -> FP change from this box score (owners without changes omitted).
+        """
+        game = payload["game"]
+        game_id = game["gameId"]
+        teams = self.counted.get(game_id, set())
+        deltas = defaultdict(float)
+
+        for side in ("homeTeam", "awayTeam"):
+            team = game[side]
+            if team["teamTricode"] not in teams:
+                continue
+            for player in team.get("players", []):
+                stats = player.get("statistics", {})
+                line = tuple(stats.get(name) or 0 for name in FP_STATS)
+                line_key = (game_id, player["personId"])
+                previous = self.lines.get(line_key)
+                if previous is not None and previous[2] == line:
+                    continue
+
+                if previous is None:
+                    key = make_player_key(f"{player.get('firstName', '')} {player.get('familyName', '')}")
+                    owner = self.owner_lookup.get(key)
+                else:
+                    key, owner = previous[0], previous[1]
+                points = fantasy_points(stats)
+                self.lines[line_key] = (key, owner, line, points)
+                if owner is not None:
+                    deltas[owner] += points - (previous[3] if previous is not None else 0)
+
+        self.status[game_id] = game.get("gameStatus", self.status.get(game_id))
+        if self.status[game_id] == FINAL:
+            self.final.add(game_id)
+        for owner, delta in deltas.items():
+            self.owner_fp[owner] += delta
+        return {owner: delta for owner, delta in deltas.items() if delta}
+
+    def poll(self, now=None):
+        """
+        Refreshes every live game of the game number once.
+
+        Args:
+            now: Current time (default: now); games that have not tipped off are skipped.
+
+        Returns:
+            dict: Owner -> FP change since the previous poll.
+        """
+        now = pd.Timestamp.now(tz="UTC") if now is None else pd.Timestamp(now)
+        changes = defaultdict(float)
+        for game_id in self._pending_games(now):
+            payload = self._get_json(self.boxscore_url.format(game_id=game_id))
+            if payload is None:
+                continue
+            for owner, delta in self.apply_boxscore(payload).items():
+                changes[owner] += delta
+        return {owner: delta for owner, delta in changes.items() if delta}
+
+    def done(self):
+        """
+        Returns True once every counted game is final.
+        """
+        return all(game_id in self.final for game_id in self.counted)
+
+    def standings(self):
+        """
+        Returns the live tally as a DataFrame (Owner, FP, Players), highest FP first.
+        Owners with no player in a counted game yet are listed with 0 FP.
+        """
+        players = defaultdict(int)
+        for _, owner, _, _ in self.lines.values():
+            if owner is not None:
+                players[owner] += 1
+        owners = sorted(set(self.owner_lookup.values()))
+        df = pd.DataFrame({
+            "Owner": owners,
+            "FP": [self.owner_fp.get(owner, 0.0) for owner in owners],
+            "Players": [players.get(owner, 0) for owner in owners],
+        })
+        return df.sort_values(["FP", "Owner"], ascending=[False, True], ignore_index=True)
+
+    def run(self, interval=POLL_INTERVAL, on_update=None, max_polls=None):
+        """
+        Polls until every counted game is final (or max_polls is reached).
+
+        Args:
+            interval (float): Seconds between polls.
+            on_update (callable, optional): Called with (scorer, changes) after each poll that
+                changed the tally.
+            max_polls (int, optional): Stop after this many polls.
+        """
+        polls = 0
+        while not self.done() and (max_polls is None or polls < max_polls):
+            start = time.monotonic()
+            changes = self.poll()
+            polls += 1
+            if changes and on_update is not None:
+                on_update(self, changes)
+            if not self.done():
+                time.sleep(max(0.0, interval - (time.monotonic() - start)))
@@ -0,0 +1,228 @@
+import logging
+
+import pandas as pd
+
+# Set up module-level logging for the master view
+logger = logging.getLogger(__name__)
+
+# Sources in column order. A column that an earlier source already provides is
+# suffixed with the later source's label (e.g. "Age (Stats)").
+SOURCES = ["contracts", "contract_types", "stats", "positions", "owners"]
+SOURCE_LABELS = {
+    "contracts": "Contracts",
+    "contract_types": "Types",
+    "stats": "Stats",
+    "positions": "Positions",
+    "owners": "Owners",
+}
+
+# The single Owner column takes the first non-blank owner in this order
+OWNER_PRIORITY = ["owners", "contracts", "positions"]
+
+KEY = "Player Key"
+
+
+def row_hashes(frame):
+    """
+    Returns a per-row hash of a source frame indexed by Player Key.
+    """
+    return pd.Series(pd.util.hash_pandas_object(frame.astype(str), index=True).to_numpy(), index=frame.index)
+
+
+class MasterView:
+    """
+    A materialized one-row-per-player view joining every league dataset on Player Key.
+
+    Each source is kept as a frame indexed by Player Key, so assembling a player's row is
+    a hash lookup into each source (reindex) rather than a merge of whole tables. When a
+    source is updated, its rows are hashed and compared with the previous version; only
+    the players whose rows changed (or appeared or disappeared) are reassembled and
+    marked dirty for export, and to_csv() re-formats only those rows. A source whose
+    columns change rebuilds the whole view.
+
+    Sources may repeat a Player Key (e.g. a player with contracts on two teams); the
+    first row is used. Each source's key index doubles as its membership set, so
+    coverage() (unmatched keys per source) needs no extra join.
+    """
+
+    def __init__(self):
+        self.frames = {}
+        self.owners = {}
+        self.hashes = {}
+        self.raw_columns = {}
+        self.columns = {}
+        self.table = pd.DataFrame(columns=[KEY, "Owner"]).set_index(KEY, drop=False)
+        self.dirty = set()
+        self.removed = set()
+        # Formatted CSV line per Player Key, and the header/dtypes they were formatted with
+        self._csv_lines = {}
+        self._csv_layout = None
+
+    def _loaded(self):
+        return [source for source in SOURCES if source in self.frames]
+
+    def _name_columns(self):
+        """
+        Assigns the view's column names for every loaded source (in SOURCES order).
+        """
+        used = {KEY, "Owner"}
+        for source in self._loaded():
+            names = []
+            for col in self.raw_columns[source]:
+                name = col if col not in used else f"{col} ({SOURCE_LABELS[source]})"
+                used.add(name)
+                names.append(name)
+            self.columns[source] = names
+
+    def _rows(self, keys):
+        """
+        Assembles the view rows of the given Player Keys from every loaded source.
+        """
+        parts = [pd.DataFrame({KEY: keys}, index=keys)]
+        for source in self._loaded():
+            part = self.frames[source].reindex(keys)
+            part.columns = self.columns[source]
+            parts.append(part)
+        rows = pd.concat(parts, axis=1)
+
+        owner = pd.Series("", index=keys, dtype=object)
+        for source in reversed(OWNER_PRIORITY):
+            if source in self.owners:
+                candidate = self.owners[source].reindex(keys).fillna("")
+                owner = candidate.where(candidate != "", owner)
+        rows["Owner"] = owner
+        return rows
+
+    def update(self, source, df):
+        """
+        Replaces one source and recomputes only the affected rows.
+
+        Args:
+            source (str): One of SOURCES.
+            df (pd.DataFrame): The source dataset (must have a Player Key column).
+
+        Returns:
+            list of str: Player Keys whose view rows were added, changed or removed.
+        """
+        if source not in SOURCE_LABELS:
+            raise ValueError(f"Unknown source {source!r}; expected one of {SOURCES}")
+
+        frame = df.copy()
+        frame[KEY] = frame[KEY].astype(str).str.strip()
+        frame = frame[frame[KEY] != ""].drop_duplicates(subset=[KEY], keep="first").set_index(KEY)
+        owner = frame.pop("Owner").fillna("").astype(str) if "Owner" in frame.columns else None
+
+        hashes = row_hashes(frame if owner is None else frame.assign(Owner=owner))
+        old_hashes = self.hashes.get(source, pd.Series(dtype="uint64"))
+        changed = hashes.index[old_hashes.reindex(hashes.index).to_numpy() != hashes.to_numpy()]
+        changed = changed.append(old_hashes.index.difference(hashes.index))
+        schema_changed = self.raw_columns.get(source) != list(frame.columns)
+
+        self.frames[source] = frame
+        self.hashes[source] = hashes
+        self.raw_columns[source] = list(frame.columns)
+        if owner is not None:
+            self.owners[source] = owner
+        else:
+            self.owners.pop(source, None)
+
+        keys = self.frames[self._loaded()[0]].index
+        for other in self._loaded()[1:]:
+            keys = keys.union(self.frames[other].index)
+
+        if schema_changed:
+            self._name_columns()
+            old_keys = self.table.index
+            self.table = self._rows(keys.sort_values())
+            touched = keys.union(old_keys)
+        else:
+            touched = changed.unique()
+            rebuild = touched.intersection(keys)
+            kept = self.table.drop(index=touched, errors="ignore")
+            rows = self._rows(rebuild)
+            if len(rows):
+                kept = pd.concat([kept, rows]) if len(kept) else rows
+            self.table = kept.sort_index()
+
+        gone = set(touched.difference(keys))
+        self.removed = (self.removed | gone) - set(keys)
+        self.dirty = (self.dirty | set(touched)) - gone
+        logger.info(
+            f"Master view: {source} updated {len(touched)} of {len(self.table)} rows"
+            + (" (columns changed, full rebuild)" if schema_changed else "")
+        )
+        return sorted(touched)
+
+    def take_dirty(self):
+        """
+        Returns the rows changed since the last call and clears the dirty marks.
+
+        Returns:
+            tuple: (pd.DataFrame of changed rows, sorted list of removed Player Keys).
+        """
+        rows = self.table.loc[sorted(self.dirty)] if self.dirty else self.table.iloc[0:0]
+        removed = sorted(self.removed)
+        self.dirty, self.removed = set(), set()
+        return rows, removed
+
+    def to_csv(self):
+        """
+        Returns the view as CSV text (the layout of table.to_csv(index=False)) and clears
+        the dirty marks.
+
+        Each player's formatted line is kept between calls, so only the rows marked dirty
+        since the previous call are formatted again. The first call, and any call after
+        the view's columns or dtypes changed, formats every row.
+        """
+        rows, removed = self.take_dirty()
+        header = self.table.iloc[0:0].to_csv(index=False)
+        layout = (header, tuple(self.table.dtypes.astype(str)))
+        if layout != self._csv_layout:
+            self._csv_lines, self._csv_layout = {}, layout
+            rows = self.table
+        for key in removed:
+            self._csv_lines.pop(key, None)
+        if len(rows):
+            lines = rows.to_csv(index=False, header=False).splitlines(keepends=True)
+            if len(lines) != len(rows):
+                # A quoted field holds a line break; format row by row instead
+                lines = [rows.iloc[[i]].to_csv(index=False, header=False) for i in range(len(rows))]
+            self._csv_lines.update(zip(rows[KEY], lines))
+        return header + "".join(self._csv_lines[key] for key in sorted(self._csv_lines))
+
+    def unmatched(self, source):
+        """
+        Returns the Player Keys of one source that no other loaded source has.
+        """
+        others = pd.Index([])
+        for other in self._loaded():
+            if other != source:
+                others = others.union(self.frames[other].index)
+        return sorted(self.frames[source].index.difference(others))
+
+    def coverage(self):
+        """
+        Returns per-source coverage of the view: keys, view rows it is missing, and keys
+        no other source has.
+        """
+        rows = []
+        for source in self._loaded():
+            index = self.frames[source].index
+            rows.append({
+                "Source": source,
+                "Keys": len(index),
+                "Missing": int((~self.table.index.isin(index)).sum()),
+                "Unmatched": len(self.unmatched(source)),
+            })
+        return pd.DataFrame(rows, columns=["Source", "Keys", "Missing", "Unmatched"])
+
+
+if __name__ == "__main__":
+    # Example usage: build the view from the CSV outputs and show the source coverage
+    view = MasterView()
+    view.update("contracts", pd.read_csv("data/spotrac_contracts.csv"))
+    view.update("contract_types", pd.read_csv("data/contract_types.csv"))
+    view.update("stats", pd.read_csv("data/nba_stats.csv"))
+    view.update("positions", pd.read_csv("data/sportsws_positions.csv"))
+    print(view.table.head().to_string(index=False))
+    print(view.coverage().to_string(index=False))
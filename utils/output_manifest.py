@@ -0,0 +1,211 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads within one process are coordinated
+    fcntl = None
+
+# Set up module-level logging for the output manifest
+logger = logging.getLogger(__name__)
+
+# Where the hashes of written files and pushed sheets are kept
+MANIFEST_PATH = os.path.join("data", ".manifest.json")
+
+# Set to 1 to write and push even when the content is unchanged (e.g. after editing a tab by hand)
+FORCE_ENV = "DMCB_FORCE_WRITES"
+
+
+def content_hash(content):
+    """
+    Returns the SHA-256 hex digest of bytes, a string, or a JSON-serializable payload.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    elif not isinstance(content, bytes):
+        content = json.dumps(content, default=str, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def atomic_write(path, content):
+    """
+    Writes bytes to path via a temporary file in the same directory and a rename, so
+    readers never see a partially written file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class OutputManifest:
+    """
+    Content hashes of every output file and every pushed Google Sheets payload.
+
+    Files are only rewritten, and tabs only cleared and re-pushed, when their content
+    differs from what was last written. The manifest is shared by concurrent pipeline
+    stages and by other processes (daemon jobs, cron scripts), so each save re-reads the
+    file under a thread and file lock, merges in the entry that changed and writes the
+    result atomically.
+    """
+
+    def __init__(self, path=MANIFEST_PATH, force=None):
+        """
+        Args:
+            path (str): Manifest JSON file.
+            force (bool, optional): Always write and push (defaults to the DMCB_FORCE_WRITES
+                environment variable).
+        """
+        self.path = path
+        self.force = os.getenv(FORCE_ENV, "") == "1" if force is None else force
+        self._lock = threading.Lock()
+        self.entries = self._load()
+
+    def _load(self):
+        entries = {"files": {}, "sheets": {}}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    entries.update(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable manifest {self.path}: {e}")
+        return entries
+
+    def _save(self, section, key):
+        # Caller holds self._lock; the file lock keeps other processes from writing
+        # between our re-read and the replace, so their entries are never dropped
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path + ".lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                entries = self._load()
+                entries[section][key] = self.entries[section][key]
+                atomic_write(self.path, json.dumps(entries, indent=2, sort_keys=True).encode("utf-8"))
+                self.entries = entries
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _file_matches(self, path, digest):
+        # Trust the recorded hash while the file's size and mtime are unchanged; otherwise
+        # hash what is on disk (e.g. the first run, or a file edited by hand)
+        if not os.path.exists(path):
+            return False
+        stat = os.stat(path)
+        entry = self.entries["files"].get(os.path.normpath(path))
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["hash"] == digest
+        with open(path, "rb") as f:
+            return content_hash(f.read()) == digest
+
+    def write_file(self, path, content):
+        """
+        Atomically writes content to path unless the file already holds the same bytes.
+
+        Args:
+            path (str): Output file.
+            content (bytes or str): File contents.
+
+        Returns:
+            bool: True if the file was written, False if it was unchanged.
+        """
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        digest = content_hash(content)
+        with self._lock:
+            if not self.force and self._file_matches(path, digest):
+                logger.info(f"{path} unchanged; skipped write")
+                return False
+            atomic_write(path, content)
+            stat = os.stat(path)
+            key = os.path.normpath(path)
+            self.entries["files"][key] = {
+                "hash": digest,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "written": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            self._save("files", key)
+        return True
+
+    def write_csv(self, df, path, **kwargs):
+        """
+        Writes a DataFrame as CSV (index=False unless given) through write_file.
+
+        Returns:
+            bool: True if the file was written, False if it was unchanged.
+        """
+        kwargs.setdefault("index", False)
+        kwargs.pop("encoding", None)
+        return self.write_file(path, df.to_csv(**kwargs))
+
+    def sheet_unchanged(self, sheet_name, payload):
+        """
+        Returns True if payload matches the last successful push to sheet_name.
+        """
+        if self.force:
+            return False
+        with self._lock:
+            entry = self.entries["sheets"].get(sheet_name)
+        unchanged = entry is not None and entry["hash"] == content_hash(payload)
+        if unchanged:
+            logger.info(f"Google Sheets '{sheet_name}' unchanged since {entry['pushed']}; skipped push")
+        return unchanged
+
+    def record_push(self, sheet_name, payload):
+        """
+        Records a successful push of payload to sheet_name.
+        """
+        with self._lock:
+            self.entries["sheets"][sheet_name] = {
+                "hash": content_hash(payload),
+                "rows": len(payload),
+                "pushed": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            self._save("sheets", sheet_name)
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_manifest():
+    """
+    Returns the process-wide manifest at MANIFEST_PATH.
+    """
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = OutputManifest()
+        return _default
+
+
+def write_file(path, content):
+    return get_manifest().write_file(path, content)
+
+
+def write_csv(df, path, **kwargs):
+    return get_manifest().write_csv(df, path, **kwargs)
+
+
+def sheet_unchanged(sheet_name, payload):
+    return get_manifest().sheet_unchanged(sheet_name, payload)
+
+
+def record_push(sheet_name, payload):
+    return get_manifest().record_push(sheet_name, payload)
@@ -0,0 +1,209 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from utils import http_client, telemetry
+from utils.google_sheets_manager import GoogleSheetsManager
+
+# Set up module-level logging to track pipeline progress
+logger = logging.getLogger(__name__)
+
+
+class PipelineContext:
+    """
+    Resources shared by every stage of a pipeline run.
+
+    The HTTP session is the shared pooled client, so all scrapers share one keep-alive
+    pool per host. The Google Sheets client is created lazily on first use, so runs that
+    never touch Sheets do not authenticate, and runs that do authenticate only once.
+    """
+
+    def __init__(self, update_csv=True, update_sheets=False, session=None):
+        self.update_csv = update_csv
+        self.update_sheets = update_sheets
+        self._owns_session = session is None
+        self.session = session or http_client.get_session()
+        self._sheets_manager = None
+        self._sheets_failed = False
+        self._sheets_lock = threading.Lock()
+
+    @property
+    def sheets_manager(self):
+        """
+        Returns the shared GoogleSheetsManager, or None if it could not be initialized.
+        """
+        with self._sheets_lock:
+            if self._sheets_manager is None and not self._sheets_failed:
+                try:
+                    self._sheets_manager = GoogleSheetsManager()
+                except Exception as e:
+                    logger.warning(f"Google Sheets unavailable for this run: {e}")
+                    self._sheets_failed = True
+            return self._sheets_manager
+
+    def close(self):
+        if self._owns_session:
+            http_client.close_session()
+
+
+class Stage:
+    """
+    A named unit of work in a pipeline.
+
+    Args:
+        name (str): Unique stage name.
+        func (callable): Called as func(context, inputs), where inputs maps each dependency
+            name to the value that stage returned.
+        depends_on (iterable of str): Names of the stages that must finish first.
+    """
+
+    def __init__(self, name, func, depends_on=()):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+
+
+class Pipeline:
+    """
+    Runs stages as a dependency graph, starting each stage as soon as its inputs are ready.
+
+    Independent stages run concurrently on a thread pool, and results are handed to
+    dependents in memory. A failed stage marks everything downstream of it as skipped.
+    """
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.stages = {}
+
+    def add_stage(self, name, func, depends_on=()):
+        """
+        Registers a stage.
+
+        Raises:
+            ValueError: If a stage with the same name already exists.
+        """
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage name: {name}")
+        self.stages[name] = Stage(name, func, depends_on)
+        return self.stages[name]
+
+    def _select(self, targets):
+        """
+        Returns the names of the target stages plus everything they depend on.
+        """
+        if targets is None:
+            return set(self.stages)
+
+        selected = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage: {name}")
+            if name not in selected:
+                selected.add(name)
+                pending.extend(self.stages[name].depends_on)
+        return selected
+
+    def _validate(self, selected):
+        """
+        Checks that all dependencies exist and that the graph has no cycles.
+
+        Raises:
+            ValueError: On a missing dependency or a cycle.
+        """
+        for name in selected:
+            for dep in self.stages[name].depends_on:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage '{name}' depends on unknown stage '{dep}'")
+
+        visiting, done = set(), set()
+
+        def visit(name, path):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+            visiting.add(name)
+            for dep in self.stages[name].depends_on:
+                visit(dep, path + [name])
+            visiting.discard(name)
+            done.add(name)
+
+        for name in sorted(selected):
+            visit(name, [])
+
+    def run(self, context, targets=None):
+        """
+        Executes the selected stages.
+
+        Args:
+            context (PipelineContext): Shared resources passed to every stage.
+            targets (iterable of str, optional): Stages to run (with their dependencies).
+                Defaults to all stages.
+
+        Returns:
+            dict: Stage name -> {"status", "result", "error", "seconds"}.
+        """
+        selected = self._select(targets)
+        self._validate(selected)
+
+        outcomes = {}
+        remaining = set(selected)
+        running = {}
+
+        def start_ready(executor):
+            for name in sorted(remaining):
+                stage = self.stages[name]
+                if not all(dep in outcomes for dep in stage.depends_on):
+                    continue
+
+                remaining.discard(name)
+                failed = [dep for dep in stage.depends_on if outcomes[dep]["status"] != "ok"]
+                if failed:
+                    logger.warning(f"Skipping stage '{name}': upstream failed ({', '.join(failed)})")
+                    outcomes[name] = {"status": "skipped", "result": None, "error": None, "seconds": 0.0}
+                    # A skip can unblock further skips downstream
+                    return True
+
+                inputs = {dep: outcomes[dep]["result"] for dep in stage.depends_on}
+                logger.info(f"Starting stage '{name}'")
+                running[executor.submit(self._run_stage, stage, context, inputs)] = name
+            return False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while remaining or running:
+                while start_ready(executor):
+                    pass
+
+                if not running:
+                    break
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    outcomes[name] = future.result()
+                    logger.info(
+                        f"Stage '{name}' {outcomes[name]['status']} in {outcomes[name]['seconds']:.1f}s"
+                    )
+
+        return outcomes
+
+    @staticmethod
+    def _run_stage(stage, context, inputs):
+        start = time.perf_counter()
+        try:
+            with telemetry.stage(stage.name):
+                result = stage.func(context, inputs)
+            status, error = "ok", None
+        except BaseException as e:
+            # Scripts call sys.exit() on fatal errors; treat that as a stage failure too
+            logger.error(f"Stage '{stage.name}' failed: {e!r}")
+            result, status, error = None, "failed", e
+        return {
+            "status": status,
+            "result": result,
+            "error": error,
+            "seconds": time.perf_counter() - start,
+        }
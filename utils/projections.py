@@ -0,0 +1,193 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+# Set up module-level logging for the projection engine
+logger = logging.getLogger(__name__)
+
+# Weights for the last three seasons, most recent first
+SEASON_WEIGHTS = (5.0, 4.0, 3.0)
+
+# Weighted minutes of league-average production blended into every projection, so a
+# small sample is pulled toward the league rate
+REGRESSION_MINUTES = 800.0
+
+# Per-year FPPM change relative to the peak age (improvement before, decline after)
+PEAK_AGE = 27
+YOUNG_AGE_RATE = 0.006
+OLD_AGE_RATE = 0.004
+
+# Per-year change in minutes per game after the peak age
+OLD_MINUTES_RATE = 0.01
+
+# Archive files are named NBA_<year>_totals.csv (year = season end, e.g. 2025 for 2024-25)
+ARCHIVE_PATTERN = re.compile(r"NBA_(\d{4})_totals\.csv$")
+
+# Bump when the projection formula changes so old cache entries are ignored
+CACHE_VERSION = 1
+
+
+def season_files(archive_dir="data/bbref_archive", current_csv=None, current_year=None):
+    """
+    Lists the season files to project from as {season year: path}.
+
+    Args:
+        archive_dir (str): Directory of NBA_<year>_totals.csv files.
+        current_csv (str, optional): In-progress season totals (e.g., data/nba_stats.csv).
+        current_year (int, optional): Season year of current_csv; defaults to the latest
+            archive year + 1.
+
+    Returns:
+        dict: Season year -> file path, in ascending year order.
+    """
+    files = {}
+    for path in glob.glob(os.path.join(archive_dir, "NBA_*_totals.csv")):
+        match = ARCHIVE_PATTERN.search(path)
+        if match:
+            files[int(match.group(1))] = path
+    if current_csv and os.path.exists(current_csv):
+        year = current_year or (max(files) + 1 if files else None)
+        if year is not None:
+            files[year] = current_csv
+    return dict(sorted(files.items()))
+
+
+def load_seasons(files):
+    """
+    Stacks season totals into one DataFrame with a Season column.
+    """
+    frames = []
+    for year, path in files.items():
+        df = pd.read_csv(path, usecols=lambda col: col in {"Player", "Player Key", "Age", "G", "MP", "FP"})
+        df["Season"] = year
+        frames.append(df.drop_duplicates(subset=["Player Key"]))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def project(stacked, target_year=None, weights=SEASON_WEIGHTS, regression_minutes=REGRESSION_MINUTES):
+    """
+    Projects FPPM, minutes and games for every player in one vectorized pass.
+
+    Each stat is pivoted to a (players x seasons) array; the last len(weights) seasons
+    before target_year are combined with the season weights, FPPM is regressed toward the
+    league rate by regression_minutes, and both FPPM and MPG are adjusted for the
+    player's age in the target season.
+
+    Args:
+        stacked (pd.DataFrame): Player, Player Key, Age, G, MP, FP and Season columns.
+        target_year (int, optional): Season to project; defaults to the latest season + 1.
+        weights (tuple): Season weights, most recent first.
+        regression_minutes (float): League-average minutes blended into each FPPM.
+
+    Returns:
+        pd.DataFrame: Projections keyed by Player Key.
+    """
+    target_year = target_year or int(stacked["Season"].max()) + 1
+    seasons = [target_year - 1 - k for k in range(len(weights))]
+    recent = stacked[stacked["Season"].isin(seasons)]
+
+    def grid(column):
+        table = recent.pivot(index="Player Key", columns="Season", values=column).reindex(columns=seasons)
+        return table.apply(pd.to_numeric, errors="coerce")
+
+    fp, mp, games = grid("FP"), grid("MP"), grid("G")
+    keys = fp.index
+    fp, mp, games = fp.to_numpy(), mp.to_numpy(), games.to_numpy()
+    played = ~np.isnan(mp) & (np.nan_to_num(mp) > 0)
+    fp, mp, games = np.nan_to_num(fp), np.nan_to_num(mp), np.nan_to_num(games)
+    w = np.asarray(weights, dtype=float)[None, :] * played
+
+    # League FPPM over the same seasons anchors the regression
+    league_fppm = fp.sum() / mp.sum() if mp.sum() else 0.0
+
+    weighted_fp = (w * fp).sum(axis=1)
+    weighted_mp = (w * mp).sum(axis=1)
+    fppm = (weighted_fp + regression_minutes * league_fppm) / (weighted_mp + regression_minutes)
+
+    weight_total = w.sum(axis=1)
+    weighted_games = (w * games).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mpg = np.where(weighted_games > 0, weighted_mp / weighted_games, 0.0)
+        games_played = np.where(weight_total > 0, weighted_games / weight_total, 0.0)
+
+    # Age in the target season from the latest season with a known age
+    ages = stacked.dropna(subset=["Age"]).sort_values("Season").drop_duplicates("Player Key", keep="last")
+    ages = ages.set_index("Player Key").reindex(keys)
+    age = (pd.to_numeric(ages["Age"], errors="coerce") + (target_year - ages["Season"])).to_numpy()
+    years_from_peak = np.nan_to_num(age - PEAK_AGE)
+    fppm_factor = np.where(years_from_peak < 0, 1 - YOUNG_AGE_RATE * years_from_peak, 1 - OLD_AGE_RATE * years_from_peak)
+    mpg_factor = np.where(years_from_peak > 0, 1 - OLD_MINUTES_RATE * years_from_peak, 1.0)
+
+    fppm = fppm * fppm_factor
+    mpg = np.clip(mpg * mpg_factor, 0, 48)
+    games_played = np.clip(games_played, 0, 82)
+
+    names = stacked.sort_values("Season").drop_duplicates("Player Key", keep="last").set_index("Player Key")["Player"]
+    projections = pd.DataFrame({
+        "Player": names.reindex(keys).to_numpy(),
+        "Player Key": keys.to_numpy(),
+        "Season": target_year,
+        "Age": age,
+        "Seasons": played.sum(axis=1),
+        "FPPM": fppm.round(3),
+        "MPG": mpg.round(1),
+        "G": games_played.round(1),
+    })
+    projections["FPPG"] = (projections["FPPM"] * projections["MPG"]).round(1)
+    projections["FP"] = (projections["FPPG"] * projections["G"]).round(0)
+    return projections.sort_values("Player Key").reset_index(drop=True)
+
+
+def input_digest(files, **params):
+    """
+    Returns a hash of the season files' contents and the projection parameters.
+    """
+    digest = hashlib.sha1(json.dumps({"version": CACHE_VERSION, **params}, sort_keys=True, default=str).encode())
+    for year, path in sorted(files.items()):
+        digest.update(str(year).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def cached_projections(files, cache_dir="data/.cache", target_year=None, **params):
+    """
+    Returns projections, recomputing them only when a season file or parameter changes.
+
+    Results are stored in cache_dir as projections_<hash>.csv; older entries are removed.
+
+    Args:
+        files (dict): Season year -> file path (see season_files).
+        cache_dir (str): Where cached projections are kept.
+        target_year (int, optional): Season to project.
+        **params: Passed to project().
+
+    Returns:
+        pd.DataFrame: Projections keyed by Player Key.
+    """
+    digest = input_digest(files, target_year=target_year, **params)
+    cache_path = os.path.join(cache_dir, f"projections_{digest}.csv")
+    if os.path.exists(cache_path):
+        logger.info(f"Season files unchanged; using cached projections {cache_path}")
+        return pd.read_csv(cache_path)
+
+    projections = project(load_seasons(files), target_year=target_year, **params)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    for old in glob.glob(os.path.join(cache_dir, "projections_*.csv")):
+        os.remove(old)
+    projections.to_csv(cache_path, index=False, encoding="utf-8")
+    logger.info(f"Projected {len(projections)} players; cached to {cache_path}")
+    return projections
+
+
+if __name__ == "__main__":
+    # Example usage: top projected players by FPPG
+    files = season_files(current_csv="data/nba_stats.csv")
+    print(cached_projections(files).sort_values("FPPG", ascending=False).head(10).to_string())
@@ -0,0 +1,182 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from utils import telemetry
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads within one process are coordinated
+    fcntl = None
+
+# Set up module-level logging for the rate limiter
+logger = logging.getLogger(__name__)
+
+# Bucket state shared by every scraper process on this machine
+STATE_PATH = os.environ.get("DMCB_RATE_STATE", os.path.join("data", ".rate_limits.json"))
+
+# Host -> (requests per second, burst). Basketball-Reference blocks clients that exceed
+# 20 requests a minute; Spotrac starts returning 502s under sustained load. The NBA
+# live feeds (cdn.nba.com) allow a poll of every live game every few seconds. Hosts
+# not listed here are not limited.
+DOMAIN_RATES = {
+    "www.basketball-reference.com": (20 / 60, 1),
+    "www.spotrac.com": (4.0, 6),
+    "sports.ws": (2.0, 2),
+    "stats.nba.com": (2.0, 2),
+    "cdn.nba.com": (4.0, 8),
+}
+
+
+class RateLimiter:
+    """
+    Per-domain token buckets persisted in a lock-protected JSON file, so concurrent
+    scripts (cron jobs, make -j, thread pools) share one budget per site.
+
+    A caller that finds the bucket empty reserves the next token (the bucket goes
+    negative) and sleeps outside the lock until it is due, so waiting processes queue
+    up in order instead of polling.
+    """
+
+    def __init__(self, path=STATE_PATH, rates=None):
+        """
+        Args:
+            path (str): Bucket state file; a sibling "<path>.lock" file is used for locking.
+            rates (dict, optional): Host -> (requests per second, burst). Defaults to DOMAIN_RATES.
+        """
+        self.path = path
+        self.rates = dict(DOMAIN_RATES if rates is None else rates)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host(url):
+        """
+        Returns the host of a URL (or the argument itself if it is already a host).
+        """
+        return urlparse(url).netloc or url
+
+    @contextmanager
+    def _locked_state(self):
+        """
+        Holds the thread and file locks, yields the bucket state dict and saves it on exit.
+        """
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path + ".lock", "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    try:
+                        with open(self.path, encoding="utf-8") as f:
+                            state = json.load(f)
+                    except (OSError, ValueError):
+                        state = {}
+                    yield state
+                    tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                    with open(tmp_path, "w", encoding="utf-8") as f:
+                        json.dump(state, f)
+                    os.replace(tmp_path, self.path)
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _refill(self, state, host, now):
+        rate, burst = self.rates[host]
+        bucket = state.get(host, {"tokens": burst, "updated": now})
+        tokens = min(burst, bucket["tokens"] + (now - bucket["updated"]) * rate)
+        return tokens, rate, burst
+
+    def acquire(self, url):
+        """
+        Takes one request token for the URL's host, sleeping until it is available.
+
+        Args:
+            url (str): URL (or host) about to be requested.
+
+        Returns:
+            float: Seconds waited (0.0 for hosts without a configured rate).
+        """
+        host = self.host(url)
+        if host not in self.rates:
+            return 0.0
+
+        with self._locked_state() as state:
+            now = time.time()
+            tokens, rate, _ = self._refill(state, host, now)
+            tokens -= 1
+            state[host] = {"tokens": tokens, "updated": now}
+        wait = max(0.0, -tokens / rate)
+
+        if wait > 0:
+            logger.debug(f"Rate limit for {host}: waiting {wait:.2f}s")
+            time.sleep(wait)
+            telemetry.record_throttle(host, wait)
+        return wait
+
+    def wait_time(self, url):
+        """
+        Returns how long a request to the URL's host would wait right now (without taking a token).
+        """
+        host = self.host(url)
+        if host not in self.rates:
+            return 0.0
+        with self._locked_state() as state:
+            tokens, rate, _ = self._refill(state, host, time.time())
+        return max(0.0, (1 - tokens) / rate)
+
+    def status(self):
+        """
+        Returns the configured rate, burst, available tokens and current wait for each host.
+        """
+        with self._locked_state() as state:
+            now = time.time()
+            status = {}
+            for host in self.rates:
+                tokens, rate, burst = self._refill(state, host, now)
+                status[host] = {
+                    "rate_per_second": round(rate, 4),
+                    "burst": burst,
+                    "tokens": round(tokens, 3),
+                    "wait_seconds": round(max(0.0, (1 - tokens) / rate), 3),
+                }
+        return status
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter():
+    """
+    Returns the process-wide rate limiter, creating it on first use.
+    """
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter()
+        return _limiter
+
+
+def acquire(url):
+    """
+    Takes one token for the URL's host from the shared limiter (see RateLimiter.acquire).
+    """
+    return get_limiter().acquire(url)
+
+
+def status():
+    """
+    Returns the shared limiter's per-host rates and current wait times.
+    """
+    return get_limiter().status()
+
+
+if __name__ == "__main__":
+    # Example usage: show each site's budget and how long the next request would wait
+    for host, entry in status().items():
+        print(f"{host:32} {entry['rate_per_second']:>7}/s  burst {entry['burst']}  "
+              f"tokens {entry['tokens']:>6}  wait {entry['wait_seconds']}s")
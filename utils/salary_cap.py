@@ -0,0 +1,290 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Status codes and season helpers live in the salary codec; they are re-exported here
+from utils.salary_codec import (
+    BLANK, RFA, SALARY, STATUS_CODES, TWO_WAY, UFA, SalaryTable, parse_cells, season_columns,
+)
+
+# Set up module-level logging for the cap engine
+logger = logging.getLogger(__name__)
+
+# The DMCB cap is 1.5x the NBA cap for the same season (league rules, section 3.2)
+DMCB_CAP_MULTIPLIER = 1.5
+
+# Announced NBA salary caps by season; later seasons are projected with PROJECTED_CAP_GROWTH
+NBA_SALARY_CAPS = {
+    "2025-26": 154_647_000,
+}
+PROJECTED_CAP_GROWTH = 0.07
+
+
+def parse_salary(value):
+    """
+    Parses a Spotrac salary cell into (dollars, status code).
+
+    Args:
+        value: A cell such as "$31978037", "Two-Way", "RFA", "UFA", a number, or blank.
+
+    Returns:
+        tuple: (int dollars, int status code). Non-salary cells are worth 0 dollars.
+    """
+    salary, status = parse_cells([value])
+    return int(salary[0]), int(status[0])
+
+
+def dmcb_cap(season, nba_caps=None, growth=PROJECTED_CAP_GROWTH):
+    """
+    Returns the DMCB salary cap for a season.
+
+    Seasons without an announced NBA cap are projected forward from the latest known
+    season at the given annual growth rate.
+
+    Args:
+        season (str): Season label, e.g. "2026-27".
+        nba_caps (dict, optional): Season -> NBA cap overrides, merged over NBA_SALARY_CAPS.
+        growth (float): Projected annual NBA cap growth.
+
+    Returns:
+        int: The league cap in dollars.
+    """
+    caps = {**NBA_SALARY_CAPS, **(nba_caps or {})}
+    if season in caps:
+        return int(round(caps[season] * DMCB_CAP_MULTIPLIER))
+
+    known = max((s for s in caps if s <= season), default=None)
+    if known is None:
+        raise ValueError(f"No NBA cap known at or before {season}")
+    years = int(season[:4]) - int(known[:4])
+    return int(round(caps[known] * (1 + growth) ** years * DMCB_CAP_MULTIPLIER))
+
+
+class CapTable:
+    """
+    Payroll, cap holds, dead money and cap space for every owner and season.
+
+    Contracts are held as (players x seasons) arrays of salaries and status codes, and
+    the owner totals as (owners x seasons) arrays, so building the table is a handful of
+    array operations and changing one contract only touches that player's row and the
+    affected owners' totals.
+
+    Two-way contracts do not count against the cap. An RFA's cap hold (if given) counts
+    in the first season the player is listed as an RFA, until the new contract is signed.
+    """
+
+    def __init__(self, contracts, dead_money=None, cap_holds=None, nba_caps=None, growth=PROJECTED_CAP_GROWTH):
+        """
+        Args:
+            contracts (SalaryTable or pd.DataFrame): Parsed contracts, or spotrac_contracts.csv
+                with Player Key, Owner and season columns. A recently traded player listed on
+                two teams is counted once.
+            dead_money (pd.DataFrame, optional): Waived guaranteed salary with Owner and season columns.
+            cap_holds (dict, optional): Player Key -> Spotrac cap hold for unsigned RFAs.
+            nba_caps (dict, optional): Season -> NBA cap overrides.
+            growth (float): Projected annual NBA cap growth for seasons without an announced cap.
+        """
+        contracts = SalaryTable.coerce(contracts).dedupe()
+        self.seasons = contracts.seasons
+        if not self.seasons:
+            raise ValueError("Contracts data has no season columns")
+
+        self.caps = np.array([dmcb_cap(s, nba_caps, growth) for s in self.seasons], dtype=np.int64)
+
+        self.keys = contracts.info["Player Key"].astype(str).tolist()
+        self.rows = {key: row for row, key in enumerate(self.keys)}
+
+        # Copies, since update_contract edits them in place
+        self.salary = contracts.salary.copy()
+        self.status = contracts.status.copy()
+
+        info = contracts.info
+        owners = info["Owner"].astype(object) if "Owner" in info.columns else pd.Series([None] * len(info))
+        owners = owners.where(owners.notna(), "").astype(str).str.strip()
+        self.owners = sorted(o for o in owners.unique() if o)
+        if dead_money is not None and "Owner" in dead_money.columns:
+            extra = dead_money["Owner"].dropna().astype(str).str.strip()
+            self.owners = sorted(set(self.owners) | {o for o in extra if o})
+        self.owner_index = {owner: i for i, owner in enumerate(self.owners)}
+        self.owner_of = np.array([self.owner_index.get(o, -1) for o in owners], dtype=np.int64)
+
+        cap_holds = cap_holds or {}
+        self.cap_hold = np.array([int(cap_holds.get(key, 0) or 0) for key in self.keys], dtype=np.int64)
+
+        self.dead_money = np.zeros((len(self.owners), len(self.seasons)), dtype=np.int64)
+        if dead_money is not None and len(dead_money):
+            for _, row in dead_money.iterrows():
+                owner = self.owner_index.get(str(row.get("Owner", "")).strip())
+                if owner is None:
+                    continue
+                for j, season in enumerate(self.seasons):
+                    if season in row:
+                        self.dead_money[owner, j] += parse_salary(row[season])[0]
+
+        self._recompute()
+
+    # ------------------------------------------------------------------
+    # Per-player contributions
+    # ------------------------------------------------------------------
+    def _contributions(self, rows):
+        """
+        Returns (salary, cap holds, standard count, two-way count) arrays for the given rows.
+        """
+        status = self.status[rows]
+        salary = np.where(status == SALARY, self.salary[rows], 0)
+
+        rfa = status == RFA
+        first_rfa = rfa & (np.cumsum(rfa, axis=-1) == 1)
+        holds = np.where(first_rfa, self.cap_hold[rows][..., None], 0)
+
+        standard = ((status == SALARY) | (holds > 0)).astype(np.int64)
+        two_way = (status == TWO_WAY).astype(np.int64)
+        return salary, holds, standard, two_way
+
+    def player_arrays(self):
+        """
+        Returns per-player (players x seasons) arrays of cap hit (salary plus cap hold),
+        standard roster spots and two-way spots, in the order of self.keys.
+        """
+        salary, holds, standard, two_way = self._contributions(np.arange(len(self.keys)))
+        return salary + holds, standard, two_way
+
+    def _recompute(self):
+        shape = (len(self.owners), len(self.seasons))
+        self.payroll = np.zeros(shape, dtype=np.int64)
+        self.cap_holds = np.zeros(shape, dtype=np.int64)
+        self.standard_count = np.zeros(shape, dtype=np.int64)
+        self.two_way_count = np.zeros(shape, dtype=np.int64)
+
+        owned = np.flatnonzero(self.owner_of >= 0)
+        salary, holds, standard, two_way = self._contributions(owned)
+        owner_rows = self.owner_of[owned]
+        np.add.at(self.payroll, owner_rows, salary)
+        np.add.at(self.cap_holds, owner_rows, holds)
+        np.add.at(self.standard_count, owner_rows, standard)
+        np.add.at(self.two_way_count, owner_rows, two_way)
+
+    def _apply(self, row, sign):
+        owner = self.owner_of[row]
+        if owner < 0:
+            return
+        salary, holds, standard, two_way = self._contributions(np.array([row]))
+        self.payroll[owner] += sign * salary[0]
+        self.cap_holds[owner] += sign * holds[0]
+        self.standard_count[owner] += sign * standard[0]
+        self.two_way_count[owner] += sign * two_way[0]
+
+    def _add_owner(self, owner):
+        # Owners are appended (not re-sorted) so existing indexes stay valid
+        self.owner_index[owner] = len(self.owners)
+        self.owners.append(owner)
+        pad = np.zeros((1, len(self.seasons)), dtype=np.int64)
+        for name in ("payroll", "cap_holds", "standard_count", "two_way_count", "dead_money"):
+            setattr(self, name, np.vstack([getattr(self, name), pad]))
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+    _UNCHANGED = object()
+
+    def update_contract(self, player_key, seasons=None, owner=_UNCHANGED, cap_hold=None):
+        """
+        Changes one player's contract, owner or cap hold and updates the owner totals in place.
+
+        Args:
+            player_key (str): The player to change. Unknown keys are added.
+            seasons (dict, optional): Season -> new cell value (e.g., {"2027-28": "$12000000"}).
+            owner (str or None, optional): New owner; None or "" releases the player.
+            cap_hold (int, optional): New RFA cap hold.
+
+        Returns:
+            list of str: Owners whose totals changed.
+        """
+        row = self.rows.get(player_key)
+        if row is None:
+            row = len(self.keys)
+            self.keys.append(player_key)
+            self.rows[player_key] = row
+            self.salary = np.vstack([self.salary, np.zeros((1, len(self.seasons)), dtype=np.int64)])
+            self.status = np.vstack([self.status, np.zeros((1, len(self.seasons)), dtype=np.int8)])
+            self.owner_of = np.append(self.owner_of, -1)
+            self.cap_hold = np.append(self.cap_hold, 0)
+
+        before = self.owner_of[row]
+        self._apply(row, -1)
+
+        for season, value in (seasons or {}).items():
+            if season not in self.seasons:
+                raise KeyError(f"Unknown season column: {season}")
+            j = self.seasons.index(season)
+            self.salary[row, j], self.status[row, j] = parse_salary(value)
+
+        if cap_hold is not None:
+            self.cap_hold[row] = int(cap_hold)
+
+        if owner is not self._UNCHANGED:
+            owner = (owner or "").strip()
+            if owner and owner not in self.owner_index:
+                self._add_owner(owner)
+            self.owner_of[row] = self.owner_index[owner] if owner else -1
+
+        self._apply(row, +1)
+        return sorted({self.owners[i] for i in (before, self.owner_of[row]) if i >= 0})
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+    @property
+    def cap_total(self):
+        """(owners x seasons) salary counted against the cap."""
+        return self.payroll + self.cap_holds + self.dead_money
+
+    @property
+    def cap_space(self):
+        """(owners x seasons) room under the cap; negative when over."""
+        return self.caps[None, :] - self.cap_total
+
+    def owner(self, owner):
+        """
+        Returns the cap rows for one owner as {season: {...}}.
+        """
+        i = self.owner_index[owner]
+        return {
+            season: {
+                "Players": int(self.standard_count[i, j]),
+                "Two-Way": int(self.two_way_count[i, j]),
+                "Salary": int(self.payroll[i, j]),
+                "Cap Holds": int(self.cap_holds[i, j]),
+                "Dead Money": int(self.dead_money[i, j]),
+                "Cap Total": int(self.cap_total[i, j]),
+                "Cap": int(self.caps[j]),
+                "Cap Space": int(self.cap_space[i, j]),
+            }
+            for j, season in enumerate(self.seasons)
+        }
+
+    def summary(self):
+        """
+        Returns the cap table as a long DataFrame with one row per owner and season.
+        """
+        n_owners, n_seasons = len(self.owners), len(self.seasons)
+        order = np.argsort(self.owners, kind="mergesort")
+        return pd.DataFrame({
+            "Owner": np.repeat(np.array(self.owners, dtype=object)[order], n_seasons),
+            "Season": np.tile(self.seasons, n_owners),
+            "Players": self.standard_count[order].ravel(),
+            "Two-Way": self.two_way_count[order].ravel(),
+            "Salary": self.payroll[order].ravel(),
+            "Cap Holds": self.cap_holds[order].ravel(),
+            "Dead Money": self.dead_money[order].ravel(),
+            "Cap Total": self.cap_total[order].ravel(),
+            "Cap": np.tile(self.caps, n_owners),
+            "Cap Space": self.cap_space[order].ravel(),
+        })
+
+
+if __name__ == "__main__":
+    # Example usage: print current cap space by owner
+    table = CapTable(pd.read_csv("data/spotrac_contracts.csv"))
+    print(table.summary().pivot(index="Owner", columns="Season", values="Cap Space"))
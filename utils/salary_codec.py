@@ -0,0 +1,206 @@
+import logging
+import re
+
+import numpy as np
+import pandas as pd
+
+# Set up module-level logging for the salary codec
+logger = logging.getLogger(__name__)
+
+# Status codes for each contract cell
+BLANK, SALARY, TWO_WAY, RFA, UFA = 0, 1, 2, 3, 4
+STATUS_CODES = {"Two-Way": TWO_WAY, "RFA": RFA, "UFA": UFA}
+STATUS_LABELS = {code: label for label, code in STATUS_CODES.items()}
+
+# Contract columns are named by season, e.g. "2026-27"
+SEASON_PATTERN = re.compile(r"^\d{4}-\d{2}$")
+
+# Repeated text columns stored as categoricals
+CATEGORICAL_COLUMNS = ["Team", "Team Link", "Position", "Owner"]
+
+
+def season_columns(df):
+    """
+    Returns the season columns of a contracts DataFrame in order (e.g., ["2026-27", ...]).
+    """
+    return [col for col in df.columns if SEASON_PATTERN.match(str(col))]
+
+
+def parse_cells(values):
+    """
+    Parses an array of Spotrac salary cells in one vectorized pass.
+
+    Args:
+        values (array-like): Cells such as "$31978037", "Two-Way", "RFA", "UFA", numbers or blanks.
+
+    Returns:
+        tuple: (int64 dollars, int8 status codes), shaped like values. Non-salary cells are
+            worth 0 dollars.
+    """
+    values = np.asarray(values, dtype=object)
+    cells = pd.Series(values.ravel(), dtype=object)
+    salary = np.zeros(len(cells), dtype=np.int64)
+    status = np.full(len(cells), BLANK, dtype=np.int8)
+
+    # Cells that are already numbers (e.g. read back from Sheets)
+    numbers = pd.to_numeric(cells.where(cells.map(lambda v: not isinstance(v, str))), errors="coerce")
+    is_number = numbers.notna().to_numpy()
+    salary[is_number] = numbers[is_number].astype(np.int64)
+    status[is_number] = SALARY
+
+    text_rows = np.flatnonzero(~is_number & cells.notna().to_numpy())
+    text = cells.iloc[text_rows].astype(str).str.strip()
+    codes = text.map(STATUS_CODES)
+    labelled = codes.notna().to_numpy()
+    status[text_rows[labelled]] = codes[labelled].astype(np.int8)
+
+    digits = text[~labelled].str.replace(r"[^\d]", "", regex=True)
+    has_digits = (digits != "").to_numpy()
+    dollar_rows = text_rows[~labelled][has_digits]
+    salary[dollar_rows] = digits[has_digits].astype(np.int64)
+    status[dollar_rows] = SALARY
+
+    return salary.reshape(values.shape), status.reshape(values.shape)
+
+
+def format_cells(salary, status, numeric=False):
+    """
+    Serializes salary and status arrays back to cells.
+
+    Args:
+        salary (np.ndarray): Dollars.
+        status (np.ndarray): Status codes.
+        numeric (bool): If True, salaries are plain integers and blanks are "" (the
+            Google Sheets layout); otherwise the legacy "$31978037" text with NaN blanks.
+
+    Returns:
+        np.ndarray: Object array shaped like salary.
+    """
+    out = np.full(salary.shape, "" if numeric else np.nan, dtype=object)
+    is_salary = status == SALARY
+    if numeric:
+        out[is_salary] = salary[is_salary].tolist()
+    else:
+        out[is_salary] = ["$" + str(v) for v in salary[is_salary].tolist()]
+    for code, label in STATUS_LABELS.items():
+        out[status == code] = label
+    return out
+
+
+class SalaryTable:
+    """
+    Contracts held as typed arrays: an int64 (players x seasons) salary array, an int8
+    status code per cell, and the player columns with Team, Position and Owner as
+    categoricals.
+
+    Cells are parsed once from the scraped or saved text; the legacy "$31978037" text is
+    only produced again when exporting to CSV, and the Sheets layout (numbers for
+    salaries, labels for statuses) comes straight from the arrays.
+    """
+
+    def __init__(self, info, seasons, salary, status, columns=None):
+        """
+        Args:
+            info (pd.DataFrame): Player columns (Player, Player Key, Team, ...), one row per contract.
+            seasons (list of str): Season labels, in order.
+            salary (np.ndarray): int64 dollars (players x seasons).
+            status (np.ndarray): int8 status codes (players x seasons).
+            columns (list of str, optional): Column order for to_frame().
+        """
+        self.info = info.reset_index(drop=True)
+        self.seasons = list(seasons)
+        self.salary = salary
+        self.status = status
+        self.columns = columns or list(info.columns) + self.seasons
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Parses a contracts DataFrame (spotrac_contracts.csv layout).
+        """
+        seasons = season_columns(df)
+        salary, status = parse_cells(df[seasons].to_numpy(dtype=object))
+        info = df.drop(columns=seasons).copy()
+        for col in CATEGORICAL_COLUMNS:
+            if col in info.columns:
+                info[col] = info[col].astype("category")
+        return cls(info, seasons, salary, status, columns=list(df.columns))
+
+    @classmethod
+    def coerce(cls, contracts):
+        """
+        Returns contracts as a SalaryTable, parsing it if it is a DataFrame.
+        """
+        return contracts if isinstance(contracts, cls) else cls.from_frame(contracts)
+
+    def __len__(self):
+        return len(self.info)
+
+    def take(self, rows):
+        """
+        Returns a SalaryTable with only the given row positions.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        return SalaryTable(self.info.iloc[rows], self.seasons, self.salary[rows], self.status[rows], self.columns)
+
+    def dedupe(self):
+        """
+        Keeps one row per Player Key.
+
+        Spotrac can list a recently traded player on both teams; the row with the most
+        filled-in seasons wins, so the salary is only counted once.
+        """
+        filled = pd.Series((self.status != BLANK).sum(axis=1))
+        order = filled.sort_values(ascending=False, kind="mergesort").index
+        keep = pd.Series(self.info["Player Key"].to_numpy()[order], index=order).drop_duplicates().index
+        return self.take(np.sort(keep.to_numpy()))
+
+    def season(self, season):
+        """
+        Returns (salary, status) arrays for one season.
+        """
+        j = self.seasons.index(season)
+        return self.salary[:, j], self.status[:, j]
+
+    def cap_hits(self):
+        """
+        Returns (players x seasons) dollars that count against the cap (salaries only).
+        """
+        return np.where(self.status == SALARY, self.salary, 0)
+
+    def _frame(self, numeric):
+        cells = format_cells(self.salary, self.status, numeric=numeric)
+        seasons = pd.DataFrame(cells, columns=self.seasons)
+        info = self.info.copy()
+        for col in CATEGORICAL_COLUMNS:
+            if col in info.columns:
+                info[col] = info[col].astype(object)
+        df = pd.concat([info, seasons], axis=1)
+        return df[[col for col in self.columns if col in df.columns]]
+
+    def to_frame(self):
+        """
+        Serializes back to the legacy text layout of spotrac_contracts.csv.
+        """
+        return self._frame(numeric=False)
+
+    def sheets_frame(self):
+        """
+        Returns the Google Sheets layout: salaries as numbers, statuses as text, blanks as "".
+        """
+        return self._frame(numeric=True).fillna("")
+
+    def memory_usage(self):
+        """
+        Returns the bytes held by the arrays and the player columns.
+        """
+        return int(self.salary.nbytes + self.status.nbytes + self.info.memory_usage(deep=True).sum())
+
+
+if __name__ == "__main__":
+    # Example usage: compare the typed table's footprint with the text frame
+    contracts = pd.read_csv("data/spotrac_contracts.csv")
+    table = SalaryTable.from_frame(contracts)
+    print(f"Text frame: {contracts.memory_usage(deep=True).sum():,} bytes")
+    print(f"SalaryTable: {table.memory_usage():,} bytes")
+    print(table.sheets_frame().head())
@@ -0,0 +1,374 @@
+import bisect
+import json
+import logging
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from utils import telemetry
+
+# Set up module-level logging for the schedule index
+logger = logging.getLogger(__name__)
+
+# Columns of a normalized schedule (one row per NBA game, times in UTC)
+SCHEDULE_COLUMNS = ["Game ID", "Start", "End", "Home", "Away"]
+
+# Regular-season game IDs start with "002" (preseason "001", playoffs "004", NBA Cup final "006")
+REGULAR_SEASON_PREFIX = "002"
+
+# Used for the end of a game when the schedule only has tip-off times
+GAME_DURATION = pd.Timedelta(hours=2, minutes=30)
+
+# Game numbers that count in the DMCB season (games 78-82 are discarded)
+DMCB_GAMES = 77
+
+
+def _utc(values):
+    return pd.to_datetime(values, utc=True)
+
+
+def normalize_schedule(df):
+    """
+    Keeps the regular-season games of a schedule and fills in missing end times.
+
+    Args:
+        df (pd.DataFrame): Game ID, Start, Home, Away and (optionally) End columns.
+
+    Returns:
+        pd.DataFrame: The schedule with SCHEDULE_COLUMNS, sorted by start time.
+    """
+    df = df.copy()
+    df["Game ID"] = df["Game ID"].astype(str).str.zfill(10)
+    df = df[df["Game ID"].str.startswith(REGULAR_SEASON_PREFIX)]
+    df["Start"] = _utc(df["Start"])
+    if "End" not in df.columns:
+        df["End"] = pd.NaT
+    df["End"] = _utc(df["End"]).fillna(df["Start"] + GAME_DURATION)
+    return df[SCHEDULE_COLUMNS].sort_values(["Start", "Game ID"], kind="mergesort").reset_index(drop=True)
+
+
+def load_schedule_csv(path):
+    """
+    Loads a schedule CSV with Game ID, Start, Home, Away and optional End columns.
+    """
+    return normalize_schedule(pd.read_csv(path, dtype={"Game ID": str}))
+
+
+def parse_schedule_json(payload):
+    """
+    Parses a raw nba_api scheduleleaguev2 response into a normalized schedule.
+
+    Args:
+        payload (dict or str): The response JSON (e.g., ScheduleLeagueV2().nba_response.get_dict()).
+
+    Returns:
+        pd.DataFrame: The normalized schedule.
+    """
+    if isinstance(payload, str):
+        payload = json.loads(payload)
+
+    rows = []
+    for game_date in payload["leagueSchedule"]["gameDates"]:
+        for game in game_date["games"]:
+            rows.append({
+                "Game ID": game["gameId"],
+                "Start": game["gameDateTimeUTC"],
+                "Home": game["homeTeam"]["teamTricode"],
+                "Away": game["awayTeam"]["teamTricode"],
+            })
+    return normalize_schedule(pd.DataFrame(rows, columns=["Game ID", "Start", "Home", "Away"]))
+
+
+def load_schedule_json(path):
+    """
+    Loads a recorded scheduleleaguev2 response from disk.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_schedule_json(json.load(f))
+
+
+def fetch_schedule(year=2026, session=None):
+    """
+    Fetches the regular-season schedule from the NBA API.
+
+    Args:
+        year (int): NBA season year, e.g. 2026 for the 2025-26 season.
+        session (requests.Session, optional): Session to use instead of the shared pooled client.
+
+    Returns:
+        pd.DataFrame: The normalized schedule.
+    """
+    from nba_api.stats.endpoints import scheduleleaguev2
+    from utils import http_client, scrape_nba
+
+    scrape_nba.use_session(session)
+    season = f"{year - 1}-{str(year)[-2:]}"
+    response = scheduleleaguev2.ScheduleLeagueV2(season=season, timeout=http_client.TIMEOUT)
+    with telemetry.timed_parse("nba_api", f"scheduleleaguev2 {season}"):
+        return parse_schedule_json(response.nba_response.get_dict())
+
+
+class ScheduleIndex:
+    """
+    Maps DMCB game numbers to their time windows and NBA games, and times back to the
+    game numbers that are open.
+
+    Matchup N opens when the first team tips off its Nth game and closes when the last
+    team finishes its Nth game. Each team's games are kept in order as rows of a
+    (teams x game number) start/end matrix, so a window is a column min/max, a game-number
+    lookup is a dictionary hit, and a rescheduled game only re-sorts its two teams' rows
+    and recomputes the columns that moved.
+    """
+
+    def __init__(self, schedule):
+        """
+        Args:
+            schedule (pd.DataFrame): A normalized schedule (see normalize_schedule).
+        """
+        self.games = {}
+        self.team_games = {}
+        for row in normalize_schedule(schedule).itertuples(index=False):
+            self.games[row[0]] = {"Start": row[1], "End": row[2], "Home": row[3], "Away": row[4]}
+            self.team_games.setdefault(row[3], []).append(row[0])
+            self.team_games.setdefault(row[4], []).append(row[0])
+
+        self.teams = sorted(self.team_games)
+        self.team_row = {team: i for i, team in enumerate(self.teams)}
+        width = max((len(ids) for ids in self.team_games.values()), default=0)
+        self.starts = np.full((len(self.teams), width), np.nan)
+        self.ends = np.full((len(self.teams), width), np.nan)
+        self.opens = np.full(width, np.nan)
+        self.closes = np.full(width, np.nan)
+        self.by_number = {}
+
+        for team in self.teams:
+            self._renumber(team)
+        self._rebuild_windows(range(width))
+
+    # ------------------------------------------------------------------
+    # Internal bookkeeping
+    # ------------------------------------------------------------------
+    def _renumber(self, team):
+        """
+        Re-sorts a team's games and returns the game numbers (0-based) whose games changed.
+        """
+        row = self.team_row[team]
+        ids = sorted(self.team_games[team], key=lambda game_id: (self.games[game_id]["Start"], game_id))
+        self.team_games[team] = ids
+
+        starts = np.array([self.games[game_id]["Start"].timestamp() for game_id in ids])
+        ends = np.array([self.games[game_id]["End"].timestamp() for game_id in ids])
+        if len(ids) > self.starts.shape[1]:
+            pad = len(ids) - self.starts.shape[1]
+            self.starts = np.pad(self.starts, ((0, 0), (0, pad)), constant_values=np.nan)
+            self.ends = np.pad(self.ends, ((0, 0), (0, pad)), constant_values=np.nan)
+            self.opens = np.pad(self.opens, (0, pad), constant_values=np.nan)
+            self.closes = np.pad(self.closes, (0, pad), constant_values=np.nan)
+
+        new_starts = np.full(self.starts.shape[1], np.nan)
+        new_ends = np.full(self.ends.shape[1], np.nan)
+        new_starts[:len(ids)] = starts
+        new_ends[:len(ids)] = ends
+        changed = ~((new_starts == self.starts[row]) | (np.isnan(new_starts) & np.isnan(self.starts[row])))
+        changed |= ~((new_ends == self.ends[row]) | (np.isnan(new_ends) & np.isnan(self.ends[row])))
+        self.starts[row] = new_starts
+        self.ends[row] = new_ends
+        return set(np.flatnonzero(changed).tolist())
+
+    def _rebuild_windows(self, columns):
+        columns = sorted(columns)
+        if not columns:
+            return
+        # Columns where no team has a game yet come out as NaN
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            self.opens[columns] = np.nanmin(self.starts[:, columns], axis=0)
+            self.closes[columns] = np.nanmax(self.ends[:, columns], axis=0)
+
+        for column in columns:
+            number = column + 1
+            self.by_number[number] = [
+                {"Game ID": self.team_games[team][column], "Team": team}
+                for team in self.teams
+                if column < len(self.team_games[team])
+            ]
+            if not self.by_number[number]:
+                del self.by_number[number]
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def window(self, number):
+        """
+        Returns (opens, closes) as UTC Timestamps for a game number (1-based).
+
+        Raises:
+            KeyError: If no team has a game with that number.
+        """
+        if number not in self.by_number:
+            raise KeyError(f"No game number {number} in the schedule")
+        column = number - 1
+        return (
+            pd.Timestamp(self.opens[column], unit="s", tz="UTC"),
+            pd.Timestamp(self.closes[column], unit="s", tz="UTC"),
+        )
+
+    def games_for(self, number):
+        """
+        Returns the NBA games that count for a game number, one entry per team.
+
+        Returns:
+            list of dict: {"Game ID", "Team"} for each team's Nth game.
+        """
+        return self.by_number.get(number, [])
+
+    def team_game_number(self, team, game_id):
+        """
+        Returns which game number (1-based) a game is for a team.
+        """
+        return self.team_games[team].index(game_id) + 1
+
+    def open_numbers(self, when):
+        """
+        Returns the game numbers whose window contains a moment.
+
+        Opens and closes only increase with the game number, so the open numbers are a
+        contiguous range found with two binary searches.
+
+        Args:
+            when: Anything pd.Timestamp accepts; naive times are taken as UTC.
+
+        Returns:
+            list of int: Open game numbers (1-based).
+        """
+        moment = pd.Timestamp(when)
+        moment = moment.tz_localize("UTC") if moment.tzinfo is None else moment
+        t = moment.timestamp()
+
+        valid = ~np.isnan(self.opens)
+        opens = self.opens[valid]
+        closes = self.closes[valid]
+        numbers = np.flatnonzero(valid) + 1
+
+        first = bisect.bisect_left(closes.tolist(), t)
+        last = bisect.bisect_right(opens.tolist(), t)
+        return numbers[first:last].tolist()
+
+    def open_on(self, date, tz="America/New_York"):
+        """
+        Returns the game numbers open at any time during a calendar day.
+        """
+        day_start = pd.Timestamp(date).tz_localize(tz) if pd.Timestamp(date).tzinfo is None else pd.Timestamp(date)
+        day_end = day_start + pd.Timedelta(days=1)
+        valid = ~np.isnan(self.opens)
+        overlaps = valid & (self.opens < day_end.timestamp()) & (self.closes >= day_start.timestamp())
+        return (np.flatnonzero(overlaps) + 1).tolist()
+
+    def windows(self, games=DMCB_GAMES):
+        """
+        Returns the windows of game numbers 1..games as a DataFrame.
+        """
+        rows = []
+        for number in range(1, games + 1):
+            if number in self.by_number:
+                opens, closes = self.window(number)
+                rows.append({"Game": number, "Opens": opens, "Closes": closes, "NBA Games": len(
+                    {entry["Game ID"] for entry in self.by_number[number]}
+                )})
+        return pd.DataFrame(rows, columns=["Game", "Opens", "Closes", "NBA Games"])
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+    def update_game(self, game_id, start=None, end=None, home=None, away=None):
+        """
+        Adds or reschedules one game and refreshes only the affected windows.
+
+        Args:
+            game_id (str): NBA game ID.
+            start: New tip-off time (UTC).
+            end: New end time; defaults to start + GAME_DURATION.
+            home (str, optional): Home team tricode (required for new games).
+            away (str, optional): Away team tricode (required for new games).
+
+        Returns:
+            list of int: Game numbers whose windows or games changed.
+        """
+        game_id = str(game_id).zfill(10)
+        old = self.games.get(game_id)
+        if old is None and (start is None or home is None or away is None):
+            raise ValueError(f"New game {game_id} needs start, home and away")
+
+        game = dict(old or {})
+        if start is not None:
+            game["Start"] = _utc(start)
+            game["End"] = _utc(end) if end is not None else game["Start"] + GAME_DURATION
+        elif end is not None:
+            game["End"] = _utc(end)
+        game["Home"] = home or game["Home"]
+        game["Away"] = away or game["Away"]
+        self.games[game_id] = game
+
+        teams = {game["Home"], game["Away"]}
+        if old is not None:
+            teams |= {old["Home"], old["Away"]}
+            for team in (old["Home"], old["Away"]):
+                self.team_games[team].remove(game_id)
+        for team in (game["Home"], game["Away"]):
+            if team not in self.team_row:
+                self.team_row[team] = len(self.teams)
+                self.teams.append(team)
+                self.team_games[team] = []
+                self.starts = np.vstack([self.starts, np.full((1, self.starts.shape[1]), np.nan)])
+                self.ends = np.vstack([self.ends, np.full((1, self.ends.shape[1]), np.nan)])
+            self.team_games[team].append(game_id)
+
+        return self._refresh(teams)
+
+    def remove_game(self, game_id):
+        """
+        Drops a game (e.g., a postponement with no new date yet).
+
+        Returns:
+            list of int: Game numbers whose windows or games changed.
+        """
+        game_id = str(game_id).zfill(10)
+        game = self.games.pop(game_id)
+        for team in (game["Home"], game["Away"]):
+            self.team_games[team].remove(game_id)
+        return self._refresh({game["Home"], game["Away"]})
+
+    def apply(self, schedule):
+        """
+        Brings the index in line with a freshly loaded schedule, touching only changed games.
+
+        Returns:
+            list of int: Game numbers whose windows or games changed.
+        """
+        schedule = normalize_schedule(schedule)
+        fresh = {row[0]: row for row in schedule.itertuples(index=False)}
+        changed = set()
+        for game_id in set(self.games) - set(fresh):
+            changed |= set(self.remove_game(game_id))
+        for game_id, row in fresh.items():
+            current = self.games.get(game_id)
+            if current is None or (current["Start"], current["End"], current["Home"], current["Away"]) != tuple(row[1:]):
+                changed |= set(self.update_game(game_id, start=row[1], end=row[2], home=row[3], away=row[4]))
+        if changed:
+            logger.info(f"Schedule update changed game numbers {sorted(changed)}")
+        return sorted(changed)
+
+    def _refresh(self, teams):
+        columns = set()
+        for team in teams:
+            columns |= self._renumber(team)
+        self._rebuild_windows(columns)
+        return sorted(column + 1 for column in columns)
+
+
+if __name__ == "__main__":
+    # Example usage: fetch this season's schedule and show which matchups are open now
+    index = ScheduleIndex(fetch_schedule(2026))
+    print(index.windows().head(10).to_string())
+    print(f"Open game numbers: {index.open_numbers(pd.Timestamp.now(tz='UTC'))}")
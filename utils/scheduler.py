@@ -0,0 +1,165 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Set up module-level logging to track scheduled refreshes
+logger = logging.getLogger(__name__)
+
+# Touch <TRIGGER_DIR>/<job name> to request an immediate refresh of that job
+TRIGGER_DIR = os.path.join("data", ".refresh")
+
+
+class RefreshJob:
+    """
+    A recurring refresh with its own cadence.
+
+    Args:
+        name (str): Unique job name (also the trigger file name).
+        func (callable): Called with no arguments to perform the refresh.
+        interval (float or callable): Seconds between runs, or a callable taking the
+            current epoch time and returning seconds (e.g., shorter on game nights).
+        run_at_start (bool): Whether the job is due as soon as the scheduler starts.
+    """
+
+    def __init__(self, name, func, interval, run_at_start=True):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.last_started = None
+        self.last_finished = None
+        self.last_status = None
+        self.next_run = 0.0 if run_at_start else None
+
+    def interval_at(self, now):
+        return self.interval(now) if callable(self.interval) else self.interval
+
+    def schedule_next(self, now):
+        self.next_run = now + self.interval_at(now)
+
+
+class RefreshScheduler:
+    """
+    Runs RefreshJobs on their cadences in one long-lived process.
+
+    Jobs run on a small thread pool so a slow job (e.g., contracts) does not hold up a fast
+    one (e.g., stats), but a job never overlaps with itself. Any job can be requested on
+    demand by creating a file named after it in the trigger directory.
+    """
+
+    def __init__(self, jobs, trigger_dir=TRIGGER_DIR, tick_seconds=5, max_workers=None):
+        self.jobs = {job.name: job for job in jobs}
+        self.trigger_dir = trigger_dir
+        self.tick_seconds = tick_seconds
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or max(1, len(self.jobs)))
+        self.running = {}
+        self._stop = threading.Event()
+        os.makedirs(self.trigger_dir, exist_ok=True)
+
+    def request(self, name):
+        """
+        Requests an on-demand run of a job by writing its trigger file.
+
+        Raises:
+            ValueError: If no job has that name.
+        """
+        if name not in self.jobs:
+            raise ValueError(f"Unknown job: {name}")
+        request_refresh(name, self.trigger_dir)
+
+    def _consume_triggers(self, now):
+        for name in os.listdir(self.trigger_dir):
+            path = os.path.join(self.trigger_dir, name)
+            if name in self.jobs:
+                logger.info(f"On-demand refresh requested: {name}")
+                self.jobs[name].next_run = now
+            else:
+                logger.warning(f"Ignoring trigger for unknown job: {name}")
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _run_job(self, job):
+        try:
+            job.func()
+            job.last_status = "ok"
+        except BaseException as e:
+            logger.error(f"Refresh '{job.name}' failed: {e!r}")
+            job.last_status = "failed"
+        finally:
+            job.last_finished = time.time()
+            logger.info(
+                f"Refresh '{job.name}' {job.last_status} in {job.last_finished - job.last_started:.1f}s"
+            )
+
+    def run_pending(self, now=None):
+        """
+        Starts every job that is due and not already running.
+
+        Returns:
+            list of str: Names of the jobs started.
+        """
+        now = time.time() if now is None else now
+        self._consume_triggers(now)
+
+        # Forget finished jobs
+        for name in [name for name, future in self.running.items() if future.done()]:
+            del self.running[name]
+
+        started = []
+        for job in self.jobs.values():
+            if job.name in self.running or job.next_run is None or job.next_run > now:
+                continue
+            job.last_started = now
+            job.schedule_next(now)
+            logger.info(f"Starting refresh '{job.name}' (next in {job.interval_at(now) / 60:.0f} min)")
+            self.running[job.name] = self.executor.submit(self._run_job, job)
+            started.append(job.name)
+        return started
+
+    def status(self):
+        """
+        Returns a summary of each job's last run and next scheduled time.
+        """
+        return {
+            name: {
+                "running": name in self.running and not self.running[name].done(),
+                "last_status": job.last_status,
+                "last_started": job.last_started,
+                "last_finished": job.last_finished,
+                "next_run": job.next_run,
+            }
+            for name, job in self.jobs.items()
+        }
+
+    def stop(self):
+        self._stop.set()
+
+    def run_forever(self, on_tick=None):
+        """
+        Loops until stop() is called, then waits for running jobs to finish.
+
+        Args:
+            on_tick (callable, optional): Called once per tick after scheduling.
+        """
+        logger.info(f"Scheduler started with jobs: {', '.join(self.jobs)}")
+        try:
+            while not self._stop.is_set():
+                self.run_pending()
+                if on_tick:
+                    on_tick()
+                self._stop.wait(self.tick_seconds)
+        finally:
+            logger.info("Scheduler stopping; waiting for running refreshes to finish...")
+            self.executor.shutdown(wait=True)
+
+
+def request_refresh(name, trigger_dir=TRIGGER_DIR):
+    """
+    Writes the trigger file that asks a running scheduler to refresh `name` now.
+    """
+    os.makedirs(trigger_dir, exist_ok=True)
+    with open(os.path.join(trigger_dir, name), "w", encoding="utf-8") as f:
+        f.write(time.strftime("%Y-%m-%d %H:%M:%S"))
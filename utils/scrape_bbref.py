@@ -1,22 +1,24 @@
-import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 
-def scrape_nba_totals(year):
-    url = f"https://www.basketball-reference.com/leagues/NBA_{year}_totals.html"
+from utils import http_client, telemetry
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/117.0 Safari/537.36"
-        )
-    }
+def scrape_nba_totals(year, session=None):
+    url = f"https://www.basketball-reference.com/leagues/NBA_{year}_totals.html"
 
-    response = requests.get(url, headers=headers)
+    # Reuse the caller's session when one is provided, otherwise the shared pooled client
+    response = http_client.get(url, session=session)
     response.raise_for_status()  # raises HTTPError if 403/404/etc.
 
-    soup = BeautifulSoup(response.content, "html.parser")
+    with telemetry.timed_parse("bbref", url):
+        return _parse_totals_page(response.content)
+
+
+def _parse_totals_page(content):
+    """
+    Parse the totals table of a Basketball-Reference season page into a DataFrame.
+    """
+    soup = BeautifulSoup(content, "html.parser")
 
     table = soup.find("table", {"id": "totals_stats"})
     
@@ -1,12 +1,33 @@
 import pandas as pd
 from nba_api.stats.endpoints import leaguedashplayerstats
+from nba_api.stats.library.http import NBAStatsHTTP
 
-def scrape_nba_totals(year=2025):
+from utils import http_client, telemetry
+
+
+def use_session(session=None):
+    """
+    Route nba_api's requests through a session built like the shared pooled client
+    (keep-alive pool, retry policy, per-domain rate limit) instead of its own bare one.
+
+    Args:
+        session (requests.Session, optional): Session to use instead of the shared pooled client.
+
+    Returns:
+        requests.Session: The session nba_api now uses.
+    """
+    session = telemetry.instrument_session(session) if session is not None else http_client.get_session()
+    NBAStatsHTTP.set_session(session)
+    return session
+
+
+def scrape_nba_totals(year=2025, session=None):
     """
     Scrape NBA player totals for a given season using the official NBA API.
 
     Args:
         year (int): The NBA season year, e.g., 2025 for 2024-25 season.
+        session (requests.Session, optional): Session to use instead of the shared pooled client.
 
     Returns:
         pd.DataFrame: Raw player totals with NBA columns.
@@ -14,9 +35,13 @@ def scrape_nba_totals(year=2025):
     # NBA API expects season string like '2024-25' for 2024-25 season
     season_str = f"{year-1}-{str(year)[-2:]}"  # e.g., 2024-25
 
+    # nba_api sends through the pooled client, with the client's timeout
+    use_session(session)
+
     # Fetch the league dash player stats
-    stats = leaguedashplayerstats.LeagueDashPlayerStats(season=season_str)
-    df = stats.get_data_frames()[0]
+    stats = leaguedashplayerstats.LeagueDashPlayerStats(season=season_str, timeout=http_client.TIMEOUT)
+    with telemetry.timed_parse("nba_api", f"leaguedashplayerstats {season_str}"):
+        df = stats.get_data_frames()[0]
 
     # Remove rows with missing player names
     df = df.dropna(subset=["PLAYER_NAME"])
@@ -1,31 +1,44 @@
+import logging
+import os
+from urllib.parse import urljoin
+
 import pandas as pd
 import requests
 from lxml import html
 
-def scrape_sportsws_positions():
+from utils import http_client, telemetry
+from utils.fetch_parse import FetchParsePool
+
+# Home page of the DMCB league on Sports.ws (standings at <league>/standings, one roster
+# page per fantasy team). There is no default: when it is unset, owners come from the
+# Google Sheets owner column instead.
+LEAGUE_URL = os.environ.get("DMCB_SPORTSWS_LEAGUE")
+
+# Roster pages are tiny; a few fetch threads cover the 16 teams within the rate limit
+ROSTER_FETCH_WORKERS = 4
+
+def scrape_sportsws_positions(session=None):
     # Define the URL
     url = "https://sports.ws/nba/stats"
     
-    # Send a GET request to the URL
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
-    response = requests.get(url, headers=headers)
+    # Reuse the caller's session when one is provided, otherwise the shared pooled client
+    response = http_client.get(url, session=session)
     
-    # Parse the HTML using lxml
-    tree = html.fromstring(response.content)
-    
-    # Use XPath to extract player names and links
-    players = tree.xpath("//td[1]//a")
-    
-    # Extract data into a list of dictionaries
-    player_data = []
-    for player in players:
-        name = player.text.strip() if player.text else ""
-        link = "https://sports.ws" + player.get('href')
-        tail = player.tail.strip() if player.tail else ""
+    with telemetry.timed_parse("sportsws", url):
+        # Parse the HTML using lxml
+        tree = html.fromstring(response.content)
         
-        player_data.append({"Name": name, "Player Link": link, "Tail": tail})
+        # Use XPath to extract player names and links
+        players = tree.xpath("//td[1]//a")
+        
+        # Extract data into a list of dictionaries
+        player_data = []
+        for player in players:
+            name = player.text.strip() if player.text else ""
+            link = "https://sports.ws" + player.get('href')
+            tail = player.tail.strip() if player.tail else ""
+            
+            player_data.append({"Name": name, "Player Link": link, "Tail": tail})
     
     # Convert the list of dictionaries to a DataFrame
     df = pd.DataFrame(player_data)
@@ -44,6 +57,102 @@ def scrape_sportsws_positions():
     # Sort the DataFrame by 'Player Link'
     return df.sort_values(by="Player Link")
 
+def fetch_page(url, session=None):
+    """
+    Fetch a Sports.ws page through the shared HTTP client.
+
+    Returns:
+        bytes: The page body.
+
+    Raises:
+        RuntimeError: "HTTP <status>" for non-200 responses, or "request failed: ..." once
+            the client's retries are exhausted.
+    """
+    try:
+        response = http_client.get(url, session=session)
+    except requests.RequestException as e:
+        raise RuntimeError(f"request failed: {e}") from e
+    if response.status_code != 200:
+        raise RuntimeError(f"HTTP {response.status_code}")
+    return response.content
+
+
+def league_teams(content, league_url):
+    """
+    Parse the league standings page into (owner, roster URL) pairs.
+
+    Each standings row links to a fantasy team's roster page; the link text is the
+    owner's name as shown in the league.
+    """
+    tree = html.fromstring(content)
+    teams = []
+    for link in tree.xpath("//table//tr//a[contains(@href, '/team/')]"):
+        owner = link.text_content().strip()
+        url = urljoin(league_url + "/", link.get("href"))
+        if owner and (owner, url) not in teams:
+            teams.append((owner, url))
+    return teams
+
+
+def roster_rows(content):
+    """
+    Parse a fantasy team's roster page into (name, player link) tuples.
+
+    Module-level so it can run in a parse worker (see utils.fetch_parse).
+    """
+    tree = html.fromstring(content)
+    rows = []
+    for player in tree.xpath("//td[1]//a[starts-with(@href, '/nba/')]"):
+        name = player.text.strip() if player.text else ""
+        rows.append((name, "https://sports.ws" + player.get("href")))
+    return tuple(rows)
+
+
+def scrape_league_rosters(session=None, league_url=LEAGUE_URL):
+    """
+    Scrape every fantasy team's roster from the league's Sports.ws pages.
+
+    Args:
+        session (requests.Session, optional): Session to use instead of the shared pooled client.
+        league_url (str): League home page on Sports.ws.
+
+    Returns:
+        pd.DataFrame: Owner, Name, Player Link and Team Link for every rostered player,
+            sorted by Player Link.
+
+    Raises:
+        RuntimeError: If no league URL is configured, the standings page cannot be
+            fetched or lists no teams, or any roster page fails (a partial map would
+            unassign players).
+    """
+    if not league_url:
+        raise RuntimeError("No Sports.ws league URL; set DMCB_SPORTSWS_LEAGUE")
+    standings_url = f"{league_url}/standings"
+    with telemetry.timed_parse("sportsws-league", standings_url):
+        teams = league_teams(fetch_page(standings_url, session=session), league_url)
+    if not teams:
+        raise RuntimeError(f"No teams found on {standings_url}")
+
+    owners = dict((url, owner) for owner, url in teams)
+    pool = FetchParsePool(
+        lambda url: fetch_page(url, session=session), roster_rows,
+        fetch_workers=ROSTER_FETCH_WORKERS, parse_workers=1, name="sportsws-roster",
+    )
+
+    roster_data = []
+    for url, rows, error in pool.map((url, url) for _, url in teams):
+        if error is not None:
+            raise RuntimeError(f"Roster {url} failed: {error}")
+        if not rows:
+            logging.warning(f"Empty roster for {owners[url]} ({url})")
+        roster_data.extend((owners[url], name, link, url) for name, link in rows)
+
+    df = pd.DataFrame(roster_data, columns=["Owner", "Name", "Player Link", "Team Link"])
+    return df.sort_values(by="Player Link", ignore_index=True)
+
+
 if __name__ == "__main__":
     df = scrape_sportsws_positions()
     print(df)
+    if LEAGUE_URL:
+        print(scrape_league_rosters())
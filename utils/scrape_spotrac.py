@@ -1,10 +1,12 @@
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree, html
 import pandas as pd
 import re
 import logging
-import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from utils import http_client, telemetry
+from utils.fetch_parse import FetchParsePool
 
 # Configure pandas display options to show all columns
 pd.set_option('display.max_columns', None)
@@ -13,50 +15,74 @@ pd.set_option('display.width', None)
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-# Global constants
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"
-}
-
-MAX_RETRIES = 3
-RETRY_DELAY = 2
-TIMEOUT = 10
-
 
-def scrape_team_contracts(team, session):
+def scrape_team_contracts(team, session=None):
     """
     Scrape contract data for a specific NBA team from Spotrac.
+
+    Transient errors (502s, timeouts, dropped connections) are retried with backoff by
+    the shared HTTP client.
     """
     # Construct the URL for the team's contracts page
-    url = f"https://www.spotrac.com/nba/{team}/yearly"
-
-    # Retry logic for handling transient errors
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            response = session.get(url, headers=HEADERS, timeout=TIMEOUT)
-
-            if response.status_code == 200:
-                # Successful response
-                break
-            elif response.status_code == 502:
-                # Bad Gateway, retry
-                logging.warning(f"502 for {team} ({attempt}/{MAX_RETRIES})")
-                time.sleep(RETRY_DELAY)
-            else:
-                # Other HTTP errors
-                logging.error(f"{team}: HTTP {response.status_code}")
-                return None
-
-        except requests.RequestException as e:
-            # Network-related errors, wait before retrying
-            logging.warning(f"{team}: {e} ({attempt}/{MAX_RETRIES})")
-            time.sleep(RETRY_DELAY)
-    else:
-        # All retries exhausted
-        logging.error(f"{team}: failed after retries")
+    url = team_url(team)
+
+    try:
+        content = fetch_page(url, session=session)
+    except RuntimeError as e:
+        logging.error(f"{team}: {e}")
         return None
 
-    soup = BeautifulSoup(response.content, "html.parser")
+    with telemetry.timed_parse("spotrac-team", url):
+        return _parse_team_page(content, team)
+
+
+def team_url(team):
+    """
+    Returns the Spotrac yearly contracts page of a team slug (e.g., "denver-nuggets").
+    """
+    return f"https://www.spotrac.com/nba/{team}/yearly"
+
+
+def fetch_page(url, session=None):
+    """
+    Fetch a Spotrac page through the shared HTTP client.
+
+    Returns:
+        bytes: The page body.
+
+    Raises:
+        RuntimeError: "HTTP <status>" for non-200 responses, or "request failed: ..." once
+            the client's retries are exhausted.
+    """
+    try:
+        response = http_client.get(url, session=session)
+    except requests.RequestException as e:
+        raise RuntimeError(f"request failed: {e}") from e
+    if response.status_code != 200:
+        raise RuntimeError(f"HTTP {response.status_code}")
+    return response.content
+
+
+def _parse_team_page(content, team):
+    """
+    Parse a Spotrac team yearly page into a contracts DataFrame (or None if it has no tables).
+    """
+    parsed = team_rows(content)
+    if parsed is None:
+        logging.warning(f"No contracts tables found for {team}")
+        return None
+    columns, rows = parsed
+    return pd.DataFrame(rows, columns=columns)
+
+
+def team_rows(content):
+    """
+    Parse a Spotrac team yearly page into compact rows (runs in a parse worker).
+
+    Returns:
+        tuple or None: (columns, list of row tuples), or None if the page has no contracts tables.
+    """
+    soup = BeautifulSoup(content, "html.parser")
 
     # Function to extract data from a table
     def extract_table(table, season_headers):
@@ -130,7 +156,7 @@ def scrape_team_contracts(team, session):
                 contract_values.append(None)
 
             # Append the extracted data
-            data.append([player_name, player_link, position, age] + contract_values)
+            data.append((player_name, player_link, position, age, *contract_values))
 
         return data
 
@@ -142,7 +168,6 @@ def scrape_team_contracts(team, session):
             tables.append(table)
 
     if not tables:
-        logging.warning(f"No contracts tables found for {team}")
         return None
 
     # Extract season headers from the first table
@@ -156,11 +181,18 @@ def scrape_team_contracts(team, session):
         all_data.extend(extract_table(table, season_headers))
 
     columns = ["Player", "Player Link", "Position", "Age"] + season_headers
-    return pd.DataFrame(all_data, columns=columns)
+    return columns, all_data
 
-def scrape_all_teams():
+def scrape_all_teams(session=None, parse_workers=None):
     """
     Scrape contract data for all NBA teams from Spotrac.
+
+    Pages are downloaded on fetch threads and parsed on a process pool (see
+    utils.fetch_parse.FetchParsePool).
+
+    Args:
+        session (requests.Session, optional): Session to use instead of the shared pooled client.
+        parse_workers (int, optional): Parse processes (default: CPU count).
     """
     teams = [
         "atlanta-hawks", "boston-celtics", "brooklyn-nets", "charlotte-hornets",
@@ -176,70 +208,215 @@ def scrape_all_teams():
     # Scrape all teams concurrently
     all_data = []
 
-    # Use a session for connection pooling
-    with requests.Session() as session:
-        session.headers.update(HEADERS)
-
-        # Use ThreadPoolExecutor for concurrent scraping
-        with ThreadPoolExecutor(max_workers=6) as executor:
-            futures = {
-                executor.submit(scrape_team_contracts, team, session): team
-                for team in teams
-            }
-
-            # Collect results as they complete
-            for future in as_completed(futures):
-                team = futures[future]
-                try:
-                    df = future.result()
-                    if df is not None:
-                        df["Team"] = team
-                        all_data.append(df)
-                        logging.info(f"✔ Finished {team}")
-                except Exception as e:
-                    logging.error(f"{team} failed: {e}")
+    # Fetch threads share one keep-alive pool; parsing runs on the parse workers
+    pool = FetchParsePool(
+        lambda url: fetch_page(url, session=session), team_rows, parse_workers=parse_workers, name="spotrac-team"
+    )
+
+    # Collect results as they complete
+    for team, parsed, error in pool.map((team, team_url(team)) for team in teams):
+        if error is not None:
+            logging.error(f"{team} failed: {error}")
+        elif parsed is None:
+            logging.warning(f"No contracts tables found for {team}")
+        else:
+            columns, rows = parsed
+            df = pd.DataFrame(rows, columns=columns)
+            df["Team"] = team
+            all_data.append(df)
+            logging.info(f"✔ Finished {team}")
 
     return pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
 
-def scrape_player_contracts(url, session):
+# Fields extracted from a Spotrac player page, in output order
+PLAYER_FIELDS = [
+    "Signed Using", "Drafted", "Contract Years", "Contract Value", "Average Salary",
+    "Guaranteed at Signing", "Total Guaranteed", "Options", "Free Agent Year", "Free Agent Type",
+]
+
+# Contract-details label -> record field for the plain dollar values
+DOLLAR_LABELS = {
+    "Average Salary": "Average Salary",
+    "GTD at Sign": "Guaranteed at Signing",
+    "Total GTD": "Total Guaranteed",
+}
+
+
+def _dollars(text):
+    digits = re.sub(r"[^\d]", "", text or "")
+    return int(digits) if digits else None
+
+
+def parse_player_page(content):
+    """
+    Extract a structured contract record from a Spotrac player page.
+
+    The page is parsed once with lxml and only two subtrees are read: the player
+    header (draft info) and the first contract-details block (the current contract),
+    whose label/value pairs are matched by label text rather than position.
+
+    The Drafted and Signed Using lookups are the ones the original scraper used. The
+    other contract-details labels and the breakdown table's Status column have only
+    been checked against benchmarks/fixtures/spotrac/player.html, not a recorded live
+    page, so every field they fail to find is reported in "Parse Errors" (which the
+    callers log as a warning) rather than left blank silently.
+
+    Args:
+        content (bytes or str): Page HTML.
+
+    Returns:
+        dict: PLAYER_FIELDS (None where absent) plus "Parse Errors", a "; "-separated
+            list of reasons for every field that could not be read ("" when complete).
+    """
+    record = dict.fromkeys(PLAYER_FIELDS)
+    errors = []
+    try:
+        tree = html.fromstring(content)
+    except (etree.ParserError, ValueError) as e:
+        record["Parse Errors"] = f"unparseable page: {e}"
+        return record
+
+    # Player header: "Drafted:" label followed by its value
+    header = tree.xpath("//div[@id='main']//div[contains(concat(' ', @class, ' '), ' pb-3 ')][1]")
+    if not header:
+        errors.append("player header not found")
+    else:
+        drafted = header[0].xpath(".//strong[normalize-space()='Drafted:']/following-sibling::span[1]")
+        if drafted:
+            record["Drafted"] = drafted[0].text_content().strip()
+        else:
+            errors.append("Drafted missing from player header")
+
+    # Current contract: the first contract wrapper under #contracts
+    wrapper = tree.xpath("//div[@id='contracts']//div[contains(@class, 'contract-wrapper')][1]")
+    if not wrapper:
+        errors.append("contract details not found")
+        record["Parse Errors"] = "; ".join(errors)
+        return record
+    wrapper = wrapper[0]
+
+    details = {}
+    for label in wrapper.xpath(".//div[contains(@class, 'contract-details')]//div[@class='label']"):
+        value = label.getnext()
+        if value is not None:
+            details[label.text_content().strip().rstrip(":")] = value.text_content().strip()
+
+    record["Signed Using"] = details.get("Signed Using") or None
+    if record["Signed Using"] is None:
+        errors.append("Signed Using missing from contract details")
+
+    terms = details.get("Contract Terms")
+    match = re.match(r"^\s*(\d+)\s*yr", terms or "")
+    if match:
+        record["Contract Years"] = int(match.group(1))
+        record["Contract Value"] = _dollars(terms.split("/", 1)[-1])
+    else:
+        errors.append(f"unreadable Contract Terms: {terms!r}" if terms else "Contract Terms missing")
+
+    for label, field in DOLLAR_LABELS.items():
+        record[field] = _dollars(details.get(label))
+        if record[field] is None:
+            errors.append(f"unreadable {label}: {details[label]!r}" if details.get(label) else f"{label} missing")
+
+    free_agent = details.get("Free Agent")
+    match = re.match(r"^\s*(\d{4})\s*/\s*(\w+)", free_agent or "")
+    if match:
+        record["Free Agent Year"] = int(match.group(1))
+        record["Free Agent Type"] = match.group(2).upper()
+    else:
+        errors.append(f"unreadable Free Agent: {free_agent!r}" if free_agent else "Free Agent missing")
+
+    # Option years from the breakdown table (Year ... Status columns, found by header)
+    options = []
+    breakdown = wrapper.xpath(".//table[contains(@class, 'contract-breakdown')]")
+    headers = [th.text_content().strip() for th in breakdown[0].xpath("./thead//th")] if breakdown else []
+    if not breakdown:
+        errors.append("contract breakdown table not found")
+    elif "Status" not in headers:
+        errors.append("Status column missing from contract breakdown")
+    else:
+        status = headers.index("Status")
+        for row in breakdown[0].xpath("./tbody/tr"):
+            cells = [cell.text_content().strip() for cell in row.xpath("./td")]
+            if len(cells) > status and "option" in cells[status].lower():
+                options.append(f"{cells[0]} {cells[status]}")
+    record["Options"] = "; ".join(options) or None
+
+    record["Parse Errors"] = "; ".join(errors)
+    return record
+
+
+def scrape_player_record(url, session=None):
     """
-    Scrape contract details for a specific player from Spotrac.
+    Fetch a Spotrac player page and extract its contract record in one visit.
+
+    Args:
+        url (str): Player contract page.
+        session (requests.Session, optional): Session to use instead of the shared pooled client.
+
+    Returns:
+        dict: See parse_player_page(). Fetch failures are reported in "Parse Errors"
+            (e.g. "HTTP 404") with every field None.
     """
     try:
-        # Make a request to the player's contract page
-        response = session.get(url, headers=HEADERS, timeout=TIMEOUT)
-        soup = BeautifulSoup(response.content, "html.parser")
+        content = fetch_page(url, session=session)
+    except RuntimeError as e:
+        return {**dict.fromkeys(PLAYER_FIELDS), "Parse Errors": str(e)}
 
-        # Extract "Signed Using" details
-        signed_using_selector = "#contracts > div > div > div.contract-wrapper.mb-5 > div.contract-details.row.m-0 > div:nth-child(5) > div.label"
-        signed_using_element = soup.select_one(signed_using_selector)
+    with telemetry.timed_parse("spotrac-player", url):
+        record = parse_player_page(content)
+    if record["Parse Errors"]:
+        logging.warning(f"{url}: {record['Parse Errors']}")
+    return record
 
-        # Get the text of the next sibling element which contains the value
-        signed_using_value = (
-            signed_using_element.find_next_sibling().get_text().strip()
-            if signed_using_element else None
-        )
 
-        # Extract "Drafted" details
-        drafted_selector = "#main > section > article > div.row.m-0.mt-0.pb-3 > div.col-md-6 > div > div:nth-child(1) > span"
-        drafted_element = soup.select_one(drafted_selector)
+def player_row(content):
+    """
+    Parse a player page into a compact (PLAYER_FIELDS..., Parse Errors) tuple (runs in a parse worker).
+    """
+    record = parse_player_page(content)
+    return tuple(record[field] for field in PLAYER_FIELDS) + (record["Parse Errors"],)
 
-        drafted_value = (
-            drafted_element.get_text().strip()
-            if drafted_element else None
-        )
 
-        return signed_using_value, drafted_value
+def scrape_player_records(urls, session=None, parse_workers=None):
+    """
+    Fetch and parse many player pages, with fetch threads feeding a parse process pool.
+
+    Args:
+        urls (iterable of str): Player contract pages.
+        session (requests.Session, optional): Session to use instead of the shared pooled client.
+        parse_workers (int, optional): Parse processes (default: CPU count).
 
-    except Exception as e:
-        return None, None
+    Yields:
+        tuple: (url, record) in completion order; see scrape_player_record() for the record.
+    """
+    pool = FetchParsePool(
+        lambda url: fetch_page(url, session=session), player_row,
+        fetch_workers=5, parse_workers=parse_workers, name="spotrac-player",
+    )
+    for url, row, error in pool.map((url, url) for url in urls):
+        if error is not None:
+            record = {**dict.fromkeys(PLAYER_FIELDS), "Parse Errors": error}
+        else:
+            record = dict(zip(PLAYER_FIELDS + ["Parse Errors"], row))
+        if record["Parse Errors"]:
+            logging.warning(f"{url}: {record['Parse Errors']}")
+        yield url, record
+
+
+def scrape_player_contracts(url, session=None):
+    """
+    Scrape the ("Signed Using", "Drafted") values for a specific player from Spotrac.
+    """
+    record = scrape_player_record(url, session=session)
+    return record["Signed Using"], record["Drafted"]
 
 
 if __name__ == "__main__":
     # Example usage: Scrape Oklahoma City Thunder contracts and print the resulting DataFrame
-    team_df = scrape_team_contracts("oklahoma-city-thunder", requests.Session())
+    team_df = scrape_team_contracts("oklahoma-city-thunder")
     print(team_df)
 
-    # Example usage: Scrape contract details for Alex Caruso and print the resulting DataFrame
-    player_df = scrape_player_contracts("https://www.spotrac.com/nba/player/_/id/21076/alex-caruso", requests.Session())
-    print(player_df)
+    # Example usage: Scrape the contract record for Alex Caruso and print it
+    record = scrape_player_record("https://www.spotrac.com/nba/player/_/id/21076/alex-caruso")
+    print(record)
@@ -0,0 +1,285 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.lineup_optimizer import eligibility_matrix, optimize_lineup
+
+# Set up module-level logging for the season simulator
+logger = logging.getLogger(__name__)
+
+# Season structure (league rules, sections 2.2 and 9.1)
+REGULAR_SEASON_GAMES = 56
+SERIES_GAMES = 7
+PLAYOFF_ROUNDS = 3
+
+# First-round pairs by seed (1v8, 2v7, 3v6, 4v5), listed so that neighbouring winners
+# meet in the next round
+BRACKET = [(0, 7), (3, 4), (1, 6), (2, 5)]
+
+# Game-to-game coefficient of variation of a player's fantasy points, used only for
+# rosters without a fitted Dispersion column (see fit_dispersion)
+PLAYER_CV = 0.35
+
+# Box score stats in the FP formula other than points (each event is worth +/-1 FP)
+UNIT_STATS = ["TRB", "AST", "STL", "BLK", "TOV", "PF"]
+
+# Per-game variance of a player's points per point scored: a made FT, 2 and 3 add 1, 4
+# and 9. Fitted as (FT + 4*2P + 9*3P) / PTS on the 2016-2025 Basketball-Reference
+# archive; used when no archive is given (nba_stats.csv has no shooting splits).
+POINTS_VARIANCE_WEIGHT = 2.16
+
+# Games of the league-wide dispersion blended into each player's own estimate
+DISPERSION_PRIOR_GAMES = 20
+
+# Seasons simulated per array batch inside a worker (bounds memory)
+BATCH_SIZE = 5000
+
+
+def points_variance_weight(archive):
+    """
+    Fits POINTS_VARIANCE_WEIGHT from season totals with shooting splits.
+
+    Args:
+        archive (pd.DataFrame): Basketball-Reference totals (FT, 2P, 3P and PTS columns).
+
+    Returns:
+        float: Per-game variance of points per point scored.
+    """
+    totals = archive[["FT", "2P", "3P", "PTS"]].apply(pd.to_numeric, errors="coerce").dropna()
+    points = totals["PTS"].sum()
+    if points <= 0:
+        return POINTS_VARIANCE_WEIGHT
+    return float((totals["FT"] + 4 * totals["2P"] + 9 * totals["3P"]).sum() / points)
+
+
+def fit_dispersion(stats, points_weight=POINTS_VARIANCE_WEIGHT, prior_games=DISPERSION_PRIOR_GAMES):
+    """
+    Estimates each player's game-to-game FP dispersion from season totals.
+
+    Treating every box score event count as Poisson per game, a player's per-game FP
+    variance is (points_weight x PTS + TRB + AST + STL + BLK + TOV + PF) / G. Its ratio to
+    the mean (FP / G) is the player's dispersion D, so a player projected for m FP per
+    game has SD sqrt(D x m). Each D is shrunk toward the league-wide value (total variance
+    over total FP) with prior_games games of weight, so players with few games lean on
+    the league. The model leaves out minute-to-minute role changes, so it is a floor on
+    the real game-to-game spread.
+
+    Args:
+        stats (pd.DataFrame): Season totals with Player Key, G, FP, PTS and UNIT_STATS
+            (e.g. nba_stats.csv).
+        points_weight (float): See points_variance_weight().
+        prior_games (float): Games of weight given to the league-wide dispersion.
+
+    Returns:
+        pd.DataFrame: Player Key and Dispersion for every player in stats.
+    """
+    columns = ["G", "FP", "PTS"] + UNIT_STATS
+    totals = stats[columns].apply(pd.to_numeric, errors="coerce").fillna(0.0)
+    variance = points_weight * totals["PTS"] + totals[UNIT_STATS].sum(axis=1)
+    valid = (totals["G"] > 0) & (totals["FP"] > 0)
+
+    league = float(variance[valid].sum() / totals.loc[valid, "FP"].sum()) if valid.any() else 1.0
+    own = (variance / totals["FP"]).where(valid, league)
+    games = totals["G"].where(valid, 0.0)
+    dispersion = (games * own + prior_games * league) / (games + prior_games)
+
+    logger.info(f"League-wide FP dispersion {league:.2f} (points weight {points_weight:.2f})")
+    return pd.DataFrame({"Player Key": stats["Player Key"].to_numpy(), "Dispersion": dispersion.to_numpy()})
+
+
+def team_distributions(rosters, player_cv=PLAYER_CV):
+    """
+    Fits a per-game fantasy point distribution for every owner.
+
+    Each owner's minutes are allocated with the lineup optimizer; a player's per-game FP is
+    taken as normal with mean minutes x FPPM and variance Dispersion x mean (see
+    fit_dispersion), and a team's per-game total is the sum of its players' independent
+    draws, i.e. normal with the summed mean and variance. Rosters without a Dispersion
+    column use standard deviation player_cv x mean instead.
+
+    Args:
+        rosters (pd.DataFrame): Owner, Player Key, Position, FPPM and Minutes (see
+            lineup_optimizer.build_rosters), optionally with Dispersion.
+        player_cv (float): Per-game coefficient of variation of a player's FP, for rosters
+            without a Dispersion column.
+
+    Returns:
+        pd.DataFrame: Owner, Mean and SD of team FP per game, sorted by Owner.
+    """
+    rows = []
+    for owner, roster in rosters.groupby("Owner", sort=True):
+        fppm = roster["FPPM"].to_numpy(dtype=float)
+        alloc = optimize_lineup(fppm, roster["Minutes"].to_numpy(dtype=float), eligibility_matrix(roster["Position"]))
+        player_mean = alloc.sum(axis=1) * fppm
+        if "Dispersion" in roster.columns:
+            # Players without stats have no dispersion, but also no FPPM (mean 0)
+            dispersion = np.nan_to_num(roster["Dispersion"].to_numpy(dtype=float))
+            variance = dispersion * np.maximum(player_mean, 0.0)
+        else:
+            variance = (player_cv * player_mean) ** 2
+        rows.append({
+            "Owner": owner,
+            "Mean": player_mean.sum(),
+            "SD": np.sqrt(variance.sum()),
+        })
+    return pd.DataFrame(rows, columns=["Owner", "Mean", "SD"])
+
+
+def round_robin(teams, games=REGULAR_SEASON_GAMES):
+    """
+    Builds a regular-season schedule by cycling a round-robin (circle method).
+
+    Returns:
+        np.ndarray: (games x teams/2 x 2) team indexes playing each other in each game.
+    """
+    order = list(range(teams))
+    rounds = []
+    for _ in range(teams - 1):
+        rounds.append([(order[i], order[teams - 1 - i]) for i in range(teams // 2)])
+        order = [order[0], order[-1]] + order[1:-1]
+    return np.array([rounds[g % len(rounds)] for g in range(games)], dtype=np.int64)
+
+
+def seed_order(wins, fppg):
+    """
+    Ranks each simulated season's teams by wins, then FPPG as the tiebreaker.
+
+    The two keys are sorted separately rather than combined into one number, which in
+    float32 would round away FPPG differences between teams tied on wins.
+
+    Args:
+        wins (np.ndarray): (sims x teams) regular-season wins.
+        fppg (np.ndarray): (sims x teams) regular-season FP per game.
+
+    Returns:
+        np.ndarray: (sims x teams) team indexes, first seed first.
+    """
+    return np.lexsort((-fppg, -wins), axis=1)
+
+
+def _simulate_batch(rng, means, sds, schedule, sims):
+    """
+    Simulates a batch of seasons and returns seed, advancement and win tallies.
+    """
+    teams = len(means)
+    regular_games = schedule.shape[0]
+    fp = rng.standard_normal((sims, regular_games + SERIES_GAMES * PLAYOFF_ROUNDS, teams), dtype=np.float32)
+    fp = fp * sds + means
+
+    # Regular season: every game number is a full slate of head-to-head matchups. Wins per
+    # team are the matchup outcomes times a (matchups x teams) incidence matrix.
+    regular = fp[:, :regular_games, :]
+    first, second = schedule[:, :, 0].ravel(), schedule[:, :, 1].ravel()
+    game_index = np.repeat(np.arange(regular_games), schedule.shape[1])
+    first_won = (regular[:, game_index, first] > regular[:, game_index, second]).astype(np.float32)
+    incidence_first = np.eye(teams, dtype=np.float32)[first]
+    incidence_second = np.eye(teams, dtype=np.float32)[second]
+    wins = first_won @ incidence_first + (1 - first_won) @ incidence_second
+
+    # Seeding: wins, then FPPG as the tiebreaker
+    fppg = regular.mean(axis=1)
+    seeds = seed_order(wins, fppg)
+    seed_counts = np.stack([np.bincount(seeds[:, k], minlength=teams) for k in range(teams)], axis=1)
+
+    # Playoffs: fixed bracket, each round a 7-game series on the next 7 game numbers
+    alive = np.stack([seeds[:, [a, b]] for a, b in BRACKET], axis=1)  # (sims, series, 2)
+    reached = [np.bincount(alive.ravel(), minlength=teams)]
+    start = regular_games
+    for _ in range(PLAYOFF_ROUNDS):
+        series_fp = fp[:, start:start + SERIES_GAMES, :]
+        first_fp = np.take_along_axis(series_fp, alive[:, None, :, 0], axis=2)
+        second_fp = np.take_along_axis(series_fp, alive[:, None, :, 1], axis=2)
+        first_takes_series = (first_fp > second_fp).sum(axis=1) * 2 > SERIES_GAMES
+        winners = np.where(first_takes_series, alive[:, :, 0], alive[:, :, 1])
+        reached.append(np.bincount(winners.ravel(), minlength=teams))
+        if winners.shape[1] > 1:
+            alive = winners.reshape(sims, -1, 2)
+        start += SERIES_GAMES
+
+    return {
+        "seed_counts": seed_counts,
+        "reached": np.stack(reached),
+        "wins": wins.sum(axis=0).round().astype(np.int64),
+    }
+
+
+def _simulate_chunk(seed_sequence, means, sds, schedule, sims):
+    # Runs in a worker process; batches keep the (sims x games x teams) draws small
+    rng = np.random.default_rng(seed_sequence)
+    totals = None
+    done = 0
+    while done < sims:
+        batch = min(BATCH_SIZE, sims - done)
+        result = _simulate_batch(rng, means, sds, schedule, batch)
+        totals = result if totals is None else {key: totals[key] + result[key] for key in totals}
+        done += batch
+    return totals
+
+
+def simulate(distributions, sims=100_000, workers=None, seed=None):
+    """
+    Simulates full seasons and reports seeding, playoff and title probabilities.
+
+    The simulation count is split across a process pool; each worker draws from its own
+    SeedSequence child stream, so results are reproducible for a given seed and worker count.
+
+    Args:
+        distributions (pd.DataFrame): Owner, Mean and SD (see team_distributions).
+        sims (int): Number of seasons to simulate.
+        workers (int, optional): Worker processes (default: CPU count). 1 runs in-process.
+        seed (int, optional): Seed for reproducible results.
+
+    Returns:
+        pd.DataFrame: One row per owner with expected wins, playoff, semifinal, finals and
+            title odds, and the probability of finishing with each seed.
+    """
+    owners = distributions["Owner"].tolist()
+    means = distributions["Mean"].to_numpy(dtype=np.float32)
+    sds = distributions["SD"].to_numpy(dtype=np.float32)
+    schedule = round_robin(len(owners))
+
+    workers = workers or os.cpu_count() or 1
+    chunks = [sims // workers + (1 if i < sims % workers else 0) for i in range(workers)]
+    chunks = [chunk for chunk in chunks if chunk]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+
+    if len(chunks) == 1:
+        results = [_simulate_chunk(seeds[0], means, sds, schedule, chunks[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [
+                executor.submit(_simulate_chunk, child, means, sds, schedule, chunk)
+                for child, chunk in zip(seeds, chunks)
+            ]
+            results = [future.result() for future in futures]
+
+    seed_counts = sum(result["seed_counts"] for result in results)
+    reached = sum(result["reached"] for result in results)
+    wins = sum(result["wins"] for result in results)
+
+    odds = pd.DataFrame({
+        "Owner": owners,
+        "Mean FP": distributions["Mean"].round(1).to_numpy(),
+        "Expected Wins": (wins / sims).round(2),
+        "Playoffs": reached[0] / sims,
+        "Semifinals": reached[1] / sims,
+        "Finals": reached[2] / sims,
+        "Title": reached[3] / sims,
+    })
+    for seed_number in range(len(owners)):
+        odds[f"Seed {seed_number + 1}"] = seed_counts[:, seed_number] / sims
+    logger.info(f"Simulated {sims} seasons across {len(chunks)} worker(s)")
+    return odds.sort_values("Title", ascending=False).reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    # Example usage: title odds from current stats and Sports.ws rosters
+    from utils.lineup_optimizer import build_rosters
+
+    stats = pd.read_csv("data/nba_stats.csv")
+    rosters = build_rosters(pd.read_csv("data/sportsws_positions.csv"), stats)
+    rosters = rosters.merge(fit_dispersion(stats).drop_duplicates("Player Key"), on="Player Key", how="left")
+    print(simulate(team_distributions(rosters), sims=20_000, seed=1)[["Owner", "Expected Wins", "Playoffs", "Title"]])
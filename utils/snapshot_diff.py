@@ -0,0 +1,175 @@
+import glob
+import logging
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from utils.salary_cap import season_columns
+
+# Set up module-level logging for the snapshot diff engine
+logger = logging.getLogger(__name__)
+
+# Change types, in the order they are reported for a player
+ADDED = "added"
+REMOVED = "removed"
+TEAM_CHANGED = "team changed"
+SALARY_CHANGED = "salary changed"
+CHANGE_TYPES = [ADDED, REMOVED, TEAM_CHANGED, SALARY_CHANGED]
+
+CHANGE_COLUMNS = ["From", "To", "Player ID", "Player", "Player Key", "Change", "Field", "Old", "New"]
+
+# Archive files are named spotrac_contracts_<year>.csv
+ARCHIVE_PATTERN = re.compile(r"spotrac_contracts_(\d{4})\.csv$")
+
+# Spotrac player IDs; archived links omit the name slug that live links carry
+PLAYER_ID_PATTERN = r"/id/(\d+)"
+
+
+def snapshot_files(archive_dir="data/spotrac_archive", current_csv=None, current_label="current"):
+    """
+    Lists contract snapshots as {label: path}, oldest first.
+
+    Args:
+        archive_dir (str): Directory of spotrac_contracts_<year>.csv files.
+        current_csv (str, optional): The live snapshot (e.g., data/spotrac_contracts.csv).
+        current_label (str): Label for the live snapshot.
+
+    Returns:
+        dict: Snapshot label -> file path.
+    """
+    files = {}
+    for path in glob.glob(os.path.join(archive_dir, "spotrac_contracts_*.csv")):
+        match = ARCHIVE_PATTERN.search(path)
+        if match:
+            files[match.group(1)] = path
+    files = dict(sorted(files.items()))
+    if current_csv and os.path.exists(current_csv):
+        files[current_label] = current_csv
+    return files
+
+
+def index_snapshot(df):
+    """
+    Keys a contracts snapshot by Spotrac player ID.
+
+    A traded player listed on two teams becomes one row whose Team joins both names, so
+    the trade shows up as a team change. Salary cells are kept as strings, so statuses
+    (Two-Way, RFA, UFA) compare like salaries.
+
+    Returns:
+        pd.DataFrame: Player, Player Key, Team and season columns, indexed by Player ID.
+    """
+    seasons = season_columns(df)
+    df = df.copy()
+    df["Player ID"] = df["Player Link"].astype(str).str.extract(PLAYER_ID_PATTERN, expand=False)
+    df["Player ID"] = df["Player ID"].fillna(df["Player Link"].astype(str))
+    df[seasons] = df[seasons].astype("string").fillna("")
+
+    teams = df.groupby("Player ID", sort=False)["Team"].agg(lambda names: " / ".join(sorted(set(names.dropna()))))
+    filled = (df[seasons] != "").sum(axis=1)
+    order = filled.sort_values(ascending=False, kind="mergesort").index
+    snapshot = df.loc[order].drop_duplicates(subset=["Player ID"]).set_index("Player ID")
+    snapshot["Team"] = teams.reindex(snapshot.index)
+    return snapshot[["Player", "Player Key", "Team"] + seasons].sort_index()
+
+
+def diff_snapshots(old, new, old_label="old", new_label="new"):
+    """
+    Diffs two indexed snapshots (see index_snapshot) into a typed change log.
+
+    Players are hash-joined on Player ID. Each side's Team and the salary cells of the
+    seasons both snapshots cover are fingerprinted, and only players whose fingerprints
+    differ are compared field by field.
+
+    Args:
+        old (pd.DataFrame): Earlier snapshot.
+        new (pd.DataFrame): Later snapshot.
+        old_label (str): Label for the earlier snapshot (From column).
+        new_label (str): Label for the later snapshot (To column).
+
+    Returns:
+        pd.DataFrame: One row per change (CHANGE_COLUMNS). Salary changes have one row per
+            season, with the season in Field.
+    """
+    seasons = [col for col in season_columns(new) if col in old.columns]
+    compared = ["Team"] + seasons
+
+    added = new.index.difference(old.index)
+    removed = old.index.difference(new.index)
+    common = new.index.intersection(old.index)
+
+    old_prints = pd.util.hash_pandas_object(old.loc[common, compared].astype(str), index=False).to_numpy()
+    new_prints = pd.util.hash_pandas_object(new.loc[common, compared].astype(str), index=False).to_numpy()
+    differs = common[old_prints != new_prints]
+
+    rows = []
+    for player_id in added:
+        player = new.loc[player_id]
+        rows.append((player_id, player["Player"], player["Player Key"], ADDED, "Team", "", player["Team"]))
+    for player_id in removed:
+        player = old.loc[player_id]
+        rows.append((player_id, player["Player"], player["Player Key"], REMOVED, "Team", player["Team"], ""))
+
+    # Field-level changes for the players whose fingerprints differ, as (player, field) cells
+    before = old.loc[differs, compared].astype(str).to_numpy()
+    after = new.loc[differs, compared].astype(str).to_numpy()
+    names = new.loc[differs, ["Player", "Player Key"]].to_numpy()
+    for i, j in zip(*np.nonzero(before != after)):
+        change = TEAM_CHANGED if j == 0 else SALARY_CHANGED
+        rows.append((differs[i], names[i, 0], names[i, 1], change, compared[j], before[i, j], after[i, j]))
+
+    changes = pd.DataFrame(rows, columns=CHANGE_COLUMNS[2:])
+    changes.insert(0, "To", new_label)
+    changes.insert(0, "From", old_label)
+    changes["Change"] = pd.Categorical(changes["Change"], categories=CHANGE_TYPES, ordered=True)
+    changes = changes.sort_values(["Change", "Player Key", "Field"], kind="mergesort").reset_index(drop=True)
+    changes["Change"] = changes["Change"].astype(str)
+    logger.info(
+        f"{old_label} -> {new_label}: {len(added)} added, {len(removed)} removed, "
+        f"{len(differs)} changed of {len(common)} common players"
+    )
+    return changes
+
+
+def diff_archive(files):
+    """
+    Diffs every consecutive pair of snapshots in one pass; each file is read and indexed once.
+
+    Args:
+        files (dict): Snapshot label -> file path, oldest first (see snapshot_files).
+
+    Returns:
+        pd.DataFrame: The concatenated change log (CHANGE_COLUMNS).
+    """
+    logs = []
+    previous = None
+    for label, path in files.items():
+        snapshot = index_snapshot(pd.read_csv(path))
+        if previous is not None:
+            logs.append(diff_snapshots(previous[1], snapshot, previous[0], label))
+        previous = (label, snapshot)
+    return pd.concat(logs, ignore_index=True) if logs else pd.DataFrame(columns=CHANGE_COLUMNS)
+
+
+def changed_keys(changes, change_types=None):
+    """
+    Returns the Player Keys touched by a change log, for targeted downstream refreshes.
+
+    Args:
+        changes (pd.DataFrame): Change log (see diff_snapshots).
+        change_types (list of str, optional): Only count these change types.
+
+    Returns:
+        list of str: Sorted Player Keys.
+    """
+    if change_types is not None:
+        changes = changes[changes["Change"].isin(change_types)]
+    return sorted(changes["Player Key"].dropna().unique().tolist())
+
+
+if __name__ == "__main__":
+    # Example usage: what changed between the archived snapshots and the live contracts
+    changes = diff_archive(snapshot_files(current_csv="data/spotrac_contracts.csv"))
+    print(changes.groupby(["From", "To", "Change"]).size())
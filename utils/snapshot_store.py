@@ -0,0 +1,242 @@
+import datetime
+import gzip
+import io
+import json
+import logging
+import os
+
+import pandas as pd
+
+from utils.output_manifest import atomic_write
+
+# Set up module-level logging for the snapshot store
+logger = logging.getLogger(__name__)
+
+# Root directory of the versioned history (one subdirectory per dataset)
+HISTORY_DIR = os.path.join("data", "history")
+
+# Row identity of each dataset. Rows that repeat a key (e.g. a duplicated Spotrac row)
+# are told apart by their occurrence number.
+DATASET_KEYS = {
+    "contracts": ["Player Key", "Team"],
+    "contract_types": ["Player Key"],
+    "stats": ["Player Key"],
+    "positions": ["Player Key"],
+}
+
+# A full checkpoint is written at least every this many versions, so rebuilding any
+# version replays a bounded number of deltas
+CHECKPOINT_EVERY = 30
+
+# Internal columns of the stored files
+OCCURRENCE = "_n"
+OP = "_op"
+UPSERT, DELETE = "U", "D"
+
+CHECKPOINT, DELTA = "checkpoint", "delta"
+
+
+def _text_frame(df):
+    """
+    Returns df as the text it would have in a CSV (blanks as ""), so values compare
+    exactly across runs regardless of in-memory dtypes.
+    """
+    return pd.read_csv(io.StringIO(df.to_csv(index=False)), dtype=str, keep_default_na=False)
+
+
+def _date_label(date):
+    if date is None:
+        return datetime.datetime.now().isoformat(timespec="seconds")
+    if isinstance(date, (datetime.date, datetime.datetime)):
+        return date.isoformat()
+    return str(date)
+
+
+class SnapshotStore:
+    """
+    Versioned history of the league datasets, stored as row-level deltas.
+
+    Each record() compares a dataset with its previous version and stores only the
+    rows that were added, changed or removed (a gzipped CSV with an op column). A full
+    checkpoint is written for the first version, every CHECKPOINT_EVERY versions, when
+    the columns change, or when the delta would be larger than half the dataset.
+    as_of() rebuilds a dataset from the nearest checkpoint plus the deltas after it.
+
+    Layout: <root>/<dataset>/versions.json lists every version (number, date, kind,
+    file, row count, columns); the version files sit next to it.
+    """
+
+    def __init__(self, root=HISTORY_DIR, keys=None, checkpoint_every=CHECKPOINT_EVERY):
+        """
+        Args:
+            root (str): History directory.
+            keys (dict, optional): Dataset -> key columns. Defaults to DATASET_KEYS.
+            checkpoint_every (int): Maximum versions between full checkpoints.
+        """
+        self.root = root
+        self.keys = dict(DATASET_KEYS if keys is None else keys)
+        self.checkpoint_every = checkpoint_every
+        # dataset -> (version, indexed text frame) of the most recently rebuilt version
+        self._latest = {}
+
+    def _dir(self, dataset):
+        return os.path.join(self.root, dataset)
+
+    def versions(self, dataset):
+        """
+        Returns the version entries of a dataset, oldest first (empty if none).
+        """
+        try:
+            with open(os.path.join(self._dir(dataset), "versions.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    def _save_versions(self, dataset, versions):
+        content = json.dumps(versions, indent=1).encode("utf-8")
+        atomic_write(os.path.join(self._dir(dataset), "versions.json"), content)
+
+    def _index(self, dataset, text):
+        keys = self.keys[dataset]
+        text = text.copy()
+        text[OCCURRENCE] = text.groupby(keys, sort=False).cumcount().astype(str)
+        return text.set_index(keys + [OCCURRENCE])
+
+    def _read(self, dataset, file_name):
+        return pd.read_csv(
+            os.path.join(self._dir(dataset), file_name), dtype=str, keep_default_na=False, compression="gzip"
+        )
+
+    def _write(self, dataset, file_name, frame):
+        content = gzip.compress(frame.to_csv(index=False).encode("utf-8"), mtime=0)
+        atomic_write(os.path.join(self._dir(dataset), file_name), content)
+        return len(content)
+
+    def _state(self, dataset, versions, position):
+        """
+        Rebuilds the indexed text frame of versions[position].
+        """
+        cached = self._latest.get(dataset)
+        if cached is not None and cached[0] == versions[position]["version"]:
+            return cached[1]
+
+        start = max(i for i in range(position + 1) if versions[i]["kind"] == CHECKPOINT)
+        key_columns = self.keys[dataset] + [OCCURRENCE]
+        state = self._read(dataset, versions[start]["file"]).set_index(key_columns)
+        for entry in versions[start + 1:position + 1]:
+            delta = self._read(dataset, entry["file"]).set_index(key_columns)
+            state = state.drop(index=delta.index, errors="ignore")
+            upserts = delta[delta[OP] == UPSERT].drop(columns=[OP])
+            state = pd.concat([state, upserts[state.columns]]) if len(state) else upserts
+        return state.sort_index(kind="mergesort")
+
+    def record(self, dataset, df, date=None):
+        """
+        Stores a new version of a dataset if it differs from the previous one.
+
+        Args:
+            dataset (str): Dataset name (a key of DATASET_KEYS).
+            df (pd.DataFrame): The dataset as written to CSV.
+            date (str or datetime, optional): Version date (default: now), ISO format.
+
+        Returns:
+            dict or None: The new version entry, or None if nothing changed.
+        """
+        versions = self.versions(dataset)
+        new = self._index(dataset, _text_frame(df)).sort_index(kind="mergesort")
+        columns = [col for col in df.columns]
+        number = versions[-1]["version"] + 1 if versions else 1
+
+        delta = None
+        if versions and versions[-1]["columns"] == columns:
+            old = self._state(dataset, versions, len(versions) - 1)
+            removed = old.index.difference(new.index)
+            added = new.index.difference(old.index)
+            common = new.index.intersection(old.index)
+            changed = common[(new.loc[common] != old.loc[common, new.columns]).any(axis=1).to_numpy()]
+            if not len(removed) and not len(added) and not len(changed):
+                logger.info(f"{dataset}: unchanged since version {versions[-1]['version']}")
+                return None
+
+            upserts = new.loc[added.append(changed)].assign(**{OP: UPSERT})
+            deletes = pd.DataFrame(index=removed, columns=new.columns).fillna("").assign(**{OP: DELETE})
+            delta = pd.concat([upserts, deletes]) if len(deletes) else upserts
+
+        since_checkpoint = next(
+            (len(versions) - i for i in range(len(versions) - 1, -1, -1) if versions[i]["kind"] == CHECKPOINT),
+            None,
+        )
+        if (delta is None or since_checkpoint is None or since_checkpoint >= self.checkpoint_every
+                or len(delta) > len(new) / 2):
+            kind, file_name = CHECKPOINT, f"{number:06d}.checkpoint.csv.gz"
+            size = self._write(dataset, file_name, new.reset_index())
+            changes = len(new)
+        else:
+            kind, file_name = DELTA, f"{number:06d}.delta.csv.gz"
+            size = self._write(dataset, file_name, delta.reset_index())
+            changes = len(delta)
+
+        entry = {
+            "version": number,
+            "date": _date_label(date),
+            "kind": kind,
+            "file": file_name,
+            "rows": len(new),
+            "changes": changes,
+            "bytes": size,
+            "columns": columns,
+        }
+        versions.append(entry)
+        self._save_versions(dataset, versions)
+        self._latest[dataset] = (number, new)
+        logger.info(f"{dataset}: version {number} ({kind}, {changes} rows, {size:,} bytes)")
+        return entry
+
+    def as_of(self, dataset, date=None):
+        """
+        Rebuilds a dataset as it was at a point in time.
+
+        Args:
+            dataset (str): Dataset name.
+            date (str or datetime, optional): ISO date or datetime. A date without a time
+                ("2026-03-01") includes every version recorded that day. Default: latest.
+
+        Returns:
+            pd.DataFrame or None: The dataset (typed as if read from its CSV, rows in key
+                order), or None if no version existed yet.
+        """
+        versions = self.versions(dataset)
+        label = None if date is None else _date_label(date)
+        positions = [i for i, entry in enumerate(versions) if label is None or entry["date"][:len(label)] <= label]
+        if not positions:
+            return None
+
+        state = self._state(dataset, versions, positions[-1])
+        text = state.reset_index().drop(columns=[OCCURRENCE])[versions[positions[-1]]["columns"]]
+        return pd.read_csv(io.StringIO(text.to_csv(index=False)))
+
+    def summary(self):
+        """
+        Returns one row per dataset: versions, checkpoints, first/last date and bytes on disk.
+        """
+        rows = []
+        for dataset in sorted(os.listdir(self.root)) if os.path.isdir(self.root) else []:
+            versions = self.versions(dataset)
+            if versions:
+                rows.append({
+                    "Dataset": dataset,
+                    "Versions": len(versions),
+                    "Checkpoints": sum(entry["kind"] == CHECKPOINT for entry in versions),
+                    "First": versions[0]["date"],
+                    "Last": versions[-1]["date"],
+                    "Bytes": sum(entry["bytes"] for entry in versions),
+                })
+        return pd.DataFrame(rows, columns=["Dataset", "Versions", "Checkpoints", "First", "Last", "Bytes"])
+
+
+if __name__ == "__main__":
+    # Example usage: record the current contracts and rebuild today's version
+    store = SnapshotStore()
+    store.record("contracts", pd.read_csv("data/spotrac_contracts.csv"))
+    print(store.as_of("contracts", datetime.date.today()).head())
+    print(store.summary())
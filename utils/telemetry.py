@@ -0,0 +1,338 @@
+import contextvars
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+# Set up module-level logging for telemetry output
+logger = logging.getLogger(__name__)
+
+# Where run metrics and cProfile dumps are written
+METRICS_DIR = os.path.join("logs", "metrics")
+PROFILE_DIR = os.path.join("logs", "profile")
+
+# Name used for work recorded outside of any stage
+NO_STAGE = "(run)"
+
+# The stage the current thread/task is working for. Thread pools inside a stage inherit it
+# when work is submitted through submit() below.
+_current_stage = contextvars.ContextVar("dmcb_stage", default=NO_STAGE)
+
+
+def _percentile(values, pct):
+    """
+    Returns the pct-th percentile of values using nearest-rank, or None if empty.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def _summarize(values):
+    return {
+        "count": len(values),
+        "total": round(sum(values), 4),
+        "p50": _percentile(values, 50),
+        "p90": _percentile(values, 90),
+        "p99": _percentile(values, 99),
+        "max": max(values) if values else None,
+    }
+
+
+class RunMetrics:
+    """
+    Thread-safe collector for one run's performance numbers, grouped by stage.
+
+    For every stage it keeps wall and CPU time, per-host HTTP counters, latencies and
+    rate-limit waits, Google Sheets API calls with payload sizes, parse times for each
+    page, and fetch/parse pool utilization.
+    """
+
+    def __init__(self, run_name, profile=False):
+        self.run_name = run_name
+        self.profile = profile
+        self.profilers = []
+        self._profiling = threading.local()
+        self.started_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        self._start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self._lock = threading.Lock()
+        self.stages = {}
+
+    def _stage(self, name=None):
+        name = name or _current_stage.get()
+        if name not in self.stages:
+            self.stages[name] = {
+                "wall_seconds": 0.0,
+                "cpu_seconds": 0.0,
+                "http": {},
+                "sheets": {},
+                "parse": {},
+                "pools": {},
+            }
+        return self.stages[name]
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Times a block as the named stage and attributes everything recorded inside it.
+
+        CPU time is measured on the calling thread; work done on helper threads is
+        attributed to the stage but not counted in its CPU time. When profiling, stages
+        running off the main thread get their own cProfile profiler (cProfile only sees
+        the thread that enabled it).
+        """
+        token = _current_stage.set(name)
+        profiler = None
+        if (self.profile and threading.current_thread() is not threading.main_thread()
+                and not getattr(self._profiling, "active", False)):
+            profiler = cProfile.Profile()
+            self._profiling.active = True
+            profiler.enable()
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall_start, time.thread_time() - cpu_start
+            if profiler:
+                profiler.disable()
+                self._profiling.active = False
+            _current_stage.reset(token)
+            with self._lock:
+                entry = self._stage(name)
+                entry["wall_seconds"] += wall
+                entry["cpu_seconds"] += cpu
+                if profiler:
+                    self.profilers.append(profiler)
+
+    def _host(self, host):
+        return self._stage()["http"].setdefault(
+            host, {"requests": 0, "bytes": 0, "status": {}, "latencies": [], "throttle_seconds": 0.0}
+        )
+
+    def record_throttle(self, host, seconds):
+        """
+        Records time spent waiting on a host's rate limit.
+        """
+        with self._lock:
+            self._host(host)["throttle_seconds"] += seconds
+
+    def record_response(self, response, *args, **kwargs):
+        """
+        requests response hook: counts the request, bytes, status code and latency by host.
+        """
+        host = urlparse(response.url).netloc or "unknown"
+        length = response.headers.get("Content-Length")
+        if length is not None and length.isdigit():
+            size = int(length)
+        elif not kwargs.get("stream"):
+            size = len(response.content)
+        else:
+            size = 0
+        latency = response.elapsed.total_seconds()
+
+        with self._lock:
+            entry = self._host(host)
+            entry["requests"] += 1
+            entry["bytes"] += size
+            entry["status"][str(response.status_code)] = entry["status"].get(str(response.status_code), 0) + 1
+            entry["latencies"].append(latency)
+        return response
+
+    def record_sheets_call(self, operation, sheet_name, payload_bytes=0, seconds=0.0):
+        """
+        Records one Google Sheets API call and the size of its payload.
+        """
+        with self._lock:
+            calls = self._stage()["sheets"]
+            entry = calls.setdefault(operation, {"calls": 0, "bytes": 0, "seconds": 0.0, "sheets": []})
+            entry["calls"] += 1
+            entry["bytes"] += payload_bytes
+            entry["seconds"] += seconds
+            if sheet_name not in entry["sheets"]:
+                entry["sheets"].append(sheet_name)
+
+    def record_parse(self, source, page, seconds):
+        """
+        Records how long it took to parse one page from a source.
+        """
+        with self._lock:
+            pages = self._stage()["parse"].setdefault(source, [])
+            pages.append({"page": page, "seconds": seconds})
+
+    def record_pool(self, name, report):
+        """
+        Records the fetch/parse utilization report of one FetchParsePool run.
+        """
+        with self._lock:
+            self._stage()["pools"].setdefault(name, []).append(dict(report))
+
+    def to_dict(self):
+        """
+        Returns the metrics as a JSON-serializable dictionary with latency percentiles.
+        """
+        with self._lock:
+            stages = {}
+            for name, entry in self.stages.items():
+                http = {}
+                for host, stats in entry["http"].items():
+                    http[host] = {
+                        "requests": stats["requests"],
+                        "bytes": stats["bytes"],
+                        "status": dict(stats["status"]),
+                        "latency_seconds": _summarize(stats["latencies"]),
+                        "throttle_seconds": round(stats["throttle_seconds"], 4),
+                    }
+                parse = {}
+                for source, pages in entry["parse"].items():
+                    parse[source] = {
+                        "seconds": _summarize([page["seconds"] for page in pages]),
+                        "pages": list(pages),
+                    }
+                stages[name] = {
+                    "wall_seconds": round(entry["wall_seconds"], 4),
+                    "cpu_seconds": round(entry["cpu_seconds"], 4),
+                    "http": http,
+                    "sheets": {op: dict(stats) for op, stats in entry["sheets"].items()},
+                    "parse": parse,
+                    "pools": {name: list(reports) for name, reports in entry["pools"].items()},
+                }
+
+        return {
+            "run": self.run_name,
+            "started_at": self.started_at,
+            "wall_seconds": round(time.perf_counter() - self._start, 4),
+            "cpu_seconds": round(time.process_time() - self._cpu_start, 4),
+            "stages": stages,
+        }
+
+    def write(self, directory=METRICS_DIR):
+        """
+        Writes the metrics to <directory>/<run>_<timestamp>.json and returns the path.
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.run_name}_{time.strftime('%Y%m%d-%H%M%S')}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logger.info(f"Run metrics written to {path}")
+        return path
+
+
+# The collector for the current process. Replaced by start_run(); the default instance
+# simply accumulates numbers for ad-hoc use.
+_metrics = RunMetrics("adhoc")
+
+
+def get_metrics():
+    """
+    Returns the active RunMetrics collector.
+    """
+    return _metrics
+
+
+def start_run(run_name, profile=False):
+    """
+    Starts a fresh collector for a new run and returns it.
+    """
+    global _metrics
+    _metrics = RunMetrics(run_name, profile=profile)
+    return _metrics
+
+
+def stage(name):
+    """
+    Shortcut for get_metrics().stage(name).
+    """
+    return _metrics.stage(name)
+
+
+def record_response(response, *args, **kwargs):
+    """
+    requests response hook that forwards to the active collector.
+    """
+    return _metrics.record_response(response, *args, **kwargs)
+
+
+def record_sheets_call(operation, sheet_name, payload_bytes=0, seconds=0.0):
+    _metrics.record_sheets_call(operation, sheet_name, payload_bytes, seconds)
+
+
+def record_throttle(host, seconds):
+    _metrics.record_throttle(host, seconds)
+
+
+def record_pool(name, report):
+    _metrics.record_pool(name, report)
+
+
+@contextmanager
+def timed_parse(source, page):
+    """
+    Times the parsing of one page and records it under the given source.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _metrics.record_parse(source, page, time.perf_counter() - start)
+
+
+def instrument_session(session):
+    """
+    Adds the metrics response hook to a requests session (once) and returns it.
+    """
+    hooks = session.hooks.setdefault("response", [])
+    if record_response not in hooks:
+        hooks.append(record_response)
+    return session
+
+
+def submit(executor, fn, *args, **kwargs):
+    """
+    Submits fn to an executor so that it records metrics under the caller's stage.
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+@contextmanager
+def run_session(run_name, profile=False):
+    """
+    Wraps a whole script run: starts a metrics collector, optionally profiles with
+    cProfile, and writes the metrics JSON (and .prof dump) when the block exits.
+
+    Args:
+        run_name (str): Name used for the output files (e.g., "get_stats").
+        profile (bool): If True, dump cProfile stats to logs/profile/ and log the top entries.
+    """
+    metrics = start_run(run_name, profile=profile)
+    profiler = cProfile.Profile() if profile else None
+    if profiler:
+        profiler.enable()
+    try:
+        with metrics.stage(run_name):
+            yield metrics
+    finally:
+        if profiler:
+            profiler.disable()
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            path = os.path.join(PROFILE_DIR, f"{run_name}_{time.strftime('%Y%m%d-%H%M%S')}.prof")
+
+            # Merge the main-thread profile with any per-stage worker-thread profiles
+            stats = pstats.Stats(profiler)
+            for stage_profiler in metrics.profilers:
+                stats.add(stage_profiler)
+            stats.dump_stats(path)
+
+            summary = io.StringIO()
+            stats.stream = summary
+            stats.sort_stats("cumulative").print_stats(25)
+            logger.info(f"cProfile stats written to {path}\n{summary.getvalue()}")
+        metrics.write()
@@ -0,0 +1,174 @@
+import logging
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+# Set up module-level logging for the trade evaluator
+logger = logging.getLogger(__name__)
+
+# Roster limits from the league rules (section 2.1)
+MIN_ROSTER = 12
+MAX_ROSTER = 15
+MAX_TWO_WAY = 2
+
+
+class TradeEvaluator:
+    """
+    Scores batches of trades for cap legality, roster limits and multi-year salary impact.
+
+    Every owner's cap totals and roster counts come from a CapTable, and every player's
+    cap hit and roster spots from its per-player arrays. A batch of N trades is turned into
+    padded (N x k) player index arrays, so the cap and roster effect of every trade in
+    every season is one gather-and-sum.
+
+    A trade is cap-legal for a team if its cap total after the trade fits under the cap,
+    or if the trade does not increase it (teams already over the cap may still shed
+    salary); roster limits are treated the same way. Legality is judged on the current
+    (first) season; later seasons are reported as salary changes.
+    """
+
+    def __init__(self, cap_table, min_roster=MIN_ROSTER, max_roster=MAX_ROSTER, max_two_way=MAX_TWO_WAY):
+        """
+        Args:
+            cap_table (CapTable): Current contracts and owner totals.
+            min_roster (int): Minimum standard players after a trade.
+            max_roster (int): Maximum standard players after a trade.
+            max_two_way (int): Maximum two-way players after a trade.
+        """
+        self.table = cap_table
+        self.min_roster = min_roster
+        self.max_roster = max_roster
+        self.max_two_way = max_two_way
+
+        cap_hit, standard, two_way = cap_table.player_arrays()
+        # An extra all-zero row lets padded trade slots gather nothing
+        self.cap_hit = np.vstack([cap_hit, np.zeros((1, cap_hit.shape[1]), dtype=np.int64)])
+        self.standard = np.vstack([standard, np.zeros((1, standard.shape[1]), dtype=np.int64)])
+        self.two_way = np.vstack([two_way, np.zeros((1, two_way.shape[1]), dtype=np.int64)])
+
+    def roster(self, owner):
+        """
+        Returns the Player Keys currently owned by an owner.
+        """
+        i = self.table.owner_index[owner]
+        return [self.table.keys[row] for row in np.flatnonzero(self.table.owner_of == i)]
+
+    def _indexes(self, groups):
+        width = max((len(group) for group in groups), default=0) or 1
+        index = np.full((len(groups), width), len(self.table.keys), dtype=np.int64)
+        for n, group in enumerate(groups):
+            index[n, :len(group)] = [self.table.rows[key] for key in group]
+        return index
+
+    def _roster_ok(self, players, players_delta, two_way, two_way_delta):
+        # A roster already outside the limits (e.g., 11 players in the offseason) only
+        # fails if the trade moves it further out
+        return (
+            ((players >= self.min_roster) | (players_delta >= 0))
+            & ((players <= self.max_roster) | (players_delta <= 0))
+            & ((two_way <= self.max_two_way) | (two_way_delta <= 0))
+        )
+
+    def evaluate(self, trades):
+        """
+        Scores a batch of trades.
+
+        Args:
+            trades (list of tuple): (owner A, keys A sends, owner B, keys B sends) per trade.
+
+        Returns:
+            pd.DataFrame: One row per trade with each team's cap total, cap space, roster
+                counts, legality flags, and A's net salary change for every season.
+
+        Raises:
+            ValueError: If a trade sends a player the owner does not have.
+        """
+        table = self.table
+        owner_a = np.array([table.owner_index[t[0]] for t in trades], dtype=np.int64)
+        owner_b = np.array([table.owner_index[t[2]] for t in trades], dtype=np.int64)
+        sends_a = self._indexes([t[1] for t in trades])
+        sends_b = self._indexes([t[3] for t in trades])
+
+        # Every sent player must belong to the sending owner
+        padding = len(table.keys)
+        owner_of = np.append(table.owner_of, -1)
+        bad_a = (sends_a != padding) & (owner_of[sends_a] != owner_a[:, None])
+        bad_b = (sends_b != padding) & (owner_of[sends_b] != owner_b[:, None])
+        if bad_a.any() or bad_b.any():
+            n = int(np.flatnonzero(bad_a.any(axis=1) | bad_b.any(axis=1))[0])
+            raise ValueError(f"Trade {n} sends a player the owner does not have: {trades[n]}")
+
+        # (N x seasons) salary and roster flows
+        out_a, in_a = self.cap_hit[sends_a].sum(axis=1), self.cap_hit[sends_b].sum(axis=1)
+        delta_a = in_a - out_a
+        std_delta_a = self.standard[sends_b].sum(axis=1) - self.standard[sends_a].sum(axis=1)
+        two_way_delta_a = self.two_way[sends_b].sum(axis=1) - self.two_way[sends_a].sum(axis=1)
+
+        cap_total = table.cap_total
+        total_a = cap_total[owner_a] + delta_a
+        total_b = cap_total[owner_b] - delta_a
+        players_a = table.standard_count[owner_a] + std_delta_a
+        players_b = table.standard_count[owner_b] - std_delta_a
+        two_way_a = table.two_way_count[owner_a] + two_way_delta_a
+        two_way_b = table.two_way_count[owner_b] - two_way_delta_a
+
+        cap = table.caps[0]
+        cap_ok_a = (total_a[:, 0] <= cap) | (delta_a[:, 0] <= 0)
+        cap_ok_b = (total_b[:, 0] <= cap) | (delta_a[:, 0] >= 0)
+        roster_ok_a = self._roster_ok(players_a[:, 0], std_delta_a[:, 0], two_way_a[:, 0], two_way_delta_a[:, 0])
+        roster_ok_b = self._roster_ok(players_b[:, 0], -std_delta_a[:, 0], two_way_b[:, 0], -two_way_delta_a[:, 0])
+
+        result = pd.DataFrame({
+            "Owner A": [t[0] for t in trades],
+            "A Sends": [", ".join(t[1]) for t in trades],
+            "Owner B": [t[2] for t in trades],
+            "B Sends": [", ".join(t[3]) for t in trades],
+            "A Cap Total": total_a[:, 0],
+            "A Cap Space": cap - total_a[:, 0],
+            "B Cap Total": total_b[:, 0],
+            "B Cap Space": cap - total_b[:, 0],
+            "A Players": players_a[:, 0],
+            "B Players": players_b[:, 0],
+            "Cap Legal": cap_ok_a & cap_ok_b,
+            "Roster Legal": roster_ok_a & roster_ok_b,
+        })
+        result["Legal"] = result["Cap Legal"] & result["Roster Legal"]
+        for j, season in enumerate(table.seasons):
+            result[f"A Net {season}"] = delta_a[:, j]
+        return result
+
+    def candidate_trades(self, owner_a, owner_b, a_sends=2, b_sends=1):
+        """
+        Lists every trade where owner A sends a_sends players for b_sends of owner B's.
+
+        Returns:
+            list of tuple: Trades in the format accepted by evaluate().
+        """
+        roster_a, roster_b = self.roster(owner_a), self.roster(owner_b)
+        return [
+            (owner_a, list(group_a), owner_b, list(group_b))
+            for group_a in combinations(roster_a, a_sends)
+            for group_b in combinations(roster_b, b_sends)
+        ]
+
+    def two_for_one(self, owner_a, owner_b):
+        """
+        Evaluates every 2-for-1 trade between two owners, in both directions.
+
+        Returns:
+            pd.DataFrame: Scored trades as returned by evaluate().
+        """
+        trades = self.candidate_trades(owner_a, owner_b, 2, 1) + self.candidate_trades(owner_a, owner_b, 1, 2)
+        logger.info(f"Evaluating {len(trades)} 2-for-1 trades between {owner_a} and {owner_b}")
+        return self.evaluate(trades)
+
+
+if __name__ == "__main__":
+    # Example usage: the legal 2-for-1 trades between two owners that save Sam the most money
+    from utils.salary_cap import CapTable
+
+    evaluator = TradeEvaluator(CapTable(pd.read_csv("data/spotrac_contracts.csv")))
+    trades = evaluator.two_for_one("Sam", "Kyle")
+    first_season = evaluator.table.seasons[0]
+    print(trades[trades["Legal"]].sort_values(f"A Net {first_season}").head(10).to_string())
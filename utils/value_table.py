@@ -0,0 +1,179 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from utils.salary_cap import SALARY, dmcb_cap
+from utils.salary_codec import SalaryTable
+
+# Set up module-level logging for the value table
+logger = logging.getLogger(__name__)
+
+# Players rostered league-wide (16 owners x 13 standard players); the FP of the player
+# ranked just outside this pool is the replacement level
+LEAGUE_TEAMS = 16
+ROSTER_SPOTS = 13
+
+# Inputs that determine a row; a row is only recomputed when one of these changes
+INPUT_COLUMNS = ["Player", "Salary", "Status", "FP", "FPPG", "FPR", "Position", "Owner"]
+
+VALUE_COLUMNS = [
+    "Player", "Player Key", "Position", "Owner", "Salary", "FP", "FPPG", "FPR",
+    "FP per $1M", "Value", "Surplus", "Overall Rank", "Position Rank", "Fingerprint",
+]
+
+
+def _inputs(contracts, stats, positions, season=None):
+    """
+    Joins the three datasets on Player Key into one row of raw inputs per contracted player.
+    """
+    contracts = SalaryTable.coerce(contracts)
+    contracts = contracts.take(np.flatnonzero(~contracts.info["Player Key"].duplicated().to_numpy()))
+    salary, status = contracts.season(season or contracts.seasons[0])
+    inputs = pd.DataFrame({
+        "Player": contracts.info["Player"].to_numpy(),
+        "Player Key": contracts.info["Player Key"].to_numpy(),
+        "Salary": np.where(status == SALARY, salary, 0),
+        "Status": status,
+    })
+    if "Owner" in contracts.info.columns:
+        inputs["Owner"] = contracts.info["Owner"].astype(object).to_numpy()
+
+    stats_columns = [col for col in ["FP", "FPPG", "FPR"] if col in stats.columns]
+    inputs = inputs.merge(
+        stats[["Player Key"] + stats_columns].drop_duplicates(subset=["Player Key"]), on="Player Key", how="left"
+    )
+    inputs = inputs.merge(
+        positions[["Player Key", "Position"]].drop_duplicates(subset=["Player Key"]), on="Player Key", how="left"
+    )
+    for col in INPUT_COLUMNS:
+        if col not in inputs.columns:
+            inputs[col] = np.nan
+    inputs[["FP", "FPPG", "FPR"]] = inputs[["FP", "FPPG", "FPR"]].apply(pd.to_numeric, errors="coerce").fillna(0)
+    return inputs.set_index("Player Key")
+
+
+def fingerprints(inputs):
+    """
+    Returns a per-row hex hash of the input columns (index: Player Key).
+    """
+    hashes = pd.util.hash_pandas_object(inputs[INPUT_COLUMNS].astype(str), index=False)
+    return pd.Series([f"{h:016x}" for h in hashes], index=inputs.index, dtype=object)
+
+
+class ValueTable:
+    """
+    A materialized join of contracts and fantasy production with value-per-dollar metrics.
+
+    Row-level columns (salary, FP per $1M) are only recomputed for rows whose input
+    fingerprint changed. League-level columns (replacement level, dollar value, surplus
+    and ranks) depend on every row, so they are recomputed with whole-column operations
+    on each refresh.
+    """
+
+    def __init__(self, season=None, cap=None, teams=LEAGUE_TEAMS, roster_spots=ROSTER_SPOTS):
+        """
+        Args:
+            season (str, optional): Salary column to value (defaults to the first season).
+            cap (int, optional): League cap per team (defaults to the DMCB cap for the season).
+            teams (int): Owners in the league.
+            roster_spots (int): Standard players per team that define the replacement level.
+        """
+        self.season = season
+        self.cap = cap
+        self.teams = teams
+        self.roster_spots = roster_spots
+        self.table = pd.DataFrame(columns=VALUE_COLUMNS).set_index("Player Key", drop=False)
+
+    @classmethod
+    def from_frame(cls, table, **kwargs):
+        """
+        Restores a previously saved table, so the next refresh only touches changed rows.
+        """
+        value_table = cls(**kwargs)
+        value_table.table = table.set_index("Player Key", drop=False)
+        return value_table
+
+    def refresh(self, contracts, stats, positions):
+        """
+        Brings the table up to date with the current datasets.
+
+        Args:
+            contracts (SalaryTable or pd.DataFrame): Parsed contracts or spotrac_contracts.csv.
+            stats (pd.DataFrame): nba_stats.csv (FP, FPPG, FPR).
+            positions (pd.DataFrame): sportsws_positions.csv.
+
+        Returns:
+            list of str: Player Keys whose rows were added, changed or removed.
+        """
+        contracts = SalaryTable.coerce(contracts)
+        self.season = self.season or contracts.seasons[0]
+        self.cap = self.cap or dmcb_cap(self.season)
+
+        inputs = _inputs(contracts, stats, positions, self.season)
+        new_prints = fingerprints(inputs)
+        old_prints = self.table["Fingerprint"] if len(self.table) else pd.Series(dtype=object)
+
+        removed = old_prints.index.difference(new_prints.index)
+        changed = new_prints.index[old_prints.reindex(new_prints.index).to_numpy() != new_prints.to_numpy()]
+
+        table = self.table.drop(index=removed)
+        if len(changed):
+            rows = self._rows(inputs.loc[changed], new_prints.loc[changed])
+            kept = table.drop(index=changed, errors="ignore")
+            table = pd.concat([kept, rows]) if len(kept) else rows
+        self.table = self._league_columns(table.loc[new_prints.index])
+
+        logger.info(f"Value table refreshed: {len(changed)} changed, {len(removed)} removed, {len(self.table)} rows")
+        return sorted(changed.tolist() + removed.tolist())
+
+    def _rows(self, inputs, prints):
+        salary = inputs["Salary"].to_numpy(dtype=np.int64)
+        rows = pd.DataFrame({
+            "Player": inputs["Player"].to_numpy(),
+            "Player Key": inputs.index.to_numpy(),
+            "Position": inputs["Position"].to_numpy(),
+            "Owner": inputs["Owner"].to_numpy(),
+            "Salary": salary,
+            "FP": inputs["FP"].to_numpy(),
+            "FPPG": inputs["FPPG"].to_numpy(),
+            "FPR": inputs["FPR"].to_numpy(),
+            "Fingerprint": prints.to_numpy(),
+        }, index=inputs.index)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rows["FP per $1M"] = np.where(salary > 0, rows["FP"] / (salary / 1e6), np.nan).round(1)
+        return rows
+
+    def _league_columns(self, table):
+        table = table.copy()
+        fp = table["FP"].to_numpy(dtype=float)
+
+        # Replacement level: the FP of the first player outside the rostered pool
+        pool = self.teams * self.roster_spots
+        ranked = np.sort(fp)[::-1]
+        replacement = ranked[pool] if len(ranked) > pool else 0.0
+
+        # Spread the league's cap dollars over FP above replacement
+        marginal = np.clip(fp - replacement, 0, None)
+        dollars_per_fp = (self.teams * self.cap) / marginal.sum() if marginal.sum() else 0.0
+
+        table["Value"] = (marginal * dollars_per_fp).round(0).astype(np.int64)
+        table["Surplus"] = table["Value"] - table["Salary"].astype(np.int64)
+        table["Overall Rank"] = table["Surplus"].rank(ascending=False, method="min").astype(int)
+        table["Position Rank"] = (
+            table.groupby(table["Position"].fillna(""))["Surplus"].rank(ascending=False, method="min").astype(int)
+        )
+        self.replacement_fp = replacement
+        self.dollars_per_fp = dollars_per_fp
+        return table[VALUE_COLUMNS].sort_values("Overall Rank", kind="mergesort")
+
+
+if __name__ == "__main__":
+    # Example usage: the best contracts by surplus value
+    value = ValueTable()
+    value.refresh(
+        pd.read_csv("data/spotrac_contracts.csv"),
+        pd.read_csv("data/nba_stats.csv"),
+        pd.read_csv("data/sportsws_positions.csv"),
+    )
+    print(value.table.head(15).drop(columns=["Fingerprint"]).to_string(index=False))